@@ -7,16 +7,17 @@
 # -------------------------------------------------------------------------
 
 
+import contextlib
 import glob
 import os
 import shlex
 import shutil
 import signal
 import sys
+import time
 import traceback
 import zipfile
 
-from functools import lru_cache
 from threading import Timer
 
 import multiprocess  # type: ignore
@@ -28,9 +29,14 @@ from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_statistics_collector.collectors.special_return_value import \
     SpecialReturnValueCollector
 
-from . import gcc_toolchain
+from tu_collector import tu_collector
+
+from . import analysis_profile, analysis_scheduler, gcc_toolchain
+from .memory_budget import MemoryBudget, MemoryMonitor, \
+    get_default_estimate, is_killed_for_memory
 
 from .analyzers import analyzer_types
+from .analyzers.analyzer_output import DEFAULT_MEMORY_LIMIT
 from .analyzers.clangsa.analyzer import ClangSA
 from .analyzers.config_handler import CheckerState
 
@@ -57,12 +63,28 @@ def print_analyzer_statistic_summary(metadata_analyzers, status, msg=None):
             LOG.info("  %s: %s", analyzer_type, res)
 
 
-def worker_result_handler(results, metadata_tool, output_path):
+def worker_result_handler(results, metadata_tool, output_path, durations,
+                          peak_memory):
     """ Print the analysis summary. """
     skipped_num = 0
     reanalyzed_num = 0
     metadata_analyzers = metadata_tool['analyzers']
-    for res, skipped, reanalyzed, analyzer_type, _, sources in results:
+    profiles = []
+    for res, skipped, reanalyzed, analyzer_type, _, sources, action_stats \
+            in results:
+        if action_stats.get('profile'):
+            profiles.append(action_stats['profile'])
+
+        mode = analysis_scheduler.mode_name(action_stats['ctu'])
+        analyzer_time = action_stats.get('analyzer_time')
+        if analyzer_time is not None:
+            durations.setdefault(action_stats['key'], {})[mode] = \
+                round(analyzer_time, 3)
+
+        if action_stats.get('peak_memory'):
+            peak_memory.setdefault(action_stats['key'], {})[mode] = \
+                action_stats['peak_memory']
+
         statistics = metadata_analyzers[analyzer_type]['analyzer_statistics']
         if skipped:
             skipped_num += 1
@@ -112,16 +134,43 @@ def worker_result_handler(results, metadata_tool, output_path):
 
     metadata_tool['result_source_files'].update(source_map)
 
+    analysis_scheduler.save_durations(output_path, durations)
+    analysis_scheduler.save_peak_memory(output_path, peak_memory)
+
+    if profiles:
+        analysis_profile.save(profiles, metadata_tool, output_path)
+
 
 # Progress reporting.
 PROGRESS_CHECKED_NUM = None
 PROGRESS_ACTIONS = None
 
+# Result cache statistics.
+RESULT_CACHE_HITS = None
+RESULT_CACHE_MISSES = None
 
-def init_worker(checked_num, action_num):
-    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS
+# Data of the analysis run which is the same for every build action. It is
+# given to the worker processes once, when the pool starts, so the jobs
+# contain only the build actions and the workers don't have to fetch anything
+# from the main process during the analysis.
+RUN_DATA = None
+
+
+def init_worker(checked_num, action_num, cache_hits, cache_misses,
+                run_data=None):
+    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS, \
+        RESULT_CACHE_HITS, RESULT_CACHE_MISSES, RUN_DATA
     PROGRESS_CHECKED_NUM = checked_num
     PROGRESS_ACTIONS = action_num
+    RESULT_CACHE_HITS = cache_hits
+    RESULT_CACHE_MISSES = cache_misses
+    RUN_DATA = run_data
+
+
+def __increment(counter):
+    """ Increment a shared counter of the worker processes. """
+    with counter.get_lock():
+        counter.value += 1
 
 
 def save_output(base_file_name, out, err):
@@ -129,12 +178,12 @@ def save_output(base_file_name, out, err):
         if out:
             with open(base_file_name + ".stdout.txt", 'w',
                       encoding="utf-8", errors="ignore") as outf:
-                outf.write(out)
+                out.copy_to(outf)
 
         if err:
             with open(base_file_name + ".stderr.txt", 'w',
                       encoding="utf-8", errors="ignore") as outf:
-                outf.write(err)
+                err.copy_to(outf)
     except IOError as ioerr:
         LOG.debug("Failed to save analyzer output")
         LOG.debug(ioerr)
@@ -227,11 +276,51 @@ def handle_success(
                   rh.analyzed_source_file)
 
 
-def handle_reproducer(source_analyzer, rh, zip_file, actions_map):
+def __read_chunks(path, chunk_size=1024 * 1024):
+    """ Returns the content of the given file in chunks. """
+    with open(path, 'rb') as f:
+        yield from iter(lambda: f.read(chunk_size), b'')
+
+
+def __reproducer_extra_files(rh):
+    """
+    Returns the name and the content in chunks of the files which are added
+    to the debug zip besides the source files.
+    """
+    action = rh.buildaction
+
+    LOG.debug("[ZIP] Writing analyzer STDOUT to /stdout")
+    yield "stdout", rh.analyzer_stdout.encoded_chunks()
+
+    LOG.debug("[ZIP] Writing analyzer STDERR to /stderr")
+    yield "stderr", rh.analyzer_stderr.encoded_chunks()
+
+    LOG.debug("[ZIP] Writing extra information...")
+    yield "build-action", [action.original_command.encode('utf-8')]
+    yield "analyzer-command", [' '.join(
+        [shlex.quote(x) for x in rh.analyzer_cmd]).encode('utf-8')]
+    yield "return-code", [str(rh.analyzer_returncode).encode('utf-8')]
+
+    toolchain = gcc_toolchain.toolchain_in_args(
+        shlex.split(action.original_command))
+    if toolchain:
+        yield "gcc-toolchain-path", [toolchain.encode('utf-8')]
+
+    compiler_info_file = os.path.join(rh.workspace, 'compiler_info.json')
+    if os.path.exists(compiler_info_file):
+        yield "compiler_info.json", __read_chunks(compiler_info_file)
+
+
+def handle_reproducer(source_analyzer, rh, zip_file, actions_map,
+                      blob_store=None):
     """
     If the analysis fails a debug zip is packed together which contains
     build, analysis information and source files to be able to
     reproduce the failed analysis.
+
+    If a tu_collector.BlobStore is given, the files are written to it and
+    only a manifest file of the debug zip is written instead of the zip
+    file.
     """
     other_files = set()
     action = rh.buildaction
@@ -269,7 +358,23 @@ def handle_reproducer(source_analyzer, rh, zip_file, actions_map):
         else:
             LOG.debug("Could not find %s in build actions.", key)
 
-    from tu_collector import tu_collector
+    if blob_store:
+        files = tu_collector.store_tu_files(blob_store, buildactions)
+
+        # TODO: What about the dependencies of the other_files?
+        tu_collector.add_sources_to_manifest(
+            blob_store, files,
+            [os.path.join(action.directory, path) for path in other_files])
+
+        for name, chunks in __reproducer_extra_files(rh):
+            files[name] = blob_store.add_chunks(chunks)
+
+        manifest_file = \
+            os.path.splitext(zip_file)[0] + tu_collector.MANIFEST_SUFFIX
+        tu_collector.write_manifest(manifest_file, blob_store, files)
+
+        LOG.debug("Manifest file of the ZIP written at '%s'", manifest_file)
+        return
 
     tu_collector.zip_tu_files(zip_file, buildactions)
 
@@ -279,28 +384,10 @@ def handle_reproducer(source_analyzer, rh, zip_file, actions_map):
         [os.path.join(action.directory, path) for path in other_files])
 
     with zipfile.ZipFile(zip_file, 'a') as archive:
-        LOG.debug("[ZIP] Writing analyzer STDOUT to /stdout")
-        archive.writestr("stdout", rh.analyzer_stdout)
-
-        LOG.debug("[ZIP] Writing analyzer STDERR to /stderr")
-        archive.writestr("stderr", rh.analyzer_stderr)
-
-        LOG.debug("[ZIP] Writing extra information...")
-        archive.writestr("build-action", action.original_command)
-        archive.writestr(
-            "analyzer-command",
-            ' '.join([shlex.quote(x) for x in rh.analyzer_cmd]),
-            )
-        archive.writestr("return-code", str(rh.analyzer_returncode))
-
-        toolchain = gcc_toolchain.toolchain_in_args(
-            shlex.split(action.original_command))
-        if toolchain:
-            archive.writestr("gcc-toolchain-path", toolchain)
-
-        compiler_info_file = os.path.join(rh.workspace, 'compiler_info.json')
-        if os.path.exists(compiler_info_file):
-            archive.write(compiler_info_file, "compiler_info.json")
+        for name, chunks in __reproducer_extra_files(rh):
+            with archive.open(name, 'w') as f:
+                for chunk in chunks:
+                    f.write(chunk)
 
     LOG.debug("ZIP file written at '%s'", zip_file)
 
@@ -431,24 +518,62 @@ def collect_ctu_involved_files(result_handler, source_analyzer, output_dir):
         os.remove(out)
 
 
-def check(check_data):
+def check(action):
     """
     Invoke clang with an action which called by processes.
     Different analyzer object belongs to for each build action.
 
-    skiplist handler is None if no skip file was configured.
+    The rest of the analysis parameters are read from RUN_DATA which is set
+    by init_worker(). skiplist handler is None if no skip file was
+    configured.
     """
-    actions_map, action, analyzer_config, \
-        output_dir, skip_handlers, filter_handlers, \
-        rs_handler, quiet_output_on_stdout, \
-        capture_analysis_output, generate_reproducer, analysis_timeout, \
-        ctu_reanalyze_on_failure, \
-        output_dirs, statistics_data = check_data
+    actions_map = RUN_DATA['actions_map']
+    analyzer_config = \
+        RUN_DATA['analyzer_config_map'].get(action.analyzer_type)
+    output_dir = RUN_DATA['output_path']
+    skip_handlers = RUN_DATA['skip_handlers']
+    filter_handlers = RUN_DATA['filter_handlers']
+    rs_handler = RUN_DATA['rs_handler']
+    quiet_output_on_stdout = RUN_DATA['quiet_analyze']
+    capture_analysis_output = RUN_DATA['capture_analysis_output']
+    generate_reproducer = RUN_DATA['generate_reproducer']
+    analysis_timeout = RUN_DATA['timeout']
+    ctu_reanalyze_on_failure = RUN_DATA['ctu_reanalyze_on_failure']
+    output_dirs = RUN_DATA['output_dirs']
+    statistics_data = RUN_DATA['statistics_data']
+    result_cache = RUN_DATA['result_cache']
+    memory_budget = RUN_DATA['memory_budget']
+    output_memory_limit = RUN_DATA['output_memory_limit']
+    jobserver = RUN_DATA['jobserver']
+
+    # The source files of the debug zips are written to a content-addressed
+    # store shared by the translation units if it is enabled.
+    blob_store = None
+    if RUN_DATA['reproducer_blob_store']:
+        blob_store = tu_collector.BlobStore(output_dirs['blobs'])
+
+    # The analyzer processes are started only with a job slot of make if
+    # CodeChecker takes part in the jobserver of make.
+    job_slot = jobserver.job_slot if jobserver else contextlib.nullcontext
 
     failed_dir = output_dirs["failed"]
     success_dir = output_dirs["success"]
     reproducer_dir = output_dirs["reproducer"]
 
+    # Information about the analyzer run which is collected by the main
+    # process, e.g. for scheduling the next analysis.
+    action_stats = {'key': None,
+                    'ctu': False,
+                    'analyzer_time': None,
+                    'peak_memory': None,
+                    'killed_for_memory': False}
+
+    # The phases of the analysis are recorded only if profiling is enabled.
+    profile = analysis_profile.ActionProfile(action, RUN_DATA['submitted']) \
+        if RUN_DATA['profile'] else None
+
+    rh = None
+    restored_from_cache = False
     try:
         # If one analysis fails the check fails.
         return_codes = 0
@@ -456,12 +581,15 @@ def check(check_data):
 
         result_file = ''
 
+        action_stats['key'] = analysis_scheduler.action_key(action)
+
         if analyzer_config is None:
             raise ValueError("Analyzer configuration is missing.")
 
         source_analyzer, rh = prepare_check(action, analyzer_config,
                                             output_dir,
                                             skip_handlers, statistics_data)
+        rh.output_memory_limit = output_memory_limit
 
         reanalyzed = os.path.exists(rh.analyzer_result_file)
 
@@ -496,18 +624,101 @@ def check(check_data):
 
         result_file_exists = os.path.exists(rh.analyzer_result_file)
 
-        # Fills up the result handler with the analyzer information.
-        source_analyzer.analyze(analyzer_cmd, rh, __create_timeout)
+        ctu_active = isinstance(source_analyzer, ClangSA) and \
+            source_analyzer.is_ctu_available() and \
+            source_analyzer.is_ctu_enabled()
 
-        # If execution reaches this line, the analyzer process has quit.
-        if timeout_cleanup[0]():
-            LOG.warning("Analyzer ran too long, exceeding time limit "
-                        "of %d seconds.", analysis_timeout)
-            LOG.warning("Considering this analysis as failed...")
-            rh.analyzer_returncode = -1
-            rh.analyzer_stderr = \
-                ">>> CodeChecker: Analysis timed out after " \
-                f"{analysis_timeout} seconds. <<<\n{rh.analyzer_stderr}"
+        # The results of CTU and statistics based analysis depend on other
+        # translation units too, so these are never cached.
+        cache_output_files = None
+        if result_cache and analyzer_cmd and not ctu_active and \
+                not statistics_data:
+            cache_output_files = \
+                source_analyzer.get_cacheable_output_files(rh)
+
+        cache_key = None
+        if cache_output_files is not None:
+            cache_key = result_cache.get_key(
+                rh, analyzer_cmd,
+                source_analyzer.get_implicit_config_files(analyzer_cmd))
+            restored_from_cache = result_cache.restore(
+                cache_key, rh, cache_output_files)
+            __increment(RESULT_CACHE_HITS if restored_from_cache
+                        else RESULT_CACHE_MISSES)
+
+        if restored_from_cache:
+            LOG.debug("Analysis result of '%s' is restored from the cache.",
+                      action.source)
+            rh.analyzer_cmd = analyzer_cmd
+        else:
+            # The analyzer is started only if its expected memory usage fits
+            # in the memory budget.
+            reservation = None
+            if memory_budget:
+                expected_memory = analysis_scheduler.get_recorded_value(
+                    RUN_DATA['peak_memory'], action_stats['key'], ctu_active)
+                reservation = memory_budget.admit(
+                    int(expected_memory or memory_budget.default_estimate))
+
+            memory_monitor = []
+
+            def __on_analyzer_start(analyzer_process):
+                __create_timeout(analyzer_process)
+                memory_monitor.append(MemoryMonitor(
+                    analyzer_process.pid,
+                    reservation.update if reservation else None))
+
+            if profile:
+                profile.begin('analyzer')
+
+            analyzer_start = time.time()
+
+            try:
+                # Fills up the result handler with the analyzer information.
+                with job_slot():
+                    source_analyzer.analyze(analyzer_cmd, rh,
+                                            __on_analyzer_start)
+            finally:
+                if memory_monitor:
+                    action_stats['peak_memory'] = memory_monitor[0].stop()
+                if reservation:
+                    reservation.release()
+
+            action_stats['ctu'] = ctu_active
+            action_stats['analyzer_time'] = time.time() - analyzer_start
+
+            # If execution reaches this line, the analyzer process has quit.
+            if timeout_cleanup[0]():
+                LOG.warning("Analyzer ran too long, exceeding time limit "
+                            "of %d seconds.", analysis_timeout)
+                LOG.warning("Considering this analysis as failed...")
+                rh.analyzer_returncode = -1
+                rh.analyzer_stderr.prepend(
+                    ">>> CodeChecker: Analysis timed out after "
+                    f"{analysis_timeout} seconds. <<<\n")
+            elif memory_budget and \
+                    is_killed_for_memory(rh.analyzer_returncode):
+                if RUN_DATA['retry_killed_for_memory']:
+                    # start_workers() analyzes it again with less jobs.
+                    LOG.warning("Analyzing %s with %s was killed, probably "
+                                "because the system ran out of memory. It "
+                                "will be retried later with less jobs.",
+                                os.path.basename(action.source),
+                                action.analyzer_type)
+                    action_stats['killed_for_memory'] = True
+                    action_stats['analyzer_time'] = None
+                    return 1, False, reanalyzed, action.analyzer_type, \
+                        None, action.source, action_stats
+
+                rh.analyzer_stderr.prepend(
+                    ">>> CodeChecker: Analyzer was killed, probably "
+                    "because the system ran out of memory. <<<\n")
+
+            if cache_key and rh.analyzer_returncode == 0:
+                result_cache.store(cache_key, rh, cache_output_files)
+
+        if profile:
+            profile.begin('post-processing')
 
         source_analyzer.post_analyze(rh)
 
@@ -518,10 +729,6 @@ def check(check_data):
         result_file = rh.analyzer_result_file.replace(r'\ ', ' ')
         result_base = os.path.basename(result_file)
 
-        ctu_active = isinstance(source_analyzer, ClangSA) and \
-            source_analyzer.is_ctu_available() and \
-            source_analyzer.is_ctu_enabled()
-
         zip_suffix = '_CTU' if ctu_active else ''
 
         failure_type = "_unknown"
@@ -540,11 +747,14 @@ def check(check_data):
 
         source_file_name = os.path.basename(action.source)
 
-        # Remove the previously generated .zip files.
-        if os.path.exists(failed_zip_file):
-            os.remove(failed_zip_file)
-        if os.path.exists(reproducer_zip_file):
-            os.remove(reproducer_zip_file)
+        # Remove the previously generated .zip files and their manifest
+        # files.
+        for previous_zip in [failed_zip_file, reproducer_zip_file]:
+            for previous_file in [previous_zip,
+                                  os.path.splitext(previous_zip)[0] +
+                                  tu_collector.MANIFEST_SUFFIX]:
+                if os.path.exists(previous_file):
+                    os.remove(previous_file)
 
         def handle_analysis_result(success, zip_file=zip_file):
             """
@@ -570,7 +780,7 @@ def check(check_data):
 
             handle_reproducer(source_analyzer, rh,
                               os.path.join(output_dir_for_zips, zip_file),
-                              actions_map)
+                              actions_map, blob_store)
 
         if rh.analyzer_returncode == 0:
             handle_analysis_result(success=True)
@@ -588,27 +798,45 @@ def check(check_data):
                       "CTU" if ctu_active else "")
 
             if not quiet_output_on_stdout:
-                LOG.error("\n%s", rh.analyzer_stdout)
-                LOG.error("\n%s", rh.analyzer_stderr)
+                LOG.error("\n%s", rh.analyzer_stdout.summary())
+                LOG.error("\n%s", rh.analyzer_stderr.summary())
 
             handle_analysis_result(success=False)
 
             if ctu_active and ctu_reanalyze_on_failure:
                 LOG.error("Try to reanalyze without CTU")
+                rh.cleanup_output()
+
                 # Try to reanalyze with CTU disabled.
                 source_analyzer, rh = \
                     prepare_check(action, analyzer_config,
                                   output_dir,
                                   skip_handlers, statistics_data,
                                   True)
+                rh.output_memory_limit = output_memory_limit
                 reanalyzed = os.path.exists(rh.analyzer_result_file)
 
                 # Construct the analyzer cmd.
                 analyzer_cmd = source_analyzer.construct_analyzer_cmd(rh)
 
+                if profile:
+                    profile.begin('analyzer without CTU')
+
+                analyzer_start = time.time()
+
                 # Fills up the result handler with
                 # the analyzer information.
-                source_analyzer.analyze(analyzer_cmd, rh)
+                with job_slot():
+                    source_analyzer.analyze(analyzer_cmd, rh)
+
+                if profile:
+                    profile.begin('post-processing')
+
+                source_analyzer.post_analyze(rh)
+
+                if action_stats['analyzer_time'] is not None:
+                    action_stats['analyzer_time'] += \
+                        time.time() - analyzer_start
 
                 return_codes = rh.analyzer_returncode
                 if rh.analyzer_returncode == 0:
@@ -638,8 +866,8 @@ def check(check_data):
 
         if not quiet_output_on_stdout:
             if rh.analyzer_returncode:
-                LOG.error('\n%s', rh.analyzer_stdout)
-                LOG.error('\n%s', rh.analyzer_stderr)
+                LOG.error('\n%s', rh.analyzer_stdout.summary())
+                LOG.error('\n%s', rh.analyzer_stderr.summary())
             else:
                 LOG.debug_analyzer('\n%s', rh.analyzer_stdout)
                 LOG.debug_analyzer('\n%s', rh.analyzer_stderr)
@@ -647,13 +875,19 @@ def check(check_data):
         PROGRESS_CHECKED_NUM.value += 1
 
         return return_codes, False, reanalyzed, action.analyzer_type, \
-            result_file, action.source
+            result_file, action.source, action_stats
 
     except Exception as e:
         LOG.debug(str(e))
         traceback.print_exc(file=sys.stdout)
         return 1, False, reanalyzed, action.analyzer_type, None, \
-            action.source
+            action.source, action_stats
+    finally:
+        if profile:
+            action_stats['profile'] = profile.finish(
+                rh, action_stats['peak_memory'], restored_from_cache)
+        if rh:
+            rh.cleanup_output()
 
 
 def skip_cpp(compile_actions, skip_handlers):
@@ -677,38 +911,11 @@ def skip_cpp(compile_actions, skip_handlers):
     return analyze, skip
 
 
-def start_workers(actions_map, actions, analyzer_config_map,
-                  jobs, output_path, skip_handlers, filter_handlers,
-                  rs_handler: ReviewStatusHandler, metadata_tool,
-                  quiet_analyze, capture_analysis_output, generate_reproducer,
-                  timeout, ctu_reanalyze_on_failure, statistics_data, manager,
-                  compile_cmd_count):
+def create_output_dirs(output_path, generate_reproducer):
     """
-    Start the workers in the process pool.
-    For every build action there is worker which makes the analysis.
+    Create the subdirectories of the output directory which are filled by
+    check().
     """
-    # Handle SIGINT to stop this script running.
-    def signal_handler(signum, _):
-        try:
-            pool.terminate()
-            pool.join()
-            manager.shutdown()
-        except Exception as e:
-            LOG.error("Failed to clean up after the pool!:\n")
-            LOG.error(e)
-            raise
-        finally:
-            sys.exit(128 + signum)
-
-    actions, skipped_actions = skip_cpp(actions, skip_handlers)
-    # Start checking parallel.
-    checked_var = multiprocess.Value('i', 1)
-    actions_num = multiprocess.Value('i', len(actions))
-    pool = multiprocess.Pool(jobs,
-                             initializer=init_worker,
-                             initargs=(checked_var, actions_num))
-    signal.signal(signal.SIGINT, signal_handler)
-
     # If the analysis has failed, we help debugging.
     failed_dir = os.path.join(output_path, "failed")
     if not os.path.exists(failed_dir):
@@ -734,70 +941,242 @@ def start_workers(actions_map, actions, analyzer_config_map,
     if not os.path.exists(ctu_connections_dir):
         os.makedirs(ctu_connections_dir)
 
+    # The content-addressed store of the source files of the debug zips. It
+    # is created when the first file is written to it.
+    blobs_dir = os.path.join(output_path, "blobs")
+
     output_dirs = {'success': success_dir,
                    'failed': failed_dir,
                    'reproducer': reproducer_dir,
-                   'ctu_connections': ctu_connections_dir}
+                   'ctu_connections': ctu_connections_dir,
+                   'blobs': blobs_dir}
 
-    @lru_cache
-    def __analyzer_config_map_get(analyzer_type):
-        """
-        analyzer_config_map is not a Dict, but multiprocess.managers.DictProxy,
-        so caching is necessary.
-        """
-        return analyzer_config_map.get(analyzer_type)
-
-    analyzed_actions = [(actions_map,
-                         build_action,
-                         __analyzer_config_map_get(build_action.analyzer_type),
-                         output_path,
-                         skip_handlers,
-                         filter_handlers,
-                         rs_handler,
-                         quiet_analyze,
-                         capture_analysis_output,
-                         generate_reproducer,
-                         timeout,
-                         ctu_reanalyze_on_failure,
-                         output_dirs,
-                         statistics_data)
-                        for build_action in actions]
-
-    if analyzed_actions:
-        try:
+    return output_dirs
 
-            # Workaround, equivalent of map.
-            # The main script does not get signal
-            # while map or map_async function is running.
-            # It is a python bug, this does not happen if a timeout is
-            # specified, then receive the interrupt immediately.
-
-            # FIXME: Ensure all shared data structures are wrapped in manager
-            #        proxy objects before passing them to other processes via
-            #        map_async.
-            #        Note that even deep-copying is known to be insufficient.
-            timeout = 3155760 if sys.platform == 'win32' else 31557600
-            pool.map_async(check,
-                           analyzed_actions,
-                           1,
-                           callback=lambda results: worker_result_handler(
-                               results, metadata_tool, output_path)
-                           ).get(timeout)
 
-            pool.close()
-        except Exception:
+def prune_blob_store(output_dirs):
+    """
+    Remove the files of the blob store of the debug zips which are not
+    referenced by any manifest file, e.g. because the build action was
+    analyzed successfully since then.
+    """
+    if not os.path.isdir(output_dirs['blobs']):
+        return
+
+    digests = set()
+    for manifest_dir in [output_dirs['failed'], output_dirs['reproducer']]:
+        for manifest_file in glob.glob(os.path.join(
+                manifest_dir, '*' + tu_collector.MANIFEST_SUFFIX)):
+            try:
+                _, files = tu_collector.read_manifest(manifest_file)
+            except (OSError, ValueError) as ex:
+                LOG.warning("Failed to read the manifest file %s: %s",
+                            manifest_file, ex)
+                # The files of an unknown manifest are kept.
+                return
+
+            digests.update(files.values())
+
+    blob_store = tu_collector.BlobStore(output_dirs['blobs'])
+    removed = blob_store.prune(digests)
+    if removed:
+        LOG.debug("Removed %d unreferenced file(s) from %s.", removed,
+                  blob_store.path)
+
+    if not digests:
+        shutil.rmtree(blob_store.path, ignore_errors=True)
+
+
+def start_workers(actions_map, actions, analyzer_config_map,
+                  jobs, output_path, skip_handlers, filter_handlers,
+                  rs_handler: ReviewStatusHandler, metadata_tool,
+                  quiet_analyze, capture_analysis_output, generate_reproducer,
+                  timeout, ctu_reanalyze_on_failure, statistics_data,
+                  compile_cmd_count, result_cache=None, memory_limit=None,
+                  coordinator=None, output_memory_limit=None,
+                  profile=False, jobserver=None,
+                  reproducer_blob_store=False):
+    """
+    Start the workers in the process pool.
+    For every build action there is worker which makes the analysis.
+
+    If memory_limit is given in bytes, the analyzers are started only while
+    their expected memory usage fits in it. The analyses which are killed
+    because the system ran out of memory are retried with less jobs.
+
+    If a distributed.Coordinator is given, the build actions are analyzed by
+    the remote workers connecting to it instead of a local process pool.
+
+    If output_memory_limit is given, at most this many characters of the
+    standard outputs of an analyzer process are kept in memory. The longer
+    outputs are spilled to files in the output directory.
+
+    If profile is True, the timing and the resource usage of the analysis of
+    every build action is saved into the metadata and into a trace file in
+    the output directory.
+
+    If a jobserver.JobServerClient is given, an analyzer process is started
+    only with a job slot of make.
+
+    If reproducer_blob_store is True, the source files of the debug zips are
+    written to a content-addressed store in the output directory and only a
+    manifest file is written for every debug zip.
+    """
+    # Handle SIGINT to stop this script running.
+    def signal_handler(signum, _):
+        try:
             pool.terminate()
+            pool.join()
+        except Exception as e:
+            LOG.error("Failed to clean up after the pool!:\n")
+            LOG.error(e)
             raise
         finally:
-            pool.join()
+            sys.exit(128 + signum)
+
+    actions, skipped_actions = skip_cpp(actions, skip_handlers)
+
+    output_dirs = create_output_dirs(output_path, generate_reproducer)
+    success_dir = output_dirs['success']
+    failed_dir = output_dirs['failed']
+
+    # Start the longest analyses first, so a long analysis doesn't extend
+    # the total analysis time at the end when the other workers are idle.
+    durations = analysis_scheduler.load_durations(output_path)
+    clangsa_config = analyzer_config_map.get(ClangSA.ANALYZER_NAME)
+    ctu_enabled = bool(clangsa_config and clangsa_config.ctu_dir)
+    actions = analysis_scheduler.order_by_expected_cost(
+        actions, durations, ctu_enabled)
+
+    peak_memory = analysis_scheduler.load_peak_memory(output_path)
+    memory_budget = None
+    if memory_limit:
+        memory_budget = MemoryBudget(
+            memory_limit,
+            get_default_estimate(peak_memory, memory_limit, jobs))
+
+    run_data = {'actions_map': actions_map,
+                'analyzer_config_map': analyzer_config_map,
+                'output_path': output_path,
+                'skip_handlers': skip_handlers,
+                'filter_handlers': filter_handlers,
+                'rs_handler': rs_handler,
+                'quiet_analyze': quiet_analyze,
+                'capture_analysis_output': capture_analysis_output,
+                'generate_reproducer': generate_reproducer,
+                'timeout': timeout,
+                'ctu_reanalyze_on_failure': ctu_reanalyze_on_failure,
+                'output_dirs': output_dirs,
+                'statistics_data': statistics_data,
+                'result_cache': result_cache,
+                'memory_budget': memory_budget,
+                'peak_memory': peak_memory if memory_budget else {},
+                'retry_killed_for_memory': jobs > 1,
+                'output_memory_limit':
+                    output_memory_limit or DEFAULT_MEMORY_LIMIT,
+                'profile': profile,
+                'submitted': time.time(),
+                'jobserver': jobserver,
+                'reproducer_blob_store': reproducer_blob_store}
+
+    # Start checking parallel. The shared counters are the only data which
+    # is modified by the workers.
+    checked_var = multiprocess.Value('i', 1)
+    actions_num = multiprocess.Value('i', len(actions))
+    cache_hits = multiprocess.Value('i', 0)
+    cache_misses = multiprocess.Value('i', 0)
+    if coordinator:
+        # The build actions are analyzed by the remote workers connecting to
+        # the coordinator.
+        if actions:
+            results = coordinator.run(actions, run_data)
+            worker_result_handler(results, metadata_tool, output_path,
+                                  durations, peak_memory)
+        else:
+            LOG.info("----==== Summary ====----")
     else:
-        pool.close()
-        pool.join()
-        LOG.info("----==== Summary ====----")
+        pool = multiprocess.Pool(jobs,
+                                 initializer=init_worker,
+                                 initargs=(checked_var, actions_num,
+                                           cache_hits, cache_misses, run_data))
+        signal.signal(signal.SIGINT, signal_handler)
+
+        if actions:
+            try:
+
+                # Workaround, equivalent of map.
+                # The main script does not get signal
+                # while map or map_async function is running.
+                # It is a python bug, this does not happen if a timeout is
+                # specified, then receive the interrupt immediately.
+
+                # The jobs contain only the build actions, everything else is
+                # given to the workers by init_worker().
+                timeout = 3155760 if sys.platform == 'win32' else 31557600
+                results = pool.map_async(check, actions, 1).get(timeout)
+
+                pool.close()
+            except Exception:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+
+            # The analyses killed for memory are retried when the others
+            # are finished, with halving the number of jobs in every round.
+            # They are considered failed if they are killed even when
+            # running alone.
+            retry_jobs = jobs
+            while True:
+                killed = [idx for idx, result in enumerate(results)
+                          if result[-1]['killed_for_memory']]
+                if not killed:
+                    break
+
+                retry_jobs = max(1, retry_jobs // 2)
+                LOG.warning("Retrying %d analyses killed for memory with %d "
+                            "job(s)...", len(killed), retry_jobs)
+
+                run_data['retry_killed_for_memory'] = retry_jobs > 1
+                run_data['submitted'] = time.time()
+                pool = multiprocess.Pool(retry_jobs,
+                                         initializer=init_worker,
+                                         initargs=(checked_var, actions_num,
+                                                   cache_hits, cache_misses,
+                                                   run_data))
+                try:
+                    retried = pool.map_async(
+                        check, [actions[idx] for idx in killed],
+                        1).get(timeout)
+
+                    pool.close()
+                except Exception:
+                    pool.terminate()
+                    raise
+                finally:
+                    pool.join()
+
+                for idx, result in zip(killed, retried):
+                    results[idx] = result
+
+            worker_result_handler(results, metadata_tool, output_path,
+                                  durations, peak_memory)
+        else:
+            pool.close()
+            pool.join()
+            LOG.info("----==== Summary ====----")
 
     for skp in skipped_actions:
         LOG.debug("%s is skipped", skp.source)
 
+    if result_cache:
+        LOG.info("Analysis result cache: %d hit(s), %d miss(es)",
+                 cache_hits.value, cache_misses.value)
+        metadata_tool['result_cache'] = {
+            'hits': cache_hits.value,
+            'misses': cache_misses.value}
+        result_cache.evict()
+
     LOG.info("Total analyzed compilation commands: %d",
              compile_cmd_count.analyze)
     # Some compile commands are skipped during log processing, if nothing
@@ -808,6 +1187,8 @@ def start_workers(actions_map, actions, analyzer_config_map,
                  compile_cmd_count.skipped + len(skipped_actions))
 
     LOG.info("----=================----")
+    prune_blob_store(output_dirs)
+
     if not os.listdir(success_dir):
         shutil.rmtree(success_dir)
 
@@ -0,0 +1,256 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Profile of the analysis of the build actions.
+
+If profiling is enabled, the analysis of every build action records the time
+it waited for a free worker, the phases of its analysis with their wall clock
+and CPU time, the peak memory usage of the analyzer and the size of its
+output. The profiles are saved into the metadata of the analysis, and they are
+written in the Chrome trace event format too, which shows the utilization of
+the workers over time in chrome://tracing or in https://ui.perfetto.dev.
+"""
+
+
+import json
+import os
+import time
+
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows.
+    resource = None  # type: ignore
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# The name of the trace file in the output directory.
+TRACE_FILE = 'profile.trace.json'
+
+# The phases in which the analyzer process is running.
+ANALYZER_PHASES = ('analyzer', 'analyzer without CTU')
+
+
+def get_children_cpu_time() -> float:
+    """
+    Returns the CPU time of the terminated child processes of this process in
+    seconds.
+    """
+    if resource is None:
+        return 0.0
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class ActionProfile:
+    """
+    Record the phases of the analysis of a build action in a worker process.
+    A phase lasts until the next one begins or the profile is finished.
+    """
+
+    def __init__(self, action, submitted: float):
+        """
+        action -- The analyzed build action.
+        submitted -- The time when the build action was handed out to the
+                     workers.
+        """
+        start = time.time()
+        self.__profile: Dict[str, Any] = {
+            'source': action.source,
+            'analyzer': action.analyzer_type,
+            'worker': os.getpid(),
+            'queue_wait': round(max(0.0, start - submitted), 6),
+            'start': start,
+            'phases': []}
+
+        self.__phase: Optional[Dict[str, Any]] = None
+        self.begin('setup')
+
+    def begin(self, name: str):
+        """ End the current phase and begin the one with the given name. """
+        self.__end_phase()
+        self.__phase = {'name': name,
+                        'start': time.time(),
+                        'cpu_time': get_children_cpu_time()}
+
+    def __end_phase(self):
+        if not self.__phase:
+            return
+
+        phase = self.__phase
+        phase['duration'] = round(time.time() - phase['start'], 6)
+        phase['cpu_time'] = \
+            round(get_children_cpu_time() - phase['cpu_time'], 6)
+        self.__profile['phases'].append(phase)
+        self.__phase = None
+
+    def finish(
+        self,
+        result_handler,
+        peak_memory: Optional[int],
+        cached: bool
+    ) -> Dict[str, Any]:
+        """
+        End the last phase and return the profile of the build action. The
+        profile contains only JSON serializable values.
+        """
+        self.__end_phase()
+
+        profile = self.__profile
+        phases = profile['phases']
+        profile['duration'] = round(time.time() - profile['start'], 6)
+        profile['analyzer_time'] = round(sum(
+            p['duration'] for p in phases if p['name'] in ANALYZER_PHASES), 6)
+        profile['analyzer_cpu_time'] = round(sum(
+            p['cpu_time'] for p in phases if p['name'] in ANALYZER_PHASES), 6)
+        profile['post_processing_time'] = round(sum(
+            p['duration'] for p in phases if p['name'] == 'post-processing'),
+            6)
+        profile['peak_memory'] = peak_memory
+        profile['cached'] = cached
+
+        output_size = {'result': 0, 'stdout': 0, 'stderr': 0}
+        if result_handler:
+            try:
+                output_size['result'] = \
+                    os.path.getsize(result_handler.analyzer_result_file)
+            except OSError:
+                pass
+            output_size['stdout'] = len(result_handler.analyzer_stdout)
+            output_size['stderr'] = len(result_handler.analyzer_stderr)
+        profile['output_size'] = output_size
+
+        return profile
+
+
+def summarize(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Returns the totals of the given action profiles and the utilization of
+    the workers, i.e. the ratio of the time they were analyzing a build
+    action.
+    """
+    if not profiles:
+        return {'actions': 0}
+
+    begin = min(p['start'] - p['queue_wait'] for p in profiles)
+    end = max(p['start'] + p['duration'] for p in profiles)
+    workers = {p['worker'] for p in profiles}
+    busy = sum(p['duration'] for p in profiles)
+
+    return {
+        'actions': len(profiles),
+        'workers': len(workers),
+        'wall_time': round(end - begin, 3),
+        'worker_utilization':
+            round(busy / (len(workers) * (end - begin)), 3)
+            if end > begin else 0.0,
+        'queue_wait': round(sum(p['queue_wait'] for p in profiles), 3),
+        'max_queue_wait': round(max(p['queue_wait'] for p in profiles), 3),
+        'analyzer_time': round(sum(p['analyzer_time'] for p in profiles), 3),
+        'analyzer_cpu_time':
+            round(sum(p['analyzer_cpu_time'] for p in profiles), 3),
+        'post_processing_time':
+            round(sum(p['post_processing_time'] for p in profiles), 3),
+        'max_peak_memory': max(p['peak_memory'] or 0 for p in profiles),
+        'output_size': sum(sum(p['output_size'].values())
+                           for p in profiles)}
+
+
+def to_trace_events(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert the action profiles to the Chrome trace event format. Every
+    worker process is a thread of the trace, the build actions and their
+    phases are complete events on them. The number of busy workers is a
+    counter of the trace.
+    """
+    if not profiles:
+        return {'traceEvents': [], 'displayTimeUnit': 'ms'}
+
+    begin = min(p['start'] - p['queue_wait'] for p in profiles)
+
+    def timestamp(t):
+        """ Microseconds since the beginning of the analysis. """
+        return round((t - begin) * 1e6)
+
+    events = []
+    workers = sorted({p['worker'] for p in profiles})
+    for idx, worker in enumerate(workers):
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': 0,
+                       'tid': worker,
+                       'args': {'name': f"worker {idx + 1} ({worker})"}})
+
+    busy_changes = []
+    for p in profiles:
+        events.append({
+            'name': f"{p['analyzer']} {os.path.basename(p['source'])}",
+            'cat': 'action',
+            'ph': 'X',
+            'pid': 0,
+            'tid': p['worker'],
+            'ts': timestamp(p['start']),
+            'dur': round(p['duration'] * 1e6),
+            'args': {key: p[key] for key in [
+                'source', 'analyzer', 'queue_wait', 'analyzer_time',
+                'analyzer_cpu_time', 'post_processing_time', 'peak_memory',
+                'output_size', 'cached']}})
+
+        for phase in p['phases']:
+            events.append({
+                'name': phase['name'],
+                'cat': 'phase',
+                'ph': 'X',
+                'pid': 0,
+                'tid': p['worker'],
+                'ts': timestamp(phase['start']),
+                'dur': round(phase['duration'] * 1e6),
+                'args': {'cpu_time': phase['cpu_time']}})
+
+        busy_changes.append((p['start'], 1))
+        busy_changes.append((p['start'] + p['duration'], -1))
+
+    busy = 0
+    for t, change in sorted(busy_changes):
+        busy += change
+        events.append({'name': 'busy workers', 'ph': 'C', 'pid': 0,
+                       'ts': timestamp(t), 'args': {'workers': busy}})
+
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def save(
+    profiles: List[Dict[str, Any]],
+    metadata_tool: Dict[str, Any],
+    output_path: str
+):
+    """
+    Save the action profiles and their summary into the metadata and write
+    them to the trace file of the output directory.
+    """
+    summary = summarize(profiles)
+    metadata_tool['profile'] = {'summary': summary,
+                                'actions': profiles}
+
+    trace_file = os.path.join(output_path, TRACE_FILE)
+    try:
+        with open(trace_file, 'w', encoding='utf-8', errors='ignore') as f:
+            json.dump(to_trace_events(profiles), f)
+    except OSError as err:
+        LOG.warning("Failed to write the analysis profile to %s: %s",
+                    trace_file, err)
+        return
+
+    LOG.info("Worker utilization: %.0f%%, total queue wait: %.1f sec.",
+             summary.get('worker_utilization', 0) * 100,
+             summary.get('queue_wait', 0))
+    LOG.info("Analysis profile is written to %s, open it in "
+             "https://ui.perfetto.dev or chrome://tracing.", trace_file)
@@ -0,0 +1,195 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Order the analysis jobs by their expected cost.
+
+The analysis of a long translation unit which is started last extends the
+wall-clock time of the whole analysis while the other workers are idle. For
+this reason the jobs are started in the order of their expected analysis time,
+the longest first. The expected time comes from the durations recorded by
+previous analyses in the report directory. For the build actions which were
+not analyzed before, the expected time is estimated from the size and the
+number of include directives of the source file.
+
+The peak memory usage of the analyses is recorded the same way, so the memory
+budget of the analysis can take it into account.
+"""
+
+
+import json
+import os
+import re
+import statistics
+
+from typing import Dict, List, Optional
+
+from codechecker_common.logger import get_logger
+
+from .util import analyzer_action_hash
+
+LOG = get_logger('analyzer')
+
+DURATIONS_FILE = 'analysis_durations.json'
+PEAK_MEMORY_FILE = 'analysis_peak_memory.json'
+
+# Only the beginning of the source files is read when the include directives
+# are counted, because these are usually at the top.
+INCLUDE_SCAN_SIZE = 64 * 1024
+
+INCLUDE_PATTERN = re.compile(rb'^\s*#\s*(include|import)\b', re.MULTILINE)
+
+# The number of analyzed actions used for converting the complexity
+# estimations to seconds.
+RATIO_SAMPLE_SIZE = 100
+
+
+def action_key(action) -> str:
+    """ Return a key which identifies the analysis of a build action. """
+    return action.analyzer_type + '_' + analyzer_action_hash(
+        action.source, action.directory, action.original_command)
+
+
+def mode_name(ctu: bool) -> str:
+    """ Name of the analysis mode in the durations file. """
+    return 'ctu' if ctu else 'non-ctu'
+
+
+def __load_records(records_file: str) -> Dict[str, Dict[str, float]]:
+    """
+    Load the records of the analyses from the given file. Returns an action
+    key -> analysis mode -> value dict.
+    """
+    if not os.path.exists(records_file):
+        return {}
+
+    try:
+        with open(records_file, encoding='utf-8', errors='ignore') as f:
+            records = json.load(f)
+    except (OSError, ValueError) as err:
+        LOG.debug("Failed to load analysis records from '%s': %s",
+                  records_file, err)
+        return {}
+
+    return records if isinstance(records, dict) else {}
+
+
+def __save_records(records_file: str, records: Dict[str, Dict[str, float]]):
+    """ Save the records of the analyses to the given file. """
+    try:
+        with open(records_file, 'w', encoding='utf-8',
+                  errors='ignore') as f:
+            json.dump(records, f)
+    except OSError as err:
+        LOG.debug("Failed to save analysis records to '%s': %s",
+                  records_file, err)
+
+
+def load_durations(output_path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Load the analysis durations recorded in the given report directory.
+    Returns an action key -> analysis mode -> duration in seconds dict.
+    """
+    return __load_records(os.path.join(output_path, DURATIONS_FILE))
+
+
+def save_durations(
+    output_path: str,
+    durations: Dict[str, Dict[str, float]]
+):
+    """ Save the analysis durations to the given report directory. """
+    __save_records(os.path.join(output_path, DURATIONS_FILE), durations)
+
+
+def load_peak_memory(output_path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Load the peak memory usage of the analyses recorded in the given report
+    directory. Returns an action key -> analysis mode -> bytes dict.
+    """
+    return __load_records(os.path.join(output_path, PEAK_MEMORY_FILE))
+
+
+def save_peak_memory(
+    output_path: str,
+    peak_memory: Dict[str, Dict[str, float]]
+):
+    """ Save the peak memory usage of the analyses. """
+    __save_records(os.path.join(output_path, PEAK_MEMORY_FILE), peak_memory)
+
+
+def estimate_complexity(source_file: str) -> float:
+    """
+    Estimate the complexity of a translation unit based on the size and
+    the number of include directives of its source file.
+    """
+    try:
+        size = os.path.getsize(source_file)
+        with open(source_file, 'rb') as f:
+            includes = len(INCLUDE_PATTERN.findall(f.read(INCLUDE_SCAN_SIZE)))
+    except OSError:
+        return 0.0
+
+    return float((size + 1) * (includes + 1))
+
+
+def get_recorded_value(
+    records: Dict[str, Dict[str, float]],
+    key: str,
+    ctu: bool
+) -> Optional[float]:
+    """
+    Return the recorded duration or memory usage of an action in the given
+    analysis mode. If the action was analyzed only in the other mode then
+    that value is returned, since it still tells more than a guess.
+    """
+    recorded = records.get(key)
+    if not recorded:
+        return None
+
+    value = recorded.get(mode_name(ctu))
+    if value is None:
+        value = recorded.get(mode_name(not ctu))
+
+    return value
+
+
+def order_by_expected_cost(
+    actions: List,
+    durations: Dict[str, Dict[str, float]],
+    ctu: bool
+) -> List:
+    """
+    Return the build actions in the order of their expected analysis time,
+    the longest first.
+    """
+    expected = {}
+    unseen = {}
+    for idx, action in enumerate(actions):
+        duration = get_recorded_value(durations, action_key(action), ctu)
+        if duration is None:
+            unseen[idx] = estimate_complexity(action.source)
+        else:
+            expected[idx] = duration
+
+    if unseen:
+        # Convert the complexity estimations to seconds by the median
+        # seconds / complexity ratio of some already analyzed actions.
+        ratios = []
+        for idx in list(expected)[:RATIO_SAMPLE_SIZE]:
+            complexity = estimate_complexity(actions[idx].source)
+            if complexity > 0:
+                ratios.append(expected[idx] / complexity)
+        ratio = statistics.median(ratios) if ratios else 1.0
+
+        for idx, complexity in unseen.items():
+            expected[idx] = complexity * ratio
+
+    LOG.debug("Expected analysis time is known for %d of %d actions.",
+              len(actions) - len(unseen), len(actions))
+
+    order = sorted(range(len(actions)), key=lambda idx: -expected[idx])
+    return [actions[idx] for idx in order]
@@ -14,12 +14,9 @@ from collections import defaultdict
 from string import Template
 import os
 import shutil
-import signal
 import sys
 import time
 
-from multiprocess.managers import SyncManager  # type: ignore
-
 from codechecker_common.logger import get_logger, DEBUG
 from codechecker_common.review_status_handler import ReviewStatusHandler
 
@@ -29,7 +26,10 @@ from .analyzers import analyzer_types
 from .analyzers.config_handler import AnalyzerConfigHandler, CheckerState
 from .analyzers.clangsa.analyzer import ClangSA
 
+from .distributed import Coordinator, read_auth_key
+from .jobserver import JobServerClient
 from .makefile import MakeFileCreator
+from .result_cache import ResultCache, get_analyzer_identity
 
 LOG = get_logger('analyzer')
 
@@ -47,10 +47,10 @@ def prepare_actions(actions, enabled_analyzers):
     return res
 
 
-def create_actions_map(actions, manager):
+def create_actions_map(actions):
     """
-    Create a dict for the build actions which is shareable
-    safely between processes.
+    Create a dict for the build actions. It is given to the worker processes
+    only once, when they are started, and it is never modified by them.
     Key: (source_file, target)
     Value: BuildAction
     """
@@ -65,17 +65,7 @@ def create_actions_map(actions, manager):
                       "with the same (source, target) pair: (%s, %s)",
                       act.source, act.target)
         result[key] = act
-    return manager.dict(result)
-
-
-def __mgr_init():
-    """
-    This function is set for the SyncManager object which handles shared data
-    structures among the processes of the pool. Ignoring the SIGINT signal is
-    necessary in the manager object so it doesn't terminate before the
-    termination of the process pool.
-    """
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    return result
 
 
 def __get_statistics_data(args):
@@ -114,14 +104,50 @@ def __get_statistics_data(args):
     return statistics_data
 
 
-def __get_ctu_data(ctu_dir):
+def __get_ctu_data(ctu_dir, ctu_incremental=False):
     """ Get CTU data. """
     tool_path, mapping_file = ClangSA.ctu_mapping()
     return {
         'ctu_dir': ctu_dir,
         'ctu_func_map_cmd': tool_path,
         'ctu_func_map_file': mapping_file,
-        'ctu_temp_fnmap_folder': 'tmpExternalFnMaps'}
+        'ctu_temp_fnmap_folder': 'tmpExternalFnMaps',
+        'ctu_incremental': ctu_incremental}
+
+
+def __get_result_cache(args, metadata_analyzers):
+    """ Get the analysis result cache if it is enabled. """
+    if 'result_cache_dir' not in args:
+        return None
+
+    max_size = None
+    if 'result_cache_max_size' in args:
+        max_size = args.result_cache_max_size * 1024 * 1024
+
+    analyzer_identities = {}
+    for analyzer, metadata_info in metadata_analyzers.items():
+        analyzer_identities[analyzer] = get_analyzer_identity(
+            analyzer_types.supported_analyzers[analyzer].analyzer_binary(),
+            metadata_info['analyzer_statistics']['version'])
+
+    return ResultCache(args.result_cache_dir, analyzer_identities, max_size)
+
+
+def __get_coordinator(args):
+    """ Get the coordinator of the distributed analysis if it is enabled. """
+    if 'coordinator_address' not in args:
+        return None
+
+    return Coordinator(args.coordinator_address,
+                       read_auth_key(args.auth_key_file))
+
+
+def __get_jobserver(args):
+    """ Get the client of the jobserver of make if it is enabled. """
+    if 'jobserver' not in args:
+        return None
+
+    return JobServerClient.from_environ()
 
 
 def __has_enabled_checker(ch: AnalyzerConfigHandler):
@@ -151,6 +177,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
 
     ctu_collect = False
     ctu_analyze = False
+    ctu_incremental = 'ctu_incremental' in args
     ctu_dir = ''
     if 'ctu_phases' in args:
         ctu_dir = os.path.join(args.output_path, 'ctu-dir')
@@ -304,7 +331,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
         makefile_creator.create(actions)
         return
 
-    if ctu_collect:
+    if ctu_collect and not ctu_incremental:
         shutil.rmtree(ctu_dir, ignore_errors=True)
     elif ctu_analyze and not os.path.exists(ctu_dir):
         LOG.error("CTU directory: '%s' does not exist.", ctu_dir)
@@ -312,23 +339,19 @@ def perform_analysis(args, skip_handlers, filter_handlers,
 
     start_time = time.time()
 
-    # Use Manager to create data objects which can be
-    # safely shared between processes.
-    manager = SyncManager()
-    manager.start(__mgr_init)
+    jobserver = __get_jobserver(args)
 
-    config_map = manager.dict(config_map)
-    actions_map = create_actions_map(actions, manager)
+    # The data of the analysis is read-only in the worker processes, so it
+    # is copied to them once, when the process pools are started.
+    actions_map = create_actions_map(actions)
 
     # Setting to not None value will enable statistical analysis features.
     statistics_data = __get_statistics_data(args)
-    if statistics_data:
-        statistics_data = manager.dict(statistics_data)
 
     if ctu_collect or statistics_data:
         ctu_data = None
         if ctu_collect or ctu_analyze:
-            ctu_data = manager.dict(__get_ctu_data(ctu_dir))
+            ctu_data = __get_ctu_data(ctu_dir, ctu_incremental)
 
         pre_analyze = [a for a in actions
                        if a.analyzer_type == ClangSA.ANALYZER_NAME]
@@ -349,7 +372,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                                                   pre_anal_skip_handlers,
                                                   ctu_data,
                                                   statistics_data,
-                                                  manager)
+                                                  jobserver)
         else:
             LOG.error("Can not run pre analysis without clang "
                       "static analyzer configuration.")
@@ -358,7 +381,7 @@ def perform_analysis(args, skip_handlers, filter_handlers,
         return
 
     if 'stats_dir' in args and args.stats_dir:
-        statistics_data = manager.dict({'stats_out_dir': args.stats_dir})
+        statistics_data = {'stats_out_dir': args.stats_dir}
 
     if ctu_analyze or statistics_data or (not ctu_analyze and not ctu_collect):
 
@@ -377,8 +400,19 @@ def perform_analysis(args, skip_handlers, filter_handlers,
                                        else None,
                                        ctu_reanalyze_on_failure,
                                        statistics_data,
-                                       manager,
-                                       compile_cmd_count)
+                                       compile_cmd_count,
+                                       __get_result_cache(
+                                           args, metadata_tool['analyzers']),
+                                       args.memory_budget * 1024 * 1024
+                                       if 'memory_budget' in args else None,
+                                       __get_coordinator(args),
+                                       args.analyzer_output_memory_limit *
+                                       1024 * 1024
+                                       if 'analyzer_output_memory_limit'
+                                       in args else None,
+                                       'profile_analysis' in args,
+                                       jobserver,
+                                       'reproducer_blob_store' in args)
         LOG.info("Analysis finished.")
         LOG.info("To view results in the terminal use the "
                  "\"CodeChecker parse\" command.")
@@ -396,7 +430,5 @@ def perform_analysis(args, skip_handlers, filter_handlers,
     metadata_tool['timestamps'] = {'begin': start_time,
                                    'end': end_time}
 
-    if ctu_collect and ctu_analyze:
+    if ctu_collect and ctu_analyze and not ctu_incremental:
         shutil.rmtree(ctu_dir, ignore_errors=True)
-
-    manager.shutdown()
@@ -21,7 +21,7 @@ from codechecker_common import logger
 from codechecker_common.checker_labels import CheckerLabels
 from codechecker_common.guidelines import Guidelines
 from codechecker_common.singleton import Singleton
-from codechecker_common.util import load_json
+from codechecker_common.util import get_user_cache_dir, load_json
 from pathlib import Path
 
 from . import env
@@ -62,7 +62,9 @@ class Context(metaclass=Singleton):
         lcfg_dict = self.__get_package_layout()
         self.pckg_layout = lcfg_dict['runtime']
 
-        self._checker_labels = CheckerLabels(labels_dir)
+        self._checker_labels = CheckerLabels(
+            labels_dir,
+            os.path.join(get_user_cache_dir(), 'checker-labels'))
         self._guidelines = Guidelines(guidelines_dir)
         self.__package_version = None
         self.__package_build_date = None
@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Persistent, per-user cache of the information which is queried from the
+analyzer binaries (version, checker list, checker and analyzer options,
+supported features).
+
+Querying this information spawns the analyzer binaries several times for every
+CodeChecker command. The parsed results are stored in the cache directory, and
+they are reused by the later commands until the analyzer binary changes. A
+binary is identified by its real path, size and modification time.
+"""
+
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from typing import Any, Callable, List, Optional, Set
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import get_user_cache_dir, load_json
+
+LOG = get_logger('analyzer')
+
+# Increase this number if the format of the cached information changes, so
+# the entries created by an older CodeChecker are not used anymore.
+CACHE_VERSION = 1
+
+
+class AnalyzerInfoCache:
+    """
+    The settings of the analyzer info cache which are shared by the
+    analyzer classes of a CodeChecker command.
+    """
+
+    # Directory of the cache. None means the default location is used.
+    cache_dir: Optional[str] = None
+
+    # If True, the cached entries are not used but they are overwritten by
+    # the results of querying the analyzer binaries again.
+    refresh: bool = False
+
+    # The cache files which have been refreshed by this process already.
+    refreshed: Set[str] = set()
+
+
+def get_cache_dir() -> str:
+    """
+    Return the directory of the analyzer info cache. The default location is
+    the CodeChecker directory of the user's cache directory.
+    """
+    if AnalyzerInfoCache.cache_dir:
+        return AnalyzerInfoCache.cache_dir
+
+    return os.path.join(get_user_cache_dir(), 'analyzer-info')
+
+
+def set_refresh(refresh: bool):
+    """
+    Query the analyzers again instead of using the cached information if
+    refresh is True. The new results replace the cached ones.
+    """
+    AnalyzerInfoCache.refresh = refresh
+    AnalyzerInfoCache.refreshed = set()
+
+
+def get_file_identity(path: Optional[str]) -> Optional[List]:
+    """
+    Return the real path, size and modification time of the given file or
+    None if it doesn't exist.
+    """
+    if not path:
+        return None
+
+    real_path = os.path.realpath(path)
+    try:
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+
+    return [real_path, stat.st_size, stat.st_mtime_ns]
+
+
+def __get_cache_file(binary_identity: List, key: List) -> str:
+    """ Returns the file of the given key in the analyzer info cache. """
+    cache_key = json.dumps([CACHE_VERSION, binary_identity, key])
+
+    return os.path.join(
+        get_cache_dir(),
+        hashlib.sha256(cache_key.encode(errors='ignore')).hexdigest() +
+        '.json')
+
+
+def __load_cached(cache_file: str) -> Optional[dict]:
+    """ Load an analyzer info entry from the cache. """
+    entry = load_json(cache_file, display_warning=False)
+    return entry if isinstance(entry, dict) and 'value' in entry else None
+
+
+def __store_cached(cache_file: str, value: Any):
+    """
+    Store an analyzer info entry in the cache. The file is written
+    atomically, since other processes may read it at the same time.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', errors='ignore', delete=False,
+                dir=os.path.dirname(cache_file), suffix='.tmp') as f:
+            json.dump({'value': value}, f)
+        os.replace(f.name, cache_file)
+    except OSError as err:
+        LOG.debug("Failed to write analyzer info cache file %s: %s",
+                  cache_file, err)
+
+
+def cached(
+    binary: Optional[str],
+    key: List,
+    query: Callable[[], Any],
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Any:
+    """
+    Return the result of query() which gets some information from the given
+    analyzer binary. The result is taken from the cache if the same key was
+    queried from the same binary earlier, otherwise the result is stored in
+    the cache.
+
+    key -- A JSON serializable list which identifies the queried information
+           of the binary, e.g. the command line arguments.
+    query -- A function returning a JSON serializable result. If it raises an
+             exception, nothing is stored in the cache and the exception is
+             propagated, so failures are not remembered.
+    cache_if -- If given, the result is stored in the cache only if this
+                function returns True for it. E.g. a negative result which
+                may depend on the environment of the binary can be checked
+                again next time.
+
+    The result goes through a JSON round trip, so tuples are returned as
+    lists.
+    """
+    binary_identity = get_file_identity(shutil.which(binary or ''))
+    if not binary_identity:
+        return query()
+
+    cache_file = __get_cache_file(binary_identity, key)
+
+    if not AnalyzerInfoCache.refresh or \
+            cache_file in AnalyzerInfoCache.refreshed:
+        entry = __load_cached(cache_file)
+        if entry is not None:
+            LOG.debug("Analyzer info %s of %s is loaded from %s",
+                      key, binary, cache_file)
+            return entry['value']
+
+    value = query()
+
+    # The result of the first query has the same types as the cached ones.
+    value = json.loads(json.dumps(value))
+
+    if cache_if is None or cache_if(value):
+        __store_cached(cache_file, value)
+        AnalyzerInfoCache.refreshed.add(cache_file)
+
+    return value
@@ -17,12 +17,15 @@ import signal
 import subprocess
 import sys
 import shlex
+import threading
 
 from typing import List, Optional
 
 from codechecker_analyzer import analyzer_context
 from codechecker_common.logger import get_logger
 
+from .analyzer_output import AnalyzerOutput, CHUNK_SIZE
+
 LOG = get_logger('analyzer')
 
 
@@ -129,14 +132,20 @@ class SourceAnalyzer(metaclass=ABCMeta):
 
         res_handler.analyzer_cmd = analyzer_cmd
         try:
-            ret_code, stdout, stderr \
-                = SourceAnalyzer.run_proc(analyzer_cmd,
-                                          res_handler.buildaction.directory,
-                                          proc_callback,
-                                          env)
-            res_handler.analyzer_returncode = ret_code
+            # The outputs are spilled to the workspace if they are too long
+            # to be kept in memory.
+            stdout = AnalyzerOutput(res_handler.output_memory_limit,
+                                    res_handler.workspace)
+            stderr = AnalyzerOutput(res_handler.output_memory_limit,
+                                    res_handler.workspace)
+            res_handler.cleanup_output()
             res_handler.analyzer_stdout = stdout
             res_handler.analyzer_stderr = stderr
+
+            ret_code = SourceAnalyzer.run_proc_streamed(
+                analyzer_cmd, stdout, stderr,
+                res_handler.buildaction.directory, proc_callback, env)
+            res_handler.analyzer_returncode = ret_code
             return res_handler
 
         except Exception as ex:
@@ -171,6 +180,27 @@ class SourceAnalyzer(metaclass=ABCMeta):
         Run immediately after the analyze function.
         """
 
+    def get_cacheable_output_files(
+        self,
+        result_handler
+    ) -> Optional[List[str]]:
+        """
+        Return the files written by the analyzer process which are needed to
+        post-process its results. Together with the standard outputs these
+        are stored in the analysis result cache.
+        None means that the results of this analyzer can't be cached.
+        """
+
+    def get_implicit_config_files(self, analyzer_cmd: List[str]) -> List[str]:
+        """
+        Return the paths of the configuration files which the analyzer reads
+        without being given in the analyzer command. These files don't need
+        to exist, the analyzer reads them only if they do. The result cache
+        takes their content into account.
+        """
+        # pylint: disable=unused-argument
+        return []
+
     @staticmethod
     def run_proc(command, cwd=None, proc_callback=None, env=None):
         """
@@ -182,6 +212,47 @@ class SourceAnalyzer(metaclass=ABCMeta):
         based on the location of the called binary.
         """
 
+        proc = SourceAnalyzer.__start_proc(command, cwd, proc_callback, env)
+
+        stdout, stderr = proc.communicate()
+        return proc.returncode, stdout, stderr
+
+    @staticmethod
+    def run_proc_streamed(command, stdout: AnalyzerOutput,
+                          stderr: AnalyzerOutput, cwd=None,
+                          proc_callback=None, env=None):
+        """
+        Run the given command and return its return code. The standard output
+        and standard error of the process are written to the given objects
+        while the process is running, instead of collecting them in strings.
+        """
+        proc = SourceAnalyzer.__start_proc(command, cwd, proc_callback, env)
+
+        def read(stream, output):
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), ''):
+                output.write(chunk)
+            output.close()
+
+        # Both pipes have to be read at the same time, otherwise the process
+        # may block on writing one of them.
+        stderr_reader = threading.Thread(target=read,
+                                         args=(proc.stderr, stderr),
+                                         daemon=True)
+        stderr_reader.start()
+        read(proc.stdout, stdout)
+        stderr_reader.join()
+
+        proc.stdout.close()
+        proc.stderr.close()
+        return proc.wait()
+
+    @staticmethod
+    def __start_proc(command, cwd, proc_callback, env):
+        """
+        Start the given command with its standard outputs redirected to
+        pipes.
+        """
+
         def signal_handler(signum, _):
             # Clang does not kill its child processes, so I have to.
             try:
@@ -216,5 +287,4 @@ class SourceAnalyzer(metaclass=ABCMeta):
         if proc_callback:
             proc_callback(proc)
 
-        stdout, stderr = proc.communicate()
-        return proc.returncode, stdout, stderr
+        return proc
@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Bounded-memory storage of the standard output and standard error of the
+analyzer processes.
+
+Some analyzers, e.g. Clang-Tidy with a noisy configuration, can emit hundreds
+of megabytes for a single translation unit. The output is kept in memory only
+up to a limit, the longer outputs are spilled to a file and they are read back
+line by line or in chunks by the consumers.
+"""
+
+
+import os
+import tempfile
+
+from typing import IO, Iterator, List, Optional, TextIO
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# The default number of characters of an analyzer output which are kept in
+# memory.
+DEFAULT_MEMORY_LIMIT = 8 * 1024 * 1024
+
+# The maximal length of the output in summary(), e.g. in the log messages and
+# the error files of the failed analyses.
+SUMMARY_LENGTH = 1024 * 1024
+
+CHUNK_SIZE = 1 << 20
+
+
+class AnalyzerOutput:
+    """
+    Standard output or standard error of an analyzer process.
+
+    At most memory_limit characters are kept in memory. If the output is
+    longer and a spill directory is given, the whole output is moved to a
+    spill file in that directory and the rest of it is written there too.
+    The spill file is removed by cleanup().
+    """
+
+    def __init__(
+        self,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        spill_dir: Optional[str] = None,
+        text: str = ''
+    ):
+        self.__memory_limit = memory_limit
+        self.__spill_dir = spill_dir
+
+        # A text which is written before the output, e.g. a message about
+        # the timeout of the analysis.
+        self.__prefix = ''
+
+        self.__chunks: List[str] = []
+        self.__length = 0
+
+        self.__spill_file: Optional[str] = None
+        self.__spill: Optional[TextIO] = None
+
+        self.write(text)
+
+    @property
+    def spill_file(self) -> Optional[str]:
+        """ The file containing the output if it didn't fit in memory. """
+        return self.__spill_file
+
+    def __len__(self) -> int:
+        return len(self.__prefix) + self.__length
+
+    def __str__(self) -> str:
+        """
+        Returns the whole output. Use splitlines(), chunks() or summary() if
+        the output may be long.
+        """
+        return ''.join(self.chunks())
+
+    def write(self, text: str):
+        """ Append the given text to the output. """
+        if not text:
+            return
+
+        self.__length += len(text)
+
+        if self.__spill:
+            self.__spill.write(text)
+            return
+
+        self.__chunks.append(text)
+        if self.__spill_dir and self.__length > self.__memory_limit:
+            self.__start_spill()
+
+    def copy_from(self, stream: IO[str]):
+        """ Append the content of the given text stream to the output. """
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), ''):
+            self.write(chunk)
+
+    def prepend(self, text: str):
+        """ Write the given text before the output. """
+        self.__prefix = text + self.__prefix
+
+    def close(self):
+        """
+        Finish writing the output. The spill file is flushed, so it can be
+        read.
+        """
+        if self.__spill:
+            self.__spill.close()
+            self.__spill = None
+
+    def cleanup(self):
+        """ Remove the spill file. The output can't be read after this. """
+        self.close()
+
+        if self.__spill_file:
+            try:
+                os.remove(self.__spill_file)
+            except OSError as err:
+                LOG.debug("Failed to remove %s: %s", self.__spill_file, err)
+            self.__spill_file = None
+
+    def __start_spill(self):
+        """ Move the output from the memory to a spill file. """
+        try:
+            fd, spill_file = tempfile.mkstemp(
+                prefix='analyzer-output-', suffix='.tmp',
+                dir=self.__spill_dir)
+            self.__spill = open(fd, 'w', encoding='utf-8', errors='ignore',
+                                newline='')
+        except OSError as err:
+            LOG.warning("Failed to create a file for the analyzer output in "
+                        "%s, it is kept in memory: %s", self.__spill_dir, err)
+            self.__spill_dir = None
+            return
+
+        self.__spill_file = spill_file
+        self.__spill.writelines(self.__chunks)
+        self.__chunks = []
+
+    def chunks(self) -> Iterator[str]:
+        """ Iterate over the output in chunks of limited size. """
+        if self.__prefix:
+            yield self.__prefix
+
+        if not self.__spill_file:
+            yield from self.__chunks
+            return
+
+        if self.__spill:
+            self.__spill.flush()
+
+        with open(self.__spill_file, encoding='utf-8', errors='ignore',
+                  newline='') as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), '')
+
+    def splitlines(self) -> Iterator[str]:
+        """
+        Iterate over the lines of the output without line endings like
+        str.splitlines(), but the output is not read into memory at once.
+        """
+        rest = ''
+        for chunk in self.chunks():
+            # The last line may continue in the next chunk, even if it ends
+            # in '\r' which may be followed by '\n'.
+            lines = (rest + chunk).splitlines(keepends=True)
+            rest = lines.pop() if lines else ''
+
+            yield from ''.join(lines).splitlines()
+
+        yield from rest.splitlines()
+
+    def copy_to(self, stream: IO[str]):
+        """ Write the output to the given text stream. """
+        for chunk in self.chunks():
+            stream.write(chunk)
+
+    def encoded_chunks(self) -> Iterator[bytes]:
+        """ Returns the output in UTF-8 encoded chunks. """
+        for chunk in self.chunks():
+            yield chunk.encode('utf-8', errors='ignore')
+
+    def summary(self, max_length: int = SUMMARY_LENGTH) -> str:
+        """
+        Returns the output if it is not longer than max_length. Otherwise the
+        beginning and the end of the output is returned with a note about the
+        omitted part.
+        """
+        length = len(self)
+        if length <= max_length:
+            return str(self)
+
+        head_length = max_length // 2
+        head: List[str] = []
+        tail: List[str] = []
+        position = 0
+        for chunk in self.chunks():
+            if position < head_length:
+                head.append(chunk[:head_length - position])
+
+            tail_start = length - (max_length - head_length) - position
+            if tail_start < len(chunk):
+                tail.append(chunk[max(tail_start, 0):])
+
+            position += len(chunk)
+
+        omitted = length - max_length
+        return f"{''.join(head)}\n" \
+            f"... [{omitted} characters of the output are omitted] ...\n" \
+            f"{''.join(tail)}"
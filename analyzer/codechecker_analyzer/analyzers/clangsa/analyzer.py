@@ -11,7 +11,6 @@ Clang Static Analyzer related functions.
 
 import os
 from pathlib import Path
-import plistlib
 import re
 import subprocess
 import sys
@@ -22,7 +21,8 @@ from semver.version import Version
 from codechecker_common import util
 from codechecker_common.logger import get_logger
 
-from codechecker_analyzer import analyzer_context, env, host_check
+from codechecker_analyzer import analyzer_context, analyzer_info_cache, \
+    env, host_check
 from codechecker_statistics_collector.collectors.special_return_value import \
     SpecialReturnValueCollector
 from codechecker_statistics_collector.collectors.return_value import \
@@ -55,20 +55,14 @@ def clang_command_output(command: List[str]) -> str:
         errors="ignore")
 
 
-def parse_clang_help_page(
-    command: List[str],
+def __parse_help_page(
+    help_page: str,
     start_label: str
 ) -> List[Tuple[str, str]]:
     """
     Parse the clang help page starting from a specific label.
     Returns a list of (flag, description) tuples.
     """
-    try:
-        help_page = clang_command_output(command)
-    except (subprocess.CalledProcessError, OSError):
-        LOG.debug("Failed to run '%s' command!", command)
-        return []
-
     try:
         help_page = help_page[help_page.index(start_label) + len(start_label):]
     except ValueError:
@@ -109,6 +103,34 @@ def parse_clang_help_page(
     return res
 
 
+def parse_clang_help_page(
+    command: List[str],
+    start_label: str
+) -> List[Tuple[str, str]]:
+    """
+    Parse the clang help page starting from a specific label.
+    Returns a list of (flag, description) tuples.
+
+    The result is stored in the analyzer info cache, keyed by the command and
+    the checker plugins loaded by it.
+    """
+    plugins = [command[i + 1] for i, arg in enumerate(command[:-1])
+               if arg == '-load']
+    key = ['help-page', command[1:], start_label,
+           [analyzer_info_cache.get_file_identity(p) for p in plugins]]
+
+    try:
+        res = analyzer_info_cache.cached(
+            command[0], key,
+            lambda: __parse_help_page(clang_command_output(command),
+                                      start_label))
+    except (subprocess.CalledProcessError, OSError):
+        LOG.debug("Failed to run '%s' command!", command)
+        return []
+
+    return [tuple(item) for item in res]
+
+
 def _is_user_disabled_checker(checker, ordered_checkers):
     """
     This function returns True if the given checker is disabled by the user
@@ -206,11 +228,13 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         version = [cls.analyzer_binary(), '-dumpversion']
 
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_info_cache.cached(
+                cls.analyzer_binary(), version[1:],
+                lambda: subprocess.check_output(version,
+                                                env=environ,
+                                                universal_newlines=True,
+                                                encoding="utf-8",
+                                                errors="ignore"))
             return ClangSA.parse_version(output)
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -285,9 +309,12 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         if not tool_path:
             return False
 
-        try:
+        def query():
             clang_command_output([tool_path, '-version'])
             return True
+
+        try:
+            return analyzer_info_cache.cached(tool_path, ['-version'], query)
         except (subprocess.CalledProcessError, OSError):
             return False
 
@@ -298,11 +325,9 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         CTU analysis.
         """
         try:
-            analyzer_options = clang_command_output([
-                cls.analyzer_binary(), '-cc1', '-analyzer-config-help'])
-
-            return 'ctu-invocation-list' in analyzer_options
-        except (subprocess.CalledProcessError, OSError):
+            return host_check.has_analyzer_config_option(
+                cls.analyzer_binary(), 'ctu-invocation-list')
+        except OSError:
             return False
 
     @classmethod
@@ -356,6 +381,24 @@ class ClangSA(analyzer_base.SourceAnalyzer):
 
         self.__checker_configs.append(checker_cfg)
 
+    @classmethod
+    def __get_cc1_options(cls, options: List[str]) -> List[str]:
+        """
+        Return the given options which are listed on the help page of the
+        clang frontend.
+        """
+        def query():
+            help_page = clang_command_output([
+                cls.analyzer_binary(), "-cc1", "--help"])
+
+            return [option for option in options if option in help_page]
+
+        try:
+            return analyzer_info_cache.cached(
+                cls.analyzer_binary(), ['cc1-help', options], query)
+        except (subprocess.CalledProcessError, OSError):
+            return []
+
     @classmethod
     def get_analyzer_checkers(
         cls,
@@ -381,16 +424,14 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         # this early return can be removed.
         version_info = cls.get_binary_version()
         if version_info:
-            try:
-                help_page = clang_command_output([
-                    cls.analyzer_binary(), "-cc1", "--help"])
-            except (subprocess.CalledProcessError, OSError):
-                help_page = ""
+            help_options = cls.__get_cc1_options([
+                "-analyzer-checker-help-alpha",
+                "-analyzer-checker-help-developer"])
 
-            if alpha and "-analyzer-checker-help-alpha" in help_page:
+            if alpha and "-analyzer-checker-help-alpha" in help_options:
                 command.append("-analyzer-checker-help-alpha")
 
-            if debug and "-analyzer-checker-help-developer" in help_page:
+            if debug and "-analyzer-checker-help-developer" in help_options:
                 command.append("-analyzer-checker-help-developer")
 
         return parse_clang_help_page(command, 'CHECKERS:')
@@ -411,17 +452,11 @@ class ClangSA(analyzer_base.SourceAnalyzer):
 
         version_info = cls.get_binary_version()
         if version_info:
-            try:
-                help_page = clang_command_output([
-                    cls.analyzer_binary(), "-cc1", "--help"])
-            except (subprocess.CalledProcessError, OSError):
-                help_page = ""
+            help_options = cls.__get_cc1_options([
+                "-analyzer-checker-option-help-alpha",
+                "-analyzer-checker-option-help-developer"])
 
-            if "-analyzer-checker-option-help-alpha" in help_page:
-                command.append("-analyzer-checker-option-help-alpha")
-
-            if "-analyzer-checker-option-help-developer" in help_page:
-                command.append("-analyzer-checker-option-help-developer")
+            command.extend(help_options)
 
         result = []
         for cfg, doc in parse_clang_help_page(command, 'OPTIONS:'):
@@ -450,38 +485,18 @@ class ClangSA(analyzer_base.SourceAnalyzer):
         """
         Disabled checkers are not actually disabled during analysis, because
         they might rely on each other under the hood. The disabled checkers'
-        reports are removed in this post-processing step.
+        reports are removed by the result handler, when the .plist file is
+        post-processed, so the file is parsed and written only once.
         """
-        try:
-            if not os.path.isfile(result_handler.analyzer_result_file):
-                # This check has the same race-condition reason as the
-                # exception, so see its description below.
-                return
-
-            with open(result_handler.analyzer_result_file, 'rb') as f:
-                plist = plistlib.load(f)
-        except plistlib.InvalidFileException:
-            # It may happen that a compilation database contains a build action
-            # multiple times (because it is compiled for several target
-            # architectures), or at least they differ in a so minor part that
-            # the same .plist file belongs to them. (For further details see
-            # analyzer_action_str() in ResultHandler about the strange behavior
-            # of make 4.3 in its -o flag.)
-            # If this happens then the analysis of the same build action is
-            # analyzed in parallel several times, so the same output .plist
-            # file is changed by several threads. This may result an invalid
-            # .plist which fails plistlib.load(). This is not a big problem,
-            # because the second thread will also execute this post-processing
-            # and it happens rarely anyways. test_compile_uniqueing() fails
-            # undeterministically without this.
-            return
-
-        plist['diagnostics'] = list(filter(
-            lambda diag: diag['check_name'] not in self.__disabled_checkers,
-            plist.get('diagnostics', [])))
-
-        with open(result_handler.analyzer_result_file, 'wb') as f:
-            plistlib.dump(plist, f)
+        result_handler.disabled_checkers = set(self.__disabled_checkers)
+
+    def get_cacheable_output_files(self, result_handler):
+        """
+        The raw .plist output is cached, so the disabled checkers are
+        filtered by the result handler even if the result comes from the
+        cache.
+        """
+        return [result_handler.analyzer_result_file]
 
     def construct_analyzer_cmd(self, result_handler):
         """
@@ -11,12 +11,15 @@ Arranges the 1st phase of 2 phase executions for CTU
 
 
 import glob
+import hashlib
+import json
 import yaml
 import os
 import shutil
 import tempfile
 from pathlib import Path
 from sys import maxsize
+from typing import Dict, Iterable, Optional, Set, Tuple
 from yaml import Dumper
 
 from codechecker_common.logger import get_logger
@@ -24,11 +27,21 @@ from codechecker_common.logger import get_logger
 from codechecker_merge_clang_extdef_mappings.merge_clang_extdef_mappings \
     import merge
 
+from ...result_cache import file_content_hash, get_analyzer_identity
 from .. import analyzer_base
 from . import ctu_triple_arch
 
 LOG = get_logger('analyzer')
 
+# Increase this number if the layout of the collect manifests changes, so the
+# CTU files collected by an older CodeChecker are regenerated.
+COLLECT_MANIFEST_VERSION = 1
+
+# The manifests of the CTU files collected for the translation units are
+# stored in this folder of the triple arch directories if the CTU files are
+# kept for the next analysis.
+COLLECT_MANIFEST_FOLDER = 'collect-manifests'
+
 
 # The inheritence comes from the YAML parser, we can't solve it with less
 # ancestors.
@@ -46,8 +59,13 @@ class LLVMComatibleYamlDumper(Dumper):
 
 
 def merge_clang_extdef_mappings(ctu_dir, ctu_func_map_file,
-                                ctu_temp_fnmap_folder):
-    """ Merge individual function maps into a global one."""
+                                ctu_temp_fnmap_folder, jobs=1,
+                                keep_fnmaps=False):
+    """ Merge individual function maps into a global one.
+
+    If keep_fnmaps is True, the individual function maps are not removed, so
+    the global map can be updated by the next analysis.
+    """
 
     triple_arches = glob.glob(os.path.join(ctu_dir, '*'))
     for triple_path in triple_arches:
@@ -60,7 +78,10 @@ def merge_clang_extdef_mappings(ctu_dir, ctu_func_map_file,
 
         merged_fn_map = os.path.join(ctu_dir, triple_arch,
                                      ctu_func_map_file)
-        merge(fnmap_dir, merged_fn_map)
+        merge(fnmap_dir, merged_fn_map, jobs)
+
+        if keep_fnmaps:
+            continue
 
         # Remove all temporary files.
         shutil.rmtree(fnmap_dir, ignore_errors=True)
@@ -134,6 +155,9 @@ def generate_ast(triple_arch, action, source, config):
     if ret_code != 0:
         LOG.error("Error generating AST.\n\ncommand:\n\n%s\n\nstderr:\n\n%s",
                   cmdstr, err)
+        return False
+
+    return True
 
 
 def ast_dump_path(source_path):
@@ -190,12 +214,16 @@ def get_extdef_mapping_cmd(action, config, source, func_map_cmd):
 
 
 def map_functions(triple_arch, action, source, config,
-                  func_map_cmd, temp_fnmap_folder):
+                  func_map_cmd, temp_fnmap_folder, fnmap_name=None):
     """ Generate function map file for the current source.
 
         On-demand CTU analysis requires the *mangled name* to *source file*
         mapping. However in case of pre-processed ast-dumps, *mangled name* to
         *ast dump* mapping must be provided.
+
+        The function map is written into a temporary file, or into fnmap_name
+        in the temporary folder if it is given, so the function map of the
+        source is replaced when it is generated again.
     """
 
     cmd = get_extdef_mapping_cmd(action, config, source, func_map_cmd)
@@ -207,7 +235,7 @@ def map_functions(triple_arch, action, source, config,
     if ret_code != 0:
         LOG.error("Error generating function map."
                   "\n\ncommand:\n\n%s\n\nstderr:\n\n%s", cmdstr, err)
-        return
+        return False
 
     func_src_list = stdout.splitlines()
     func_ast_list = func_map_list_src_to_ast(
@@ -220,9 +248,217 @@ def map_functions(triple_arch, action, source, config,
         except OSError:
             pass
 
-    if func_ast_list:
+    if fnmap_name:
+        fnmap_file = os.path.join(extern_fns_map_folder, fnmap_name)
+        if func_ast_list:
+            with open(fnmap_file, 'w', encoding='utf-8',
+                      errors='ignore') as out_file:
+                out_file.write("\n".join(func_ast_list) + "\n")
+        elif os.path.exists(fnmap_file):
+            os.remove(fnmap_file)
+    elif func_ast_list:
         with tempfile.NamedTemporaryFile(mode='w',
                                          dir=extern_fns_map_folder,
                                          delete=False,
                                          encoding='utf-8') as out_file:
             out_file.write("\n".join(func_ast_list) + "\n")
+
+    return True
+
+
+def get_collect_entry_id(source: str, key: str) -> str:
+    """
+    Returns the identifier of the CTU files collected for a source file by a
+    build action with the given collect key. A source file which is built by
+    several build actions has a manifest and a function map for each of
+    them, but it has one AST dump in a triple arch directory.
+    """
+    return hashlib.sha256(
+        f"{os.path.realpath(source)}\0{key}".encode(errors='ignore')) \
+        .hexdigest()
+
+
+def get_collect_key(triple_arch, action, source, config,
+                    func_map_cmd) -> str:
+    """
+    Returns a key which changes if the CTU files of the source have to be
+    generated again because of a change in the commands generating them or in
+    the binaries running these commands. The CTU directory is masked in the
+    commands, so the key doesn't change if the CTU directory is moved.
+    """
+    cmds = [get_extdef_mapping_cmd(action, config, source, func_map_cmd)]
+    if not config.ctu_on_demand:
+        cmds.append(generate_ast_cmd(action, config, triple_arch, source)[0])
+
+    key_parts = [
+        str(COLLECT_MANIFEST_VERSION),
+        triple_arch,
+        str(config.ctu_on_demand),
+        os.path.normpath(os.path.join(os.getcwd(), action.directory))]
+    for cmd in cmds:
+        key_parts.append(get_analyzer_identity(cmd[0], None))
+        key_parts.extend(arg.replace(config.ctu_dir, '<ctu-dir>')
+                         for arg in cmd)
+
+    return hashlib.sha256(
+        '\0'.join(key_parts).encode(errors='ignore')).hexdigest()
+
+
+def __collect_manifest_path(ctu_dir, triple_arch, entry_id):
+    return os.path.join(ctu_dir, triple_arch, COLLECT_MANIFEST_FOLDER,
+                        entry_id + '.json')
+
+
+def __load_collect_manifest(manifest_path) -> Optional[Dict]:
+    try:
+        with open(manifest_path, encoding='utf-8', errors='ignore') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get('version') != COLLECT_MANIFEST_VERSION:
+        return None
+
+    return manifest
+
+
+def get_collect_outputs(source, key, config,
+                        temp_fnmap_folder) -> Dict[str, str]:
+    """
+    Returns the CTU files collected for the source with the given collect key
+    by their paths relative to the triple arch directory.
+    """
+    entry_id = get_collect_entry_id(source, key)
+    outputs = {'fnmap': os.path.join(temp_fnmap_folder, entry_id)}
+    if not config.ctu_on_demand:
+        outputs['ast'] = os.path.join(
+            'ast', os.path.realpath(source)[1:] + '.ast')
+
+    return outputs
+
+
+def is_collected(triple_arch, source, config, key) -> bool:
+    """
+    Check if the CTU files of the source were collected by a previous
+    analysis with the same key, and the source files of the translation unit
+    haven't changed since then.
+    """
+    entry_id = get_collect_entry_id(source, key)
+    manifest = __load_collect_manifest(
+        __collect_manifest_path(config.ctu_dir, triple_arch, entry_id))
+    if not manifest or manifest['key'] != key:
+        return False
+
+    triple_arch_dir = os.path.join(config.ctu_dir, triple_arch)
+    for output in manifest['outputs']:
+        if not os.path.exists(os.path.join(triple_arch_dir, output)):
+            return False
+
+    for path, digest in manifest['dependencies'].items():
+        if file_content_hash(path) != digest:
+            LOG.debug("CTU files of '%s' are out of date, '%s' has been "
+                      "changed.", source, path)
+            return False
+
+    return True
+
+
+def store_collect_manifest(triple_arch, action, source, config, key,
+                           temp_fnmap_folder):
+    """
+    Store the manifest of the CTU files collected for the source, so they are
+    reused by the next analysis if the translation unit doesn't change.
+    """
+    # Import it here so tu_collector is loaded only if the manifests are
+    # used.
+    from tu_collector import tu_collector
+
+    dependencies, err = tu_collector.get_dependent_headers(
+        action.original_command, action.directory)
+    if err:
+        LOG.debug("CTU files of '%s' will be generated again, because its "
+                  "dependencies couldn't be collected.", source)
+        return
+
+    dependencies.add(os.path.normpath(os.path.join(action.directory,
+                                                   source)))
+
+    triple_arch_dir = os.path.join(config.ctu_dir, triple_arch)
+    manifest = {
+        'version': COLLECT_MANIFEST_VERSION,
+        'source': source,
+        'key': key,
+        'outputs': [
+            output for output in get_collect_outputs(
+                source, key, config, temp_fnmap_folder).values()
+            if os.path.exists(os.path.join(triple_arch_dir, output))],
+        'dependencies': {}}
+
+    for path in dependencies:
+        digest = file_content_hash(path)
+        if digest is None:
+            LOG.debug("CTU files of '%s' will be generated again, because "
+                      "'%s' can't be read.", source, path)
+            return
+        manifest['dependencies'][path] = digest
+
+    manifest_path = __collect_manifest_path(
+        config.ctu_dir, triple_arch, get_collect_entry_id(source, key))
+    manifest_dir = os.path.dirname(manifest_path)
+    os.makedirs(manifest_dir, exist_ok=True)
+
+    # The manifest is renamed to its final place, so it is never read
+    # partially written.
+    with tempfile.NamedTemporaryFile(mode='w', dir=manifest_dir,
+                                     suffix='.tmp', delete=False,
+                                     encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(f.name, manifest_path)
+
+
+def remove_stale_collect_outputs(config, ctu_temp_fnmap_folder,
+                                 collected: Iterable[Tuple[str, str, str]]):
+    """
+    Remove the CTU files of the translation units which are not collected
+    by this analysis, e.g. because they have been removed from the build. The
+    collected translation units are given by their triple arch, source file
+    and collect key. The CTU files which are shared with a collected
+    translation unit (e.g. the AST dump of a source file which is built by
+    several build actions) are kept.
+    """
+    collected_ids: Set[Tuple[str, str]] = set()
+    collected_outputs: Set[Tuple[str, str]] = set()
+    for triple_arch, source, key in collected:
+        collected_ids.add((triple_arch, get_collect_entry_id(source, key)))
+        collected_outputs.update(
+            (triple_arch, output) for output in get_collect_outputs(
+                source, key, config, ctu_temp_fnmap_folder).values())
+
+    for triple_path in glob.glob(os.path.join(config.ctu_dir, '*')):
+        if not os.path.isdir(triple_path):
+            continue
+
+        triple_arch = os.path.basename(triple_path)
+        manifest_dir = os.path.join(triple_path, COLLECT_MANIFEST_FOLDER)
+        for manifest_path in glob.glob(os.path.join(manifest_dir, '*')):
+            entry_id = os.path.splitext(os.path.basename(manifest_path))[0]
+            if (triple_arch, entry_id) in collected_ids:
+                continue
+
+            manifest = __load_collect_manifest(manifest_path)
+            for output in manifest['outputs'] if manifest else []:
+                if (triple_arch, output) in collected_outputs:
+                    continue
+
+                output_path = os.path.join(triple_path, output)
+                if os.path.isfile(output_path):
+                    os.remove(output_path)
+            os.remove(manifest_path)
+
+        # The function maps of the translation units which failed to be
+        # collected may have no manifest.
+        fnmap_dir = os.path.join(triple_path, ctu_temp_fnmap_folder)
+        for fnmap_path in glob.glob(os.path.join(fnmap_dir, '*')):
+            if (triple_arch, os.path.basename(fnmap_path)) \
+                    not in collected_ids:
+                os.remove(fnmap_path)
@@ -11,7 +11,7 @@ Result handler for Clang Static Analyzer.
 
 import os
 
-from typing import Optional
+from typing import Optional, Set
 
 from codechecker_report_converter.report.parser.base import AnalyzerInfo
 from codechecker_report_converter.report import report_file, error_file
@@ -32,6 +32,11 @@ class ClangSAResultHandler(ResultHandler):
 
     def __init__(self, *args, **kwargs):
         self.analyzer_info = AnalyzerInfo(name='clangsa')
+
+        # Reports of these checkers are removed by postprocess_result(). See
+        # ClangSA.post_analyze() for details.
+        self.disabled_checkers: Set[str] = set()
+
         super().__init__(*args, **kwargs)
 
     def postprocess_result(
@@ -42,17 +47,23 @@ class ClangSAResultHandler(ResultHandler):
         """
         Generate analyzer result output file which can be parsed and stored
         into the database.
+
+        The reports of the disabled checkers, the skipped and the ignored
+        reports are removed and the report hashes are recomputed in one pass,
+        so the result file is parsed and written only once.
         """
         error_file.update(
             self.analyzer_result_file, self.analyzer_returncode,
             self.analyzer_info, self.analyzer_cmd,
-            self.analyzer_stdout, self.analyzer_stderr)
+            self.analyzer_stdout.summary(), self.analyzer_stderr.summary())
 
         if os.path.exists(self.analyzer_result_file):
             reports = report_file.get_reports(
                 self.analyzer_result_file, self.checker_labels,
                 source_dir_path=self.source_dir_path)
-            reports = [r for r in reports if not r.skip(skip_handlers)]
+            reports = [r for r in reports
+                       if r.checker_name not in self.disabled_checkers and
+                       not r.skip(skip_handlers)]
 
             hash_type = None
             if self.report_hash_type in ['context-free', 'context-free-v2']:
@@ -26,7 +26,7 @@ import yaml
 from codechecker_common import util
 from codechecker_common.logger import get_logger
 
-from codechecker_analyzer import analyzer_context, env
+from codechecker_analyzer import analyzer_context, analyzer_info_cache, env
 
 from .. import analyzer_base
 from ..config_handler import CheckerState
@@ -179,7 +179,7 @@ def get_warnings():
 
     environment = analyzer_context.get_context().get_env_for_bin(diagtool_bin)
 
-    try:
+    def query():
         result = subprocess.check_output(
             [diagtool_bin, 'tree'],
             env=environment,
@@ -188,6 +188,9 @@ def get_warnings():
             errors="ignore")
         return [w[2:] for w in result.split()
                 if w.startswith("-W") and w != "-W"]
+
+    try:
+        return analyzer_info_cache.cached(str(diagtool_bin), ['tree'], query)
     except subprocess.CalledProcessError as exc:
         LOG.error("'diagtool' encountered an error while retrieving the "
                   "checker list. If you are using a custom compiled clang, "
@@ -276,11 +279,13 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_info_cache.cached(
+                cls.analyzer_binary(), version[1:],
+                lambda: subprocess.check_output(version,
+                                                env=environ,
+                                                universal_newlines=True,
+                                                encoding="utf-8",
+                                                errors="ignore"))
             version_re = re.compile(r'.*version (?P<version>[\d\.]+)', re.S)
             match = version_re.match(output)
             if match:
@@ -309,14 +314,20 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
             blacklisted_checkers = context.checker_labels.checkers_by_labels(
                 ["blacklist:true"], cls.ANALYZER_NAME)
 
+            command = [cls.analyzer_binary(), "-list-checks", "-checks=*"]
             environ = context.get_env_for_bin(cls.analyzer_binary())
-            result = subprocess.check_output(
-                [cls.analyzer_binary(), "-list-checks", "-checks=*"],
-                env=environ,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
-            checker_description = parse_checkers(result)
+
+            def query():
+                return parse_checkers(subprocess.check_output(
+                    command,
+                    env=environ,
+                    universal_newlines=True,
+                    encoding="utf-8",
+                    errors="ignore"))
+
+            checker_description = [
+                tuple(checker) for checker in analyzer_info_cache.cached(
+                    cls.analyzer_binary(), command[1:], query)]
 
             checker_description.extend(
                 (checker, "")
@@ -333,24 +344,33 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
         except (subprocess.CalledProcessError, OSError):
             return []
 
+    @classmethod
+    def __dump_config(cls) -> str:
+        """
+        Return the configuration of clang-tidy with all checkers enabled.
+        """
+        return subprocess.check_output(
+            [cls.analyzer_binary(), "-dump-config", "-checks=*"],
+            env=analyzer_context.get_context()
+            .get_env_for_bin(cls.analyzer_binary()),
+            universal_newlines=True,
+            encoding="utf-8",
+            errors="ignore")
+
     @classmethod
     def get_checker_config(cls) -> List[analyzer_base.CheckerConfig]:
         """
         Return the checker configuration of the all of the supported checkers.
         """
         try:
-            help_page = subprocess.check_output(
-                [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
+            checker_config = analyzer_info_cache.cached(
+                cls.analyzer_binary(), ['checker-config'],
+                lambda: parse_checker_config(cls.__dump_config()))
         except (subprocess.CalledProcessError, OSError):
             return []
 
         result = []
-        for cfg, doc in parse_checker_config(help_page):
+        for cfg, doc in checker_config:
             checker, opt = cfg.split(':', 1)
             result.append(analyzer_base.CheckerConfig(checker, opt, doc))
 
@@ -365,14 +385,9 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
             return []
 
         try:
-            result = subprocess.check_output(
-                [cls.analyzer_binary(), "-dump-config", "-checks=*"],
-                env=analyzer_context.get_context()
-                .get_env_for_bin(cls.analyzer_binary()),
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="ignore")
-            native_config = parse_analyzer_config(result)
+            native_config = analyzer_info_cache.cached(
+                cls.analyzer_binary(), ['analyzer-config'],
+                lambda: parse_analyzer_config(cls.__dump_config()))
         except (subprocess.CalledProcessError, OSError):
             native_config = []
 
@@ -490,6 +505,34 @@ class ClangTidy(analyzer_base.SourceAnalyzer):
 
         return checkers, compiler_warnings
 
+    def get_cacheable_output_files(self, result_handler):
+        """
+        The reports are parsed from the standard output, only the fixits are
+        written to a file.
+        """
+        return [result_handler.fixit_file]
+
+    def get_implicit_config_files(self, analyzer_cmd: List[str]) -> List[str]:
+        """
+        Clang Tidy reads the .clang-tidy files of the directory of the source
+        file and its parent directories, unless its configuration is given by
+        the -config or -config-file option.
+        """
+        tidy_args = analyzer_cmd[:analyzer_cmd.index('--')] \
+            if '--' in analyzer_cmd else analyzer_cmd
+        if any(arg.lstrip('-').startswith('config') for arg in tidy_args):
+            return []
+
+        config_files = []
+        directory = os.path.dirname(os.path.normpath(os.path.join(
+            self.buildaction.directory, self.source_file)))
+        while True:
+            config_files.append(os.path.join(directory, '.clang-tidy'))
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return config_files
+            directory = parent
+
     def construct_analyzer_cmd(self, result_handler):
         """ Contruct command which will be executed on analysis. """
         try:
@@ -80,4 +80,4 @@ class ClangTidyResultHandler(ResultHandler):
         error_file.update(
             self.analyzer_result_file, self.analyzer_returncode,
             self.analyzer_info, self.analyzer_cmd,
-            self.analyzer_stdout, self.analyzer_stderr)
+            self.analyzer_stdout.summary(), self.analyzer_stderr.summary())
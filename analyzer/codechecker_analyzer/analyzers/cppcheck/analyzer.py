@@ -23,7 +23,7 @@ import xml.etree.ElementTree as ET
 from codechecker_common.logger import get_logger
 from codechecker_common import util
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 from codechecker_analyzer.env import get_binary_in_path
 
 from .. import analyzer_base
@@ -98,11 +98,13 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         version = [cls.analyzer_binary(), '--version']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             universal_newlines=True,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_info_cache.cached(
+                cls.analyzer_binary(), version[1:],
+                lambda: subprocess.check_output(version,
+                                                env=environ,
+                                                universal_newlines=True,
+                                                encoding="utf-8",
+                                                errors="ignore"))
             return parse_version(output)
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -294,9 +296,15 @@ class Cppcheck(analyzer_base.SourceAnalyzer):
         command = [cls.analyzer_binary(), "--errorlist"]
         environ = analyzer_context.get_context().get_env_for_bin(
             command[0])
+
+        def query():
+            return parse_checkers(
+                subprocess.check_output(command, env=environ))
+
         try:
-            errorlist_output = subprocess.check_output(command, env=environ)
-            checkers = parse_checkers(errorlist_output)
+            checkers = [
+                tuple(checker) for checker in analyzer_info_cache.cached(
+                    cls.analyzer_binary(), command[1:], query)]
 
             # Cppcheck can and will report with checks that have a different
             # name than marked in the --errorlist xml. To be able to suppress
@@ -105,4 +105,4 @@ class CppcheckResultHandler(ResultHandler):
         error_file.update(
             self.analyzer_result_file, self.analyzer_returncode,
             self.analyzer_info, self.analyzer_cmd,
-            self.analyzer_stdout, self.analyzer_stderr)
+            self.analyzer_stdout.summary(), self.analyzer_stderr.summary())
@@ -14,7 +14,7 @@ import sys
 from codechecker_common.logger import get_logger
 from codechecker_common import util
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 
 from .. import analyzer_base
 from ..flag import has_flag
@@ -101,10 +101,10 @@ class Gcc(analyzer_base.SourceAnalyzer):
             return []
         environ = analyzer_context.get_context().get_env_for_bin(
             command[0])
-        checker_list = []
 
-        try:
+        def query():
             output = subprocess.check_output(command, env=environ)
+            checker_list = []
 
             # Still contains the help message we need to remove.
             for entry in output.decode().split('\n'):
@@ -118,6 +118,10 @@ class Gcc(analyzer_base.SourceAnalyzer):
                     checker_list.append(
                         (renamed_checker_name, description.strip()))
             return checker_list
+
+        try:
+            return [tuple(checker) for checker in analyzer_info_cache.cached(
+                cls.analyzer_binary(), command[1:], query)]
         except (subprocess.CalledProcessError) as e:
             LOG.error(e.stderr)
         except (OSError) as e:
@@ -168,10 +172,12 @@ class Gcc(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         version = [cls.analyzer_binary(), '-dumpfullversion']
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_info_cache.cached(
+                cls.analyzer_binary(), version[1:],
+                lambda: subprocess.check_output(version,
+                                                env=environ,
+                                                encoding="utf-8",
+                                                errors="ignore"))
             return Version.parse(output.strip())
         except (subprocess.CalledProcessError, OSError) as oerr:
             LOG.warning("Failed to get analyzer version: %s",
@@ -78,7 +78,7 @@ class GccResultHandler(ResultHandler):
                      self.buildaction_hash + ".sarif"))
 
         with open(gcc_dest_file_name, 'w', encoding="utf-8") as f:
-            f.write(gcc_stderr)
+            gcc_stderr.copy_to(f)
         assert os.path.exists(gcc_dest_file_name)
 
         reports = report_file.get_reports(
@@ -122,4 +122,4 @@ class GccResultHandler(ResultHandler):
         error_file.update(
             self.analyzer_result_file, self.analyzer_returncode,
             self.analyzer_info, self.analyzer_cmd,
-            self.analyzer_stdout, self.analyzer_stderr)
+            self.analyzer_stdout.summary(), self.analyzer_stderr.summary())
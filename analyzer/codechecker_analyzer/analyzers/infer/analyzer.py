@@ -20,7 +20,7 @@ from semver.version import Version
 from codechecker_common import util
 from codechecker_common.logger import get_logger
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 
 from .. import analyzer_base
 from ..config_handler import CheckerState
@@ -107,27 +107,35 @@ class Infer(analyzer_base.SourceAnalyzer):
         context = analyzer_context.get_context()
 
         command = [cls.analyzer_binary(), "help", "--list-issue-types"]
-        checker_list = []
-        try:
+
+        def query():
+            """ Return the list of (checker, user checker) pairs. """
             env = context.get_env_for_bin(cls.analyzer_binary())
             env.update(TZ='UTC')
             output = subprocess.check_output(command,
                                              stderr=subprocess.DEVNULL,
                                              env=env)
+            issue_types = []
             for entry in output.decode().split('\n'):
                 data = entry.strip().split(":")
                 if len(data) < 7:
                     continue
 
                 checker = f'infer-{data[0].lower().replace("_", "-")}'
+                user = data[6] if len(data) == 7 else data[5]
+                issue_types.append((checker, user))
+            return issue_types
 
+        checker_list = []
+        try:
+            for checker, user in analyzer_info_cache.cached(
+                    cls.analyzer_binary(), command[1:], query):
                 description = context.checker_labels.label_of_checker(
                     checker,
                     'description',
                     cls.ANALYZER_NAME)
 
                 if not description:
-                    user = data[6] if len(data) == 7 else data[5]
                     description = f"used by '{user}' checker"
 
                 checker_list.append((checker, description))
@@ -161,7 +169,7 @@ class Infer(analyzer_base.SourceAnalyzer):
             analyzer_cmd, res_handler, proc_callback, env)
 
         if result_handler.analyzer_returncode != 0:
-            LOG.error(result_handler.analyzer_stderr)
+            LOG.error(result_handler.analyzer_stderr.summary())
 
         return result_handler
 
@@ -190,10 +198,12 @@ class Infer(analyzer_base.SourceAnalyzer):
             cls.analyzer_binary())
         environ.update(TZ='UTC')
         try:
-            output = subprocess.check_output(version,
-                                             env=environ,
-                                             encoding="utf-8",
-                                             errors="ignore")
+            output = analyzer_info_cache.cached(
+                cls.analyzer_binary(), version[1:],
+                lambda: subprocess.check_output(version,
+                                                env=environ,
+                                                encoding="utf-8",
+                                                errors="ignore"))
             output = output.split('\n', maxsplit=1)[0]
             return Version.parse(output.strip().split(" ")[-1][1:])
         except (subprocess.CalledProcessError, OSError) as oerr:
@@ -20,6 +20,8 @@ from codechecker_common.logger import get_logger
 from codechecker_common.skiplist_handler import SkipListHandlers
 from codechecker_common.review_status_handler import ReviewStatusHandler
 
+from .analyzer_output import AnalyzerOutput, DEFAULT_MEMORY_LIMIT
+
 
 LOG = get_logger('analyzer')
 
@@ -54,8 +56,13 @@ class ResultHandler(metaclass=ABCMeta):
         self.__workspace = workspace
 
         self.analyzer_cmd = []
-        self.analyzer_stdout = ''
-        self.analyzer_stderr = ''
+        self.analyzer_stdout = AnalyzerOutput()
+        self.analyzer_stderr = AnalyzerOutput()
+
+        # The number of characters of the analyzer's standard outputs which
+        # are kept in memory. The longer outputs are spilled to the
+        # workspace.
+        self.output_memory_limit = DEFAULT_MEMORY_LIMIT
         self.checker_labels = analyzer_context.get_context().checker_labels
         self.skiplist_handler = None
         self.analyzed_source_file = None
@@ -71,6 +78,15 @@ class ResultHandler(metaclass=ABCMeta):
         # report id (hash) values.
         self.report_hash_type = report_hash_type
 
+    def cleanup_output(self):
+        """
+        Remove the files of the analyzer outputs which were spilled to the
+        workspace. This should be called when the outputs are not needed
+        anymore.
+        """
+        self.analyzer_stdout.cleanup()
+        self.analyzer_stderr.cleanup()
+
     @property
     def buildaction(self):
         return self.__buildaction
@@ -13,6 +13,8 @@ import collections
 import os
 import re
 
+from typing import Tuple
+
 
 AnalyzerConfigArg = collections.namedtuple(
     "AnalyzerConfigArg", ["analyzer", "option", "value"])
@@ -91,6 +93,22 @@ class OrderedConfigAction(argparse.Action):
             dest.append(flag)
 
 
+def network_address(arg: str) -> Tuple[str, int]:
+    """
+    This function can be used at "type" argument of argparse.add_argument().
+    It checks the format of a network address: <host>:<port>
+    These two things return as a tuple.
+    """
+    m = re.match(r"(?P<host>.*):(?P<port>\d+)$", arg)
+
+    if not m or int(m.group("port")) > 65535:
+        raise argparse.ArgumentTypeError(
+            f"Network address in wrong format: {arg}, should be "
+            "<host>:<port>")
+
+    return m.group("host"), int(m.group("port"))
+
+
 def existing_abspath(path: str) -> str:
     """
     This function can be used at "type" argument of argparse.add_argument()
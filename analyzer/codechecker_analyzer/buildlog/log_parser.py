@@ -14,10 +14,12 @@ from functools import lru_cache
 from pathlib import Path
 
 import glob
+import hashlib
 import json
 import os
 import re
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -28,13 +30,30 @@ from codechecker_analyzer.analyzers.clangsa.analyzer import ClangSA
 
 from codechecker_common.compatibility import multiprocessing
 from codechecker_common.logger import get_logger
-from codechecker_common.util import load_json
+from codechecker_common.util import chunks, load_json
 
 from .. import gcc_toolchain
 from .build_action import BuildAction
 
 LOG = get_logger('buildlogger')
 
+# Number of compilation database entries sent to a parser process at once.
+PARSE_CHUNK_SIZE = 64
+
+# The compilation database entries are parsed in windows of this many chunks
+# per process, so only a window of entries is kept in the memory at once.
+PARSE_WINDOW_CHUNKS = 8
+
+# Increase this number if the format of the compiler info cache entries
+# changes, so the entries created by an older CodeChecker are not used anymore.
+COMPILER_INFO_CACHE_VERSION = 1
+
+# These environment variables affect the implicit include paths of compilers,
+# so they are part of the compiler info cache key.
+COMPILER_INFO_ENV_VARS = ['CPATH', 'C_INCLUDE_PATH', 'CPLUS_INCLUDE_PATH',
+                          'OBJC_INCLUDE_PATH', 'COMPILER_PATH',
+                          'GCC_EXEC_PREFIX', 'SDKROOT']
+
 SOURCE_EXTENSIONS = {".c", ".cc", ".cp", ".cpp", ".cxx", ".c++", ".o", ".so",
                      ".a"}
 
@@ -347,6 +366,17 @@ class ImplicitCompilerInfo:
 
     compiler_info: Dict[ImplicitInfoSpecifierKey, dict] = {}
     compiler_isexecutable: Dict[str, bool] = {}
+
+    # Directory of the persistent compiler info cache which is shared by
+    # analysis runs and processes. None means the cache is not used.
+    cache_dir: Optional[str] = None
+
+    # Compiler info entries used by this process and the ones among them
+    # which haven't been returned by pop_new_compiler_info() yet.
+    __used_compiler_info: Dict[ImplicitInfoSpecifierKey, dict] = {}
+    __new_compiler_info: Dict[ImplicitInfoSpecifierKey, dict] = {}
+    __loaded_compiler_info_file: Optional[str] = None
+
     # Store the already detected compiler version information.
     # If the value is False the compiler is not clang otherwise the value
     # should be a clang version information object.
@@ -553,6 +583,131 @@ class ImplicitCompilerInfo:
 
         return standard
 
+    @staticmethod
+    def __get_cache_file(cache_dir: str, iisk) -> Optional[str]:
+        """
+        Returns the file of the given key in the compiler info cache or None
+        if the compiler can't be identified. The compiler binary is
+        identified by its real path, size and modification time, so the
+        entries become invalid if the toolchain is updated.
+        """
+        compiler_path = which(iisk.compiler)
+        if not compiler_path:
+            return None
+
+        real_path = os.path.realpath(compiler_path)
+        try:
+            stat = os.stat(real_path)
+        except OSError:
+            return None
+
+        key = json.dumps([
+            COMPILER_INFO_CACHE_VERSION,
+            iisk.compiler,
+            real_path,
+            stat.st_size,
+            stat.st_mtime_ns,
+            iisk.language,
+            list(iisk.compiler_flags),
+            [os.environ.get(var) for var in COMPILER_INFO_ENV_VARS]])
+
+        return os.path.join(
+            cache_dir,
+            hashlib.sha256(key.encode(errors='ignore')).hexdigest() + '.json')
+
+    @staticmethod
+    def __invoke_compiler(iisk) -> dict:
+        """
+        Return the implicit compiler information of the given key by invoking
+        the compiler.
+        """
+        ICI = ImplicitCompilerInfo
+        return {
+            'compiler_includes': ICI.get_compiler_includes(
+                iisk.compiler, iisk.language, iisk.compiler_flags),
+            'compiler_standard': ICI.get_compiler_standard(
+                iisk.compiler, iisk.language),
+            'target': ICI.get_compiler_target(iisk.compiler)
+        }
+
+    @staticmethod
+    def __detect(iisk) -> dict:
+        """
+        Return the implicit compiler information of the given key. It is
+        taken from the compiler info cache if possible, otherwise the
+        compiler is invoked.
+
+        The cache file is locked while the compiler is invoked, so the
+        processes which need the same entry at the same time (e.g. the parser
+        processes) wait for it instead of invoking the compiler too.
+        """
+        cache_file = None
+        if ImplicitCompilerInfo.cache_dir:
+            cache_file = ImplicitCompilerInfo.__get_cache_file(
+                ImplicitCompilerInfo.cache_dir, iisk)
+
+        if not cache_file:
+            return ImplicitCompilerInfo.__invoke_compiler(iisk)
+
+        import portalocker
+
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # pylint: disable=consider-using-with
+            cache = open(cache_file, 'a+', encoding='utf-8', errors='ignore')
+        except OSError as err:
+            LOG.debug("Failed to open compiler info cache file %s: %s",
+                      cache_file, err)
+            return ImplicitCompilerInfo.__invoke_compiler(iisk)
+
+        with cache:
+            portalocker.lock(cache, portalocker.LOCK_EX)
+
+            cache.seek(0)
+            try:
+                info = json.load(cache)
+            except ValueError:
+                info = None
+
+            if isinstance(info, dict):
+                LOG.debug("Compiler info of %s is loaded from %s",
+                          iisk, cache_file)
+                return info
+
+            # The cache file is empty if it was created now, or it was
+            # partially written by a process which was stopped.
+            info = ImplicitCompilerInfo.__invoke_compiler(iisk)
+            try:
+                cache.seek(0)
+                cache.truncate()
+                json.dump(info, cache)
+                cache.flush()
+            except OSError as err:
+                LOG.debug("Failed to write compiler info cache file %s: %s",
+                          cache_file, err)
+
+            return info
+
+    @staticmethod
+    def pop_new_compiler_info() -> Dict[ImplicitInfoSpecifierKey, dict]:
+        """
+        Return the compiler info entries which were used by this process
+        since the previous call. The parser processes send these to the main
+        process this way.
+        """
+        new_compiler_info = ImplicitCompilerInfo.__new_compiler_info
+        ImplicitCompilerInfo.__new_compiler_info = {}
+        return new_compiler_info
+
+    @staticmethod
+    def reset(cache_dir: Optional[str] = None):
+        """ Forget the compiler info which was collected earlier. """
+        ImplicitCompilerInfo.compiler_info = {}
+        ImplicitCompilerInfo.cache_dir = cache_dir
+        ImplicitCompilerInfo.__used_compiler_info = {}
+        ImplicitCompilerInfo.__new_compiler_info = {}
+        ImplicitCompilerInfo.__loaded_compiler_info_file = None
+
     @staticmethod
     def dump_compiler_info(file_path: str):
         dumpable = {
@@ -593,19 +748,21 @@ class ImplicitCompilerInfo:
         iisk = compiler_info_key(details)
 
         if compiler_info_file and os.path.exists(compiler_info_file):
-            # Compiler info file exists, load it.
-            ICI.load_compiler_info(compiler_info_file)
-        else:
-            if iisk not in ICI.compiler_info:
-                ICI.compiler_info[iisk] = {
-                    'compiler_includes': ICI.get_compiler_includes(
-                        iisk.compiler, iisk.language, iisk.compiler_flags),
-                    'compiler_standard': ICI.get_compiler_standard(
-                        iisk.compiler, iisk.language),
-                    'target': ICI.get_compiler_target(iisk.compiler)
-                }
-
-        for k, v in ICI.compiler_info.get(iisk, {}).items():
+            # Compiler info file exists, load it once.
+            loaded_file = ImplicitCompilerInfo.__loaded_compiler_info_file
+            if loaded_file != compiler_info_file:
+                ICI.load_compiler_info(compiler_info_file)
+                ImplicitCompilerInfo.__loaded_compiler_info_file = \
+                    compiler_info_file
+        elif iisk not in ICI.compiler_info:
+            ICI.compiler_info[iisk] = ImplicitCompilerInfo.__detect(iisk)
+
+        info = ICI.compiler_info.get(iisk, {})
+        if iisk not in ImplicitCompilerInfo.__used_compiler_info:
+            ImplicitCompilerInfo.__used_compiler_info[iisk] = info
+            ImplicitCompilerInfo.__new_compiler_info[iisk] = info
+
+        for k, v in info.items():
             if not details.get(k):
                 details[k] = v
 
@@ -968,6 +1125,25 @@ def __skip_gcc(flag_iterator, _):
     return False
 
 
+def get_source_file_path(compilation_db_entry) -> str:
+    """
+    Return the absolute path of the source file compiled by the given
+    compilation database entry.
+    """
+    source = compilation_db_entry['file']
+    # Calculate absolute path to file if not already abs
+    if not Path(source).is_absolute():
+        source = str(Path(
+            Path(compilation_db_entry['directory']).absolute(),
+            compilation_db_entry['file']).resolve())
+
+    # In case the file attribute in the entry is empty.
+    if source == '.':
+        source = ''
+
+    return source
+
+
 def parse_options(compilation_db_entry,
                   compiler_info_file=None,
                   keep_gcc_include_fixed=False,
@@ -1077,16 +1253,7 @@ def parse_options(compilation_db_entry,
     if details['action_type'] is None:
         details['action_type'] = BuildAction.COMPILE
 
-    details['source'] = compilation_db_entry['file']
-    # Calculate absolute path to file if not already abs
-    if not Path(details['source']).is_absolute():
-        details['source'] = str(Path(
-            Path(compilation_db_entry['directory']).absolute(),
-            compilation_db_entry['file']).resolve())
-
-    # In case the file attribute in the entry is empty.
-    if details['source'] == '.':
-        details['source'] = ''
+    details['source'] = get_source_file_path(compilation_db_entry)
 
     lang = get_language(os.path.splitext(details['source'])[1])
     if lang:
@@ -1246,22 +1413,27 @@ class CompileActionUniqueingType(Enum):
 def _process_entry_worker(args):
     """
     Worker function for processing compilation database entries in parallel.
+    Returns the build action (or None on error) and the implicit compiler
+    info entries which were first used by the worker process.
 
     args -- Tuple containing (entry, compiler_info_file,
-            keep_gcc_include_fixed, keep_gcc_intrin, analyzer_clang_version)
+            keep_gcc_include_fixed, keep_gcc_intrin, compiler_info_cache_dir)
     """
     (entry, compiler_info_file, keep_gcc_include_fixed,
-     keep_gcc_intrin) = args
+     keep_gcc_intrin, compiler_info_cache_dir) = args
+
+    ImplicitCompilerInfo.cache_dir = compiler_info_cache_dir
 
     try:
         action = parse_options(entry,
                                compiler_info_file,
                                keep_gcc_include_fixed,
                                keep_gcc_intrin)
-        return action
     except Exception as e:
         LOG.error("Error processing entry: %s", e)
-        return None
+        action = None
+
+    return action, ImplicitCompilerInfo.pop_new_compiler_info()
 
 
 def parse_unique_log(compilation_database,
@@ -1272,7 +1444,8 @@ def parse_unique_log(compilation_database,
                      jobs=None,
                      analysis_skip_handlers=None,
                      pre_analysis_skip_handlers=None,
-                     ctu_or_stats_enabled=False):
+                     ctu_or_stats_enabled=False,
+                     compiler_info_cache_dir=None):
     """
     This function reads up the compilation_database
     and returns with a list of build actions that is
@@ -1286,12 +1459,14 @@ def parse_unique_log(compilation_database,
     This function also dumps auto-detected the compiler info
     into <report_dir>/compiler_info.json.
 
-    compilation_database -- A compilation database as a list of dict objects.
-                            These object should contain "file", "dictionary"
-                            and "command" keys. The "command" may be replaced
-                            by "arguments" which is a split command. Older
-                            versions of intercept-build provide the build
-                            command this way.
+    compilation_database -- A compilation database as an iterable of dict
+                            objects. These object should contain "file",
+                            "dictionary" and "command" keys. The "command"
+                            may be replaced by "arguments" which is a split
+                            command. Older versions of intercept-build provide
+                            the build command this way. The entries are
+                            processed one by one, so this can be a generator
+                            which reads a huge compilation database lazily.
     compile_uniqueing -- Compilation database uniqueing mode.
                          If there are more than one compile commands for a
                          target file, only a single one is kept.
@@ -1320,7 +1495,20 @@ def parse_unique_log(compilation_database,
                                  skipped during pre analysis
     ctu_or_stats_enabled -- ctu or statistics based analysis was enabled
                             influences the behavior which files are skipped.
+    compiler_info_cache_dir -- Directory of a persistent cache of the
+                               implicit compiler information which is shared
+                               by analysis runs. The compilers are not invoked
+                               again for the cached compiler and flag
+                               combinations.
     """
+    # The parser processes share the implicit compiler information through
+    # a compiler info cache, so it is detected only once for a compiler and
+    # flag combination. If no persistent cache is given, a temporary one is
+    # used during the parsing.
+    worker_cache_dir = compiler_info_cache_dir
+    if not worker_cache_dir:
+        worker_cache_dir = tempfile.mkdtemp(prefix='compiler-info-')
+
     try:
         uniqued_build_actions = {}
         uniqueing_re = None
@@ -1346,42 +1534,59 @@ def parse_unique_log(compilation_database,
         # Prepare entries for parallel processing
         entries = extend_compilation_database_entries(compilation_database)
 
-        # Create arguments for worker function as generator
-        worker_args = ((entry, compiler_info_file, keep_gcc_include_fixed,
-                       keep_gcc_intrin)
-                       for entry in entries)
+        # The compilation commands of the source files which are skipped at
+        # both analysis phases (pre analysis and analysis) are dropped before
+        # their expensive option parsing. Skipping of the compile commands is
+        # done differently if no CTU or statistics related feature was
+        # enabled.
+        def should_skip(entry):
+            if not analysis_skip_handlers or 'file' not in entry or \
+                    'directory' not in entry:
+                return False
+
+            source = get_source_file_path(entry)
+            if analysis_skip_handlers.should_skip(source) and \
+                    (not ctu_or_stats_enabled or pre_analysis_skip_handlers and
+                     pre_analysis_skip_handlers.should_skip(source)):
+                LOG.debug("skipping: %s", source)
+                return True
+
+            return False
+
+        def worker_args():
+            nonlocal skipped_cmp_cmd_count
+            for entry in entries:
+                if should_skip(entry):
+                    skipped_cmp_cmd_count += 1
+                    continue
+
+                yield (entry, compiler_info_file, keep_gcc_include_fixed,
+                       keep_gcc_intrin, worker_cache_dir)
+
+        # The worker processes return the implicit compiler info entries
+        # which they used and these are collected here, so they can be dumped
+        # by ImplicitCompilerInfo.dump_compiler_info().
+        ImplicitCompilerInfo.reset(compiler_info_cache_dir)
 
-        # Here we overwrite ImplicitCompilerInfo.compiker_info with a dict type
-        # that can be used in multiprocess environment, since the next section
-        # is executed in a process pool.
-        manager = multiprocessing.SyncManager()
-        manager.start()
-        ImplicitCompilerInfo.compiler_info = manager.dict()
+        # Process entries in parallel. The entries are read and parsed in
+        # windows, so only the unique build actions are kept in the memory,
+        # not the whole compilation database. The results are processed in
+        # the order of the entries, so uniqueing is deterministic.
+        window_size = jobs * PARSE_WINDOW_CHUNKS * PARSE_CHUNK_SIZE
+
+        def parse_entries(pool):
+            for window in chunks(worker_args(), window_size):
+                yield from pool.map(_process_entry_worker, window,
+                                    chunksize=PARSE_CHUNK_SIZE)
 
-        # Process entries in parallel using imap_unordered with chunk size 1024
         with multiprocessing.Pool(jobs) as pool:
-            # Convert generator to list for map function
-            worker_args_list = list(worker_args)
-            results = pool.map(_process_entry_worker, worker_args_list)
+            for action, compiler_info in parse_entries(pool):
+                ImplicitCompilerInfo.compiler_info.update(compiler_info)
 
-            for action in results:
                 if action is None:
                     skipped_cmp_cmd_count += 1
                     continue
 
-                # Skip parsing the compilaton commands if it should be skipped
-                # at both analysis phases (pre analysis and analysis).
-                # Skipping of the compile commands is done differently if no
-                # CTU or statistics related feature was enabled.
-                if (analysis_skip_handlers
-                    and analysis_skip_handlers.should_skip(action.source)
-                    and (not ctu_or_stats_enabled or pre_analysis_skip_handlers
-                         and pre_analysis_skip_handlers.should_skip(
-                             action.source))):
-                    skipped_cmp_cmd_count += 1
-                    LOG.debug("skipping: %s", action.source)
-                    continue
-
                 if not action.lang:
                     skipped_cmp_cmd_count += 1
                     continue
@@ -1447,3 +1652,6 @@ def parse_unique_log(compilation_database,
         LOG.debug(traceback.format_exc())
         LOG.debug(ex)
         sys.exit(1)
+    finally:
+        if worker_cache_dir != compiler_info_cache_dir:
+            shutil.rmtree(worker_cache_dir, ignore_errors=True)
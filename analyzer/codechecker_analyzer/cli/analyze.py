@@ -15,20 +15,25 @@ import json
 import os
 import shutil
 import sys
-from typing import List
+import tempfile
+from typing import List, Optional
 from pathlib import Path
 from functools import partial
 
 from tu_collector import tu_collector
 
 from codechecker_analyzer import analyzer, analyzer_context, \
-    compilation_database
+    analyzer_info_cache, compilation_database
 from codechecker_analyzer.analyzers import analyzer_types, clangsa
 from codechecker_analyzer.arg import \
     OrderedCheckersAction, OrderedConfigAction, existing_abspath, \
-    analyzer_config, checker_config, AnalyzerConfigArg, CheckerConfigArg
+    analyzer_config, checker_config, network_address, AnalyzerConfigArg, \
+    CheckerConfigArg
 
 from codechecker_analyzer.buildlog import log_parser
+from codechecker_analyzer.dependency_index import DependencyIndex, \
+    DEPENDENCY_INDEX_FILE
+from codechecker_analyzer.distributed import read_auth_key
 
 from codechecker_common import arg, logger, cmd_config, review_status_handler
 from codechecker_common.compatibility.multiprocessing import cpu_count
@@ -174,6 +179,71 @@ def add_arguments_to_parser(parser):
                              "threads mean faster analysis at the cost of "
                              "using more memory.")
 
+    parser.add_argument('--memory-budget',
+                        type=int,
+                        dest='memory_budget',
+                        metavar='MEGABYTES',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Start new analyzer processes only while the "
+                             "sum of their expected memory usage fits in "
+                             "this many megabytes. The expected memory usage "
+                             "of a source file is its peak memory usage in "
+                             "the previous analysis into the same output "
+                             "directory. This way a high number of jobs can "
+                             "be used without running out of memory when a "
+                             "few source files need a lot of memory to "
+                             "analyze. The analyses which are killed because "
+                             "the system ran out of memory are retried at "
+                             "the end with less jobs.")
+
+    parser.add_argument('--analyzer-output-memory-limit',
+                        type=int,
+                        dest='analyzer_output_memory_limit',
+                        metavar='MEGABYTES',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Keep at most this many megabytes of the "
+                             "standard output and standard error of an "
+                             "analyzer process in memory. The longer outputs "
+                             "are written to temporary files in the output "
+                             "directory while the analyzer is running. "
+                             "(default: 8)")
+
+    parser.add_argument('--profile-analysis',
+                        dest='profile_analysis',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Record the time and resource usage of the "
+                             "analysis of every build action: the time it "
+                             "waited for a free worker, the wall clock and "
+                             "CPU time and the peak memory usage of the "
+                             "analyzer, the time of post-processing its "
+                             "results and the size of its output. The "
+                             "records are saved into the 'metadata.json' "
+                             "file of the output directory, and into a "
+                             "'profile.trace.json' file in the Chrome trace "
+                             "event format, which shows the utilization of "
+                             "the workers over time in "
+                             "https://ui.perfetto.dev or chrome://tracing.")
+
+    parser.add_argument('--jobserver',
+                        dest='jobserver',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Use the job slots of GNU make if CodeChecker "
+                             "is run by 'make -jN', e.g. to analyze the "
+                             "source files while the rest of the project is "
+                             "being built. An analyzer process is started "
+                             "only with a free job slot of make, so the build "
+                             "jobs and the analyzer processes together don't "
+                             "exceed N. The number of analyzer processes is "
+                             "limited by '--jobs' too. If make is older than "
+                             "4.4, the make recipe running CodeChecker must "
+                             "be prefixed by '+'.")
+
     skip_mode = parser.add_argument_group("file filter arguments")
     skip_mode.add_argument('-i', '--ignore', '--skip',
                            dest="skipfile",
@@ -229,6 +299,21 @@ def add_arguments_to_parser(parser):
                              "specified file rather than invoke the compiler "
                              "executable.")
 
+    parser.add_argument('--compiler-info-cache',
+                        dest="compiler_info_cache_dir",
+                        metavar="CACHE_DIR",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Directory of a persistent cache of the implicit "
+                             "compiler information (include paths, default "
+                             "language standard and target). The cache can "
+                             "be shared by analysis runs, so the compilers "
+                             "are not invoked again for the same compiler "
+                             "and flag combinations. An entry becomes "
+                             "invalid if the compiler binary changes. This "
+                             "option is ignored if --compiler-info-file is "
+                             "given.")
+
     parser.add_argument('--dump-compiler-info-file',
                         dest="dump_compiler_info_file",
                         required=False,
@@ -293,7 +378,11 @@ def add_arguments_to_parser(parser):
                              "executed by calling the make command like "
                              "'make -f output_dir/Makefile'. You can ignore "
                              "errors with the -i/--ignore-errors options: "
-                             "'make -f output_dir/Makefile -i'.")
+                             "'make -f output_dir/Makefile -i'. If it is run "
+                             "by a recipe of another Makefile as '$(MAKE) -f "
+                             "output_dir/Makefile' without a -j option, the "
+                             "analyzers use the job slots of the outer make "
+                             "command.")
 
     parser.add_argument('-q', '--quiet',
                         dest="quiet",
@@ -421,6 +510,78 @@ def add_arguments_to_parser(parser):
                                     "report directory. When this flag is "
                                     "used, 'failed' directory remains empty.")
 
+    analyzer_opts.add_argument('--reproducer-blob-store',
+                               dest='reproducer_blob_store',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Write the source files of the zip files "
+                                    "of the failed analyses (or the "
+                                    "reproducers, see "
+                                    "'--generate-reproducer') into a "
+                                    "content-addressed store in the 'blobs' "
+                                    "directory of the report directory, "
+                                    "where every distinct file is stored "
+                                    "only once, and write a manifest file "
+                                    "instead of every zip file. This saves "
+                                    "disk space and I/O if lots of "
+                                    "translation units fail, and the "
+                                    "manifest files and the files they "
+                                    "reference are uploaded by 'CodeChecker "
+                                    "store' instead of the zip files. A zip "
+                                    "file can be written from its manifest "
+                                    "file by 'tu_collector --manifest "
+                                    "MANIFEST --zip ZIP'.")
+
+    analyzer_opts.add_argument('--result-cache',
+                               type=str,
+                               dest='result_cache_dir',
+                               metavar='CACHE_DIR',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Directory of a persistent analysis "
+                                    "result cache which can be shared by "
+                                    "several analysis runs. A build action "
+                                    "is not analyzed again if the cache "
+                                    "contains its result for the same "
+                                    "analyzer binary, checker configuration "
+                                    "and the same content of the source file "
+                                    "and its included headers. CTU and "
+                                    "statistics based analysis results are "
+                                    "not cached.")
+
+    analyzer_opts.add_argument('--result-cache-max-size',
+                               type=int,
+                               dest='result_cache_max_size',
+                               metavar='MEGABYTES',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="The maximum size of the analysis result "
+                                    "cache in megabytes. The least recently "
+                                    "used entries are removed from the cache "
+                                    "at the end of the analysis if it grows "
+                                    "larger. By default the size of the "
+                                    "cache is not limited.")
+
+    analyzer_opts.add_argument('--refresh-analyzer-info',
+                               dest='refresh_analyzer_info',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Query the version, the checkers and "
+                                    "the options of the analyzer binaries "
+                                    "again instead of taking them from the "
+                                    "analyzer info cache. The cache is "
+                                    "stored in the 'codechecker' directory "
+                                    "of the user's cache directory "
+                                    "($XDG_CACHE_HOME or ~/.cache) and its "
+                                    "entries are identified by the real "
+                                    "path, size and modification time of "
+                                    "the analyzer binaries. Use this flag if "
+                                    "an analyzer is updated without changing "
+                                    "its binary, e.g. behind a wrapper "
+                                    "script.")
+
     cmd_config.add_option(analyzer_opts)
 
     analyzer_opts.add_argument('--cppcheckargs',
@@ -539,6 +700,45 @@ def add_arguments_to_parser(parser):
                                     "that much of a slowdown compared to "
                                     "using only the Z3 solver.")
 
+    distributed_opts = parser.add_argument_group(
+        "distributed analysis arguments",
+        """
+The analysis can be distributed among several machines. In this mode
+'CodeChecker analyze' is the coordinator: it hands out the build actions to
+'CodeChecker analyze-worker' processes running on other machines, and
+collects the results into the output directory. The source files and the
+analyzers must be available at the same paths on the workers, e.g. on a
+shared file system or in a copy of the source tree.""")
+
+    distributed_opts.add_argument('--coordinator',
+                                  type=network_address,
+                                  dest='coordinator_address',
+                                  metavar='HOST:PORT',
+                                  default=argparse.SUPPRESS,
+                                  required=False,
+                                  help="Don't run the analyzers on this "
+                                       "machine, but listen at the given "
+                                       "address for analyzer workers and "
+                                       "hand out the build actions to them. "
+                                       "The build actions of a lost worker "
+                                       "are handed out again. The workers "
+                                       "can be started by 'CodeChecker "
+                                       "analyze-worker HOST:PORT'. Cross "
+                                       "translation unit and statistics "
+                                       "analysis, '--result-cache' and "
+                                       "'--memory-budget' and '--jobserver' "
+                                       "are not supported in this mode.")
+
+    distributed_opts.add_argument('--auth-key-file',
+                                  type=existing_abspath,
+                                  dest='auth_key_file',
+                                  default=argparse.SUPPRESS,
+                                  required=False,
+                                  help="File containing a secret key which "
+                                       "authenticates the analyzer workers. "
+                                       "The workers must be given the same "
+                                       "key. Required by '--coordinator'.")
+
     ctu_opts = parser.add_argument_group(
         "cross translation unit analysis arguments",
         """
@@ -591,6 +791,21 @@ Cross-TU analysis. By default, no CTU analysis is run when
                                "same translation unit without "
                                "Cross-TU enabled.")
 
+    ctu_opts.add_argument('--ctu-incremental',
+                          action='store_true',
+                          dest='ctu_incremental',
+                          default=argparse.SUPPRESS,
+                          help="Keep the files created by the 'collect' "
+                               "phase of Cross-TU analysis in "
+                               "'<OUTPUT_DIR>/ctu-dir' and reuse them in the "
+                               "next 'collect' phase. The AST dumps and "
+                               "function maps are generated again only for "
+                               "the translation units whose build command, "
+                               "source file or included headers have "
+                               "changed, and the files of the translation "
+                               "units which are not in the build anymore "
+                               "are removed.")
+
     # Only check for AST loading modes if CTU is available.
     ctu_opts.add_argument('--ctu-ast-mode',
                           action='store',
@@ -1001,12 +1216,17 @@ def is_checker_config_valid(
 
 def get_affected_file_paths(
     file_filters: List[str],
-    compile_commands: tu_collector.CompilationDB
+    compile_commands: tu_collector.CompilationDB,
+    index_file: Optional[str] = None,
+    jobs: int = 1
 ) -> List[str]:
     """
     Returns a list of source files for existing header file otherwise returns
-    with the same file path expression.
+    with the same file path expression. The source files depending on the
+    headers are looked up in a dependency index which is loaded from and
+    saved to index_file (if any).
     """
+    dep_index = None
     file_paths = []  # Use list to keep the order of the file paths.
     for file_filter in file_filters:
         file_paths.append(str(Path(file_filter).resolve())
@@ -1015,8 +1235,13 @@ def get_affected_file_paths(
         if os.path.exists(file_filter) and \
                 file_filter.endswith(header_file_extensions):
             LOG.info("Get dependent source files for '%s'...", file_filter)
-            dependent_sources = tu_collector.get_dependent_sources(
-                compile_commands, file_filter)
+            if dep_index is None:
+                dep_index = DependencyIndex(index_file)
+                dep_index.update(compile_commands, jobs)
+                dep_index.save()
+
+            dependent_sources = dep_index.get_dependent_sources(
+                os.path.abspath(file_filter))
 
             LOG.info("Get dependent source files for '%s' done.", file_filter)
             LOG.debug("Dependent source files: %s",
@@ -1034,8 +1259,13 @@ def __get_skip_handlers(args, compile_commands) -> SkipListHandlers:
     """
     skip_handlers = SkipListHandlers()
     if 'files' in args:
+        index_file = None
+        if not args.dump_compiler_info_file:
+            index_file = os.path.join(args.output_path,
+                                      DEPENDENCY_INDEX_FILE)
+
         source_file_paths = get_affected_file_paths(
-            args.files, compile_commands)
+            args.files, compile_commands, index_file, args.jobs)
 
         # Creates a skip file where all source files will be skipped except
         # the given source files and all the header files.
@@ -1056,6 +1286,34 @@ def __get_skip_handlers(args, compile_commands) -> SkipListHandlers:
     return skip_handlers
 
 
+def __record_compile_commands(compile_commands, compile_cmd_file, counts):
+    """
+    Forward the build actions of the compilation database, meanwhile count
+    them and write them to the given file (if any) in the same format as
+    json.dump(compile_commands, f, indent=2) would write them. This way the
+    compilation database is read only once and it is not kept in the memory
+    as a whole.
+    """
+    if not compile_cmd_file:
+        for build_action in compile_commands:
+            counts['total'] += 1
+            yield build_action
+        return
+
+    compile_cmd_file.write('[')
+    for build_action in compile_commands:
+        yield build_action
+
+        # The build action is written when the next one is requested,
+        # because the log parser expands the response files of the build
+        # action in place.
+        compile_cmd_file.write(',\n  ' if counts['total'] else '\n  ')
+        compile_cmd_file.write(
+            json.dumps(build_action, indent=2).replace('\n', '\n  '))
+        counts['total'] += 1
+    compile_cmd_file.write('\n]' if counts['total'] else ']')
+
+
 def __update_skip_file(args):
     """
     Remove previous skip file if there was any.
@@ -1256,6 +1514,9 @@ def main(args):
     """
     logger.setup_logger(args.verbose if 'verbose' in args else None)
 
+    if 'refresh_analyzer_info' in args:
+        analyzer_info_cache.set_refresh(True)
+
     __transform_deprecated_flags(args)
 
     # Validate analyzer and checker config (if any)
@@ -1280,6 +1541,49 @@ def main(args):
         LOG.error("Analyzer option 'ctu-ast-mode' requires CTU mode enabled")
         sys.exit(1)
 
+    if 'ctu_incremental' in args and \
+            ('ctu_phases' not in args or not args.ctu_phases[0]):
+        LOG.error("Analyzer option 'ctu-incremental' requires the 'collect' "
+                  "phase of CTU analysis enabled")
+        sys.exit(1)
+
+    if 'result_cache_max_size' in args and args.result_cache_max_size < 0:
+        LOG.error("The size of the result cache can't be negative.")
+        sys.exit(1)
+
+    if 'memory_budget' in args and args.memory_budget <= 0:
+        LOG.error("The memory budget must be positive.")
+        sys.exit(1)
+
+    if 'analyzer_output_memory_limit' in args and \
+            args.analyzer_output_memory_limit <= 0:
+        LOG.error("The memory limit of the analyzer output must be "
+                  "positive.")
+        sys.exit(1)
+
+    if 'coordinator_address' in args:
+        if 'auth_key_file' not in args:
+            LOG.error("Distributed analysis requires an authentication key "
+                      "given by '--auth-key-file'.")
+            sys.exit(1)
+
+        try:
+            read_auth_key(args.auth_key_file)
+        except (OSError, ValueError) as ex:
+            LOG.error("Failed to read the authentication key: %s", ex)
+            sys.exit(1)
+
+        unsupported = [option for option, dest in [
+            ('--ctu', 'ctu_phases'), ('--stats', 'stats_enabled'),
+            ('--stats-collect', 'stats_output'), ('--stats-use', 'stats_dir'),
+            ('--result-cache', 'result_cache_dir'),
+            ('--memory-budget', 'memory_budget'),
+            ('--jobserver', 'jobserver')] if dest in args]
+        if unsupported:
+            LOG.error("Distributed analysis doesn't support the following "
+                      "options: %s", ', '.join(unsupported))
+            sys.exit(1)
+
     check_satisfied_capabilities(args)
 
     try:
@@ -1322,7 +1626,14 @@ def main(args):
         LOG.error(f"Found no compilation commands in '{args.input}'")
         sys.exit(1)
 
+    if 'clean' in args and os.path.isdir(args.output_path):
+        LOG.info("Previous analysis results in '%s' have been removed, "
+                 "overwriting with current result", args.output_path)
+        shutil.rmtree(args.output_path)
+
     # Process the skip list if present. This will filter out analysis actions.
+    # The dependency index of the '--file' option is saved in the output
+    # directory, so it must be cleaned before.
     skip_handlers = __get_skip_handlers(args, compile_commands)
     # Post processin filters
     filter_handlers = None
@@ -1362,23 +1673,14 @@ def main(args):
 
     context = analyzer_context.get_context()
 
-    # Number of all the compilation commands in the parsed log files,
-    # logged by the logger.
-    all_cmp_cmd_count = len(compile_commands)
-
     # We clear the output directory in the following cases.
     ctu_dir = os.path.join(args.output_path, 'ctu-dir')
     if 'ctu_phases' in args and args.ctu_phases[0] and \
-            os.path.isdir(ctu_dir):
+            'ctu_incremental' not in args and os.path.isdir(ctu_dir):
         # Clear the CTU-dir if the user turned on the collection phase.
         LOG.debug("Previous CTU contents have been deleted.")
         shutil.rmtree(ctu_dir)
 
-    if 'clean' in args and os.path.isdir(args.output_path):
-        LOG.info("Previous analysis results in '%s' have been removed, "
-                 "overwriting with current result", args.output_path)
-        shutil.rmtree(args.output_path)
-
     if not os.path.exists(args.output_path) and \
             not args.dump_compiler_info_file:
         os.makedirs(args.output_path)
@@ -1386,8 +1688,20 @@ def main(args):
     LOG.debug("args: %s", str(args))
     LOG.debug("Output will be stored to: '%s'", args.output_path)
 
+    # Number of all the compilation commands in the parsed log files,
+    # logged by the logger. These are counted while they are parsed.
+    cmp_cmd_counts = {'total': 0}
+
+    # The compilation commands are written to a temporary file while they are
+    # parsed, which is copied to compile_cmd.json after the analysis.
+    compile_cmd_file = None
+    if not args.dump_compiler_info_file:
+        compile_cmd_file = tempfile.TemporaryFile(
+            'w+', encoding="utf-8", errors="ignore", dir=args.output_path)
+
     actions, skipped_cmp_cmd_count = log_parser.parse_unique_log(
-        compile_commands,
+        __record_compile_commands(
+            compile_commands, compile_cmd_file, cmp_cmd_counts),
         args.compile_uniqueing,
         compiler_info_file,
         args.keep_gcc_include_fixed,
@@ -1395,7 +1709,9 @@ def main(args):
         args.jobs,
         skip_handlers,
         pre_analysis_skip_handlers,
-        ctu_or_stats_enabled)
+        ctu_or_stats_enabled,
+        args.compiler_info_cache_dir if 'compiler_info_cache_dir' in args
+        else None)
 
     if not actions:
         LOG.warning("No analysis is required.")
@@ -1449,6 +1765,8 @@ def main(args):
         metadata_tool['result_source_files'] = \
             __get_result_source_files(metadata_prev)
 
+    all_cmp_cmd_count = cmp_cmd_counts['total']
+
     CompileCmdParseCount = \
         collections.namedtuple('CompileCmdParseCount',
                                'total, analyze, skipped, removed_by_uniqueing')
@@ -1494,7 +1812,9 @@ def main(args):
     # WARN: store command will search for this file!!!!
     compile_cmd_json = os.path.join(args.output_path, 'compile_cmd.json')
     with open(compile_cmd_json, 'w', encoding="utf-8", errors="ignore") as f:
-        json.dump(compile_commands, f, indent=2)
+        compile_cmd_file.seek(0)
+        shutil.copyfileobj(compile_cmd_file, f)
+    compile_cmd_file.close()
 
     try:
         # pylint: disable=no-name-in-module
@@ -0,0 +1,127 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Defines a subcommand for CodeChecker which analyzes the build actions handed
+out by the coordinator of a distributed analysis.
+"""
+
+
+import argparse
+import sys
+
+import multiprocess  # type: ignore
+
+from codechecker_analyzer.arg import existing_abspath, network_address
+from codechecker_analyzer.distributed import read_auth_key, run_worker
+
+from codechecker_common import logger
+from codechecker_common.compatibility.multiprocessing import cpu_count
+
+
+LOG = logger.get_logger('system')
+
+
+def get_argparser_ctor_args():
+    """
+    This method returns a dict containing the kwargs for constructing an
+    argparse.ArgumentParser (either directly or as a subparser).
+    """
+
+    return {
+        'prog': 'CodeChecker analyze-worker',
+        'formatter_class': argparse.ArgumentDefaultsHelpFormatter,
+
+        # Description is shown when the command's help is queried directly
+        'description': """
+Connect to the coordinator of a distributed analysis started by
+'CodeChecker analyze --coordinator HOST:PORT' and analyze the build actions
+handed out by it. The results are sent back to the coordinator which saves
+them into its output directory. The worker exits when every build action is
+analyzed.
+
+The source files and the analyzers must be available at the same paths as on
+the machine of the coordinator, e.g. on a shared file system or in a copy of
+the source tree.""",
+
+        # Help is shown when the "parent" CodeChecker command lists the
+        # individual subcommands.
+        'help': "Analyze the build actions handed out by the coordinator of "
+                "a distributed analysis."
+    }
+
+
+def add_arguments_to_parser(parser):
+    """
+    Add the subcommand's arguments to the given argparse.ArgumentParser.
+    """
+
+    parser.add_argument('coordinator_address',
+                        type=network_address,
+                        metavar='HOST:PORT',
+                        help="The address of the coordinator given to "
+                             "'CodeChecker analyze --coordinator'.")
+
+    parser.add_argument('--auth-key-file',
+                        type=existing_abspath,
+                        dest='auth_key_file',
+                        required=True,
+                        help="File containing the secret key which "
+                             "authenticates the worker to the coordinator.")
+
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=cpu_count(),
+                        help="Number of threads to use in analysis. More "
+                             "threads mean faster analysis at the cost of "
+                             "using more memory.")
+
+    parser.add_argument('--connect-timeout',
+                        type=int,
+                        dest='connect_timeout',
+                        metavar='SECONDS',
+                        required=False,
+                        default=60,
+                        help="Keep trying to connect to the coordinator for "
+                             "this many seconds, because it starts to "
+                             "listen only after the build actions are "
+                             "parsed.")
+
+    logger.add_verbose_arguments(parser)
+    parser.set_defaults(func=main)
+
+
+def main(args):
+    """
+    Analyze the build actions handed out by the coordinator.
+    """
+    logger.setup_logger(args.verbose if 'verbose' in args else None)
+
+    if args.jobs <= 0:
+        LOG.error("The number of jobs must be positive.")
+        sys.exit(1)
+
+    try:
+        auth_key = read_auth_key(args.auth_key_file)
+    except (OSError, ValueError) as ex:
+        LOG.error("Failed to read the authentication key: %s", ex)
+        sys.exit(1)
+
+    try:
+        run_worker(args.coordinator_address, auth_key, args.jobs,
+                   args.connect_timeout)
+    except multiprocess.AuthenticationError as ex:
+        LOG.error("Failed to authenticate to the coordinator: %s", ex)
+        sys.exit(1)
+    except (OSError, EOFError) as ex:
+        LOG.error("Lost the connection to the coordinator: %s", ex)
+        sys.exit(1)
+    except Exception as ex:
+        LOG.error("Analysis failed: %s", ex)
+        sys.exit(1)
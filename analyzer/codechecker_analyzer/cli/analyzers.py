@@ -16,7 +16,7 @@ import subprocess
 
 from codechecker_report_converter import twodim
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 from codechecker_analyzer.analyzers import analyzer_types
 
 from codechecker_common import logger
@@ -95,6 +95,18 @@ def add_arguments_to_parser(parser):
                         choices=USER_FORMATS,
                         help="Specify the format of the output list.")
 
+    parser.add_argument('--refresh-analyzer-info',
+                        dest='refresh_analyzer_info',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Query the version, the checkers and the "
+                             "options of the analyzer binaries again instead "
+                             "of taking them from the analyzer info cache. "
+                             "The cache entries are identified by the real "
+                             "path, size and modification time of the "
+                             "analyzer binaries.")
+
     logger.add_verbose_arguments(parser)
     parser.set_defaults(func=main)
 
@@ -111,6 +123,9 @@ def main(args):
 
     logger.setup_logger(args.verbose if 'verbose' in args else None, stream)
 
+    if 'refresh_analyzer_info' in args:
+        analyzer_info_cache.set_refresh(True)
+
     context = analyzer_context.get_context()
     _, errored = \
         analyzer_types.check_supported_analyzers(
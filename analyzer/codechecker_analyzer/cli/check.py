@@ -137,6 +137,21 @@ def add_arguments_to_parser(parser):
                              "specified file rather than invoke the compiler "
                              "executable.")
 
+    parser.add_argument('--compiler-info-cache',
+                        dest="compiler_info_cache_dir",
+                        metavar="CACHE_DIR",
+                        required=False,
+                        default=argparse.SUPPRESS,
+                        help="Directory of a persistent cache of the implicit "
+                             "compiler information (include paths, default "
+                             "language standard and target). The cache can "
+                             "be shared by analysis runs, so the compilers "
+                             "are not invoked again for the same compiler "
+                             "and flag combinations. An entry becomes "
+                             "invalid if the compiler binary changes. This "
+                             "option is ignored if --compiler-info-file is "
+                             "given.")
+
     parser.add_argument('--dump-compiler-info-file',
                         dest="dump_compiler_info_file",
                         required=False,
@@ -234,6 +249,77 @@ used to generate a log file on the fly.""")
                                     "More threads mean faster analysis at "
                                     "the cost of using more memory.")
 
+    analyzer_opts.add_argument('--memory-budget',
+                               type=int,
+                               dest='memory_budget',
+                               metavar='MEGABYTES',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Start new analyzer processes only while "
+                                    "the sum of their expected memory usage "
+                                    "fits in this many megabytes. The "
+                                    "expected memory usage of a source file "
+                                    "is its peak memory usage in the previous "
+                                    "analysis into the same output "
+                                    "directory. This way a high number of "
+                                    "jobs can be used without running out of "
+                                    "memory when a few source files need a "
+                                    "lot of memory to analyze. The analyses "
+                                    "which are killed because the system ran "
+                                    "out of memory are retried at the end "
+                                    "with less jobs.")
+
+    analyzer_opts.add_argument('--analyzer-output-memory-limit',
+                               type=int,
+                               dest='analyzer_output_memory_limit',
+                               metavar='MEGABYTES',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Keep at most this many megabytes of the "
+                                    "standard output and standard error of "
+                                    "an analyzer process in memory. The "
+                                    "longer outputs are written to temporary "
+                                    "files in the output directory while the "
+                                    "analyzer is running. (default: 8)")
+
+    analyzer_opts.add_argument('--profile-analysis',
+                               dest='profile_analysis',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Record the time and resource usage of "
+                                    "the analysis of every build action: the "
+                                    "time it waited for a free worker, the "
+                                    "wall clock and CPU time and the peak "
+                                    "memory usage of the analyzer, the time "
+                                    "of post-processing its results and the "
+                                    "size of its output. The records are "
+                                    "saved into the 'metadata.json' file of "
+                                    "the output directory, and into a "
+                                    "'profile.trace.json' file in the Chrome "
+                                    "trace event format, which shows the "
+                                    "utilization of the workers over time in "
+                                    "https://ui.perfetto.dev or "
+                                    "chrome://tracing.")
+
+    analyzer_opts.add_argument('--jobserver',
+                               dest='jobserver',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Use the job slots of GNU make if "
+                                    "CodeChecker is run by 'make -jN', e.g. "
+                                    "to analyze the source files while the "
+                                    "rest of the project is being built. An "
+                                    "analyzer process is started only with a "
+                                    "free job slot of make, so the build jobs "
+                                    "and the analyzer processes together "
+                                    "don't exceed N. The number of analyzer "
+                                    "processes is limited by '--jobs' too. If "
+                                    "make is older than 4.4, the make recipe "
+                                    "running CodeChecker must be prefixed by "
+                                    "'+'.")
+
     analyzer_opts.add_argument('-c', '--clean',
                                dest="clean",
                                required=False,
@@ -377,6 +463,78 @@ used to generate a log file on the fly.""")
                                     "report directory. When this flag is "
                                     "used, 'failed' directory remains empty.")
 
+    analyzer_opts.add_argument('--reproducer-blob-store',
+                               dest='reproducer_blob_store',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Write the source files of the zip files "
+                                    "of the failed analyses (or the "
+                                    "reproducers, see "
+                                    "'--generate-reproducer') into a "
+                                    "content-addressed store in the 'blobs' "
+                                    "directory of the report directory, "
+                                    "where every distinct file is stored "
+                                    "only once, and write a manifest file "
+                                    "instead of every zip file. This saves "
+                                    "disk space and I/O if lots of "
+                                    "translation units fail, and the "
+                                    "manifest files and the files they "
+                                    "reference are uploaded by 'CodeChecker "
+                                    "store' instead of the zip files. A zip "
+                                    "file can be written from its manifest "
+                                    "file by 'tu_collector --manifest "
+                                    "MANIFEST --zip ZIP'.")
+
+    analyzer_opts.add_argument('--result-cache',
+                               type=str,
+                               dest='result_cache_dir',
+                               metavar='CACHE_DIR',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Directory of a persistent analysis "
+                                    "result cache which can be shared by "
+                                    "several analysis runs. A build action "
+                                    "is not analyzed again if the cache "
+                                    "contains its result for the same "
+                                    "analyzer binary, checker configuration "
+                                    "and the same content of the source file "
+                                    "and its included headers. CTU and "
+                                    "statistics based analysis results are "
+                                    "not cached.")
+
+    analyzer_opts.add_argument('--result-cache-max-size',
+                               type=int,
+                               dest='result_cache_max_size',
+                               metavar='MEGABYTES',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="The maximum size of the analysis result "
+                                    "cache in megabytes. The least recently "
+                                    "used entries are removed from the cache "
+                                    "at the end of the analysis if it grows "
+                                    "larger. By default the size of the "
+                                    "cache is not limited.")
+
+    analyzer_opts.add_argument('--refresh-analyzer-info',
+                               dest='refresh_analyzer_info',
+                               action='store_true',
+                               default=argparse.SUPPRESS,
+                               required=False,
+                               help="Query the version, the checkers and "
+                                    "the options of the analyzer binaries "
+                                    "again instead of taking them from the "
+                                    "analyzer info cache. The cache is "
+                                    "stored in the 'codechecker' directory "
+                                    "of the user's cache directory "
+                                    "($XDG_CACHE_HOME or ~/.cache) and its "
+                                    "entries are identified by the real "
+                                    "path, size and modification time of "
+                                    "the analyzer binaries. Use this flag if "
+                                    "an analyzer is updated without changing "
+                                    "its binary, e.g. behind a wrapper "
+                                    "script.")
+
     cmd_config.add_option(analyzer_opts)
 
     # TODO: One day, get rid of these. See Issue #36, #427.
@@ -970,6 +1128,14 @@ def main(args):
                           'checker_config',
                           'capture_analysis_output',
                           'generate_reproducer',
+                          'reproducer_blob_store',
+                          'result_cache_dir',
+                          'result_cache_max_size',
+                          'refresh_analyzer_info',
+                          'memory_budget',
+                          'analyzer_output_memory_limit',
+                          'profile_analysis',
+                          'jobserver',
                           'config_file',
                           'ctu_ast_mode',
                           'ctu_phases',
@@ -989,6 +1155,7 @@ def main(args):
                           'report_hash',
                           'add_gcc_include_dirs_with_isystem',
                           'compiler_info_file',
+                          'compiler_info_cache_dir',
                           'dump_compiler_info_file',
                           'enable_z3',
                           'enable_z3_refutation']
@@ -1014,6 +1181,7 @@ def main(args):
         __update_if_key_exists(args, parse_args, 'trim_path_prefix')
         __update_if_key_exists(args, parse_args, 'review_status')
         __update_if_key_exists(args, parse_args, 'verbose')
+        __update_if_key_exists(args, parse_args, 'jobs')
         __update_if_key_exists(args, parse_args, 'skipfile')
         __update_if_key_exists(args, parse_args, 'suppress')
 
@@ -19,7 +19,7 @@ from typing import Dict, Iterable, List, Tuple, Union
 
 from codechecker_report_converter import twodim
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 from codechecker_analyzer.analyzers import analyzer_types
 from codechecker_analyzer.analyzers.config_handler import CheckerState
 
@@ -177,6 +177,18 @@ def add_arguments_to_parser(parser):
                         choices=USER_FORMATS + ['custom'],
                         help="The format to list the applicable checkers as.")
 
+    parser.add_argument('--refresh-analyzer-info',
+                        dest='refresh_analyzer_info',
+                        action='store_true',
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Query the version, the checkers and the "
+                             "options of the analyzer binaries again instead "
+                             "of taking them from the analyzer info cache. "
+                             "The cache entries are identified by the real "
+                             "path, size and modification time of the "
+                             "analyzer binaries.")
+
     logger.add_verbose_arguments(parser)
     parser.set_defaults(func=main)
 
@@ -583,6 +595,9 @@ def main(args):
     logger.setup_logger(args.verbose if 'verbose' in args else None,
                         None if args.output_format == 'table' else 'stderr')
 
+    if 'refresh_analyzer_info' in args:
+        analyzer_info_cache.set_refresh(True)
+
     cl = analyzer_context.get_context().checker_labels
 
     if 'profile' in args and not args.profile:
@@ -14,25 +14,24 @@ human-readable format.
 import argparse
 import os
 import sys
-from typing import Dict, Optional, Set, List, Any
+from typing import Dict, Optional, Set, List, Any, Iterator, Tuple
 import json
 import fnmatch
 
 from codechecker_report_converter.util import dump_json_output
-from codechecker_report_converter.report import report_file, \
+from codechecker_report_converter.report import File, report_file, \
     reports as reports_helper
 from codechecker_report_converter.report.output import baseline, codeclimate, \
     gerrit, sarif, json as report_to_json, plaintext
-from codechecker_report_converter.report.output.html import \
-    html as report_to_html
 from codechecker_report_converter.report.statistics import Statistics
 
 
 from codechecker_analyzer import analyzer_context, suppress_handler
 from codechecker_analyzer.util import analyzer_action_hash
-from codechecker_analyzer.analyzers.analyzer_types import supported_analyzers
 
 from codechecker_common import arg, logger, cmd_config
+from codechecker_common.checker_labels import CheckerLabels
+from codechecker_common.compatibility.multiprocessing import Pool, cpu_count
 from codechecker_common.review_status_handler import ReviewStatusHandler
 from codechecker_common.skiplist_handler import SkipListHandler, \
     SkipListHandlers
@@ -43,6 +42,24 @@ from codechecker_common.util import load_json
 
 LOG = logger.get_logger('system')
 
+# The export formats which are written as the analyzer result files are
+# processed. The reports of an analyzer result file are dropped after they
+# are processed, except for the gerrit export which needs all the reports at
+# once.
+EXPORT_WRITERS = {
+    'json': report_to_json.Writer,
+    'codeclimate': codeclimate.Writer,
+    'sarif': sarif.Writer}
+
+# The analyzer result files are parsed in batches of this many files per job.
+# The next batch is parsed while the results of the previous one are
+# processed, so at most two batches of reports are in memory.
+PARSE_BATCH_SIZE_PER_JOB = 4
+
+# The data of the processes which parse the analyzer result files. It is set
+# by init_parse_worker().
+PARSE_WORKER_DATA: Dict[str, Any] = {}
+
 
 def init_logger(level, stream=None, logger_name='system'):
     logger.setup_logger(level, stream)
@@ -125,6 +142,17 @@ def add_arguments_to_parser(parser):
                         help="Specify the format the analysis results were "
                              "created as.")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=cpu_count(),
+                        help="Number of parallel processes which parse the "
+                             "analysis result files. The results are "
+                             "printed in the same order as by a single "
+                             "process. Choosing value 1 doesn't use "
+                             "sub-processes.")
+
     output_opts = parser.add_argument_group("export arguments")
     output_opts.add_argument('-e', '--export',
                              dest="export",
@@ -284,6 +312,10 @@ def get_metadata(dir_path: str) -> Optional[Dict]:
 def get_report_dir_status(compile_commands: List[dict[str, str]],
                           report_dir: str,
                           detailed_flag: bool):
+    # Loading the analyzer modules is slow, so they are not imported when
+    # parse is started only to print the reports.
+    from codechecker_analyzer.analyzers.analyzer_types import \
+        supported_analyzers
 
     recent: Dict[str, Dict[str, int]] = {}
     old: Dict[str, Dict[str, int]] = {}
@@ -389,6 +421,9 @@ def print_status(report_dir: str,
                  files: Optional[List[str]],
                  export: Optional[str] = None,
                  output_path: Optional[str] = None):
+    from codechecker_analyzer.analyzers.analyzer_types import \
+        supported_analyzers
+
     if export and export != "json":
         LOG.error("Only JSON export format is supported.")
         sys.exit(1)
@@ -469,6 +504,104 @@ def print_status(report_dir: str,
             LOG.info("Status info was dumped to '%s'.", output_path)
 
 
+def init_parse_worker(
+    skip_handlers: SkipListHandlers,
+    checker_labels: Optional[CheckerLabels]
+):
+    """ Initialize a process which parses analyzer result files. """
+    PARSE_WORKER_DATA.clear()
+    PARSE_WORKER_DATA.update({
+        'skip_handlers': skip_handlers,
+        'checker_labels': checker_labels,
+        'file_cache': {},  # For memory effiency.
+        'review_status_handlers': {}})
+
+
+def parse_result_file(
+    task: Tuple[str, Optional[str]]
+) -> Tuple[List[Any], Dict[int, Any], List[str], Optional[str]]:
+    """
+    Parse an analyzer result file and determine the review status of its
+    reports. The task is the path of the analyzer result file and the path of
+    the review status config file which applies to it.
+
+    Returns the reports which are not skipped, the source code comments of
+    the reports by their index, the warnings about the source code comments
+    and an error message if the review status of a report is ambiguous.
+    """
+    file_path, review_status_cfg = task
+
+    # The review status config file is parsed only once in every process.
+    handlers = PARSE_WORKER_DATA['review_status_handlers']
+    review_status_handler = handlers.get(review_status_cfg)
+    if review_status_handler is None:
+        review_status_handler = ReviewStatusHandler()
+        if review_status_cfg:
+            review_status_handler.set_review_status_config(review_status_cfg)
+        handlers[review_status_cfg] = review_status_handler
+
+    num_of_warnings = len(review_status_handler.source_comment_warnings())
+
+    reports = report_file.get_reports(
+        file_path, PARSE_WORKER_DATA['checker_labels'],
+        PARSE_WORKER_DATA['file_cache'])
+
+    kept_reports = []
+    error = None
+    for report in reports:
+        try:
+            # Skipped reports shouldn't check source code comments because
+            # they potentially raise an exception.
+            if not report.skip(PARSE_WORKER_DATA['skip_handlers']):
+                report.review_status = \
+                    review_status_handler.get_review_status(report)
+                kept_reports.append(report)
+        except ValueError as err:
+            error = str(err)
+            break
+
+    source_comments = {}
+    for idx, report in enumerate(kept_reports):
+        source_comment = review_status_handler.source_comment(report)
+        if source_comment:
+            source_comments[idx] = source_comment
+
+    warnings = review_status_handler.source_comment_warnings()[
+        num_of_warnings:]
+
+    return kept_reports, source_comments, warnings, error
+
+
+def parse_result_files(
+    tasks: List[Tuple[str, Optional[str]]],
+    skip_handlers: SkipListHandlers,
+    checker_labels: Optional[CheckerLabels],
+    jobs: int
+) -> Iterator[Tuple[List[Any], Dict[int, Any], List[str], Optional[str]]]:
+    """
+    Parse the analyzer result files of the given tasks (see
+    parse_result_file()) in parallel processes. The results are returned in
+    the order of the tasks.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        init_parse_worker(skip_handlers, checker_labels)
+        yield from map(parse_result_file, tasks)
+        return
+
+    batch_size = jobs * PARSE_BATCH_SIZE_PER_JOB
+    with Pool(max_workers=jobs, initializer=init_parse_worker,
+              initargs=(skip_handlers, checker_labels)) as executor:
+        previous_batch: Iterator = iter(())
+        for start in range(0, len(tasks), batch_size):
+            batch = executor.map(parse_result_file,
+                                 tasks[start:start + batch_size])
+
+            yield from previous_batch
+            previous_batch = batch
+
+        yield from previous_batch
+
+
 def main(args):
     """
     Entry point for parsing some analysis results and printing them to the
@@ -602,30 +735,50 @@ def main(args):
         'trim_path_prefix' in args else None
 
     all_reports = []
+    report_hashes: Set[str] = set()
+    file_cache: Dict[str, File] = {}  # For memory effiency.
     statistics = Statistics()
-    file_cache = {}  # For memory effiency.
     changed_files: Set[str] = set()
     processed_path_hashes = set()
     processed_file_paths = set()
     print_steps = 'print_steps' in args
     review_status_handler = ReviewStatusHandler()
+    source_comment_warnings: List[str] = []
+
+    report_writer = None
+    if export in EXPORT_WRITERS:
+        report_writer = EXPORT_WRITERS[export](
+            get_output_file_path("reports.json"))
 
-    html_builder: Optional[report_to_html.HtmlBuilder] = None
+    html_builder = None
     if export == 'html':
+        # The HTML generator is slow to import, so it is loaded only if it is
+        # needed. Parse is started for every file by some pre-commit hooks.
+        from codechecker_report_converter.report.output.html import \
+            html as report_to_html
+
         html_builder = report_to_html.HtmlBuilder(
             context.path_plist_to_html_dist,
             context.checker_labels)
 
+    # The analyzer result files with the review status config file which
+    # applies to them and the metadata of their report directory. The config
+    # file of a report directory applies to the following directories too
+    # which don't have one.
+    result_files = []
+    review_status_cfg = None
     for dir_path, file_paths in report_file.analyzer_result_files(args.input):
-        review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
-        if os.path.lexists(review_status_cfg):
+        dir_review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
+        if os.path.lexists(dir_review_status_cfg):
             try:
                 review_status_handler.set_review_status_config(
-                    review_status_cfg)
+                    dir_review_status_cfg)
             except ValueError as err:
                 LOG.error(err)
                 sys.exit(1)
 
+            review_status_cfg = dir_review_status_cfg
+
         metadata = get_metadata(dir_path)
 
         if metadata and 'files' in args:
@@ -643,74 +796,83 @@ def main(args):
                 else []
             file_paths = specifed_file_paths or file_paths
 
-        for file_path in file_paths:
-            reports = report_file.get_reports(
-                file_path, context.checker_labels, file_cache)
+        result_files.extend((file_path, review_status_cfg, metadata)
+                            for file_path in file_paths)
 
-            for report in reports:
-                try:
-                    # TODO: skip_handler is used later in reports_helper.skip()
-                    # too. However, skipped reports shouldn't check source code
-                    # comments because they potentially raise an exception.
-                    # Skipped files shouldn't raise an exception, also, "skip"
-                    # shouldn't be checked twice.
-                    if not report.skip(skip_handlers):
-                        report.review_status = \
-                            review_status_handler.get_review_status(report)
-                except ValueError as err:
-                    LOG.error(err)
-                    sys.exit(1)
-
-            reports = reports_helper.skip(
-                reports, processed_path_hashes, skip_handlers, suppr_handler,
-                src_comment_status_filter)
-
-            statistics.num_of_analyzer_result_files += 1
-            for report in reports:
-                if report.changed_files:
-                    changed_files.update(report.changed_files)
-
-                statistics.add_report(report)
-
-                if trim_path_prefixes:
-                    report.trim_path_prefixes(trim_path_prefixes)
+    # The analyzer result files are parsed in parallel, but the reports are
+    # processed in the order of the files, so the uniqueing of the reports
+    # and the output is the same as when they are parsed one by one.
+    results = parse_result_files(
+        [(file_path, cfg) for file_path, cfg, _ in result_files],
+        skip_handlers, context.checker_labels,
+        args.jobs if 'jobs' in args else 1)
 
-            all_reports.extend(reports)
+    for (file_path, _, metadata), result in zip(result_files, results):
+        reports, source_comments, warnings, error = result
+
+        source_comment_warnings.extend(warnings)
+        if error:
+            LOG.error(error)
+            sys.exit(1)
+
+        # The reports which are parsed in other processes share the File
+        # objects of the reports which are parsed earlier.
+        for report in reports:
+            report.intern_files(file_cache)
 
-            # Print reports continously.
-            if not export:
-                file_report_map = plaintext.get_file_report_map(
-                    reports, file_path, metadata)
-                plaintext.convert(
-                    review_status_handler,
-                    file_report_map, processed_file_paths, print_steps)
-            elif export == 'html':
-                print(f"Parsing input file '{file_path}'.")
-                report_to_html.convert(
-                    file_path, reports, output_dir_path,
-                    html_builder)
-
-    for warning in review_status_handler.source_comment_warnings():
+        for idx, source_comment in source_comments.items():
+            review_status_handler.set_source_comment(
+                reports[idx], source_comment)
+
+        # The skipped reports are already removed by parse_result_file().
+        reports = reports_helper.skip(
+            reports, processed_path_hashes, None, suppr_handler,
+            src_comment_status_filter)
+
+        statistics.num_of_analyzer_result_files += 1
+        for report in reports:
+            if report.changed_files:
+                changed_files.update(report.changed_files)
+
+            statistics.add_report(report)
+
+            if trim_path_prefixes:
+                report.trim_path_prefixes(trim_path_prefixes)
+
+        if report_writer:
+            report_writer.write(reports)
+        elif export == 'gerrit':
+            all_reports.extend(reports)
+        elif export == 'baseline':
+            report_hashes.update(baseline.convert(reports))
+
+        # Print reports continously.
+        if not export:
+            file_report_map = plaintext.get_file_report_map(
+                reports, file_path, metadata)
+            plaintext.convert(
+                review_status_handler,
+                file_report_map, processed_file_paths, print_steps)
+        elif export == 'html':
+            print(f"Parsing input file '{file_path}'.")
+            report_to_html.convert(
+                file_path, reports, output_dir_path,
+                html_builder)
+
+    for warning in source_comment_warnings:
         LOG.warning(warning)
 
     if export is None:  # Plain text output
         statistics.write()
     elif export == 'html':
         html_builder.finish(output_dir_path, statistics)
-    elif export == 'json':
-        data = report_to_json.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
-    elif export == 'codeclimate':
-        data = codeclimate.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
+    elif report_writer:
+        report_writer.finish()
     elif export == 'gerrit':
         data = gerrit.convert(all_reports)
         dump_json_output(data, get_output_file_path("reports.json"))
-    elif export == 'sarif':
-        data = sarif.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'baseline':
-        data = baseline.convert(all_reports)
+        data = sorted(report_hashes)
         output_path = get_output_file_path("reports.baseline")
         if output_path:
             baseline.write(output_path, data)
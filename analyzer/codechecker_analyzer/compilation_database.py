@@ -12,9 +12,9 @@ Utilities for compilation database handling.
 
 import os
 import shlex
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 
-from codechecker_common.util import load_json
+from codechecker_common.util import iter_json_array, load_json
 
 
 # For details see
@@ -55,7 +55,7 @@ def find_closest_compilation_database(path: str) -> Optional[str]:
     return None
 
 
-def change_args_to_command_in_comp_db(compile_commands: List[Dict]):
+def change_args_to_command(build_action: Dict):
     """
     In CodeChecker we support compilation databases where the JSON object of a
     build action contains "file", "directory" and "command" fields. However,
@@ -63,12 +63,58 @@ def change_args_to_command_in_comp_db(compile_commands: List[Dict]):
     "command" which is a list of command-line arguments instead of the same
     command as a single string. This function make this appropriate conversion.
     """
+    if 'command' not in build_action:
+        # TODO: shlex.join(cmd) would be more elegant after upgrading to
+        # Python 3.8.
+        build_action['command'] = \
+            ' '.join(map(shlex.quote, build_action['arguments']))
+        del build_action['arguments']
+
+
+def change_args_to_command_in_comp_db(compile_commands: List[Dict]):
+    """
+    Convert the "arguments" field of the build actions to "command". See
+    change_args_to_command() for details.
+    """
     for cc in compile_commands:
-        if 'command' not in cc:
-            # TODO: shlex.join(cmd) would be more elegant after upgrading to
-            # Python 3.8.
-            cc['command'] = ' '.join(map(shlex.quote, cc['arguments']))
-            del cc['arguments']
+        change_args_to_command(cc)
+
+
+class CompilationDatabaseFile:
+    """
+    Compilation database JSON file of which the build actions are read
+    incrementally on every iteration. This way the whole file is never loaded
+    in the memory, which matters in case of huge compilation databases.
+
+    Iteration raises ValueError if the file is not a valid JSON array.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self) -> Iterator[Dict]:
+        for build_action in iter_json_array(self.path):
+            change_args_to_command(build_action)
+            yield build_action
+
+
+def is_json_array_file(path: str) -> bool:
+    """
+    Returns True if the given file starts as a JSON array. The file is not
+    validated, only its beginning is checked.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    return False
+
+                chunk = chunk.lstrip()
+                if chunk:
+                    return chunk[0] == '['
+    except OSError:
+        return False
 
 
 def find_all_compilation_databases(path: str) -> List[str]:
@@ -137,13 +183,16 @@ def find_build_actions_for_file(file_path: str) -> List[Dict]:
         load_json(comp_db)))
 
 
-def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
+def gather_compilation_database(
+    analysis_input: str
+) -> Optional[Iterable[Dict]]:
     """
     Return a compilation database that describes the build of the given
     analysis_input:
 
     - If analysis_input is a compilation database JSON file then its entries
-      return.
+      return. The entries are read lazily from the file, see
+      CompilationDatabaseFile.
     - If analysis_input is a C/C++/Obj-C source file then the corresponding
       build command is found from the compilation database. Only the innermost
       compilation database is checked (see find_closest_compilation_database()
@@ -172,14 +221,14 @@ def gather_compilation_database(analysis_input: str) -> Optional[List[Dict]]:
 
     # Case 1: analysis_input is a compilation database JSON file.
 
-    build_actions = load_json(analysis_input, display_warning=False)
+    if os.path.isfile(analysis_input) and is_json_array_file(analysis_input):
+        return CompilationDatabaseFile(analysis_input)
 
-    if build_actions is not None:
-        pass
+    build_actions: Optional[List[Dict]] = None
 
     # Case 2: analysis_input is a C/C++/Obj-C source file.
 
-    elif is_c_lang_source_file(analysis_input):
+    if is_c_lang_source_file(analysis_input):
         build_actions = find_build_actions_for_file(analysis_input)
 
     # Case 3: analysis_input is a directory.
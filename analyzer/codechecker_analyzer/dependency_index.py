@@ -0,0 +1,230 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Index of the files which the translation units of a compilation database are
+built from.
+
+Finding the source files which depend on a header requires the dependency
+generation of the compiler for every build action. The index stores the
+results in the report directory, so the next analysis runs the compiler only
+for the build actions which are new or of which some files were modified
+since then.
+"""
+
+
+import bisect
+import json
+import os
+import re
+import time
+
+from fnmatch import translate
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tu_collector import tu_collector
+
+from codechecker_common.compatibility import multiprocessing
+from codechecker_common.logger import get_logger
+
+from .util import analyzer_action_hash
+
+LOG = get_logger('analyzer')
+
+DEPENDENCY_INDEX_FILE = 'dependency_index.json'
+
+# Increase this number if the format of the index changes, so the indexes
+# created by an older CodeChecker are rebuilt.
+DEPENDENCY_INDEX_VERSION = 1
+
+GLOB_SPECIAL_CHARS = re.compile(r'[*?[]')
+
+
+def action_key(build_action: tu_collector.CompileAction) -> str:
+    """ Return a key which identifies a compilation database entry. """
+    return analyzer_action_hash(build_action['file'],
+                                build_action['directory'],
+                                build_action['command'])
+
+
+def collect_dependencies(
+    build_action: tu_collector.CompileAction
+) -> Tuple[str, Dict]:
+    """
+    Run the dependency generation of the compiler for the given compilation
+    database entry. Returns the key of the entry and its index record.
+    """
+    # Files modified after this point make the record outdated.
+    timestamp = time.time_ns()
+
+    files, err = tu_collector.get_dependent_headers(
+        build_action['command'], build_action['directory'])
+
+    files = {os.path.normpath(path) for path in files}
+    source = os.path.normpath(os.path.join(build_action['directory'],
+                                           build_action['file']))
+    files.add(source)
+
+    return action_key(build_action), {
+        'source': source,
+        'files': sorted(files),
+        # Records with missing files are collected again next time.
+        'timestamp': None if err else timestamp}
+
+
+class DependencyIndex:
+    """
+    Mapping of the build actions to the files of their translation units,
+    which can be queried for the source files depending on a header.
+    """
+
+    def __init__(self, index_file: Optional[str] = None):
+        """
+        index_file -- The index is loaded from and saved to this file. If it
+                      is None, the index is not persisted.
+        """
+        self.__index_file = index_file
+        self.__records: Dict[str, Dict] = {}
+
+        # Sorted list of the files in the index and the source files which
+        # depend on them. These are built at the first query.
+        self.__files: List[str] = []
+        self.__dependents: Dict[str, Set[str]] = {}
+
+        if index_file and os.path.isfile(index_file):
+            self.__load()
+
+    def __load(self):
+        """ Load the records of the index file. """
+        try:
+            with open(self.__index_file, encoding='utf-8',
+                      errors='ignore') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as err:
+            LOG.debug("Failed to load dependency index '%s': %s",
+                      self.__index_file, err)
+            return
+
+        if isinstance(data, dict) and \
+                data.get('version') == DEPENDENCY_INDEX_VERSION:
+            self.__records = data.get('actions', {})
+
+    def save(self):
+        """ Save the index to its index file. """
+        if not self.__index_file:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.__index_file), exist_ok=True)
+            with open(self.__index_file, 'w', encoding='utf-8',
+                      errors='ignore') as f:
+                json.dump({'version': DEPENDENCY_INDEX_VERSION,
+                           'actions': self.__records}, f)
+        except OSError as err:
+            LOG.debug("Failed to save dependency index '%s': %s",
+                      self.__index_file, err)
+
+    @staticmethod
+    def __is_up_to_date(record: Dict, mtimes: Dict[str, Optional[int]]):
+        """
+        Check if none of the files of a record was modified or removed since
+        the record was collected. The modification times are cached in mtimes,
+        since the same headers belong to several translation units.
+        """
+        timestamp = record.get('timestamp')
+        if timestamp is None:
+            return False
+
+        for path in record['files']:
+            if path not in mtimes:
+                try:
+                    mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    mtimes[path] = None
+
+            mtime = mtimes[path]
+            if mtime is None or mtime > timestamp:
+                return False
+
+        return True
+
+    def update(
+        self,
+        compilation_db: Iterable[tu_collector.CompileAction],
+        jobs: int = 1
+    ):
+        """
+        Bring the index in sync with the given compilation database. The
+        dependencies are collected in parallel for the new build actions and
+        the ones with modified files. The records of build actions which are
+        not in the compilation database anymore are removed.
+        """
+        records = {}
+        outdated = []
+        mtimes: Dict[str, Optional[int]] = {}
+
+        for build_action in compilation_db:
+            key = action_key(build_action)
+            if key in records:
+                continue
+
+            record = self.__records.get(key)
+            if record and self.__is_up_to_date(record, mtimes):
+                records[key] = record
+            else:
+                records[key] = {}
+                outdated.append(build_action)
+
+        LOG.debug("Collecting dependencies of %d of %d build actions.",
+                  len(outdated), len(records))
+
+        if outdated:
+            with multiprocessing.Pool(jobs) as pool:
+                for key, record in pool.map(collect_dependencies, outdated):
+                    records[key] = record
+
+        self.__records = records
+        self.__files = []
+        self.__dependents = {}
+
+    def __build_file_index(self):
+        """ Build the reverse mapping of the files to the source files. """
+        dependents: Dict[str, Set[str]] = {}
+        for record in self.__records.values():
+            for path in record['files']:
+                dependents.setdefault(path, set()).add(record['source'])
+
+        self.__dependents = dependents
+        self.__files = sorted(dependents)
+
+    def get_dependent_sources(self, file_pattern: str) -> Set[str]:
+        """
+        Returns the source files of the translation units which contain a
+        file matching the given path or glob pattern. Only the indexed files
+        which start with the literal prefix of the pattern are matched.
+        """
+        if not self.__files and self.__records:
+            self.__build_file_index()
+
+        pattern = os.path.normpath(file_pattern.strip())
+        special = GLOB_SPECIAL_CHARS.search(pattern)
+        if not special:
+            return set(self.__dependents.get(pattern, ()))
+
+        prefix = pattern[:special.start()]
+        regex = re.compile(translate(pattern))
+
+        sources: Set[str] = set()
+        idx = bisect.bisect_left(self.__files, prefix)
+        while idx < len(self.__files) and \
+                self.__files[idx].startswith(prefix):
+            path = self.__files[idx]
+            if regex.match(path):
+                sources.update(self.__dependents[path])
+            idx += 1
+
+        return sources
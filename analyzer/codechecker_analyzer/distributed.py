@@ -0,0 +1,485 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Distributed analysis with a coordinator and remote analyzer workers.
+
+The coordinator ('CodeChecker analyze --coordinator HOST:PORT') parses the
+build actions and builds the analyzer configuration as usual, but instead of
+running the analyzers in a local process pool, it hands out the build actions
+to 'CodeChecker analyze-worker' processes connecting to it over TCP. The
+connections are authenticated by a challenge-response handshake with a key
+shared by the coordinator and the workers.
+
+A worker gets the data of the analysis run (see analysis_manager.RUN_DATA)
+once, then analyzes the build actions in a local process pool, each of them
+into a temporary output directory. The files created by the analysis (result
+plist files, failure zips, etc.) are sent back to the coordinator with the
+result of analysis_manager.check() and they are saved into the report
+directory. The build actions in progress on a lost worker are handed out
+again. A worker sends heartbeats while its analyzer processes are busy, so a
+worker which sends nothing is considered lost even if its connection is not
+closed.
+
+The source files and the analyzer binaries must be available at the same
+paths on the workers as on the coordinator, e.g. on a shared file system or
+in a copy of the source tree.
+"""
+
+
+import collections
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import multiprocess  # type: ignore
+from multiprocess.connection import (  # type: ignore
+    Client, Connection, answer_challenge, deliver_challenge)
+
+from codechecker_common.logger import get_logger
+
+from . import analysis_manager
+
+LOG = get_logger('analyzer')
+
+# Seconds between two attempts of a worker to connect to the coordinator or
+# to ask for a build action when all of them are in progress.
+POLL_INTERVAL = 1.0
+
+# Seconds after the coordinator warns if no worker is connected to it.
+WORKER_WAIT_WARNING_INTERVAL = 60.0
+
+# Seconds between two heartbeat messages of a worker which is waiting for
+# its analyzer processes.
+HEARTBEAT_INTERVAL = 10.0
+
+# Seconds after a peer which sends nothing, not even a heartbeat, is
+# considered to be lost, e.g. its host died or the network is partitioned
+# without closing the connection. The build actions in progress on a lost
+# worker are handed out again.
+PEER_TIMEOUT = 60.0
+
+
+def _enable_keepalive(sock: socket.socket):
+    """
+    Enable TCP keepalive on the socket, so a connection of which the peer
+    disappeared is closed by the operating system even while a message is
+    being received.
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    interval = max(1, int(HEARTBEAT_INTERVAL))
+    for option, value in [('TCP_KEEPIDLE', interval),
+                          ('TCP_KEEPINTVL', interval),
+                          ('TCP_KEEPCNT',
+                           max(1, int(PEER_TIMEOUT / interval)))]:
+        if hasattr(socket, option):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option),
+                            value)
+
+
+def _recv(conn: Connection):
+    """
+    Receive a message from the peer. ConnectionError is raised if the peer
+    sends nothing in PEER_TIMEOUT seconds.
+    """
+    if not conn.poll(PEER_TIMEOUT):
+        raise ConnectionError(
+            f"no message has been received in {PEER_TIMEOUT:g} seconds")
+
+    return conn.recv()
+
+
+def read_auth_key(auth_key_file: str) -> bytes:
+    """ Read the key authenticating the workers from the given file. """
+    with open(auth_key_file, 'rb') as f:
+        auth_key = f.read().strip()
+
+    if not auth_key:
+        raise ValueError(f"The authentication key file '{auth_key_file}' "
+                         "is empty.")
+
+    return auth_key
+
+
+class _Dispatcher:
+    """
+    Book-keeping of the build actions handed out to the workers.
+    """
+
+    def __init__(self, action_num: int):
+        self.__cond = threading.Condition()
+        self.__pending = collections.deque(range(action_num))
+        self.__in_progress: Dict[int, str] = {}
+        self.results: List[Optional[Any]] = [None] * action_num
+        self.__remaining = action_num
+
+    def next_action(self, worker: str) -> Optional[int]:
+        """
+        Returns the index of the next build action to analyze on the given
+        worker. None is returned if there is nothing to hand out right now.
+        """
+        with self.__cond:
+            if not self.__pending:
+                return None
+
+            idx = self.__pending.popleft()
+            self.__in_progress[idx] = worker
+            return idx
+
+    def finish(self, worker: str, idx: int, result) -> int:
+        """
+        Store the result of a build action. Returns the number of finished
+        build actions.
+        """
+        with self.__cond:
+            if self.__in_progress.get(idx) == worker and \
+                    self.results[idx] is None:
+                del self.__in_progress[idx]
+                self.results[idx] = result
+                self.__remaining -= 1
+                self.__cond.notify_all()
+
+            return len(self.results) - self.__remaining
+
+    def remaining(self) -> int:
+        """ Number of the build actions which are not analyzed yet. """
+        with self.__cond:
+            return self.__remaining
+
+    def release(self, worker: str) -> List[int]:
+        """
+        Hand out again the build actions in progress on a lost worker.
+        """
+        with self.__cond:
+            lost = [idx for idx, owner in self.__in_progress.items()
+                    if owner == worker]
+            for idx in lost:
+                del self.__in_progress[idx]
+
+            # These are the oldest ones, so they are handed out first.
+            self.__pending.extendleft(reversed(sorted(lost)))
+            return lost
+
+    def is_done(self) -> bool:
+        """ Check if every build action is analyzed. """
+        with self.__cond:
+            return not self.__remaining
+
+
+class Coordinator:
+    """
+    Hand out the build actions to the remote workers and collect their
+    results into the report directory.
+    """
+
+    def __init__(self, address: Tuple[str, int], auth_key: bytes):
+        self.address = address
+        self.__auth_key = auth_key
+        self.__lock = threading.Lock()
+        self.__worker_num = 0
+
+    def __worker_connected(self, diff: int):
+        with self.__lock:
+            self.__worker_num += diff
+
+    def run(self, actions, run_data: Dict[str, Any]) -> List[Any]:
+        """
+        Analyze the build actions on the workers connecting to the
+        coordinator. Returns the results of analysis_manager.check() in the
+        order of the build actions.
+        """
+        output_path = run_data['output_path']
+        dispatcher = _Dispatcher(len(actions))
+
+        threads = []
+        with socket.create_server(self.address) as server:
+            server.settimeout(POLL_INTERVAL)
+            host, port = server.getsockname()[:2]
+            LOG.info("Waiting for analyzer workers at %s:%d ...", host, port)
+
+            last_worker_seen = time.time()
+            while not dispatcher.is_done():
+                try:
+                    sock, _ = server.accept()
+                except socket.timeout:
+                    # The analysis would hang silently if the workers
+                    # couldn't connect, e.g. because of a wrong address or
+                    # authentication key.
+                    with self.__lock:
+                        worker_num = self.__worker_num
+
+                    if worker_num:
+                        last_worker_seen = time.time()
+                    elif time.time() - last_worker_seen >= \
+                            WORKER_WAIT_WARNING_INTERVAL:
+                        LOG.warning("No analyzer worker is connected to "
+                                    "%s:%d, %d build action(s) are waiting "
+                                    "for analysis. Start the workers by "
+                                    "'CodeChecker analyze-worker %s:%d "
+                                    "--auth-key-file AUTH_KEY_FILE'.",
+                                    host, port, dispatcher.remaining(),
+                                    host, port)
+                        last_worker_seen = time.time()
+                    continue
+
+                sock.settimeout(None)
+                _enable_keepalive(sock)
+                thread = threading.Thread(
+                    target=self.__serve,
+                    args=(sock, actions, run_data, output_path,
+                          dispatcher),
+                    daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        # Give the idle workers time to ask for a build action, so they get
+        # to know that the analysis is finished.
+        deadline = time.time() + 3 * POLL_INTERVAL
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.time()))
+
+        return dispatcher.results
+
+    def __serve(self, sock, actions, run_data, output_path, dispatcher):
+        """ Communicate with a worker in a separate thread. """
+        host, port = sock.getpeername()[:2]
+        worker = f"{host}:{port}"
+
+        conn = Connection(sock.detach())
+        try:
+            deliver_challenge(conn, self.__auth_key)
+            answer_challenge(conn, self.__auth_key)
+        except (multiprocess.AuthenticationError, EOFError, OSError) as ex:
+            LOG.warning("Rejected analyzer worker %s: %s", worker, ex)
+            conn.close()
+            return
+
+        LOG.info("Analyzer worker %s connected.", worker)
+        self.__worker_connected(1)
+        try:
+            conn.send(('run_data', run_data))
+
+            while True:
+                # The worker sends a heartbeat while it is busy, so it is lost
+                # if nothing is received from it.
+                kind, payload = _recv(conn)
+                if kind == 'heartbeat':
+                    continue
+
+                if kind == 'request':
+                    idx = dispatcher.next_action(worker)
+                    if idx is not None:
+                        conn.send(('action', (idx, actions[idx])))
+                    elif dispatcher.is_done():
+                        conn.send(('done', None))
+                    else:
+                        conn.send(('wait', None))
+                elif kind == 'result':
+                    idx, result, files = payload
+                    result = self.__save_result(result, files, output_path)
+                    finished = dispatcher.finish(worker, idx, result)
+
+                    rc, _, _, analyzer_type, _, source, _ = result
+                    LOG.info("[%d/%d] %s %s %s on %s.",
+                             finished, len(actions), analyzer_type,
+                             "analyzed" if rc == 0 else "failed to analyze",
+                             os.path.basename(source), worker)
+        except ConnectionError as ex:
+            LOG.warning("Connection of analyzer worker %s is lost: %s",
+                        worker, ex)
+        except (EOFError, OSError) as ex:
+            LOG.debug("Connection of analyzer worker %s closed: %s",
+                      worker, ex)
+        except Exception as ex:
+            LOG.error("Communication with analyzer worker %s failed: %s",
+                      worker, ex)
+        finally:
+            conn.close()
+            self.__worker_connected(-1)
+
+            lost = dispatcher.release(worker)
+            if lost:
+                LOG.warning("Analyzer worker %s is lost, its %d build "
+                            "action(s) in progress are handed out again.",
+                            worker, len(lost))
+            else:
+                LOG.info("Analyzer worker %s disconnected.", worker)
+
+    @staticmethod
+    def __save_result(result, files, output_path):
+        """
+        Save the files created by the analysis of a build action into the
+        report directory.
+        """
+        for rel_path, content in files:
+            rel_path = os.path.normpath(rel_path)
+            if os.path.isabs(rel_path) or \
+                    rel_path.split(os.sep)[0] == os.pardir:
+                raise ValueError(f"Invalid result file path: {rel_path}")
+
+            path = os.path.join(output_path, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+
+        result = list(result)
+        if result[4]:
+            result[4] = os.path.join(output_path, os.path.basename(result[4]))
+
+        return tuple(result)
+
+
+def analyze(action):
+    """
+    Analyze a build action in a worker process into a temporary output
+    directory. Returns the result of analysis_manager.check() and the
+    contents of the created files by their path relative to the output
+    directory.
+    """
+    run_data = analysis_manager.RUN_DATA
+
+    with tempfile.TemporaryDirectory(prefix='codechecker-worker-') as tmp:
+        output_dirs = analysis_manager.create_output_dirs(
+            tmp, run_data['generate_reproducer'])
+
+        # The fixits of clang-tidy are exported into this directory which is
+        # created by 'CodeChecker analyze' on the coordinator.
+        os.makedirs(os.path.join(tmp, 'fixit'))
+
+        analysis_manager.RUN_DATA = dict(run_data,
+                                         output_path=tmp,
+                                         output_dirs=output_dirs)
+        try:
+            result = analysis_manager.check(action)
+        finally:
+            analysis_manager.RUN_DATA = run_data
+
+        files = []
+        for root, _, file_names in os.walk(tmp):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                with open(path, 'rb') as f:
+                    files.append((os.path.relpath(path, tmp), f.read()))
+
+    return result, files
+
+
+def __connect(address: Tuple[str, int], auth_key: bytes,
+              connect_timeout: float):
+    """
+    Connect to the coordinator. It may not listen yet if it is still
+    parsing the build actions, so it is retried until the timeout.
+    """
+    deadline = time.time() + connect_timeout
+    while True:
+        try:
+            conn = Client(address, authkey=auth_key)
+            with socket.socket(fileno=os.dup(conn.fileno())) as sock:
+                _enable_keepalive(sock)
+            return conn
+        except ConnectionRefusedError:
+            if time.time() >= deadline:
+                raise
+            time.sleep(POLL_INTERVAL)
+
+
+def run_worker(address: Tuple[str, int], auth_key: bytes, jobs: int,
+               connect_timeout: float = 60):
+    """
+    Analyze the build actions handed out by the coordinator at the given
+    address with the given number of analyzer processes, until every build
+    action is analyzed.
+    """
+    conn = __connect(address, auth_key, connect_timeout)
+    LOG.info("Connected to the coordinator at %s:%d.", *address)
+
+    try:
+        _, run_data = _recv(conn)
+
+        # The progress counters are local to this worker, the coordinator
+        # prints the overall progress.
+        pool = multiprocess.Pool(
+            jobs,
+            initializer=analysis_manager.init_worker,
+            initargs=(multiprocess.Value('i', 1), multiprocess.Value('i', 0),
+                      multiprocess.Value('i', 0), multiprocess.Value('i', 0),
+                      run_data))
+
+        results: queue.Queue = queue.Queue()
+
+        def on_result(idx, res):
+            results.put((idx, res, None))
+
+        def on_error(idx, ex):
+            results.put((idx, None, ex))
+
+        in_progress = 0
+        finished = False
+        analyzed_num = 0
+
+        try:
+            while True:
+                # Ask for build actions until every analyzer process is busy.
+                while not finished and in_progress < jobs:
+                    conn.send(('request', None))
+                    kind, payload = _recv(conn)
+                    if kind == 'done':
+                        finished = True
+                    elif kind == 'wait':
+                        # Every build action is in progress somewhere, but
+                        # some of them may be handed out again.
+                        break
+                    else:
+                        idx, action = payload
+                        pool.apply_async(
+                            analyze, (action,),
+                            callback=partial(on_result, idx),
+                            error_callback=partial(on_error, idx))
+                        in_progress += 1
+
+                if not in_progress:
+                    if finished:
+                        break
+
+                    time.sleep(POLL_INTERVAL)
+                    continue
+
+                try:
+                    idx, res, ex = results.get(timeout=HEARTBEAT_INTERVAL)
+                except queue.Empty:
+                    # The coordinator considers a silent worker lost.
+                    conn.send(('heartbeat', None))
+                    continue
+
+                in_progress -= 1
+                if ex is not None:
+                    # The coordinator hands out the build actions of this
+                    # worker again when the connection is closed.
+                    raise ex
+
+                result, files = res
+                conn.send(('result', (idx, result, files)))
+                analyzed_num += 1
+
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+    finally:
+        conn.close()
+
+    LOG.info("Analyzed %d build action(s), all analyses are finished.",
+             analyzed_num)
@@ -15,13 +15,13 @@ import re
 import subprocess
 import tempfile
 
-from codechecker_analyzer import analyzer_context
+from codechecker_analyzer import analyzer_context, analyzer_info_cache
 from codechecker_common.logger import get_logger
 
 LOG = get_logger('analyzer')
 
 
-def check_analyzer(compiler_bin):
+def __check_analyzer(compiler_bin):
     """
     Simple check if clang is available.
     """
@@ -52,8 +52,22 @@ def check_analyzer(compiler_bin):
         return False
 
 
-def has_analyzer_config_option(clang_bin, config_option_name):
-    """Check if an analyzer config option is available."""
+def check_analyzer(compiler_bin):
+    """
+    Simple check if clang is available. Only the successful checks are
+    stored in the analyzer info cache, since a failure may be caused by the
+    environment of the binary.
+    """
+    return analyzer_info_cache.cached(
+        compiler_bin, ['check-analyzer'],
+        lambda: __check_analyzer(compiler_bin), cache_if=bool)
+
+
+def __has_analyzer_config_option(clang_bin, config_option_name):
+    """
+    Check if an analyzer config option is available. Returns None if the
+    config options can't be listed.
+    """
     cmd = [clang_bin, "-cc1", "-analyzer-config-help"]
 
     LOG.debug_analyzer('run: "%s"', ' '.join(cmd))
@@ -70,6 +84,9 @@ def has_analyzer_config_option(clang_bin, config_option_name):
         LOG.debug_analyzer("stdout:\n%s", out)
         LOG.debug_analyzer("stderr:\n%s", err)
 
+        if proc.returncode:
+            return None
+
         match = re.search(config_option_name, out)
         if match:
             LOG.debug("Config option '%s' is available.", config_option_name)
@@ -80,7 +97,19 @@ def has_analyzer_config_option(clang_bin, config_option_name):
         raise
 
 
-def has_analyzer_option(clang_bin, feature):
+def has_analyzer_config_option(clang_bin, config_option_name):
+    """
+    Check if an analyzer config option is available. The result is stored
+    in the analyzer info cache only if the analyzer could list its config
+    options, since a failure may be caused by the environment of the binary.
+    """
+    return bool(analyzer_info_cache.cached(
+        clang_bin, ['has-analyzer-config-option', config_option_name],
+        lambda: __has_analyzer_config_option(clang_bin, config_option_name),
+        cache_if=lambda available: available is not None))
+
+
+def __has_analyzer_option(clang_bin, feature):
     """Test if the analyzer has a specific option.
 
     Testing a feature is done by compiling a dummy file."""
@@ -106,4 +135,19 @@ def has_analyzer_option(clang_bin, feature):
             return proc.returncode == 0
         except OSError:
             LOG.error('Failed to run: "%s"', ' '.join(cmd))
-            return False
+            raise
+
+
+def has_analyzer_option(clang_bin, feature):
+    """
+    Test if the analyzer has a specific option. Only the available options
+    are stored in the analyzer info cache, since the failure of the test may
+    be caused by the environment of the binary.
+    """
+    try:
+        return analyzer_info_cache.cached(
+            clang_bin, ['has-analyzer-option', feature],
+            lambda: __has_analyzer_option(clang_bin, feature),
+            cache_if=bool)
+    except OSError:
+        return False
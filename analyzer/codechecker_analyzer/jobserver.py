@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Client of the jobserver of GNU make.
+
+If CodeChecker is run by 'make -jN', the job slots of make are available to
+it through a named pipe (make 4.4 and later) or through an inherited pipe
+(older versions) given in the MAKEFLAGS environment variable. Every job slot
+is a byte in the pipe. CodeChecker gets one job slot implicitly, the one which
+make used to start it, and it reads a byte from the pipe for every further
+analyzer process running in parallel. The byte is written back when the
+analyzer process is finished. This way the build jobs of make and the analyzer
+processes together don't exceed N.
+
+See https://www.gnu.org/software/make/manual/html_node/Job-Slots.html
+"""
+
+
+import contextlib
+import os
+import re
+import select
+import sys
+
+from typing import Optional, Tuple
+
+import multiprocess  # type: ignore
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('analyzer')
+
+# The jobserver options of make in MAKEFLAGS. '--jobserver-fds' is used by
+# make older than 4.2.
+JOBSERVER_AUTH_PATTERN = re.compile(
+    r'--jobserver-(?:auth|fds)=(?P<auth>\S+)')
+
+# The interval in seconds of checking whether the implicit job slot is free
+# while waiting for a job slot from make.
+POLL_INTERVAL = 0.1
+
+
+def get_jobserver_auth(makeflags: str) -> Optional[str]:
+    """
+    Returns the jobserver of make given in MAKEFLAGS, i.e. 'fifo:PATH' or
+    'R,W' where R and W are the file descriptors of the pipe. If there are
+    several jobserver options the last one is used, like make does.
+    """
+    matches = JOBSERVER_AUTH_PATTERN.findall(makeflags)
+    return matches[-1] if matches else None
+
+
+class JobServerClient:
+    """
+    Job slots of the jobserver of GNU make which are shared by the processes
+    of the analysis. The client is given to the worker processes when the
+    process pool starts, and the pipe of the jobserver is opened in every
+    process when it first needs a job slot.
+    """
+
+    def __init__(self, auth: str):
+        """
+        auth -- The jobserver in the format of get_jobserver_auth().
+        """
+        self.__auth = auth
+
+        # The job slot which make used to start CodeChecker. It is shared by
+        # the worker processes.
+        self.__implicit_slot = multiprocess.Lock()
+
+        self.__fds: Optional[Tuple[int, int]] = None
+        self.__pid: Optional[int] = None
+
+    @staticmethod
+    def from_environ(environ=None) -> Optional['JobServerClient']:
+        """
+        Returns the client of the jobserver in MAKEFLAGS or None if there is
+        no usable jobserver.
+        """
+        environ = os.environ if environ is None else environ
+        auth = get_jobserver_auth(environ.get('MAKEFLAGS', ''))
+        if not auth:
+            LOG.warning("No jobserver of make is found in the MAKEFLAGS "
+                        "environment variable, '--jobserver' is ignored.")
+            return None
+
+        if sys.platform == 'win32':
+            LOG.warning("The jobserver of make is not supported on Windows, "
+                        "'--jobserver' is ignored.")
+            return None
+
+        client = JobServerClient(auth)
+        try:
+            client.__open()
+        except (OSError, ValueError) as err:
+            LOG.warning("Failed to open the jobserver of make (%s): %s. If "
+                        "make is older than 4.4, the make recipe running "
+                        "CodeChecker must be prefixed by '+'. '--jobserver' "
+                        "is ignored.", auth, err)
+            return None
+
+        LOG.info("Using the job slots of the jobserver of make.")
+        return client
+
+    def __getstate__(self):
+        # The file descriptors are opened again in the worker process if the
+        # client is pickled, i.e. the worker processes are not forked.
+        state = self.__dict__.copy()
+        state['_JobServerClient__fds'] = None
+        state['_JobServerClient__pid'] = None
+        return state
+
+    def __open(self) -> Tuple[int, int]:
+        """
+        Returns the file descriptors to read and write the job slots in the
+        current process.
+        """
+        if self.__fds is not None and self.__pid == os.getpid():
+            return self.__fds
+
+        if self.__auth.startswith('fifo:'):
+            # Every process opens the named pipe itself, so the reads can be
+            # non-blocking without affecting make.
+            fd = os.open(self.__auth[len('fifo:'):],
+                         os.O_RDWR | os.O_NONBLOCK)
+            self.__fds = (fd, fd)
+        else:
+            read_fd, write_fd = map(int, self.__auth.split(','))
+            if read_fd < 0 or write_fd < 0:
+                raise ValueError("the jobserver is disabled by make")
+
+            # Fails if make didn't pass the pipe to this process.
+            os.fstat(read_fd)
+            os.fstat(write_fd)
+            self.__fds = (read_fd, write_fd)
+
+        self.__pid = os.getpid()
+        return self.__fds
+
+    def acquire(self) -> Optional[bytes]:
+        """
+        Wait for a free job slot. Returns the byte read from the jobserver or
+        None if the implicit job slot is acquired.
+        """
+        read_fd, _ = self.__open()
+        while True:
+            if self.__implicit_slot.acquire(block=False):
+                return None
+
+            readable, _, _ = select.select([read_fd], [], [], POLL_INTERVAL)
+            if not readable:
+                continue
+
+            # The pipe inherited from make is blocking, so this waits if
+            # another process has taken the job slot in the meantime.
+            try:
+                token = os.read(read_fd, 1)
+            except (BlockingIOError, InterruptedError):
+                continue
+
+            if token:
+                return token
+
+    def release(self, token: Optional[bytes]):
+        """ Give back the job slot returned by acquire(). """
+        if token is None:
+            self.__implicit_slot.release()
+            return
+
+        _, write_fd = self.__open()
+        os.write(write_fd, token)
+
+    @contextlib.contextmanager
+    def job_slot(self):
+        """ Hold a job slot while the context is active. """
+        token = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(token)
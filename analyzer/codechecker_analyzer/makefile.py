@@ -84,7 +84,11 @@ class MakeFileCreator:
         mfile.write("#\n# Autogenerated by CodeChecker "
                     f"v{analyzer_context.get_context().version}.\n#\n"
                     "# DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT "
-                    "YOU ARE DOING.\n#\n\n")
+                    "YOU ARE DOING.\n#\n"
+                    "# To share the job slots of the build, run it from a "
+                    "recipe of the build\n"
+                    f"# as '$(MAKE) -f {self.__makefile}' without a -j "
+                    "option.\n#\n\n")
 
     def __write_env_exports(self, mfile):
         """ Exports environment variables. """
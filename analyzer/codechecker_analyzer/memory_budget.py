@@ -0,0 +1,209 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Memory aware admission control of the analyzer processes.
+
+Some translation units need several gigabytes of memory to analyze (e.g. in
+CTU mode) while most of them need much less. Instead of lowering the number
+of jobs for the sake of the few large ones, the analyzer processes are
+started only while their expected memory usage fits in a memory budget. The
+expected memory usage of a build action is its peak RSS recorded by a
+previous analysis. While an analyzer runs, its reservation follows the
+sampled RSS of its process tree.
+"""
+
+
+import signal
+import statistics
+import threading
+
+from typing import Callable, Dict, Optional
+
+import multiprocess  # type: ignore
+import psutil
+
+# Seconds between two samples of the memory usage of an analyzer process.
+SAMPLING_INTERVAL = 0.5
+
+
+def get_process_tree_rss(proc: psutil.Process) -> int:
+    """
+    Returns the resident set size of the given process and its children in
+    bytes.
+    """
+    rss = 0
+    for p in [proc] + proc.children(recursive=True):
+        try:
+            rss += p.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    return rss
+
+
+def is_killed_for_memory(returncode: int) -> bool:
+    """
+    Check if an analyzer process was killed by SIGKILL, which is sent by the
+    OOM killer of the operating system.
+    """
+    sigkill = getattr(signal, 'SIGKILL', None)
+    return sigkill is not None and returncode in (-sigkill, 128 + sigkill)
+
+
+class MemoryBudget:
+    """
+    Memory budget shared by the analysis worker processes. An analyzer is
+    admitted if its expected memory usage fits in the budget or nothing else
+    is running.
+    """
+
+    def __init__(self, limit: int, default_estimate: int):
+        """
+        limit -- The memory budget in bytes.
+        default_estimate -- The expected memory usage of the analyses of
+                            which the peak memory usage is not known.
+        """
+        self.limit = limit
+        self.default_estimate = default_estimate
+
+        self.__cond = multiprocess.Condition()
+        self.__reserved = multiprocess.RawValue('q', 0)
+        self.__running = multiprocess.RawValue('i', 0)
+
+    def admit(self, expected: int) -> 'Reservation':
+        """
+        Wait until the given amount of memory fits in the budget and reserve
+        it.
+        """
+        with self.__cond:
+            self.__cond.wait_for(
+                lambda: not self.__running.value or
+                self.__reserved.value + expected <= self.limit)
+
+            self.__reserved.value += expected
+            self.__running.value += 1
+
+        return Reservation(self, expected)
+
+    def resize(self, old_size: int, new_size: int):
+        """ Change the size of a reservation. """
+        with self.__cond:
+            self.__reserved.value += new_size - old_size
+            if new_size < old_size:
+                self.__cond.notify_all()
+
+    def release(self, size: int):
+        """ Release a reservation. """
+        with self.__cond:
+            self.__reserved.value -= size
+            self.__running.value -= 1
+            self.__cond.notify_all()
+
+
+class Reservation:
+    """
+    Memory reserved for an analyzer process in a memory budget.
+    """
+
+    def __init__(self, budget: MemoryBudget, expected: int):
+        self.__budget = budget
+        self.__expected = expected
+        self.__size = expected
+        self.__lock = threading.Lock()
+
+    def update(self, rss: int):
+        """
+        Follow the current memory usage of the analyzer, but keep at least
+        the expected amount reserved since the usage may grow.
+        """
+        with self.__lock:
+            new_size = max(self.__expected, rss)
+            if self.__size is not None and new_size != self.__size:
+                self.__budget.resize(self.__size, new_size)
+                self.__size = new_size
+
+    def release(self):
+        """ Release the reservation when the analyzer finished. """
+        with self.__lock:
+            if self.__size is not None:
+                self.__budget.release(self.__size)
+                self.__size = None
+
+
+class MemoryMonitor:
+    """
+    Sample the memory usage of a process tree in a background thread and
+    keep its peak.
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        callback: Optional[Callable[[int], None]] = None,
+        interval: float = SAMPLING_INTERVAL
+    ):
+        """
+        pid -- The process to monitor.
+        callback -- Called with the RSS of the process tree at every sample.
+        """
+        self.peak_rss = 0
+
+        self.__callback = callback
+        self.__interval = interval
+        self.__stopped = threading.Event()
+
+        try:
+            self.__proc: Optional[psutil.Process] = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            self.__proc = None
+            return
+
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __sample(self):
+        try:
+            rss = get_process_tree_rss(self.__proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+
+        self.peak_rss = max(self.peak_rss, rss)
+        if self.__callback:
+            self.__callback(rss)
+
+    def __run(self):
+        while True:
+            self.__sample()
+            if self.__stopped.wait(self.__interval):
+                break
+
+    def stop(self) -> int:
+        """ Stop the sampling and return the peak RSS in bytes. """
+        if self.__proc is not None:
+            self.__stopped.set()
+            self.__thread.join()
+
+        return self.peak_rss
+
+
+def get_default_estimate(
+    peak_memory: Dict[str, Dict[str, float]],
+    limit: int,
+    jobs: int
+) -> int:
+    """
+    Returns the expected memory usage of the analyses which weren't analyzed
+    before: the median of the recorded peak memory usages or an even share
+    of the budget among the jobs if nothing is recorded.
+    """
+    recorded = [value for modes in peak_memory.values()
+                for value in modes.values()]
+    if recorded:
+        return int(statistics.median(recorded))
+
+    return limit // max(jobs, 1)
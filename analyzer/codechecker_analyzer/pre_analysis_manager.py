@@ -9,6 +9,8 @@
 Run pre analysis, collect statistics or CTU data.
 """
 
+import contextlib
+import glob
 import os
 import shlex
 import shutil
@@ -33,8 +35,9 @@ LOG = get_logger('analyzer')
 
 def collect_statistics(action, source, clangsa_config, statistics_data):
     """
-    Run the statistics collection command and save the
-    stdout and stderr to a file.
+    Run the statistics collection command and save the samples of the
+    statistics collector checkers in its stdout and stderr to a partial
+    result file, which is merged with the others in the post-processing.
     """
     cmd, can_collect = statistics.build_stat_coll_cmd(action, clangsa_config,
                                                       source)
@@ -59,14 +62,15 @@ def collect_statistics(action, source, clangsa_config, statistics_data):
 
     _, source_filename = os.path.split(source)
 
-    output_id = source_filename + str(uuid.uuid4()) + '.stat'
+    output_id = source_filename + str(uuid.uuid4()) + \
+        post_process_stats.PARTIAL_SUFFIX
 
     stat_for_source = os.path.join(statistics_data['stat_tmp_dir'],
                                    output_id)
 
-    with open(stat_for_source, 'w', encoding="utf-8", errors="ignore") as out:
-        out.write(analyzer_out)
-        out.write(analyzer_err)
+    partial = post_process_stats.aggregate_lines(analyzer_out.splitlines())
+    post_process_stats.aggregate_lines(analyzer_err.splitlines(), partial)
+    post_process_stats.write_partial(partial, stat_for_source)
 
     return ret_code
 
@@ -75,22 +79,99 @@ def collect_statistics(action, source, clangsa_config, statistics_data):
 PROGRESS_CHECKED_NUM = None
 PROGRESS_ACTIONS = None
 
+# Data of the pre-analysis which is the same for every build action. It is
+# given to the worker processes once by init_worker().
+RUN_DATA = None
 
-def init_worker(checked_num, action_num):
-    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS
+
+def init_worker(checked_num, action_num, run_data=None):
+    global PROGRESS_CHECKED_NUM, PROGRESS_ACTIONS, RUN_DATA
     PROGRESS_CHECKED_NUM = checked_num
     PROGRESS_ACTIONS = action_num
+    RUN_DATA = run_data
+
+
+def collect_ctu(action, triple_arch, clangsa_config, ctu_data):
+    """ Generate the CTU files of the build action. """
+    ctu_temp_fnmap_folder = ctu_data.get('ctu_temp_fnmap_folder')
+    ctu_func_map_cmd = ctu_data.get('ctu_func_map_cmd')
+
+    # TODO: reorganize the various ctu modes parameters
+    # Dump-based analysis requires serialized ASTs.
+    if clangsa_config.ctu_on_demand:
+        ctu_manager.generate_invocation_list(triple_arch, action,
+                                             action.source,
+                                             clangsa_config)
+    else:
+        ctu_manager.generate_ast(triple_arch, action, action.source,
+                                 clangsa_config)
+    # On-demand analysis does not require AST-dumps.
+    # We map the function names to corresponding sources of ASTs.
+    # In case of On-demand analysis this source is the original source
+    # code. In case of AST-dump based analysis these sources are the
+    # generated AST-dumps.
+    ctu_manager.map_functions(triple_arch, action, action.source,
+                              clangsa_config, ctu_func_map_cmd,
+                              ctu_temp_fnmap_folder)
+
+
+def collect_ctu_incremental(action, triple_arch, clangsa_config, ctu_data):
+    """
+    Generate the CTU files of the build action only if the ones collected by
+    a previous analysis are out of date. Returns the collect key of the build
+    action if its CTU files are available, otherwise None.
+    """
+    ctu_temp_fnmap_folder = ctu_data.get('ctu_temp_fnmap_folder')
+    ctu_func_map_cmd = ctu_data.get('ctu_func_map_cmd')
+
+    # The invocation list is cheap to generate, it is always created again.
+    if clangsa_config.ctu_on_demand:
+        ctu_manager.generate_invocation_list(triple_arch, action,
+                                             action.source,
+                                             clangsa_config)
+
+    key = ctu_manager.get_collect_key(triple_arch, action, action.source,
+                                      clangsa_config, ctu_func_map_cmd)
+    if ctu_manager.is_collected(triple_arch, action.source, clangsa_config,
+                                key):
+        LOG.debug("CTU files of '%s' are up to date.", action.source)
+        return key
+
+    if not clangsa_config.ctu_on_demand and \
+            not ctu_manager.generate_ast(triple_arch, action, action.source,
+                                         clangsa_config):
+        return None
+
+    if not ctu_manager.map_functions(
+            triple_arch, action, action.source, clangsa_config,
+            ctu_func_map_cmd, ctu_temp_fnmap_folder,
+            ctu_manager.get_collect_entry_id(action.source, key)):
+        return None
 
+    ctu_manager.store_collect_manifest(triple_arch, action, action.source,
+                                       clangsa_config, key,
+                                       ctu_temp_fnmap_folder)
+    return key
 
-def pre_analyze(params):
-    action, clangsa_config, skip_handlers, ctu_data, statistics_data = params
+
+def pre_analyze(action):
+    """
+    Run the pre-analysis of the build action. If the CTU files are collected
+    incrementally, the triple arch, the source file and the collect key of the
+    build action are returned when its CTU files are available.
+    """
+    clangsa_config = RUN_DATA['clangsa_config']
+    skip_handlers = RUN_DATA['skip_handlers']
+    ctu_data = RUN_DATA['ctu_data']
+    statistics_data = RUN_DATA['statistics_data']
+    jobserver = RUN_DATA['jobserver']
 
     PROGRESS_CHECKED_NUM.value += 1
 
     if skip_handlers and skip_handlers.should_skip(action.source):
-        return
+        return None
     if action.analyzer_type != ClangSA.ANALYZER_NAME:
-        return
+        return None
 
     _, source_filename = os.path.split(action.source)
 
@@ -98,33 +179,30 @@ def pre_analyze(params):
              PROGRESS_CHECKED_NUM.value,
              PROGRESS_ACTIONS.value, source_filename)
 
+    # The pre-analysis of a build action runs the analyzer processes one
+    # after the other, so it needs one job slot of make.
+    with jobserver.job_slot() if jobserver else contextlib.nullcontext():
+        return __pre_analyze(action, clangsa_config, ctu_data,
+                             statistics_data)
+
+
+def __pre_analyze(action, clangsa_config, ctu_data, statistics_data):
+    """ Collect the CTU and statistics data of the build action. """
+    collected = None
     try:
         if ctu_data:
             LOG.debug("running CTU pre analysis")
-            ctu_temp_fnmap_folder = ctu_data.get('ctu_temp_fnmap_folder')
-            ctu_func_map_cmd = ctu_data.get('ctu_func_map_cmd')
-
             triple_arch = \
                 ctu_triple_arch.get_triple_arch(action, action.source,
                                                 clangsa_config)
 
-            # TODO: reorganize the various ctu modes parameters
-            # Dump-based analysis requires serialized ASTs.
-            if clangsa_config.ctu_on_demand:
-                ctu_manager.generate_invocation_list(triple_arch, action,
-                                                     action.source,
-                                                     clangsa_config)
+            if ctu_data.get('ctu_incremental'):
+                key = collect_ctu_incremental(action, triple_arch,
+                                              clangsa_config, ctu_data)
+                if key:
+                    collected = (triple_arch, action.source, key)
             else:
-                ctu_manager.generate_ast(triple_arch, action, action.source,
-                                         clangsa_config)
-            # On-demand analysis does not require AST-dumps.
-            # We map the function names to corresponding sources of ASTs.
-            # In case of On-demand analysis this source is the original source
-            # code. In case of AST-dump based analysis these sources are the
-            # generated AST-dumps.
-            ctu_manager.map_functions(triple_arch, action, action.source,
-                                      clangsa_config, ctu_func_map_cmd,
-                                      ctu_temp_fnmap_folder)
+                collect_ctu(action, triple_arch, clangsa_config, ctu_data)
 
     except Exception as ex:
         LOG.error("Pre-analysis failed for %s: %s", action.source, str(ex))
@@ -143,11 +221,17 @@ def pre_analyze(params):
         traceback.print_exc(file=sys.stdout)
         raise
 
+    return collected
+
 
 def run_pre_analysis(actions, clangsa_config,
-                     jobs, skip_handlers, ctu_data, statistics_data, manager):
+                     jobs, skip_handlers, ctu_data, statistics_data,
+                     jobserver=None):
     """
     Run multiple pre analysis jobs before the actual analysis.
+
+    If a jobserver.JobServerClient is given, the pre-analysis of a build
+    action is started only with a job slot of make.
     """
     LOG.info('Pre-analysis started.')
     if ctu_data:
@@ -158,7 +242,6 @@ def run_pre_analysis(actions, clangsa_config,
     def signal_handler(signum, _):
         try:
             pool.terminate()
-            manager.shutdown()
         finally:
             sys.exit(128 + signum)
 
@@ -167,9 +250,15 @@ def run_pre_analysis(actions, clangsa_config,
     processed_var = multiprocess.Value('i', 0)
     actions_num = multiprocess.Value('i', len(actions))
 
+    run_data = {'clangsa_config': clangsa_config,
+                'skip_handlers': skip_handlers,
+                'ctu_data': ctu_data,
+                'statistics_data': statistics_data,
+                'jobserver': jobserver}
+
     pool = multiprocess.Pool(jobs,
                              initializer=init_worker,
-                             initargs=(processed_var, actions_num))
+                             initargs=(processed_var, actions_num, run_data))
 
     if statistics_data:
         # Statistics collection is enabled setup temporary
@@ -182,18 +271,15 @@ def run_pre_analysis(actions, clangsa_config,
 
         os.makedirs(stat_tmp_dir)
 
+    ctu_incremental = ctu_data and ctu_data.get('ctu_incremental')
+    if ctu_incremental:
+        # The invocation lists are created again from every build action.
+        for invocation_list in glob.glob(os.path.join(
+                ctu_data.get('ctu_dir'), '*', 'invocation-list.yml')):
+            os.remove(invocation_list)
+
     try:
-        collect_actions = [(build_action,
-                            clangsa_config,
-                            skip_handlers,
-                            ctu_data,
-                            statistics_data)
-                           for build_action in actions]
-        # FIXME: Ensure all shared data structures are wrapped in manager
-        #        proxy objects before passing them to other processes via
-        #        map_async.
-        #        Note that even deep-copying is known to be insufficient.
-        result = pool.map_async(pre_analyze, collect_actions)
+        result = pool.map_async(pre_analyze, actions)
         pool.close()
     except Exception:
         pool.terminate()
@@ -208,10 +294,20 @@ def run_pre_analysis(actions, clangsa_config,
 
     # Postprocessing the pre analysis results.
     if ctu_data:
+        if ctu_incremental:
+            # The global function maps are merged from the function maps of
+            # the translation units in the current build only.
+            ctu_manager.remove_stale_collect_outputs(
+                clangsa_config,
+                ctu_data.get('ctu_temp_fnmap_folder'),
+                [collected for collected in result.get() if collected])
+
         ctu_manager.merge_clang_extdef_mappings(
                 ctu_data.get('ctu_dir'),
                 ctu_data.get('ctu_func_map_file'),
-                ctu_data.get('ctu_temp_fnmap_folder'))
+                ctu_data.get('ctu_temp_fnmap_folder'),
+                jobs,
+                ctu_incremental)
 
     if statistics_data:
 
@@ -0,0 +1,327 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Persistent, content-addressed cache of analyzer results.
+
+An entry of the cache is identified by a key which is computed from the
+analyzer command (which contains the build action, the enabled checkers and
+the analyzer configuration), the configuration files which the analyzer reads
+implicitly (e.g. .clang-tidy), the build directory and the identity of the
+analyzer binary. Every entry stores the raw output of the analyzer and a
+manifest of the files building up the translation unit with their content
+hashes. An entry can be reused only if none of these files have changed since
+the entry was created.
+"""
+
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from typing import Dict, Iterable, List, Optional
+
+from codechecker_common.logger import get_logger
+
+from .analyzers.analyzer_output import AnalyzerOutput
+
+LOG = get_logger('analyzer')
+
+# Increase this number if the layout of the cache entries changes, so the
+# entries created by an older CodeChecker are not used anymore.
+CACHE_VERSION = 2
+
+MANIFEST_FILE = 'manifest.json'
+
+# The files of the standard outputs of the analyzer in a cache entry.
+STDOUT_FILE = 'stdout'
+STDERR_FILE = 'stderr'
+
+
+def file_content_hash(path: str) -> Optional[str]:
+    """
+    Return the SHA-256 hash of the given file's content or None if the file
+    can't be read.
+    """
+    sha = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+    except OSError:
+        return None
+
+    return sha.hexdigest()
+
+
+def get_analyzer_identity(analyzer_binary: Optional[str],
+                          version: Optional[str]) -> str:
+    """
+    Return a string which identifies the given analyzer binary. The string
+    changes if the binary is replaced, even if its version remains the same.
+    """
+    if not analyzer_binary:
+        return str(version)
+
+    real_path = os.path.realpath(analyzer_binary)
+    try:
+        stat = os.stat(real_path)
+        return f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}:{version}"
+    except OSError:
+        return f"{real_path}:{version}"
+
+
+class ResultCache:
+    """
+    Store and restore analyzer outputs in a cache directory which can be
+    shared between analysis runs and report directories.
+
+    The layout of the cache directory is: <cache_dir>/<key[:2]>/<key>/ where
+    every entry directory contains a manifest file and the output files of the
+    analyzer.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        analyzer_identities: Dict[str, str],
+        max_size: Optional[int] = None
+    ):
+        """
+        cache_dir -- The root directory of the cache.
+        analyzer_identities -- Analyzer name -> identity string of the
+                               analyzer binary. See get_analyzer_identity().
+        max_size -- The maximum size of the cache in bytes. If it is
+                    exceeded then the least recently used entries are evicted
+                    by evict(). None means no size limit.
+        """
+        self.__cache_dir = os.path.abspath(cache_dir)
+        self.__analyzer_identities = analyzer_identities
+        self.__max_size = max_size
+
+        os.makedirs(self.__cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> str:
+        return self.__cache_dir
+
+    def __entry_dir(self, key: str) -> str:
+        return os.path.join(self.__cache_dir, key[:2], key)
+
+    def get_key(
+        self,
+        result_handler,
+        analyzer_cmd: List[str],
+        config_files: Iterable[str] = ()
+    ) -> str:
+        """
+        Compute the cache key of an analyzer invocation. The paths under the
+        report directory are masked in the analyzer command, so the same
+        analysis of a build action has the same key in different report
+        directories.
+
+        config_files -- The configuration files which are read by the
+                        analyzer implicitly. See get_implicit_config_files()
+                        of the analyzers.
+        """
+        workspace = result_handler.workspace
+        analyzer_type = result_handler.buildaction.analyzer_type
+
+        key_parts = [
+            str(CACHE_VERSION),
+            analyzer_type,
+            self.__analyzer_identities.get(analyzer_type, ''),
+            os.path.normpath(os.path.join(
+                os.getcwd(), result_handler.buildaction.directory))]
+        key_parts.extend(arg.replace(workspace, '<workspace>')
+                         for arg in analyzer_cmd)
+
+        # Creating, removing or changing a configuration file changes the key.
+        for config_file in config_files:
+            key_parts.append(
+                f"{config_file}:{file_content_hash(config_file) or ''}")
+
+        return hashlib.sha256(
+            '\0'.join(key_parts).encode(errors='ignore')).hexdigest()
+
+    def __load_manifest(self, key: str) -> Optional[dict]:
+        manifest_file = os.path.join(self.__entry_dir(key), MANIFEST_FILE)
+        try:
+            with open(manifest_file, encoding='utf-8',
+                      errors='ignore') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def restore(self, key: str, result_handler,
+                output_files: List[str]) -> bool:
+        """
+        Fill the result handler with the cached analyzer output and copy the
+        cached output files to their place. Returns False if the cache has no
+        valid entry for the given key.
+        """
+        manifest = self.__load_manifest(key)
+        if not manifest:
+            return False
+
+        for path, digest in manifest['dependencies'].items():
+            if file_content_hash(path) != digest:
+                LOG.debug("Result cache entry %s is stale, '%s' has been "
+                          "changed.", key, path)
+                return False
+
+        entry_dir = self.__entry_dir(key)
+
+        # The outputs may be long, so they are spilled to the workspace like
+        # the outputs of the analyzer processes.
+        stdout = AnalyzerOutput(result_handler.output_memory_limit,
+                                result_handler.workspace)
+        stderr = AnalyzerOutput(result_handler.output_memory_limit,
+                                result_handler.workspace)
+        try:
+            for idx in manifest['outputs']:
+                shutil.copyfile(os.path.join(entry_dir, f"output-{idx}"),
+                                output_files[idx])
+
+            for output, output_file in [(stdout, STDOUT_FILE),
+                                        (stderr, STDERR_FILE)]:
+                with open(os.path.join(entry_dir, output_file),
+                          encoding='utf-8', errors='ignore',
+                          newline='') as f:
+                    output.copy_from(f)
+                output.close()
+
+            # The modification time of the manifest marks when the entry was
+            # used last time. This is used by the eviction.
+            os.utime(os.path.join(entry_dir, MANIFEST_FILE))
+        except (OSError, IndexError) as err:
+            # The entry may have been evicted by a parallel analysis.
+            LOG.debug("Failed to restore result cache entry %s: %s",
+                      key, err)
+            stdout.cleanup()
+            stderr.cleanup()
+            return False
+
+        result_handler.cleanup_output()
+        result_handler.analyzer_returncode = 0
+        result_handler.analyzer_stdout = stdout
+        result_handler.analyzer_stderr = stderr
+
+        return True
+
+    def store(self, key: str, result_handler, output_files: List[str]):
+        """
+        Store the output of a successful analyzer invocation in the cache.
+        The files of the translation unit are collected by the compiler which
+        is used in the build action.
+        """
+        # Import it here so tu_collector is loaded only if the cache is used.
+        from tu_collector import tu_collector
+
+        action = result_handler.buildaction
+        dependencies, err = tu_collector.get_dependent_headers(
+            action.original_command, action.directory)
+
+        if err:
+            LOG.debug("Result of '%s' is not cached, because its "
+                      "dependencies couldn't be collected.", action.source)
+            return
+
+        dependencies.add(os.path.normpath(
+            os.path.join(action.directory, action.source)))
+
+        manifest = {
+            'version': CACHE_VERSION,
+            'source': action.source,
+            'analyzer': action.analyzer_type,
+            'outputs': [],
+            'dependencies': {}}
+
+        for path in dependencies:
+            digest = file_content_hash(path)
+            if digest is None:
+                LOG.debug("Result of '%s' is not cached, because '%s' "
+                          "can't be read.", action.source, path)
+                return
+            manifest['dependencies'][path] = digest
+
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.__cache_dir)
+        try:
+            for idx, output_file in enumerate(output_files):
+                if os.path.isfile(output_file):
+                    shutil.copyfile(output_file,
+                                    os.path.join(tmp_dir, f"output-{idx}"))
+                    manifest['outputs'].append(idx)
+
+            for output, output_file in [
+                    (result_handler.analyzer_stdout, STDOUT_FILE),
+                    (result_handler.analyzer_stderr, STDERR_FILE)]:
+                with open(os.path.join(tmp_dir, output_file), 'w',
+                          encoding='utf-8', errors='ignore',
+                          newline='') as f:
+                    output.copy_to(f)
+
+            with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w',
+                      encoding='utf-8', errors='ignore') as f:
+                json.dump(manifest, f)
+
+            # The entry is renamed to its final place so parallel analyses
+            # never see a partially written entry.
+            entry_dir = self.__entry_dir(key)
+            os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+            if os.path.isdir(entry_dir):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.rename(tmp_dir, entry_dir)
+        except OSError as err:
+            LOG.debug("Failed to store result cache entry %s: %s", key, err)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def evict(self):
+        """
+        Remove the least recently used cache entries until the size of the
+        cache fits in the configured limit.
+        """
+        if self.__max_size is None:
+            return
+
+        entries = []
+        total_size = 0
+        for prefix in os.listdir(self.__cache_dir):
+            prefix_dir = os.path.join(self.__cache_dir, prefix)
+            if prefix.startswith('.') or not os.path.isdir(prefix_dir):
+                continue
+
+            for key in os.listdir(prefix_dir):
+                entry_dir = os.path.join(prefix_dir, key)
+                try:
+                    last_used = os.path.getmtime(
+                        os.path.join(entry_dir, MANIFEST_FILE))
+                    size = sum(
+                        os.path.getsize(os.path.join(entry_dir, f))
+                        for f in os.listdir(entry_dir))
+                except OSError:
+                    continue
+
+                entries.append((last_used, size, entry_dir))
+                total_size += size
+
+        if total_size <= self.__max_size:
+            return
+
+        entries.sort()
+        evicted = 0
+        for _, size, entry_dir in entries:
+            if total_size <= self.__max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+            evicted += 1
+
+        LOG.debug("%d entries have been evicted from the result cache.",
+                  evicted)
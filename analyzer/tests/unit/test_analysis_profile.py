@@ -0,0 +1,141 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the profile of the analysis of the build actions.
+"""
+
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from codechecker_analyzer import analysis_profile
+from codechecker_analyzer.analyzers.analyzer_output import AnalyzerOutput
+
+
+class BuildAction:
+    analyzer_type = 'clangsa'
+
+    def __init__(self, source):
+        self.source = source
+
+
+class ResultHandler:
+    def __init__(self, analyzer_result_file):
+        self.analyzer_result_file = analyzer_result_file
+        self.analyzer_stdout = AnalyzerOutput(text='out')
+        self.analyzer_stderr = AnalyzerOutput(text='error')
+
+
+def make_profile(worker, source, start, queue_wait, duration):
+    """ Returns an action profile with an analyzer phase only. """
+    return {'source': source,
+            'analyzer': 'clangsa',
+            'worker': worker,
+            'queue_wait': queue_wait,
+            'start': start,
+            'duration': duration,
+            'phases': [{'name': 'analyzer', 'start': start,
+                        'duration': duration, 'cpu_time': duration}],
+            'analyzer_time': duration,
+            'analyzer_cpu_time': duration,
+            'post_processing_time': 0.0,
+            'peak_memory': 100,
+            'cached': False,
+            'output_size': {'result': 10, 'stdout': 0, 'stderr': 0}}
+
+
+class AnalysisProfileTest(unittest.TestCase):
+    """
+    Test recording, summarizing and exporting the action profiles.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_action_profile(self):
+        """ The phases of the analysis of a build action are recorded. """
+        result_file = os.path.join(self.tmp_dir, 'main.c.plist')
+        with open(result_file, 'w', encoding='utf-8') as f:
+            f.write('<plist/>')
+
+        profile = analysis_profile.ActionProfile(
+            BuildAction('/src/main.c'), time.time() - 1)
+
+        profile.begin('analyzer')
+        subprocess.run([sys.executable, '-c',
+                        'sum(range(1000000))'], check=True)
+        profile.begin('post-processing')
+
+        result = profile.finish(ResultHandler(result_file), 1024, False)
+        json.dumps(result)
+
+        self.assertEqual(result['source'], '/src/main.c')
+        self.assertEqual(result['worker'], os.getpid())
+        self.assertGreaterEqual(result['queue_wait'], 1)
+        self.assertEqual([p['name'] for p in result['phases']],
+                         ['setup', 'analyzer', 'post-processing'])
+        self.assertGreater(result['analyzer_time'], 0)
+        self.assertLessEqual(result['analyzer_time'], result['duration'])
+        if analysis_profile.resource:
+            self.assertGreater(result['analyzer_cpu_time'], 0)
+        self.assertEqual(result['peak_memory'], 1024)
+        self.assertEqual(result['output_size'],
+                         {'result': 8, 'stdout': 3, 'stderr': 5})
+
+    def test_summary(self):
+        """ The workers are busy in three quarters of the analysis. """
+        profiles = [make_profile(1, '/src/a.c', 100.0, 0.0, 2.0),
+                    make_profile(2, '/src/b.c', 100.0, 0.0, 1.0),
+                    make_profile(2, '/src/c.c', 101.0, 1.0, 1.0),
+                    make_profile(1, '/src/d.c', 102.0, 2.0, 2.0)]
+
+        summary = analysis_profile.summarize(profiles)
+        self.assertEqual(summary['actions'], 4)
+        self.assertEqual(summary['workers'], 2)
+        self.assertEqual(summary['wall_time'], 4.0)
+        self.assertEqual(summary['worker_utilization'], 0.75)
+        self.assertEqual(summary['queue_wait'], 3.0)
+        self.assertEqual(summary['max_queue_wait'], 2.0)
+        self.assertEqual(summary['analyzer_time'], 6.0)
+
+        self.assertEqual(analysis_profile.summarize([]), {'actions': 0})
+
+    def test_trace_events(self):
+        """ The build actions are complete events on the worker threads. """
+        profiles = [make_profile(1, '/src/a.c', 100.0, 0.0, 2.0),
+                    make_profile(2, '/src/b.c', 100.5, 0.5, 1.0)]
+
+        metadata_tool = {}
+        analysis_profile.save(profiles, metadata_tool, self.tmp_dir)
+        self.assertEqual(metadata_tool['profile']['actions'], profiles)
+
+        with open(os.path.join(self.tmp_dir, analysis_profile.TRACE_FILE),
+                  encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+
+        actions = [e for e in events if e.get('cat') == 'action']
+        self.assertEqual([(e['tid'], e['name'], e['ts'], e['dur'])
+                          for e in actions],
+                         [(1, 'clangsa a.c', 0, 2000000),
+                          (2, 'clangsa b.c', 500000, 1000000)])
+
+        threads = [e['tid'] for e in events if e['ph'] == 'M']
+        self.assertEqual(threads, [1, 2])
+
+        busy = [e['args']['workers'] for e in events if e['ph'] == 'C']
+        self.assertEqual(busy, [1, 2, 1, 0])
@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the ordering of the analysis jobs.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer import analysis_scheduler
+
+
+class BuildAction:
+    analyzer_type = 'clangsa'
+
+    def __init__(self, source):
+        self.source = source
+        self.directory = os.path.dirname(source)
+        self.original_command = f'gcc -c {source}'
+
+
+class AnalysisSchedulerTest(unittest.TestCase):
+    """
+    Test the cost based ordering of build actions.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __action(self, name, content):
+        source = os.path.join(self.tmp_dir, name)
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return BuildAction(source)
+
+    def test_recorded_durations(self):
+        """ Actions with longer recorded durations are started first. """
+        actions = [self.__action(f'{i}.c', '') for i in range(3)]
+        durations = {
+            analysis_scheduler.action_key(actions[0]): {'non-ctu': 1.0},
+            analysis_scheduler.action_key(actions[1]): {'non-ctu': 10.0},
+            analysis_scheduler.action_key(actions[2]): {'non-ctu': 5.0}}
+
+        ordered = analysis_scheduler.order_by_expected_cost(
+            actions, durations, False)
+        self.assertEqual(ordered, [actions[1], actions[2], actions[0]])
+
+    def test_analysis_mode(self):
+        """ The durations of the current analysis mode are preferred. """
+        actions = [self.__action(f'{i}.c', '') for i in range(2)]
+        durations = {
+            analysis_scheduler.action_key(actions[0]):
+                {'non-ctu': 1.0, 'ctu': 20.0},
+            analysis_scheduler.action_key(actions[1]):
+                {'non-ctu': 5.0}}
+
+        self.assertEqual(analysis_scheduler.order_by_expected_cost(
+            actions, durations, False), [actions[1], actions[0]])
+        self.assertEqual(analysis_scheduler.order_by_expected_cost(
+            actions, durations, True), [actions[0], actions[1]])
+
+    def test_estimation_of_unseen_actions(self):
+        """
+        The analysis time of unseen actions is estimated from their source
+        files relative to the already analyzed ones.
+        """
+        small = self.__action('small.c', '\n')
+        large = self.__action(
+            'large.c', '#include <stdio.h>\n#include <stdlib.h>\n' +
+            'int x;\n' * 100)
+        known = self.__action('known.c', 'int main() {}\n')
+
+        durations = {
+            analysis_scheduler.action_key(known): {'non-ctu': 2.0}}
+
+        ordered = analysis_scheduler.order_by_expected_cost(
+            [small, known, large], durations, False)
+        self.assertEqual(ordered, [large, known, small])
+
+    def test_save_and_load(self):
+        """ Durations are persisted in the report directory. """
+        durations = {'clangsa_abc': {'ctu': 1.5}}
+        analysis_scheduler.save_durations(self.tmp_dir, durations)
+
+        self.assertEqual(analysis_scheduler.load_durations(self.tmp_dir),
+                         durations)
+        self.assertEqual(analysis_scheduler.load_durations(
+            os.path.join(self.tmp_dir, 'nonexistent')), {})
+
+        peak_memory = {'clangsa_abc': {'non-ctu': 1024}}
+        analysis_scheduler.save_peak_memory(self.tmp_dir, peak_memory)
+
+        self.assertEqual(analysis_scheduler.load_peak_memory(self.tmp_dir),
+                         peak_memory)
+        self.assertEqual(analysis_scheduler.load_durations(self.tmp_dir),
+                         durations)
@@ -0,0 +1,180 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the cache of the information queried from the analyzer binaries.
+"""
+
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from codechecker_analyzer import analyzer_info_cache, host_check
+from codechecker_analyzer.analyzer_info_cache import AnalyzerInfoCache
+
+
+class AnalyzerInfoCacheTest(unittest.TestCase):
+    """
+    Test storing and reusing the analyzer info cache entries.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        AnalyzerInfoCache.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        analyzer_info_cache.set_refresh(False)
+
+        self.binary = os.path.join(self.tmp_dir, 'clang-tidy')
+        self.__write_binary('#!/bin/sh\necho clang-tidy\n')
+
+        self.queries = 0
+
+    def tearDown(self):
+        AnalyzerInfoCache.cache_dir = None
+        analyzer_info_cache.set_refresh(False)
+        shutil.rmtree(self.tmp_dir)
+
+    def __write_binary(self, content):
+        with open(self.binary, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(self.binary, stat.S_IRWXU)
+
+    def __query(self):
+        """ Simulate querying the checkers of the analyzer. """
+        self.queries += 1
+        return [('checker', f'description {self.queries}')]
+
+    def __cached(self, key=None, **kwargs):
+        return analyzer_info_cache.cached(
+            self.binary, key or ['-list-checks'], self.__query, **kwargs)
+
+    def test_cached(self):
+        """ The analyzer is queried again only if the binary changes. """
+        self.assertEqual(self.__cached(), [['checker', 'description 1']])
+        self.assertEqual(self.__cached(), [['checker', 'description 1']])
+        self.assertEqual(self.queries, 1)
+
+        # Other information of the same binary.
+        self.__cached(['-dump-config'])
+        self.assertEqual(self.queries, 2)
+
+        # The binary is updated.
+        self.__write_binary('#!/bin/sh\necho clang-tidy 2\n')
+        self.assertEqual(self.__cached(), [['checker', 'description 3']])
+        self.assertEqual(self.queries, 3)
+
+    def test_refresh(self):
+        """ The cached information is replaced if refresh is requested. """
+        self.__cached()
+
+        analyzer_info_cache.set_refresh(True)
+        self.assertEqual(self.__cached(), [['checker', 'description 2']])
+
+        # Refreshed only once by a command.
+        self.assertEqual(self.__cached(), [['checker', 'description 2']])
+
+        analyzer_info_cache.set_refresh(False)
+        self.assertEqual(self.__cached(), [['checker', 'description 2']])
+        self.assertEqual(self.queries, 2)
+
+    def test_not_cached(self):
+        """
+        Failed queries, rejected results and unknown binaries are not cached.
+        """
+        def fail():
+            self.queries += 1
+            raise OSError("clang-tidy can't be executed")
+
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                analyzer_info_cache.cached(self.binary, ['fail'], fail)
+        self.assertEqual(self.queries, 2)
+
+        self.__cached(cache_if=lambda checkers: False)
+        self.__cached(cache_if=lambda checkers: False)
+        self.assertEqual(self.queries, 4)
+
+        self.binary = os.path.join(self.tmp_dir, 'missing')
+        self.__cached()
+        self.__cached()
+        self.assertEqual(self.queries, 6)
+
+
+class HostCheckCacheTest(unittest.TestCase):
+    """
+    Test that only the successful feature checks of the analyzer are cached.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        AnalyzerInfoCache.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        analyzer_info_cache.set_refresh(False)
+
+        # The fake analyzer counts its runs and fails until the 'works' file
+        # is created, like an analyzer which misses its environment.
+        self.clang = os.path.join(self.tmp_dir, 'clang')
+        self.runs = os.path.join(self.tmp_dir, 'runs')
+        with open(self.clang, 'w', encoding='utf-8') as f:
+            f.write(f'#!/bin/sh\n'
+                    f'echo run >> {self.runs}\n'
+                    f'[ -f {self.tmp_dir}/works ] || exit 1\n'
+                    f'echo "  mode (string)"\n')
+        os.chmod(self.clang, stat.S_IRWXU)
+
+        context = mock.Mock()
+        context.get_env_for_bin.return_value = dict(os.environ)
+        self.patcher = mock.patch.object(
+            host_check.analyzer_context, 'get_context', return_value=context)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        AnalyzerInfoCache.cache_dir = None
+        shutil.rmtree(self.tmp_dir)
+
+    def __count_runs(self):
+        if not os.path.exists(self.runs):
+            return 0
+        with open(self.runs, encoding='utf-8') as f:
+            return len(f.readlines())
+
+    def __set_works(self):
+        with open(os.path.join(self.tmp_dir, 'works'), 'w',
+                  encoding='utf-8'):
+            pass
+
+    def test_config_option_failure_not_cached(self):
+        """ The config option is checked again if the analyzer failed. """
+        for _ in range(2):
+            self.assertFalse(
+                host_check.has_analyzer_config_option(self.clang, 'mode'))
+        self.assertEqual(self.__count_runs(), 2)
+
+        self.__set_works()
+        for _ in range(2):
+            self.assertTrue(
+                host_check.has_analyzer_config_option(self.clang, 'mode'))
+            self.assertFalse(
+                host_check.has_analyzer_config_option(self.clang, 'missing'))
+        self.assertEqual(self.__count_runs(), 4)
+
+    def test_option_failure_not_cached(self):
+        """ The option is checked again if the analyzer failed. """
+        for _ in range(2):
+            self.assertFalse(
+                host_check.has_analyzer_option(self.clang, ['-fopt']))
+        self.assertEqual(self.__count_runs(), 2)
+
+        self.__set_works()
+        for _ in range(2):
+            self.assertTrue(
+                host_check.has_analyzer_option(self.clang, ['-fopt']))
+        self.assertEqual(self.__count_runs(), 3)
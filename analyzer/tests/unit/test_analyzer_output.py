@@ -0,0 +1,143 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the bounded-memory storage of the analyzer outputs.
+"""
+
+
+import io
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import unittest
+import zipfile
+
+from codechecker_analyzer.analyzers.analyzer_base import SourceAnalyzer
+from codechecker_analyzer.analyzers.analyzer_output import AnalyzerOutput
+
+
+class AnalyzerOutputTest(unittest.TestCase):
+    """
+    Test the analyzer outputs kept in memory and spilled to a file.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_in_memory(self):
+        """ A short output is not written to a file. """
+        output = AnalyzerOutput(100, self.tmp_dir)
+        output.write('first\r\nsecond\n')
+        output.close()
+
+        self.assertIsNone(output.spill_file)
+        self.assertEqual(str(output), 'first\r\nsecond\n')
+        self.assertEqual(list(output.splitlines()), ['first', 'second'])
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_spill(self):
+        """ A long output is moved to a file, which is removed by cleanup. """
+        text = ''.join(f'line {i}\r\n' if i % 3 else f'line {i}\r'
+                       for i in range(1000))
+
+        output = AnalyzerOutput(100, self.tmp_dir)
+        output.copy_from(io.StringIO(text))
+        output.close()
+
+        self.assertEqual(os.path.dirname(output.spill_file), self.tmp_dir)
+        self.assertEqual(len(output), len(text))
+        self.assertEqual(str(output), text)
+        self.assertEqual(list(output.splitlines()), text.splitlines())
+
+        stream = io.StringIO()
+        output.copy_to(stream)
+        self.assertEqual(stream.getvalue(), text)
+
+        output.cleanup()
+        self.assertIsNone(output.spill_file)
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_prepend(self):
+        """ The prepended text is written before the spilled output. """
+        output = AnalyzerOutput(4, self.tmp_dir, 'output')
+        output.prepend('[TIMEOUT]\n')
+        output.close()
+
+        self.assertEqual(str(output), '[TIMEOUT]\noutput')
+        self.assertEqual(list(output.splitlines()), ['[TIMEOUT]', 'output'])
+
+        output.cleanup()
+
+    def test_summary(self):
+        """ The middle of a long output is omitted from the summary. """
+        output = AnalyzerOutput(10, self.tmp_dir, 'a' * 50 + 'b' * 50)
+        output.close()
+
+        self.assertEqual(output.summary(1000), 'a' * 50 + 'b' * 50)
+        self.assertEqual(
+            output.summary(20),
+            'a' * 10 + '\n'
+            '... [80 characters of the output are omitted] ...\n' +
+            'b' * 10)
+
+        output.cleanup()
+
+    def test_write_to_zip(self):
+        """ The output is written to a file of a zip archive. """
+        text = 'árvíztűrő\n' * 100
+
+        output = AnalyzerOutput(10, self.tmp_dir, text)
+        output.close()
+
+        zip_file = os.path.join(self.tmp_dir, 'output.zip')
+        with zipfile.ZipFile(zip_file, 'w') as archive:
+            with archive.open('stderr', 'w') as f:
+                for chunk in output.encoded_chunks():
+                    f.write(chunk)
+
+        with zipfile.ZipFile(zip_file) as archive:
+            self.assertEqual(archive.read('stderr').decode('utf-8'), text)
+
+        output.cleanup()
+
+    def test_run_proc_streamed(self):
+        """
+        Both standard outputs of a process are read without a deadlock even
+        if they are longer than the pipe buffers.
+        """
+        script = "import sys\n" \
+                 "for i in range(100000):\n" \
+                 "    sys.stdout.write(f'out {i}\\n')\n" \
+                 "    sys.stderr.write(f'err {i}\\n')\n" \
+                 "sys.exit(3)\n"
+
+        stdout = AnalyzerOutput(1000, self.tmp_dir)
+        stderr = AnalyzerOutput(1000, self.tmp_dir)
+        sigint_handler = signal.getsignal(signal.SIGINT)
+        try:
+            returncode = SourceAnalyzer.run_proc_streamed(
+                [sys.executable, '-c', script], stdout, stderr,
+                env=os.environ)
+        finally:
+            signal.signal(signal.SIGINT, sigint_handler)
+
+        self.assertEqual(returncode, 3)
+        self.assertEqual(list(stdout.splitlines()),
+                         [f'out {i}' for i in range(100000)])
+        self.assertEqual(list(stderr.splitlines()),
+                         [f'err {i}' for i in range(100000)])
+
+        stdout.cleanup()
+        stderr.cleanup()
+        self.assertEqual(os.listdir(self.tmp_dir), [])
@@ -225,3 +225,54 @@ class TestCheckerLabels(unittest.TestCase):
                 'bugprone-undelegated-constructor',
                 'google-objc-global-variable-declaration',
                 'cert-err34-c']))
+
+    def test_checker_prefix(self):
+        cl = CheckerLabels(self.labels_dir.name)
+
+        self.assertEqual(
+            cl.severity('core.DivideZero.Extra', 'clangsa'), 'HIGH')
+        self.assertEqual(
+            cl.severity('core.builtin.NoReturnFunctionsX'), 'MEDIUM')
+        self.assertEqual(
+            cl.severity('core.Divide', 'clangsa'), 'UNSPECIFIED')
+
+        # The results are cached, but they can be modified by the caller.
+        labels = cl.labels_of_checker('cert-err34-c-extra')
+        labels.clear()
+        self.assertEqual(
+            cl.label_of_checker('cert-err34-c-extra', 'guideline'),
+            ['sei-cert-c'])
+
+    def test_label_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cl = CheckerLabels(self.labels_dir.name, cache_dir)
+            self.assertEqual(cl.severity('core.DivideZero'), 'HIGH')
+
+            cache_files = os.listdir(cache_dir)
+            self.assertEqual(len(cache_files), 1)
+            cache_file = os.path.join(cache_dir, cache_files[0])
+
+            # The labels are loaded from the cache file.
+            with open(cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+            cache['labels']['clangsa']['core.DivideZero'] = ['severity:LOW']
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+
+            cl = CheckerLabels(self.labels_dir.name, cache_dir)
+            self.assertEqual(cl.severity('core.DivideZero'), 'LOW')
+
+            # The cache is not used after a label config file changes.
+            clangsa_file = os.path.join(
+                self.labels_dir.name, 'analyzers', 'clangsa.json')
+            with open(clangsa_file, encoding='utf-8') as f:
+                labels = json.load(f)
+            labels['labels']['core.DivideZero'] = ['severity:CRITICAL']
+            with open(clangsa_file, 'w', encoding='utf-8') as f:
+                json.dump(labels, f)
+
+            cl = CheckerLabels(self.labels_dir.name, cache_dir)
+            self.assertEqual(cl.severity('core.DivideZero'), 'CRITICAL')
+            self.assertEqual(
+                CheckerLabels(self.labels_dir.name, cache_dir).severity(
+                    'core.DivideZero'), 'CRITICAL')
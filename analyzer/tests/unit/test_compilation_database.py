@@ -16,6 +16,7 @@ import tempfile
 import unittest
 
 from codechecker_analyzer import compilation_database
+from codechecker_common.util import iter_json_array
 
 
 class TestCompilationDatabase(unittest.TestCase):
@@ -172,3 +173,50 @@ class TestCompilationDatabase(unittest.TestCase):
             os.path.join(TestCompilationDatabase.project_dir, "non_existing"))
 
         self.assertIsNone(comp_db)
+
+    def test_gather_compilation_database_json(self):
+        """
+        The build actions of a compilation database JSON file are read
+        lazily, on every iteration.
+        """
+        comp_db_file = os.path.join(self.project_dir, "build.json")
+        with open(comp_db_file, "w", encoding="utf-8", errors="ignore") as f:
+            json.dump([{
+                "directory": self.project_dir,
+                "arguments": ["gcc", "-DNAME=\"a b\"", "outer.c"],
+                "file": "outer.c"
+            }, {
+                "directory": self.project_sub_dir,
+                "command": "gcc inner.c",
+                "file": "inner.c"
+            }], f, indent=2)
+
+        comp_db = compilation_database.gather_compilation_database(
+            comp_db_file)
+
+        for _ in range(2):
+            self.assertEqual(
+                [comp_action["command"] for comp_action in comp_db],
+                ["gcc '-DNAME=\"a b\"' outer.c", "gcc inner.c"])
+
+    def test_iter_json_array(self):
+        """
+        The elements of a JSON array are parsed correctly even if they are
+        split between the chunks which are read from the file.
+        """
+        json_file = os.path.join(self.project_dir, "array.json")
+        content = [{"key": "value " * i, "list": [i, 1.5, None]}
+                   for i in range(20)] + [12345, "text", []]
+
+        with open(json_file, "w", encoding="utf-8", errors="ignore") as f:
+            json.dump(content, f)
+
+        for chunk_size in [1, 7, 100, 1 << 20]:
+            self.assertEqual(list(iter_json_array(json_file, chunk_size)),
+                             content)
+
+        with open(json_file, "w", encoding="utf-8", errors="ignore") as f:
+            f.write('[{"key": "value"}, {"key"')
+
+        with self.assertRaises(ValueError):
+            list(iter_json_array(json_file, 8))
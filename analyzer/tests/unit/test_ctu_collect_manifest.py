@@ -0,0 +1,167 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test reusing the CTU files collected by a previous analysis.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+from tu_collector import tu_collector
+
+from codechecker_analyzer.analyzers.clangsa import ctu_manager
+
+
+TRIPLE_ARCH = 'x86_64'
+FNMAP_FOLDER = 'tmpExternalFnMaps'
+
+
+class CtuCollectManifestTest(unittest.TestCase):
+    """
+    Test storing and checking the manifests of the collected CTU files.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(self.src_dir)
+
+        self.config = SimpleNamespace(
+            ctu_dir=os.path.join(self.tmp_dir, 'ctu-dir'),
+            ctu_on_demand=False)
+
+        self.sources = [os.path.join(self.src_dir, name)
+                        for name in ['a.c', 'b.c']]
+        for source in self.sources:
+            self.__write(source, '#include "lib.h"\n')
+        self.header = os.path.join(self.src_dir, 'lib.h')
+        self.__write(self.header, 'int f();\n')
+
+        patcher = mock.patch.object(
+            tu_collector, 'get_dependent_headers',
+            lambda command, directory: ({self.header}, None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def __write(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def __output_paths(self, source, key='key'):
+        return [os.path.join(self.config.ctu_dir, TRIPLE_ARCH, output)
+                for output in ctu_manager.get_collect_outputs(
+                    source, key, self.config, FNMAP_FOLDER).values()]
+
+    def __collect(self, source, key='key'):
+        """ Simulate the generation of the CTU files of a source. """
+        for output in self.__output_paths(source, key):
+            self.__write(output, source)
+
+        action = SimpleNamespace(original_command=f'gcc -c {source}',
+                                 directory=self.src_dir)
+        ctu_manager.store_collect_manifest(TRIPLE_ARCH, action, source,
+                                           self.config, key, FNMAP_FOLDER)
+
+    def test_collected(self):
+        """ The CTU files are reused until the translation unit changes. """
+        source = self.sources[0]
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'key'))
+
+        self.__collect(source)
+        self.assertTrue(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'key'))
+
+        # The build command has changed.
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'other key'))
+
+        # An included header has changed.
+        self.__write(self.header, 'int f(int);\n')
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'key'))
+
+        self.__collect(source)
+        self.assertTrue(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'key'))
+
+        # The AST dump has been removed.
+        os.remove(self.__output_paths(source)[-1])
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'key'))
+
+    def test_remove_stale_outputs(self):
+        """
+        The CTU files of the translation units which are not collected
+        anymore are removed.
+        """
+        for source in self.sources:
+            self.__collect(source)
+
+        # A function map without manifest, e.g. the translation unit failed
+        # to be collected.
+        failed = os.path.join(self.src_dir, 'failed.c')
+        failed_fnmap = self.__output_paths(failed)[0]
+        self.__write(failed_fnmap, failed)
+
+        ctu_manager.remove_stale_collect_outputs(
+            self.config, FNMAP_FOLDER,
+            [(TRIPLE_ARCH, self.sources[0], 'key')])
+
+        self.assertTrue(ctu_manager.is_collected(
+            TRIPLE_ARCH, self.sources[0], self.config, 'key'))
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, self.sources[1], self.config, 'key'))
+
+        for output in self.__output_paths(self.sources[0]):
+            self.assertTrue(os.path.exists(output))
+        for output in self.__output_paths(self.sources[1]):
+            self.assertFalse(os.path.exists(output))
+        self.assertFalse(os.path.exists(failed_fnmap))
+
+    def test_several_build_actions(self):
+        """
+        The CTU files collected by several build actions of the same source
+        are reused for each of them.
+        """
+        source = self.sources[0]
+        self.__collect(source, 'debug')
+        self.__collect(source, 'release')
+
+        # Each build action has its own function map.
+        fnmaps = [self.__output_paths(source, key)[0]
+                  for key in ['debug', 'release']]
+        self.assertNotEqual(fnmaps[0], fnmaps[1])
+
+        for key in ['debug', 'release']:
+            self.assertTrue(ctu_manager.is_collected(
+                TRIPLE_ARCH, source, self.config, key))
+
+        # The AST dump of the source is kept for the build action which is
+        # still in the build.
+        ctu_manager.remove_stale_collect_outputs(
+            self.config, FNMAP_FOLDER, [(TRIPLE_ARCH, source, 'release')])
+
+        self.assertTrue(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'release'))
+        self.assertFalse(ctu_manager.is_collected(
+            TRIPLE_ARCH, source, self.config, 'debug'))
+        self.assertFalse(os.path.exists(fnmaps[0]))
+        self.assertTrue(os.path.exists(fnmaps[1]))
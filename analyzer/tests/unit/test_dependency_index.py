@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the index of the files constituting the translation units.
+"""
+
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer import dependency_index
+
+
+class DependencyIndexTest(unittest.TestCase):
+    """
+    Test the building, the incremental update and the queries of the
+    dependency index.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.index_file = os.path.join(self.tmp_dir, 'reports',
+                                       dependency_index.DEPENDENCY_INDEX_FILE)
+
+        self.__write('inc/a.h', 'int a();\n')
+        self.__write('inc/b.h', 'int b();\n')
+        self.__write('a.c', '#include "inc/a.h"\nint main() { return a(); }\n')
+        self.__write('b.c', '#include "inc/b.h"\nint main() { return b(); }\n')
+
+        self.compilation_db = [
+            {'directory': self.tmp_dir, 'file': f, 'command': f'gcc -c {f}'}
+            for f in ['a.c', 'b.c']]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def __path(self, name):
+        return os.path.join(self.tmp_dir, name)
+
+    def __timestamps(self):
+        with open(self.index_file, encoding='utf-8') as f:
+            records = json.load(f)['actions']
+        return {r['source']: r['timestamp'] for r in records.values()}
+
+    def test_query(self):
+        """ Dependent sources are found by header path and glob. """
+        index = dependency_index.DependencyIndex()
+        index.update(self.compilation_db, 2)
+
+        self.assertEqual(index.get_dependent_sources(self.__path('inc/a.h')),
+                         {self.__path('a.c')})
+        self.assertEqual(index.get_dependent_sources(self.__path('inc/*.h')),
+                         {self.__path('a.c'), self.__path('b.c')})
+        self.assertEqual(index.get_dependent_sources(self.__path('*/b.?')),
+                         {self.__path('b.c')})
+        self.assertEqual(index.get_dependent_sources(self.__path('c.h')),
+                         set())
+
+    def test_incremental_update(self):
+        """ Only the build actions with modified files are collected again. """
+        index = dependency_index.DependencyIndex(self.index_file)
+        index.update(self.compilation_db)
+        index.save()
+        timestamps = self.__timestamps()
+
+        self.__write('a.c', '#include "inc/b.h"\nint main() { return b(); }\n')
+
+        index = dependency_index.DependencyIndex(self.index_file)
+        index.update(self.compilation_db)
+        index.save()
+        new_timestamps = self.__timestamps()
+
+        self.assertEqual(new_timestamps[self.__path('b.c')],
+                         timestamps[self.__path('b.c')])
+        self.assertGreater(new_timestamps[self.__path('a.c')],
+                           timestamps[self.__path('a.c')])
+
+        self.assertEqual(index.get_dependent_sources(self.__path('inc/a.h')),
+                         set())
+        self.assertEqual(index.get_dependent_sources(self.__path('inc/b.h')),
+                         {self.__path('a.c'), self.__path('b.c')})
+
+    def test_removed_build_actions(self):
+        """ Build actions not in the compilation database are removed. """
+        index = dependency_index.DependencyIndex(self.index_file)
+        index.update(self.compilation_db)
+        index.update(self.compilation_db[1:])
+
+        self.assertEqual(index.get_dependent_sources(self.__path('inc/*')),
+                         {self.__path('b.c')})
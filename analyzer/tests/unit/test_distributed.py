@@ -0,0 +1,206 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the distributed analysis with a coordinator and workers on localhost.
+"""
+
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import multiprocess
+from multiprocess.connection import Client
+
+from codechecker_analyzer import analysis_manager, distributed
+
+
+AUTH_KEY = b'secret'
+
+
+def fake_check(action):
+    """ Analysis of a build action which writes a result file. """
+    output_path = analysis_manager.RUN_DATA['output_path']
+    result_file = os.path.join(output_path, action.name + '.plist')
+    with open(result_file, 'w', encoding='utf-8') as f:
+        f.write(action.name)
+
+    return 0, False, False, 'fake', result_file, action.source, {}
+
+
+def slow_check(action):
+    """ Analysis of a build action which takes longer than the timeout. """
+    time.sleep(1)
+    return fake_check(action)
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def connect(address, auth_key):
+    """ Connect to the coordinator when it starts to listen. """
+    for _ in range(100):
+        try:
+            return Client(address, authkey=auth_key)
+        except ConnectionRefusedError:
+            time.sleep(0.1)
+
+    return Client(address, authkey=auth_key)
+
+
+class DistributedAnalysisTest(unittest.TestCase):
+    """
+    Test handing out the build actions to the workers and collecting their
+    results.
+    """
+
+    def setUp(self):
+        self.output_path = tempfile.mkdtemp()
+        self.address = ('127.0.0.1', get_free_port())
+        self.actions = [SimpleNamespace(name=f'a{i}', source=f'/src/a{i}.c')
+                        for i in range(5)]
+        self.results = None
+
+        patchers = [mock.patch.object(analysis_manager, 'check', fake_check),
+                    mock.patch.object(distributed, 'POLL_INTERVAL', 0.1)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        def run_coordinator():
+            coordinator = distributed.Coordinator(self.address, AUTH_KEY)
+            self.results = coordinator.run(
+                self.actions, {'output_path': self.output_path,
+                               'generate_reproducer': False})
+
+        self.coordinator = threading.Thread(target=run_coordinator)
+        self.coordinator.start()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_path)
+
+    def __assert_analyzed(self):
+        self.coordinator.join(10)
+        self.assertFalse(self.coordinator.is_alive())
+
+        self.assertEqual([r[5] for r in self.results],
+                         [a.source for a in self.actions])
+        for action, result in zip(self.actions, self.results):
+            self.assertEqual(os.path.dirname(result[4]), self.output_path)
+            with open(result[4], encoding='utf-8') as f:
+                self.assertEqual(f.read(), action.name)
+
+    def test_workers(self):
+        """ The build actions are analyzed by several workers. """
+        workers = [threading.Thread(target=distributed.run_worker,
+                                    args=(self.address, AUTH_KEY, jobs, 10))
+                   for jobs in [1, 2]]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(20)
+
+        self.__assert_analyzed()
+
+    def test_lost_worker(self):
+        """ The build actions of a lost worker are handed out again. """
+        conn = connect(self.address, AUTH_KEY)
+        conn.recv()
+        conn.send(('request', None))
+        self.assertEqual(conn.recv()[0], 'action')
+        conn.close()
+
+        distributed.run_worker(self.address, AUTH_KEY, 2)
+
+        self.__assert_analyzed()
+
+    def test_authentication(self):
+        """ Workers with a wrong key are rejected. """
+        with self.assertRaises(multiprocess.AuthenticationError):
+            distributed.run_worker(self.address, b'wrong', 1, 10)
+
+        distributed.run_worker(self.address, AUTH_KEY, 1)
+
+        self.__assert_analyzed()
+
+    def test_invalid_result_file(self):
+        """ Result files outside of the output directory are rejected. """
+        conn = connect(self.address, AUTH_KEY)
+        conn.recv()
+        conn.send(('request', None))
+        _, (idx, action) = conn.recv()
+        result = (0, False, False, 'fake', None, action.source, {})
+        conn.send(('result', (idx, result, [('../outside.plist', b'')])))
+
+        # The worker is disconnected.
+        with self.assertRaises(EOFError):
+            conn.recv()
+        conn.close()
+
+        self.assertFalse(os.path.exists(
+            os.path.join(os.path.dirname(self.output_path), 'outside.plist')))
+
+        distributed.run_worker(self.address, AUTH_KEY, 1)
+
+        self.__assert_analyzed()
+
+    def test_no_workers_warning(self):
+        """ The coordinator warns if no worker is connected to it. """
+        with mock.patch.object(distributed, 'WORKER_WAIT_WARNING_INTERVAL',
+                               0.2), \
+                self.assertLogs('analyzer', 'WARNING') as logs:
+            time.sleep(1)
+
+        self.assertIn("No analyzer worker is connected", logs.output[0])
+        self.assertIn("5 build action(s) are waiting", logs.output[0])
+
+        distributed.run_worker(self.address, AUTH_KEY, 1)
+
+        self.__assert_analyzed()
+
+    def test_silent_worker(self):
+        """
+        The build actions of a worker which stops responding without closing
+        its connection are handed out again.
+        """
+        with mock.patch.object(distributed, 'PEER_TIMEOUT', 0.5), \
+                self.assertLogs('analyzer', 'WARNING') as logs:
+            conn = connect(self.address, AUTH_KEY)
+            conn.recv()
+            conn.send(('request', None))
+            self.assertEqual(conn.recv()[0], 'action')
+
+            # The connection is kept open, but nothing is sent anymore.
+            distributed.run_worker(self.address, AUTH_KEY, 2)
+            self.__assert_analyzed()
+            conn.close()
+
+        self.assertTrue(any("is lost" in line for line in logs.output))
+
+    def test_heartbeat(self):
+        """
+        A worker which analyzes longer than the timeout is not considered to
+        be lost, because it sends heartbeats.
+        """
+        with mock.patch.object(analysis_manager, 'check', slow_check), \
+                mock.patch.object(distributed, 'PEER_TIMEOUT', 0.5), \
+                mock.patch.object(distributed, 'HEARTBEAT_INTERVAL', 0.1), \
+                self.assertNoLogs('analyzer', 'WARNING'):
+            distributed.run_worker(self.address, AUTH_KEY, 5)
+            self.__assert_analyzed()
@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the client of the jobserver of GNU make.
+"""
+
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import multiprocess  # type: ignore
+
+from codechecker_analyzer.jobserver import JobServerClient, \
+    get_jobserver_auth
+
+
+CLIENT = None
+RUNNING = None
+MAX_RUNNING = None
+
+
+def init_worker(client, running, max_running):
+    global CLIENT, RUNNING, MAX_RUNNING
+    CLIENT = client
+    RUNNING = running
+    MAX_RUNNING = max_running
+
+
+def run_job(_):
+    """ Simulate an analyzer process which needs a job slot. """
+    with CLIENT.job_slot():
+        with RUNNING.get_lock():
+            RUNNING.value += 1
+            MAX_RUNNING.value = max(MAX_RUNNING.value, RUNNING.value)
+
+        time.sleep(0.05)
+
+        with RUNNING.get_lock():
+            RUNNING.value -= 1
+
+
+class JobServerTest(unittest.TestCase):
+    """
+    Test sharing the job slots of make between the worker processes.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_makeflags(self):
+        """ The jobserver is parsed from MAKEFLAGS. """
+        self.assertEqual(
+            get_jobserver_auth(' -j4 --jobserver-auth=fifo:/tmp/GMfifo1'),
+            'fifo:/tmp/GMfifo1')
+        self.assertEqual(
+            get_jobserver_auth('ks -j --jobserver-auth=3,4'), '3,4')
+        self.assertEqual(
+            get_jobserver_auth(' --jobserver-fds=5,6 -j'), '5,6')
+        self.assertEqual(
+            get_jobserver_auth('--jobserver-auth=3,4 --jobserver-auth=-2,-2'),
+            '-2,-2')
+        self.assertIsNone(get_jobserver_auth('ks'))
+
+        self.assertIsNone(JobServerClient.from_environ({'MAKEFLAGS': 'k'}))
+        self.assertIsNone(JobServerClient.from_environ(
+            {'MAKEFLAGS': '--jobserver-auth=-2,-2'}))
+        self.assertIsNone(JobServerClient.from_environ(
+            {'MAKEFLAGS': '--jobserver-auth=fifo:' +
+             os.path.join(self.tmp_dir, 'missing')}))
+
+    def __run_jobs(self, makeflags, jobs):
+        """
+        Run jobs in a process pool with the given number of workers and
+        return the maximal number of jobs running in parallel.
+        """
+        client = JobServerClient.from_environ({'MAKEFLAGS': makeflags})
+        self.assertIsNotNone(client)
+
+        running = multiprocess.Value('i', 0)
+        max_running = multiprocess.Value('i', 0)
+        with multiprocess.Pool(jobs, initializer=init_worker,
+                               initargs=(client, running,
+                                         max_running)) as pool:
+            pool.map(run_job, range(24), 1)
+
+        return max_running.value
+
+    def test_pipe(self):
+        """
+        The workers share the implicit job slot and the job slots in the
+        pipe inherited from make.
+        """
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, b'++')
+
+            max_running = self.__run_jobs(
+                f'-j3 --jobserver-auth={read_fd},{write_fd}', 6)
+            self.assertEqual(max_running, 3)
+
+            # Every job slot is given back to make.
+            os.set_blocking(read_fd, False)
+            self.assertEqual(os.read(read_fd, 10), b'++')
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_fifo(self):
+        """ The job slots are read from the named pipe of make 4.4. """
+        fifo = os.path.join(self.tmp_dir, 'GMfifo')
+        os.mkfifo(fifo)
+        fd = os.open(fifo, os.O_RDWR | os.O_NONBLOCK)
+        try:
+            os.write(fd, b'+')
+
+            max_running = self.__run_jobs(
+                f'-j2 --jobserver-auth=fifo:{fifo}', 4)
+            self.assertEqual(max_running, 2)
+            self.assertEqual(os.read(fd, 10), b'+')
+        finally:
+            os.close(fd)
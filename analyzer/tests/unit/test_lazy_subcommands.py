@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test loading the subcommands of the command line lazily.
+"""
+
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from codechecker_common.cli import ArgumentParser, LazySubParsersAction
+
+
+PACKAGE = 'lazy_subcommands_test'
+
+SUBCOMMANDS = ['alpha', 'beta', 'gamma']
+
+SUBCOMMAND_MODULE = '''
+def get_argparser_ctor_args():
+    return {{'help': "The {sub_cmd} subcommand."}}
+
+
+def add_arguments_to_parser(parser):
+    parser.add_argument('--{sub_cmd}-flag', action='store_true')
+    parser.set_defaults(sub_cmd='{sub_cmd}')
+'''
+
+
+class LazySubParsersTest(unittest.TestCase):
+    """
+    Test that the module of a subcommand is imported only when it is needed.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        package_dir = os.path.join(self.tmp_dir, PACKAGE)
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, '__init__.py'), 'w',
+                  encoding='utf-8'):
+            pass
+
+        for sub_cmd in SUBCOMMANDS:
+            with open(os.path.join(package_dir, f'{sub_cmd}.py'), 'w',
+                      encoding='utf-8') as f:
+                f.write(SUBCOMMAND_MODULE.format(sub_cmd=sub_cmd))
+
+        sys.path.insert(0, self.tmp_dir)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir)
+        for module_name in list(sys.modules):
+            if module_name.split('.')[0] == PACKAGE:
+                del sys.modules[module_name]
+
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def __create_parser():
+        parser = ArgumentParser(prog='CodeChecker')
+        subparsers = parser.add_subparsers(help='commands',
+                                           action=LazySubParsersAction)
+        for sub_cmd in SUBCOMMANDS:
+            subparsers.add_lazy_parser(sub_cmd, f'{PACKAGE}.{sub_cmd}')
+
+        return parser
+
+    @staticmethod
+    def __imported():
+        return sorted(module_name.split('.')[1] for module_name in sys.modules
+                      if module_name.startswith(f'{PACKAGE}.'))
+
+    def test_only_selected_imported(self):
+        """ Only the module of the chosen subcommand is imported. """
+        args = self.__create_parser().parse_args(['beta', '--beta-flag'])
+
+        self.assertEqual(args.sub_cmd, 'beta')
+        self.assertTrue(args.beta_flag)
+        self.assertEqual(self.__imported(), ['beta'])
+
+    def test_help_order(self):
+        """
+        The subcommands are listed in the order of adding them, independently
+        of the order of loading them.
+        """
+        parser = self.__create_parser()
+        parser.parse_args(['gamma'])
+        parser.parse_args(['beta'])
+
+        help_message = parser.format_help()
+
+        self.assertIn('{alpha,beta,gamma}', help_message)
+        positions = [help_message.index(f"The {sub_cmd} subcommand.")
+                     for sub_cmd in SUBCOMMANDS]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(self.__imported(), SUBCOMMANDS)
+
+    def test_invalid_choice(self):
+        """
+        An invalid subcommand is reported with the list of the subcommands
+        without importing any of them.
+        """
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), \
+                self.assertRaises(SystemExit) as ctx:
+            self.__create_parser().parse_args(['delta'])
+
+        self.assertEqual(ctx.exception.code, 1)
+
+        # The quoting of the choices depends on the Python version.
+        error = stderr.getvalue().replace("'", "")
+        self.assertIn("invalid choice: delta (choose from alpha, beta, gamma)",
+                      error)
+        self.assertEqual(self.__imported(), [])
@@ -12,8 +12,10 @@
 import json
 import os
 import shutil
+import stat
 import tempfile
 import unittest
+from unittest import mock
 
 from codechecker_analyzer.buildlog import log_parser
 from codechecker_common.skiplist_handler import SkipListHandler, \
@@ -749,3 +751,86 @@ class LogParserTest(unittest.TestCase):
 
         self.assertEqual(len(build_actions), 3)
         self.assertEqual(build_action.source, file_c_symdir)
+
+    def test_compiler_info_cache(self):
+        """
+        Test that the implicit compiler info is stored in the compiler info
+        cache and it is used by the next parsing instead of the compiler.
+        """
+        cache_dir = os.path.join(self.tmp_dir, "compiler_info_cache")
+        compilation_cmd = [
+            {"directory": self.tmp_dir,
+             "command": "g++ -c " + self.src_file_path,
+             "file": self.src_file_path}]
+
+        build_actions, _ = log_parser.parse_unique_log(
+            compilation_cmd, self.__this_dir,
+            compiler_info_cache_dir=cache_dir)
+        self.assertEqual(len(build_actions), 1)
+
+        cache_files = os.listdir(cache_dir)
+        self.assertEqual(len(cache_files), 1)
+
+        cache_file = os.path.join(cache_dir, cache_files[0])
+        info = load_json(cache_file)
+        self.assertIn('compiler_includes', info)
+
+        info['compiler_includes'] = ['/cached/include']
+        with open(cache_file, 'w', encoding='utf-8', errors='ignore') as f:
+            json.dump(info, f)
+
+        build_actions, _ = log_parser.parse_unique_log(
+            compilation_cmd, self.__this_dir,
+            compiler_info_cache_dir=cache_dir)
+        self.assertEqual(build_actions[0].compiler_includes,
+                         ['/cached/include'])
+
+    def test_compiler_info_detected_once(self):
+        """
+        Test that the parser processes detect the implicit compiler info of a
+        compiler and flag combination only once, even without a compiler info
+        cache.
+        """
+        compiler_dir = os.path.join(self.tmp_dir, "compiler_info_once")
+        os.makedirs(compiler_dir)
+        invocations = os.path.join(compiler_dir, "invocations")
+        compiler = os.path.join(compiler_dir, "cc-count")
+        with open(compiler, 'w', encoding='utf-8') as f:
+            f.write(f"#!/bin/sh\n"
+                    f"echo \"$@\" >> {invocations}\n"
+                    f"echo '#include <...> search starts here:' >&2\n"
+                    f"echo ' /fake/include' >&2\n"
+                    f"echo 'End of search list.' >&2\n")
+        os.chmod(compiler, stat.S_IRWXU)
+
+        compilation_cmd = []
+        for idx in range(16):
+            source = os.path.join(compiler_dir, f"main_{idx}.cpp")
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write("int main() { return 0; }")
+
+            compilation_cmd.extend(
+                {"directory": compiler_dir,
+                 "command": f"{compiler} {flag} -c {source}",
+                 "file": source}
+                for flag in ["-std=c++11", "-std=c++17"])
+
+        def count_invocations(jobs):
+            if os.path.exists(invocations):
+                os.remove(invocations)
+
+            # Every entry is parsed by the next free parser process.
+            with mock.patch.object(log_parser, 'PARSE_CHUNK_SIZE', 1):
+                build_actions, _ = log_parser.parse_unique_log(
+                    compilation_cmd, jobs=jobs)
+
+            self.assertEqual(len(build_actions), 32)
+            self.assertEqual(build_actions[0].compiler_includes,
+                             ['/fake/include'])
+
+            with open(invocations, encoding='utf-8') as f:
+                return len(f.readlines())
+
+        invocations_of_one_job = count_invocations(1)
+        self.assertGreater(invocations_of_one_job, 0)
+        self.assertEqual(count_invocations(4), invocations_of_one_job)
@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the memory aware admission control of the analyzer processes.
+"""
+
+
+import signal
+import subprocess
+import sys
+import threading
+import unittest
+
+from codechecker_analyzer import memory_budget
+
+
+class MemoryBudgetTest(unittest.TestCase):
+    """
+    Test the memory budget and the sampling of the memory usage.
+    """
+
+    def test_admission(self):
+        """
+        An analyzer is admitted only if its reservation fits in the budget.
+        """
+        budget = memory_budget.MemoryBudget(100, 10)
+        first = budget.admit(60)
+
+        admitted = threading.Event()
+
+        def admit_second():
+            budget.admit(60).release()
+            admitted.set()
+
+        thread = threading.Thread(target=admit_second)
+        thread.start()
+        self.assertFalse(admitted.wait(0.2))
+
+        # The reservation follows the memory usage of the analyzer, but it
+        # doesn't go below the expected amount.
+        first.update(20)
+        self.assertFalse(admitted.wait(0.2))
+
+        first.update(80)
+        first.release()
+        self.assertTrue(admitted.wait(5))
+        thread.join()
+
+    def test_admission_of_large_analysis(self):
+        """ Larger analyses than the budget are admitted alone. """
+        budget = memory_budget.MemoryBudget(100, 10)
+        budget.admit(200).release()
+
+    def test_memory_monitor(self):
+        """ The peak memory usage of a process is sampled. """
+        reservation_updates = []
+
+        with subprocess.Popen(
+                [sys.executable, '-c',
+                 'import time; x = bytearray(64 * 1024 * 1024); '
+                 'time.sleep(0.5)']) as proc:
+            monitor = memory_budget.MemoryMonitor(
+                proc.pid, reservation_updates.append, 0.05)
+            proc.wait()
+            peak_rss = monitor.stop()
+
+        self.assertGreater(peak_rss, 64 * 1024 * 1024)
+        self.assertEqual(max(reservation_updates), peak_rss)
+
+    def test_killed_for_memory(self):
+        """ Processes killed by SIGKILL are considered killed for memory. """
+        if not hasattr(signal, 'SIGKILL'):
+            self.skipTest("SIGKILL is not available on this platform.")
+
+        self.assertTrue(memory_budget.is_killed_for_memory(-signal.SIGKILL))
+        self.assertTrue(memory_budget.is_killed_for_memory(137))
+        self.assertFalse(memory_budget.is_killed_for_memory(1))
+        self.assertFalse(memory_budget.is_killed_for_memory(-signal.SIGTERM))
+
+    def test_default_estimate(self):
+        """
+        Unknown analyses are expected to use the median of the recorded
+        memory usages or an even share of the budget.
+        """
+        self.assertEqual(memory_budget.get_default_estimate({}, 1000, 4), 250)
+        self.assertEqual(memory_budget.get_default_estimate(
+            {'a': {'ctu': 10}, 'b': {'non-ctu': 30, 'ctu': 50}}, 1000, 4),
+            30)
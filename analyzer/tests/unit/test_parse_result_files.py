@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test parsing the analyzer result files in parallel processes.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import File, Report, report_file
+
+from codechecker_analyzer.cli import parse
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
+
+
+class ParseResultFilesTest(unittest.TestCase):
+    """
+    Test that the analyzer result files give the same results in the same
+    order independently of the number of processes.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.tasks = []
+        for idx in range(10):
+            source = os.path.join(self.tmp_dir, f"file_{idx}.c")
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write("int x = 1 / 0;\n"
+                        "// codechecker_false_positive [core.DivideZero] "
+                        "not a bug\n"
+                        "int y = 1 / 0;\n")
+
+            reports = [
+                Report(File(source), line, 9, "Division by zero",
+                       'core.DivideZero', report_hash=f"{idx}:{line}",
+                       analyzer_name='clangsa')
+                for line in [1, 3]]
+
+            plist = os.path.join(self.tmp_dir, f"file_{idx}.c_clangsa.plist")
+            report_file.create(plist, reports)
+            self.tasks.append((plist, None))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __parse(self, jobs, skip_handlers=None):
+        results = []
+        for reports, source_comments, warnings, error in \
+                parse.parse_result_files(
+                    self.tasks, skip_handlers or SkipListHandlers(), None,
+                    jobs):
+            self.assertIsNone(error)
+            self.assertEqual(warnings, [])
+            results.append((
+                [(r.report_hash, r.review_status.status) for r in reports],
+                {idx: c.status for idx, c in source_comments.items()}))
+
+        return results
+
+    def test_order(self):
+        """ The results are in the order of the analyzer result files. """
+        serial = self.__parse(1)
+        self.assertEqual(len(serial), len(self.tasks))
+        self.assertEqual(serial[3], ([('3:1', 'unreviewed'),
+                                      ('3:3', 'false_positive')],
+                                     {1: 'false_positive'}))
+
+        self.assertEqual(self.__parse(3), serial)
+
+    def test_skip(self):
+        """ The skipped reports are dropped by the workers. """
+        skip_handlers = SkipListHandlers([
+            SkipListHandler(f"-{self.tmp_dir}/file_1.c")])
+
+        results = self.__parse(2, skip_handlers)
+        self.assertEqual(results[1], ([], {}))
+        self.assertEqual(len(results[2][0]), 2)
@@ -0,0 +1,148 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test writing the debug zips of the failed analyses into a blob store.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from tu_collector import tu_collector
+
+from codechecker_analyzer import analysis_manager
+from codechecker_analyzer.analyzers.analyzer_output import AnalyzerOutput
+
+
+class BuildAction:
+    def __init__(self, directory, source):
+        self.directory = directory
+        self.source = source
+        self.original_command = f"gcc -c {source}"
+        self.target = ''
+
+
+class SourceAnalyzer:
+    @staticmethod
+    def get_analyzer_mentioned_files(_):
+        return set()
+
+
+class ResultHandler:
+    def __init__(self, workspace, action):
+        self.workspace = workspace
+        self.buildaction = action
+        self.analyzer_cmd = ['clang', '--analyze', action.source]
+        self.analyzer_returncode = 254
+        self.analyzer_stdout = AnalyzerOutput(text='')
+        self.analyzer_stderr = AnalyzerOutput(
+            text=f"crash in {action.source}\n")
+
+
+class ReproducerBlobStoreTest(unittest.TestCase):
+    """
+    Test the manifest files of the debug zips and their blob store.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(self.src_dir)
+        with open(os.path.join(self.src_dir, 'common.h'), 'w',
+                  encoding='utf-8') as f:
+            f.write('int common(void);\n')
+        for source in ['a.c', 'b.c']:
+            with open(os.path.join(self.src_dir, source), 'w',
+                      encoding='utf-8') as f:
+                f.write('#include "common.h"\n'
+                        'int main(void) { return common(); }\n')
+
+        self.output_dirs = analysis_manager.create_output_dirs(
+            os.path.join(self.tmp_dir, 'reports'), False)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __handle_reproducer(self, source, zip_file, blob_store=None):
+        action = BuildAction(self.src_dir, os.path.join(self.src_dir, source))
+        analysis_manager.handle_reproducer(
+            SourceAnalyzer(), ResultHandler(self.tmp_dir, action), zip_file,
+            {}, blob_store)
+
+    def test_manifest(self):
+        """
+        The manifest file is materialized into the same zip file which is
+        written without the blob store, and the header file is stored once.
+        """
+        blob_store = tu_collector.BlobStore(self.output_dirs['blobs'])
+        failed_dir = self.output_dirs['failed']
+
+        for source in ['a.c', 'b.c']:
+            self.__handle_reproducer(
+                source, os.path.join(failed_dir, source + '_crash.zip'),
+                blob_store)
+
+        self.assertEqual(sorted(os.listdir(failed_dir)),
+                         ['a.c_crash.manifest.json',
+                          'b.c_crash.manifest.json'])
+
+        _, files_a = tu_collector.read_manifest(
+            os.path.join(failed_dir, 'a.c_crash.manifest.json'))
+        _, files_b = tu_collector.read_manifest(
+            os.path.join(failed_dir, 'b.c_crash.manifest.json'))
+
+        header = tu_collector.sources_root_path(
+            os.path.join(self.src_dir, 'common.h'))
+        self.assertEqual(files_a[header], files_b[header])
+        self.assertNotEqual(files_a['stderr'], files_b['stderr'])
+
+        materialized = os.path.join(self.tmp_dir, 'materialized.zip')
+        tu_collector.materialize_zip(
+            os.path.join(failed_dir, 'a.c_crash.manifest.json'),
+            materialized)
+
+        classic = os.path.join(self.tmp_dir, 'classic.zip')
+        self.__handle_reproducer('a.c', classic)
+
+        with zipfile.ZipFile(materialized) as m_archive, \
+                zipfile.ZipFile(classic) as c_archive:
+            self.assertEqual(sorted(m_archive.namelist()),
+                             sorted(c_archive.namelist()))
+            for name in c_archive.namelist():
+                self.assertEqual(m_archive.read(name), c_archive.read(name))
+
+            self.assertEqual(m_archive.read('return-code'), b'254')
+
+    def test_prune(self):
+        """ The files of the removed manifest files are removed. """
+        blob_store = tu_collector.BlobStore(self.output_dirs['blobs'])
+        failed_dir = self.output_dirs['failed']
+
+        for source in ['a.c', 'b.c']:
+            self.__handle_reproducer(
+                source, os.path.join(failed_dir, source + '_crash.zip'),
+                blob_store)
+
+        os.remove(os.path.join(failed_dir, 'b.c_crash.manifest.json'))
+        analysis_manager.prune_blob_store(self.output_dirs)
+
+        _, files = tu_collector.read_manifest(
+            os.path.join(failed_dir, 'a.c_crash.manifest.json'))
+        stored = {os.path.basename(root) + f
+                  for root, _, names in os.walk(blob_store.path)
+                  for f in names}
+        self.assertEqual(stored, set(files.values()))
+
+        os.remove(os.path.join(failed_dir, 'a.c_crash.manifest.json'))
+        analysis_manager.prune_blob_store(self.output_dirs)
+        self.assertFalse(os.path.exists(blob_store.path))
@@ -0,0 +1,201 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the persistent analysis result cache.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_analyzer.analyzers.analyzer_output import AnalyzerOutput
+from codechecker_analyzer.analyzers.clangtidy.analyzer import ClangTidy
+from codechecker_analyzer.result_cache import ResultCache
+
+
+class BuildAction:
+    analyzer_type = 'clangsa'
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.source = os.path.join(directory, 'main.c')
+        self.original_command = f'gcc -c {self.source} -o main.o'
+
+
+class ResultHandler:
+    def __init__(self, action, workspace):
+        self.buildaction = action
+        self.workspace = workspace
+        self.analyzer_result_file = os.path.join(workspace, 'main.c.plist')
+        self.analyzer_returncode = 1
+        self.analyzer_stdout = AnalyzerOutput()
+        self.analyzer_stderr = AnalyzerOutput()
+        self.output_memory_limit = 4
+
+    def cleanup_output(self):
+        self.analyzer_stdout.cleanup()
+        self.analyzer_stderr.cleanup()
+
+
+class ResultCacheTest(unittest.TestCase):
+    """
+    Test storing, restoring and evicting analysis results.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        os.makedirs(self.src_dir)
+
+        with open(os.path.join(self.src_dir, 'main.c'), 'w',
+                  encoding='utf-8') as f:
+            f.write('#include "lib.h"\nint main() { return LIB; }\n')
+        self.__write_header('#define LIB 0\n')
+
+        self.action = BuildAction(self.src_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write_header(self, content):
+        with open(os.path.join(self.src_dir, 'lib.h'), 'w',
+                  encoding='utf-8') as f:
+            f.write(content)
+
+    def __analyze(self, cache, workspace):
+        """
+        Simulate an analyzer invocation which writes its output to the
+        workspace.
+        """
+        os.makedirs(workspace, exist_ok=True)
+        rh = ResultHandler(self.action, workspace)
+        cmd = ['clang', '--analyze', '-o', rh.analyzer_result_file,
+               self.action.source]
+        key = cache.get_key(rh, cmd)
+
+        if cache.restore(key, rh, [rh.analyzer_result_file]):
+            return rh, True
+
+        with open(rh.analyzer_result_file, 'w', encoding='utf-8') as f:
+            f.write('<plist/>')
+        rh.analyzer_returncode = 0
+        rh.analyzer_stdout = AnalyzerOutput(text='stdout')
+        rh.analyzer_stderr = AnalyzerOutput(text='stderr')
+        cache.store(key, rh, [rh.analyzer_result_file])
+
+        return rh, False
+
+    def test_restore_in_other_workspace(self):
+        """
+        The result of the same build action is restored in a different
+        report directory.
+        """
+        cache = ResultCache(self.cache_dir, {'clangsa': 'clang-20'})
+
+        _, cached = self.__analyze(cache, os.path.join(self.tmp_dir, 'r1'))
+        self.assertFalse(cached)
+
+        rh, cached = self.__analyze(cache, os.path.join(self.tmp_dir, 'r2'))
+        self.assertTrue(cached)
+        self.assertEqual(rh.analyzer_returncode, 0)
+        self.assertEqual(str(rh.analyzer_stdout), 'stdout')
+        self.assertEqual(str(rh.analyzer_stderr), 'stderr')
+
+        # The restored outputs are longer than the memory limit of the
+        # result handler, so they are spilled to its workspace.
+        self.assertEqual(os.path.dirname(rh.analyzer_stdout.spill_file),
+                         rh.workspace)
+        rh.cleanup_output()
+        self.assertEqual(os.listdir(rh.workspace), ['main.c.plist'])
+
+        with open(rh.analyzer_result_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<plist/>')
+
+    def test_header_change_invalidates(self):
+        """ Changing an included header makes the entry stale. """
+        cache = ResultCache(self.cache_dir, {'clangsa': 'clang-20'})
+        workspace = os.path.join(self.tmp_dir, 'reports')
+
+        self.__analyze(cache, workspace)
+        self.__write_header('#define LIB 1\n')
+
+        _, cached = self.__analyze(cache, workspace)
+        self.assertFalse(cached)
+
+        _, cached = self.__analyze(cache, workspace)
+        self.assertTrue(cached)
+
+    def test_analyzer_change_invalidates(self):
+        """ A different analyzer binary doesn't use the same entries. """
+        workspace = os.path.join(self.tmp_dir, 'reports')
+
+        self.__analyze(ResultCache(self.cache_dir, {'clangsa': 'clang-19'}),
+                       workspace)
+
+        _, cached = self.__analyze(
+            ResultCache(self.cache_dir, {'clangsa': 'clang-20'}), workspace)
+        self.assertFalse(cached)
+
+    def test_eviction(self):
+        """ Entries are removed if the cache exceeds its size limit. """
+        workspace = os.path.join(self.tmp_dir, 'reports')
+
+        cache = ResultCache(self.cache_dir, {'clangsa': 'clang-20'}, 0)
+        self.__analyze(cache, workspace)
+        cache.evict()
+
+        _, cached = self.__analyze(cache, workspace)
+        self.assertFalse(cached)
+
+        cache = ResultCache(self.cache_dir, {'clangsa': 'clang-20'},
+                            1024 * 1024)
+        cache.evict()
+
+        _, cached = self.__analyze(cache, workspace)
+        self.assertTrue(cached)
+
+    def test_config_file_change_invalidates(self):
+        """
+        Creating or changing a configuration file which the analyzer reads
+        implicitly changes the key of the analysis.
+        """
+        cache = ResultCache(self.cache_dir, {'clang-tidy': 'clang-tidy-20'})
+        rh = ResultHandler(self.action, os.path.join(self.tmp_dir, 'reports'))
+        cmd = ['clang-tidy', self.action.source]
+        config_file = os.path.join(self.src_dir, '.clang-tidy')
+
+        keys = [cache.get_key(rh, cmd, [config_file])]
+        for content in ['Checks: "-*,misc-*"', 'Checks: "-*,bugprone-*"']:
+            with open(config_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            keys.append(cache.get_key(rh, cmd, [config_file]))
+
+        self.assertEqual(len(set(keys)), 3)
+        self.assertEqual(keys[-1], cache.get_key(rh, cmd, [config_file]))
+
+    def test_clang_tidy_config_files(self):
+        """
+        Clang Tidy reads the .clang-tidy files of the parent directories of
+        the source file, unless its configuration is given explicitly.
+        """
+        analyzer = ClangTidy(None, self.action)
+        analyzer.source_file = 'main.c'
+
+        config_files = analyzer.get_implicit_config_files(
+            ['clang-tidy', '-checks=-*,misc-*', 'main.c', '--', '-c'])
+        self.assertEqual(config_files[:2], [
+            os.path.join(self.src_dir, '.clang-tidy'),
+            os.path.join(self.tmp_dir, '.clang-tidy')])
+        self.assertEqual(config_files[-1], os.path.join('/', '.clang-tidy'))
+
+        self.assertEqual(analyzer.get_implicit_config_files(
+            ['clang-tidy', '-config={}', 'main.c', '--']), [])
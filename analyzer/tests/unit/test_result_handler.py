@@ -6,10 +6,17 @@
 #
 # -------------------------------------------------------------------------
 
+import os
 import random
+import shutil
 import string
+import tempfile
 import unittest
 
+from codechecker_report_converter.report import report_file
+
+from codechecker_analyzer.analyzers.clangsa.result_handler import \
+    ClangSAResultHandler
 from codechecker_analyzer.analyzers.result_handler_base import ResultHandler
 
 
@@ -47,3 +54,32 @@ class ResultHandlerTest(unittest.TestCase):
         self.assertEqual(
             rh.analyzer_action_str,
             'main.cpp_clangsa_193423e3c13026c10bc1457b7434a25a')
+
+    def test_clangsa_disabled_checkers(self):
+        """
+        The reports of the disabled checkers are removed when the result
+        file is post-processed.
+        """
+        ba = BuildAction()
+        ba.directory = os.path.join(os.path.dirname(__file__),
+                                    'remove_report_test_files')
+        ba.original_command = 'g++ files/x.cpp'
+
+        workspace = tempfile.mkdtemp()
+        try:
+            rh = ClangSAResultHandler(ba, workspace)
+            rh.analyzed_source_file = 'files/x.cpp'
+            rh.checker_labels = None
+            rh.analyzer_returncode = 0
+            rh.disabled_checkers = {'core.DivideZero', 'deadcode.DeadStores'}
+            shutil.copyfile(os.path.join(ba.directory, 'x.plist'),
+                            rh.analyzer_result_file)
+
+            rh.postprocess_result(None, None)
+
+            reports = report_file.get_reports(rh.analyzer_result_file)
+            self.assertEqual(
+                sorted(r.checker_name for r in reports),
+                ['alpha.clone.CloneChecker', 'core.NullDereference'])
+        finally:
+            shutil.rmtree(workspace)
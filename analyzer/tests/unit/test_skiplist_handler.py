@@ -0,0 +1,102 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the matching of the skip list handler.
+"""
+
+
+import fnmatch
+import os
+import random
+import re
+import unittest
+
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
+
+
+def reference_should_skip(skip_lines, source):
+    """
+    The skip lines are tried one by one and the first matching one decides.
+    """
+    for line in skip_lines:
+        glob = fnmatch.translate(os.path.normpath(line[1:].strip()))
+        if glob.endswith((r"\Z", r"\z")):
+            glob = glob[:-2]
+        if re.match(glob + fr"(?:\{os.path.sep}.*)?$", source):
+            return line[0] == '-'
+    return False
+
+
+class SkipListHandlerTest(unittest.TestCase):
+    """
+    Test that the skip list handler finds the first matching skip line.
+    """
+
+    def __assert_equivalent(self, skip_lines, paths):
+        handler = SkipListHandler('\n'.join(skip_lines))
+        for path in paths:
+            self.assertEqual(handler.should_skip(path),
+                             reference_should_skip(skip_lines, path),
+                             path)
+            # The second query is answered from the cache.
+            self.assertEqual(handler.should_skip(path),
+                             reference_should_skip(skip_lines, path),
+                             path)
+
+    def test_first_match(self):
+        """ The first matching line decides even among literal paths. """
+        skip_lines = ['+/src/lib/keep.c',
+                      '-/src/lib',
+                      '+/src/*/test_*.c',
+                      '-/src/*',
+                      '+/src/lib/other.c',
+                      '-*.h',
+                      '-/',
+                      '+*']
+        paths = ['/src/lib/keep.c', '/src/lib/other.c', '/src/libx/a.c',
+                 '/src/app/test_a.c', '/src/app/main.c', '/src',
+                 '/include/a.h', '/main.c', '//main.c', '/src/lib/',
+                 '/src/lib\n', '/src/app/x.c\n/y']
+        self.__assert_equivalent(skip_lines, paths)
+
+    def test_random_skip_lines(self):
+        """ Random skip lists give the same result as the line by line scan.
+        """
+        rnd = random.Random(42)
+        parts = ['a', 'b', 'lib', 'test', 'x.c', 'y.h', '*', '?', '*.c',
+                 '[ab]', '..', '.']
+
+        def random_path(glob):
+            elements = rnd.choices(parts if glob else parts[:6],
+                                   k=rnd.randint(1, 5))
+            return ('/' if rnd.random() < 0.8 else '') + '/'.join(elements)
+
+        for _ in range(20):
+            skip_lines = [rnd.choice('+-') + random_path(True)
+                          for _ in range(rnd.randint(1, 30))]
+            paths = [random_path(False) for _ in range(200)]
+            self.__assert_equivalent(skip_lines, paths)
+
+    def test_overwrite_skip_content(self):
+        """ The cached results are dropped when the skip lines change. """
+        handler = SkipListHandler('-/a/*')
+        self.assertTrue(handler.should_skip('/a/b.c'))
+
+        handler.overwrite_skip_content(['+/a/b.c', '-*'])
+        self.assertFalse(handler.should_skip('/a/b.c'))
+        self.assertTrue(handler.should_skip('/a/c.c'))
+
+    def test_handlers(self):
+        """ A path is skipped if any of the handlers skips it. """
+        handlers = SkipListHandlers([SkipListHandler('-/a/*'),
+                                     SkipListHandler('-/b/*')])
+        self.assertTrue(handlers.should_skip('/a/x.c'))
+        self.assertTrue(handlers.should_skip('/b/x.c'))
+        self.assertFalse(handlers.should_skip('/c/x.c'))
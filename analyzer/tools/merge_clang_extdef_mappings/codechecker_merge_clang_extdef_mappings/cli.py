@@ -52,6 +52,13 @@ def __add_arguments_to_parser(parser):
                         help="Output file where the merged function maps will "
                              "be stored into.")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        metavar='jobs',
+                        default=1,
+                        help="Number of processes merging the function maps "
+                             "if they are too big to be merged in memory.")
+
 
 def main():
     """ Merge CTU funcs maps main command line. """
@@ -68,7 +75,7 @@ def main():
 
     args = parser.parse_args()
 
-    merge_clang_extdef_mappings.merge(args.input, args.output)
+    merge_clang_extdef_mappings.merge(args.input, args.output, args.jobs)
 
 
 if __name__ == "__main__":
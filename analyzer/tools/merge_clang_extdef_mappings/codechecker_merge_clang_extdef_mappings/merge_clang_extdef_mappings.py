@@ -7,19 +7,62 @@
 # -------------------------------------------------------------------------
 
 import glob
+import heapq
+import multiprocessing
 import os
+import shutil
+import tempfile
+import zlib
 
+# The function maps are merged in memory if their total size is below this
+# limit (in bytes). Otherwise they are split into partitions of about this
+# size by the mangled names, and the partitions are merged separately.
+PARTITION_SIZE = 64 * 1024 * 1024
 
-def _generate_func_map_lines(func_map_dir):
-    """ Iterate over all lines of input files in random order. """
-    files = glob.glob(os.path.join(func_map_dir, '*'))
-    for func_map_file in files:
+# Every worker keeps a file open for every partition while splitting the
+# function maps.
+MAX_PARTITIONS = 256
+
+# The partition files contain the position of the line in the input files as
+# a fixed width hexadecimal prefix, so the merged partitions can be ordered by
+# comparing the lines.
+_KEY_LENGTH = 20
+
+
+def _get_func_map_files(func_map_dir):
+    """ Returns the input files in random order. """
+    return glob.glob(os.path.join(func_map_dir, '*'))
+
+
+def _generate_func_map_lines(func_map_files):
+    """ Iterate over all lines of input files. """
+    for func_map_file in func_map_files:
         with open(func_map_file, 'r',
                   encoding='utf-8', errors="ignore") as func_map:
             for line in func_map:
                 yield line
 
 
+def _parse_func_map_line(line):
+    """
+    Returns the mangled name and the AST file of a function map line.
+    """
+    # FIXME: Detect and report invalid input.
+    # The format of the external function map file changed in between
+    # clang-15 and clang-16, check whether this is the updated format.
+    # The new file format is <Length>:<USR> <File-Path>
+    if line[0].isdigit():
+        length_str, _ = line.split(':', 1)
+        length = int(length_str)
+        sep_pos = len(length_str) + 1 + length
+        mangled_name = line[0: sep_pos]
+        ast_file = line[sep_pos + 1:]  # Skipping the ' ' separator
+    else:  # The old file format
+        mangled_name, ast_file = line.split(' ', 1)
+
+    return mangled_name, ast_file
+
+
 def _create_global_ctu_function_map(func_map_lines):
     """ Takes iterator of individual function maps and creates a global map.
 
@@ -32,18 +75,10 @@ def _create_global_ctu_function_map(func_map_lines):
     # We collect all occurences of a function name into a set.
     for line in func_map_lines:
         line = line.strip()
-        # FIXME: Detect and report invalid input.
-        # The format of the external function map file changed in between
-        # clang-15 and clang-16, check whether this is the updated format.
-        # The new file format is <Length>:<USR> <File-Path>
-        if line[0].isdigit():
-            length_str, _ = line.split(':', 1)
-            length = int(length_str)
-            sep_pos = len(length_str) + 1 + length
-            mangled_name = line[0: sep_pos]
-            ast_file = line[sep_pos + 1:]  # Skipping the ' ' separator
-        else:  # The old file format
-            mangled_name, ast_file = line.split(' ', 1)
+        if not line:
+            continue
+
+        mangled_name, ast_file = _parse_func_map_line(line)
         if mangled_name not in mangled_to_asts:
             mangled_to_asts[mangled_name] = {ast_file}
         else:
@@ -58,7 +93,124 @@ def _create_global_ctu_function_map(func_map_lines):
     return mangled_ast_pairs
 
 
-def merge(func_map_dir, output_file):
+def _get_partition(mangled_name, partition_num):
+    """ Returns the partition of a mangled name. """
+    return zlib.crc32(mangled_name.encode('utf-8', 'ignore')) % partition_num
+
+
+def _split_func_maps(func_map_files, partition_num, split_dir, task_id):
+    """
+    Split the lines of the given (file index, function map file) pairs into
+    partition files by the mangled names.
+
+    The lines are prefixed with their position in the input, so the original
+    order of the first occurrences can be restored after merging.
+    """
+    partition_files = [
+        open(os.path.join(split_dir, f"{task_id}-{partition}"), 'w',
+             encoding='utf-8', errors='ignore')
+        for partition in range(partition_num)]
+
+    try:
+        for file_idx, func_map_file in func_map_files:
+            with open(func_map_file, 'r',
+                      encoding='utf-8', errors="ignore") as func_map:
+                for line_idx, line in enumerate(func_map):
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    mangled_name, ast_file = _parse_func_map_line(line)
+                    partition = _get_partition(mangled_name, partition_num)
+                    partition_files[partition].write(
+                        f"{file_idx:08x}{line_idx:012x}"
+                        f"{mangled_name} {ast_file}\n")
+    finally:
+        for partition_file in partition_files:
+            partition_file.close()
+
+
+def _merge_partition(split_dir, task_num, partition, merged_file):
+    """
+    Merge the lines of a partition split by the workers and write the unique
+    names into the given file ordered by their first occurrence.
+    """
+    mangled_to_ast = {}
+    conflicts = set()
+
+    for task_id in range(task_num):
+        split_file = os.path.join(split_dir, f"{task_id}-{partition}")
+        with open(split_file, 'r',
+                  encoding='utf-8', errors='ignore') as split:
+            for line in split:
+                key = line[:_KEY_LENGTH]
+                mangled_name, ast_file = \
+                    _parse_func_map_line(line[_KEY_LENGTH:-1])
+
+                if mangled_name in conflicts:
+                    continue
+
+                first = mangled_to_ast.get(mangled_name)
+                if first is None:
+                    mangled_to_ast[mangled_name] = (key, ast_file)
+                elif first[1] != ast_file:
+                    del mangled_to_ast[mangled_name]
+                    conflicts.add(mangled_name)
+                elif key < first[0]:
+                    mangled_to_ast[mangled_name] = (key, ast_file)
+
+        os.remove(split_file)
+
+    lines = sorted(f"{key}{mangled_name} {ast_file}\n"
+                   for mangled_name, (key, ast_file) in mangled_to_ast.items())
+
+    with open(merged_file, 'w',
+              encoding='utf-8', errors='ignore') as out_file:
+        out_file.writelines(lines)
+
+
+def _merge_partitioned(func_map_files, output_file, partition_num, jobs):
+    """
+    Merge the function maps by splitting them into partitions by the mangled
+    names, so only one partition of every worker has to fit in the memory.
+
+    The result is the same as the result of the in memory merge.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='extdef-map-merge-',
+                               dir=os.path.dirname(
+                                   os.path.abspath(output_file)))
+    try:
+        indexed_files = list(enumerate(func_map_files))
+        task_num = min(jobs, len(func_map_files))
+        tasks = [(indexed_files[task_id::task_num],
+                  partition_num, tmp_dir, task_id)
+                 for task_id in range(task_num)]
+
+        merged_files = [os.path.join(tmp_dir, f"merged-{partition}")
+                        for partition in range(partition_num)]
+
+        with multiprocessing.Pool(jobs) as pool:
+            pool.starmap(_split_func_maps, tasks)
+            pool.starmap(_merge_partition,
+                         [(tmp_dir, task_num, partition, merged_file)
+                          for partition, merged_file
+                          in enumerate(merged_files)])
+
+        merged = [open(merged_file, 'r', encoding='utf-8', errors='ignore')
+                  for merged_file in merged_files]
+        try:
+            with open(output_file, 'w',
+                      encoding='utf-8', errors='ignore') as out_file:
+                for line in heapq.merge(*merged):
+                    out_file.write(line[_KEY_LENGTH:])
+        finally:
+            for merged_file in merged:
+                merged_file.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def merge(func_map_dir, output_file, jobs=1, partition_size=PARTITION_SIZE):
     """ Merge individual function maps into a global one.
 
     As the collect phase runs parallel on multiple threads, all compilation
@@ -67,8 +219,22 @@ def merge(func_map_dir, output_file):
     (AST generated from the source) which had them.
     These files should be merged at the end into a global map file:
     ctu_func_map_file.
+
+    If the function maps are bigger than partition_size bytes, they are merged
+    in partitions on the given number of processes.
     """
-    func_map_lines = _generate_func_map_lines(func_map_dir)
+    func_map_files = _get_func_map_files(func_map_dir)
+
+    total_size = sum(os.path.getsize(f) for f in func_map_files)
+    partition_num = min(MAX_PARTITIONS, -(-total_size // partition_size))
+
+    if partition_num > 1:
+        _merge_partitioned(func_map_files, output_file,
+                           min(MAX_PARTITIONS, max(partition_num, jobs)),
+                           jobs)
+        return
+
+    func_map_lines = _generate_func_map_lines(func_map_files)
     mangled_ast_pairs = _create_global_ctu_function_map(func_map_lines)
 
     # Write (mangled function name, ast file) pairs into final file.
@@ -11,6 +11,8 @@ import unittest
 import shutil
 import tempfile
 
+from unittest import mock
+
 from codechecker_merge_clang_extdef_mappings import merge_clang_extdef_mappings
 
 
@@ -97,3 +99,62 @@ class TestMergeClangExtdefMappingsTest(unittest.TestCase):
                           "c:@F@h# path/to/file2.cpp.ast"]
         for expected_line in expected_lines:
             self.assertTrue(expected_line in lines)
+
+    def test_merge_partitioned(self):
+        """
+        Test merging function maps which are too big to be merged in memory.
+        """
+        # New format with USRs containing spaces and conflicting names which
+        # are defined multiple times in the same file.
+        extdef_map_file_3 = os.path.join(self.extdef_maps_dir,
+                                         'externalDefMap3.txt')
+        with open(extdef_map_file_3, 'w',
+                  encoding='utf-8', errors='ignore') as map_f:
+            map_f.write('\n'.join([
+                "9:c:@F@a b# path/to/file3.cpp.ast",
+                "7:c:@F@f# path/to/file3.cpp.ast",
+                "9:c:@F@a b# path/to/file3.cpp.ast",
+                "c:@F@g# path/to/file.cpp.ast",
+                ""]))
+
+        expected_file = os.path.join(self.test_workspace, 'expected.txt')
+        merge_clang_extdef_mappings.merge(self.extdef_maps_dir, expected_file)
+
+        output_file = os.path.join(self.test_workspace, 'externalDefMap.txt')
+        for jobs in [1, 2]:
+            merge_clang_extdef_mappings.merge(self.extdef_maps_dir,
+                                              output_file, jobs,
+                                              partition_size=32)
+
+            with open(expected_file, 'r',
+                      encoding='utf-8', errors='ignore') as e_file, \
+                    open(output_file, 'r',
+                         encoding='utf-8', errors='ignore') as o_file:
+                self.assertEqual(o_file.read(), e_file.read())
+
+        with open(output_file, 'r',
+                  encoding='utf-8', errors='ignore') as o_file:
+            lines = o_file.read().split('\n')
+
+        self.assertIn("9:c:@F@a b# path/to/file3.cpp.ast", lines)
+        self.assertIn("7:c:@F@f# path/to/file3.cpp.ast", lines)
+        self.assertIn("c:@F@g# path/to/file.cpp.ast", lines)
+        self.assertNotIn("c:@F@both# path/to/file.cpp.ast", lines)
+        self.assertNotIn("c:@F@both# path/to/file2.cpp.ast", lines)
+        self.assertEqual(len(os.listdir(self.test_workspace)), 3)
+
+    def test_partition_limit(self):
+        """
+        The number of partitions doesn't exceed the limit even if there are
+        more jobs.
+        """
+        output_file = os.path.join(self.test_workspace, 'externalDefMap.txt')
+        with mock.patch.object(merge_clang_extdef_mappings,
+                               '_merge_partitioned') as merge_partitioned:
+            merge_clang_extdef_mappings.merge(
+                self.extdef_maps_dir, output_file,
+                merge_clang_extdef_mappings.MAX_PARTITIONS + 10,
+                partition_size=1)
+
+        self.assertEqual(merge_partitioned.call_args[0][2],
+                         merge_clang_extdef_mappings.MAX_PARTITIONS)
@@ -26,18 +26,16 @@ class ReturnValueCollector:
     # Checker name which runs the analysis.
     checker_analyze = 'statisticsbased.UncheckedReturnValue'
 
+    # Matching these lines:
+    # /.../x.c:551:12:
+    # warning: Return Value Check:/.../x.c:551:12,parsedate,0
+    ret_val_regexp = re.compile(r'.*warning: Return Value Check:'
+                                '.*:[0-9]*:[0-9]*.*,(.*),([0,1])')
+
     def __init__(self, stats_min_sample_count, stats_relevance_threshold):
         self.stats_min_sample_count = stats_min_sample_count
         self.stats_relevance_threshold = stats_relevance_threshold
 
-        # Matching these lines:
-        # /.../x.c:551:12:
-        # warning: Return Value Check:/.../x.c:551:12,parsedate,0
-
-        self.ret_val_regexp = \
-            re.compile(r'.*warning: Return Value Check:'
-                       '.*:[0-9]*:[0-9]*.*,(.*),([0,1])')
-
         self.stats = {'total': defaultdict(int),
                       'nof_unchecked': defaultdict(int)}
 
@@ -61,14 +59,28 @@ class ReturnValueCollector:
     def unchecked(self):
         return self.stats.get('unchecked')
 
+    @classmethod
+    def parse_line(cls, line):
+        """
+        Match regex on the line. Returns the function name and the number of
+        unchecked return values in the line or None if the line doesn't
+        contain a sample.
+        """
+        m = cls.ret_val_regexp.match(line)
+        if m:
+            return m.group(1), (int(m.group(2)),)
+        return None
+
+    def add_sample(self, func, unchecked, count=1):
+        """ Add count calls of the function to the statistics. """
+        self.stats['total'][func] += count
+        self.stats['nof_unchecked'][func] += unchecked * count
+
     def process_line(self, line):
         """ Match regex on the line """
-        m = self.ret_val_regexp.match(line)
-        if m:
-            func = m.group(1)
-            checked = m.group(2)
-            self.stats['total'][func] += 1
-            self.stats['nof_unchecked'][func] += int(checked)
+        sample = self.parse_line(line)
+        if sample:
+            self.add_sample(sample[0], *sample[1])
 
     def filter_stats(self):
         """ Filter the collected statistics based on the threshold.
@@ -28,19 +28,17 @@ class SpecialReturnValueCollector:
     # Checker name which runs the analysis.
     checker_analyze = 'statisticsbased.SpecialReturnValue'
 
+    # Matching these lines:
+    # /.../x.c:551:12: warning:
+    # Special Return Value:/.../x.c:551:12,parsedate,0,0
+    special_ret_val_regexp = re.compile(
+        r'.*warning: Special Return Value:'
+        '.*:[0-9]*:[0-9]*.*,(.*),([0,1]),([0,1])')
+
     def __init__(self, stats_min_sample_count, stats_relevance_threshold):
         self.stats_min_sample_count = stats_min_sample_count
         self.stats_relevance_threshold = stats_relevance_threshold
 
-        # Matching these lines:
-        # /.../x.c:551:12: warning:
-        # Special Return Value:/.../x.c:551:12,parsedate,0,0
-
-        ptrn = \
-            r'.*warning: Special Return Value:'\
-            '.*:[0-9]*:[0-9]*.*,(.*),([0,1]),([0,1])'
-        self.special_ret_val_regexp = re.compile(ptrn)
-
         self.stats = {'total': defaultdict(int),
                       'nof_negative': defaultdict(int),
                       'nof_null': defaultdict(int)}
@@ -65,17 +63,29 @@ class SpecialReturnValueCollector:
     def nof_negative(self):
         return self.stats.get('nof_negative')
 
-    def process_line(self, line):
-        """ Match regex on the line. """
-        m = self.special_ret_val_regexp.match(line)
+    @classmethod
+    def parse_line(cls, line):
+        """
+        Match regex on the line. Returns the function name and the number of
+        negative and null return values in the line or None if the line
+        doesn't contain a sample.
+        """
+        m = cls.special_ret_val_regexp.match(line)
         if m:
-            func = m.group(1)
-            ret_negative = m.group(2)
-            ret_null = m.group(3)
+            return m.group(1), (int(m.group(2)), int(m.group(3)))
+        return None
+
+    def add_sample(self, func, ret_negative, ret_null, count=1):
+        """ Add count calls of the function to the statistics. """
+        self.stats['total'][func] += count
+        self.stats['nof_negative'][func] += ret_negative * count
+        self.stats['nof_null'][func] += ret_null * count
 
-            self.stats['total'][func] += 1
-            self.stats['nof_negative'][func] += int(ret_negative)
-            self.stats['nof_null'][func] += int(ret_null)
+    def process_line(self, line):
+        """ Match regex on the line. """
+        sample = self.parse_line(line)
+        if sample:
+            self.add_sample(sample[0], *sample[1])
 
     def filter_stats(self):
         """ Filter the collected statistics based on the threshold. """
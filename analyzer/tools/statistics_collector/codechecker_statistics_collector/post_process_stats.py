@@ -12,8 +12,16 @@ Post-process statistical results.
 Clang output files will be parsed for outputs by the statistics collector
 checkers and converted into a special yml file which can be parsed back by the
 statistics checkers.
+
+The clang outputs can be aggregated into partial results right after the
+statistics collection of a translation unit, so only the samples of the
+statistics collector checkers are kept instead of the whole outputs. The
+partial results are merged when the statistics are post-processed.
 """
 
+from collections import Counter
+import hashlib
+import json
 import logging
 import os
 
@@ -22,12 +30,96 @@ from .collectors.special_return_value import SpecialReturnValueCollector
 
 LOG = logging.getLogger('StatisticsCollector')
 
+# The extension of the partial result files. The other files in the input
+# directory are clang outputs.
+PARTIAL_SUFFIX = '.stat.json'
+
+# Increase this number if the format of the partial results changes.
+PARTIAL_VERSION = 1
+
+COLLECTORS = [ReturnValueCollector, SpecialReturnValueCollector]
+
+
+def new_partial():
+    """ Returns an empty partial result. """
+    partial = {'version': PARTIAL_VERSION}
+    for collector in COLLECTORS:
+        partial[collector.checker_collect] = {}
+    return partial
+
+
+def aggregate_lines(lines, partial=None):
+    """
+    Collect the samples of the statistics collector checkers from the lines
+    of a clang output into a partial result.
+
+    The samples are keyed by the digest of their line. This way a line which
+    is in several outputs, e.g. a function call in a header file included in
+    several translation units, is counted once when the partial results are
+    merged, like the lines of the clang outputs used to be. A sample is
+    stored as a "function,values" string, so the merged partial results
+    consist of a big dict of strings per collector, which is cheap for the
+    garbage collector.
+    """
+    if partial is None:
+        partial = new_partial()
+
+    for line in lines:
+        if 'warning:' not in line:
+            continue
+
+        line = line.rstrip('\r\n')
+        for collector in COLLECTORS:
+            sample = collector.parse_line(line)
+            if sample:
+                func, values = sample
+                digest = hashlib.blake2b(line.encode('utf-8', 'ignore'),
+                                         digest_size=8).hexdigest()
+                partial[collector.checker_collect][digest] = \
+                    f"{func},{''.join(map(str, values))}"
+
+    return partial
+
+
+def merge(partial, other):
+    """ Merge the other partial result into the given one. """
+    for collector in COLLECTORS:
+        partial[collector.checker_collect].update(
+            other.get(collector.checker_collect, {}))
+    return partial
+
+
+def write_partial(partial, path):
+    """ Write the partial result to the given file. """
+    with open(path, 'w', encoding='utf-8', errors='ignore') as f:
+        json.dump(partial, f, separators=(',', ':'))
+
+
+def load_partial(path):
+    """
+    Load the partial result from the given file. Returns None if it can't be
+    read or it is written by an incompatible version.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            partial = json.load(f)
+    except (OSError, ValueError) as ex:
+        LOG.warning("Failed to read partial statistics %s: %s", path, ex)
+        return None
+
+    if partial.get('version') != PARTIAL_VERSION:
+        LOG.warning("Partial statistics %s has an unknown version.", path)
+        return None
+
+    return partial
+
 
 def process(input_dir, output_dir,
             stats_min_sample_count, stats_relevance_threshold):
     """
     Read the clang analyzer outputs where the statistics emitter checkers
-    were enabled and collect the statistics.
+    were enabled and the partial results aggregated from such outputs, and
+    collect the statistics.
 
     After the statistics collection cleanup the output files.
     """
@@ -63,14 +155,25 @@ def process(input_dir, output_dir,
         SpecialReturnValueCollector(stats_min_sample_count,
                                     stats_relevance_threshold)
 
-    lines = set()
+    # The clang outputs, e.g. the ones written by the generated Makefile,
+    # are aggregated here, the partial results are merged.
+    partial = new_partial()
     for clang_output in clang_outs:
-        with open(clang_output, 'r',
-                  encoding='utf-8', errors='ignore') as out:
-            lines |= set(out.readlines())
-    for line in lines:
-        ret_collector.process_line(line)
-        special_ret_collector.process_line(line)
+        if clang_output.endswith(PARTIAL_SUFFIX):
+            other = load_partial(clang_output)
+            if other:
+                merge(partial, other)
+        else:
+            with open(clang_output, 'r',
+                      encoding='utf-8', errors='ignore') as out:
+                aggregate_lines(out, partial)
+
+    for collector in [ret_collector, special_ret_collector]:
+        # Only the number of the same samples of a function matters.
+        samples = Counter(partial[collector.checker_collect].values())
+        for sample, count in samples.items():
+            func, values = sample.rsplit(',', 1)
+            collector.add_sample(func, *map(int, values), count=count)
     LOG.debug("Collecting statistics finished.")
 
     # Write out statistics.
@@ -9,8 +9,12 @@
 """ Unit tests for the statistics_collectors module. """
 
 
+import os
+import shutil
+import tempfile
 import unittest
 
+from codechecker_statistics_collector import post_process_stats
 from codechecker_statistics_collector.collectors.special_return_value import \
     SpecialReturnValueCollector
 from codechecker_statistics_collector.collectors.return_value import \
@@ -161,3 +165,69 @@ class statisticsCollectorTest(unittest.TestCase):
         self.assertEqual({'parsedate': 10}, ret_val_collector.total())
         self.assertEqual({'parsedate': 1}, ret_val_collector.nof_unchecked())
         self.assertEqual(['parsedate'], ret_val_collector.filter_stats())
+
+    def test_partial_results(self):
+        """
+        The partial results of the clang outputs give the same statistics as
+        the clang outputs. A line which is in several outputs is counted
+        once.
+        """
+        header = "/.../x.h:10:3: warning: Return Value Check:" \
+                 "/.../x.h:10:3,parsedate,{}\n"
+        source = "/.../{}.c:{}:3: warning: Return Value Check:" \
+                 "/.../{}.c:{}:3,parsedate,{}\n"
+        special = "/.../{}.c:{}:3: warning: Special Return Value:" \
+                  "/.../{}.c:{}:3,myfunc,0,{}\n"
+
+        outputs = []
+        for tu in range(4):
+            lines = [header.format(0), "/.../x.c:1:1: note: other\n"]
+            for line in range(5):
+                lines.append(source.format(tu, line, tu, line, line % 2))
+                lines.append(
+                    special.format(tu, line, tu, line, int(line > 0)))
+            outputs.append(lines)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            raw_dir = os.path.join(tmp_dir, 'raw')
+            partial_dir = os.path.join(tmp_dir, 'partial')
+            os.makedirs(raw_dir)
+            os.makedirs(partial_dir)
+
+            for idx, lines in enumerate(outputs):
+                with open(os.path.join(raw_dir, f'{idx}.stat'), 'w',
+                          encoding='utf-8') as f:
+                    f.writelines(lines)
+
+                post_process_stats.write_partial(
+                    post_process_stats.aggregate_lines(lines),
+                    os.path.join(partial_dir,
+                                 f'{idx}{post_process_stats.PARTIAL_SUFFIX}'))
+
+            for input_dir in [raw_dir, partial_dir]:
+                out_dir = os.path.join(tmp_dir, 'out')
+                post_process_stats.process(input_dir, out_dir, 10, 0.3)
+
+                with open(ReturnValueCollector.stats_file(out_dir),
+                          encoding='utf-8') as f:
+                    self.assertEqual(f.read().splitlines()[-1],
+                                     '- parsedate')
+
+                with open(SpecialReturnValueCollector.stats_file(out_dir),
+                          encoding='utf-8') as f:
+                    self.assertEqual(f.read().splitlines()[-1],
+                                     '{name: myfunc, relation: EQ, value: 0}')
+
+            partial = post_process_stats.new_partial()
+            for lines in outputs:
+                post_process_stats.merge(
+                    partial, post_process_stats.aggregate_lines(lines))
+
+            # The header line is counted once.
+            self.assertEqual(
+                len(partial[ReturnValueCollector.checker_collect]), 21)
+            self.assertEqual(
+                len(partial[SpecialReturnValueCollector.checker_collect]), 20)
+        finally:
+            shutil.rmtree(tmp_dir)
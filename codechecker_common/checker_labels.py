@@ -6,12 +6,22 @@
 #
 # -------------------------------------------------------------------------
 from collections import defaultdict
+import hashlib
+import json
 import os
-from typing import Any, cast, DefaultDict, Dict, Iterable, List, Optional, \
-    Set, Tuple, Union
+import tempfile
+from typing import Any, cast, DefaultDict, Dict, FrozenSet, Iterable, List, \
+    Optional, Set, Tuple, Union
 
+from codechecker_common.logger import get_logger
 from codechecker_common.util import load_json
 
+LOG = get_logger('system')
+
+# Increase this number if the format of the precompiled label cache changes,
+# so the cache files created by an older CodeChecker are not used anymore.
+CACHE_VERSION = 1
+
 
 def split_label_kv(key_value: str) -> Tuple[str, str]:
     """
@@ -44,27 +54,118 @@ class CheckerLabels:
         'blacklist': 'false',
         'description': ''}
 
-    def __init__(self, checker_labels_dir: str):
+    def __init__(
+        self,
+        checker_labels_dir: str,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        checker_labels_dir -- The directory of the label config files.
+        cache_dir -- If given, the parsed and validated label config files are
+                     stored in a precompiled cache file in this directory.
+                     The later processes load this single file instead of
+                     parsing the label config files again, until one of them
+                     changes.
+        """
         if not os.path.isdir(checker_labels_dir):
             raise NotADirectoryError(
                 f'{checker_labels_dir} is not a directory.')
 
-        label_json_files: Iterable[str] = os.listdir(
-            os.path.join(checker_labels_dir, 'analyzers'))
+        label_json_files = sorted(
+            os.path.join(checker_labels_dir, 'analyzers', f)
+            for f in os.listdir(os.path.join(checker_labels_dir, 'analyzers')))
+
+        descriptions_file = os.path.join(checker_labels_dir,
+                                         'descriptions.json')
+
+        # The position of the checkers in the label config of each analyzer
+        # and the lengths of their names in ascending order. This index is
+        # built on demand for finding the checker of which the name is a
+        # prefix of the given checker name.
+        self.__prefix_index: \
+            Dict[str, Tuple[Dict[str, int], List[int]]] = {}
+
+        # The results of labels_of_checker() by the checker and analyzer
+        # names, and the parsed labels of the checkers of the label config by
+        # the analyzer and checker names. The same checkers are queried for
+        # every report.
+        self.__labels_of_checker: \
+            Dict[Tuple[str, Optional[str]], List[Tuple[str, str]]] = {}
+        self.__parsed_labels: \
+            Dict[Tuple[str, str], FrozenSet[Tuple[str, str]]] = {}
+
+        cache_file = None
+        if cache_dir:
+            sources = [self.__get_file_identity(f)
+                       for f in [descriptions_file] + label_json_files]
+            cache_file = os.path.join(cache_dir, hashlib.sha256(
+                os.path.realpath(checker_labels_dir).encode(errors='ignore')
+            ).hexdigest() + '.json')
+
+            if self.__load_cache(cache_file, sources):
+                return
 
         self.__descriptions = {}
 
-        if 'descriptions.json' in os.listdir(checker_labels_dir):
-            self.__descriptions = load_json(os.path.join(
-                checker_labels_dir, 'descriptions.json'))
-
-        label_json_files = map(
-            lambda f: os.path.join(checker_labels_dir, 'analyzers', f),
-            label_json_files)
+        if os.path.exists(descriptions_file):
+            self.__descriptions = load_json(descriptions_file)
 
         self.__data = self.__union_label_files(label_json_files)
         self.__check_json_format(self.__data)
 
+        if cache_file:
+            self.__store_cache(cache_file, sources)
+
+    @staticmethod
+    def __get_file_identity(path: str) -> Optional[List]:
+        """
+        Returns the path, size and modification time of the given file or
+        None if it doesn't exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return [path, stat.st_size, stat.st_mtime_ns]
+
+    def __load_cache(self, cache_file: str, sources: List) -> bool:
+        """
+        Load the labels from the precompiled cache file if it was created
+        from the same label config files. Returns True on success.
+        """
+        cache = load_json(cache_file, display_warning=False)
+
+        if not isinstance(cache, dict) or \
+                cache.get('version') != CACHE_VERSION or \
+                cache.get('sources') != sources:
+            return False
+
+        self.__descriptions = cache['descriptions']
+        self.__data = cache['labels']
+
+        return True
+
+    def __store_cache(self, cache_file: str, sources: List):
+        """
+        Store the parsed labels in the precompiled cache file. The file is
+        written atomically, since other processes may read it at the same
+        time.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', errors='ignore', delete=False,
+                    dir=os.path.dirname(cache_file), suffix='.tmp') as f:
+                json.dump({'version': CACHE_VERSION,
+                           'sources': sources,
+                           'descriptions': self.__descriptions,
+                           'labels': self.__data}, f)
+            os.replace(f.name, cache_file)
+        except OSError as err:
+            LOG.debug("Failed to write checker label cache file %s: %s",
+                      cache_file, err)
+
     def __union_label_files(
         self,
         label_files: Iterable[str]
@@ -235,22 +336,70 @@ class CheckerLabels:
         then its prefixes are also searched. For example "clang-diagnostic" in
         the config file matches "clang-diagnostic-unused-argument".
         """
-        labels: List[Tuple[str, str]] = []
+        labels = self.__labels_of_checker.get((checker, analyzer))
 
-        for _, checkers in self.__get_analyzer_data(analyzer):
-            c: Optional[str] = checker
+        if labels is None:
+            # TODO set() is used for uniqueing results in case a checker name
+            # is provided by multiple analyzers. This will be unnecessary when
+            # we cover this case properly.
+            label_set: Set[Tuple[str, str]] = set()
 
-            if c not in checkers:
-                c = next(filter(
-                    lambda c: checker.startswith(cast(str, c)),
-                    iter(checkers.keys())), None)
+            for a, checkers in self.__get_analyzer_data(analyzer):
+                c = self.__find_checker(checker, a, checkers)
+                if c is None:
+                    continue
 
-            labels.extend(map(split_label_kv, checkers.get(c, [])))
+                parsed = self.__parsed_labels.get((a, c))
+                if parsed is None:
+                    parsed = frozenset(map(split_label_kv, checkers[c]))
+                    self.__parsed_labels[(a, c)] = parsed
 
-        # TODO set() is used for uniqueing results in case a checker name is
-        # provided by multiple analyzers. This will be unnecessary when we
-        # cover this case properly.
-        return list(set(labels))
+                label_set.update(parsed)
+
+            labels = list(label_set)
+            self.__labels_of_checker[(checker, analyzer)] = labels
+
+        return list(labels)
+
+    def __find_checker(
+        self,
+        checker: str,
+        analyzer: str,
+        checkers: Dict[str, List[str]]
+    ) -> Optional[str]:
+        """
+        Returns the given checker name if the analyzer's label config contains
+        it. Otherwise the first checker of the label config of which the name
+        is a prefix of the given checker name is returned, or None if there is
+        no such checker.
+
+        Only those prefixes of the given checker name are looked up in the
+        index which are as long as a checker name of the label config, so the
+        lookup doesn't depend on the number of checkers.
+        """
+        if checker in checkers:
+            return checker
+
+        index = self.__prefix_index.get(analyzer)
+        if index is None:
+            index = ({c: pos for pos, c in enumerate(checkers)},
+                     sorted(set(map(len, checkers))))
+            self.__prefix_index[analyzer] = index
+
+        positions, lengths = index
+
+        found: Optional[str] = None
+        found_pos = len(positions)
+        for length in lengths:
+            if length >= len(checker):
+                break
+
+            prefix = checker[:length]
+            pos = positions.get(prefix, found_pos)
+            if pos < found_pos:
+                found, found_pos = prefix, pos
+
+        return found
 
     def get_description(self, label: str) -> Dict[str, str]:
         """
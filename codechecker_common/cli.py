@@ -33,10 +33,116 @@ class ArgumentParser(argparse.ArgumentParser):
         self.exit(1, f"{self.prog}: error: {message}\n")
 
 
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action which imports the module of a subcommand and constructs
+    its parser only when it is needed, i.e. when the subcommand is chosen or
+    the subcommands are listed in the help message.
+
+    Importing every subcommand module takes a considerable time, since they
+    import the modules of the analyzers, the report converter, the server,
+    etc.
+    """
+
+    class ParserMap(dict):
+        """
+        The parsers of the subcommands by their names. The parser of a
+        subcommand which is not loaded yet is None, and it is loaded when it
+        is first accessed.
+        """
+
+        def __init__(self, load_parser):
+            super().__init__()
+            self.__load_parser = load_parser
+
+        def __getitem__(self, sub_cmd):
+            parser = super().__getitem__(sub_cmd)
+            if parser is None:
+                parser = self.__load_parser(sub_cmd)
+
+            return parser
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.__module_names = {}
+        self.__order = []
+        self._name_parser_map = self.ParserMap(self.__load_parser)
+        self.choices = self._name_parser_map
+
+    def add_lazy_parser(self, sub_cmd, module_name):
+        """
+        Add a subcommand which is implemented in the given module. The module
+        is not imported yet.
+        """
+        self.__module_names[sub_cmd] = module_name
+        self.__order.append(sub_cmd)
+        dict.__setitem__(self._name_parser_map, sub_cmd, None)
+
+    def __restore_order(self):
+        """
+        Keep the order of the subcommands in the usage and in the help
+        message independent of the order of loading them: add_parser() puts
+        the loaded subcommands at the end.
+        """
+        def key(sub_cmd):
+            return self.__order.index(sub_cmd) if sub_cmd in self.__order \
+                else len(self.__order)
+
+        items = sorted(dict.items(self._name_parser_map),
+                       key=lambda item: key(item[0]))
+        dict.clear(self._name_parser_map)
+        dict.update(self._name_parser_map, items)
+
+        self._choices_actions.sort(key=lambda action: key(action.dest))
+
+    def __load_parser(self, sub_cmd):
+        """
+        Import the module of the given subcommand and construct its parser.
+        """
+        module_name = self.__module_names.pop(sub_cmd)
+
+        # The placeholder is replaced by add_parser(). It is not put back if
+        # the module can't be imported, so the subcommand is not listed.
+        dict.__delitem__(self._name_parser_map, sub_cmd)
+        try:
+            parser = add_subcommand(self, sub_cmd, module_name)
+            self.__restore_order()
+            return parser
+        except (IOError, ImportError) as ex:
+            print(f"Couldn't import module for subcommand '{sub_cmd}'... "
+                  "ignoring.")
+            import traceback
+            traceback.print_exc(file=sys.stdout)
+
+            raise argparse.ArgumentError(
+                self, f"invalid choice: '{sub_cmd}'") from ex
+
+    def load_all(self):
+        """
+        Load the parser of every subcommand. The subcommands which can't be
+        imported are left out.
+        """
+        for sub_cmd in list(self.__module_names):
+            try:
+                self._name_parser_map[sub_cmd]
+            except argparse.ArgumentError:
+                pass
+
+    def _get_subactions(self):
+        """
+        The subcommands are listed with their help in the help message, so
+        every subcommand is loaded.
+        """
+        self.load_all()
+        return super()._get_subactions()
+
+
 def add_subcommand(subparsers, sub_cmd, module_name):
     """
     Load the subcommand module and then add the subcommand to the available
-    subcommands in the given subparsers collection.
+    subcommands in the given subparsers collection. Returns the parser of the
+    subcommand.
 
     subparsers has to be the return value of the add_parsers() method on an
     argparse.ArgumentParser.
@@ -56,6 +162,8 @@ def add_subcommand(subparsers, sub_cmd, module_name):
     # Run the method which adds the arguments to the subcommand's handler.
     command_module.add_arguments_to_parser(sc_parser)
 
+    return sc_parser
+
 
 def discover_subcommands():
     """Discover available subcommands based on the modules in the project."""
@@ -200,27 +308,13 @@ output.
 
     CodeChecker check -b "cd ~/myproject && make\" """)
 
-        subparsers = parser.add_subparsers(help='commands')
-
-        if subcommands:
-            # Try to check if the user has already given us a subcommand to
-            # execute. If so, don't load every available parts of CodeChecker
-            # to ensure a more optimised run.
-            if len(sys.argv) > 1:
-                first_command = sys.argv[1]
-                if first_command in subcommands:
-
-                    # Consider only the given command as an available one.
-                    subcommands = {first_command: subcommands[first_command]}
-
-            for subcommand, module_name in subcommands.items():
-                try:
-                    add_subcommand(subparsers, subcommand, module_name)
-                except (IOError, ImportError):
-                    print("Couldn't import module for subcommand '" +
-                          subcommand + "'... ignoring.")
-                    import traceback
-                    traceback.print_exc(file=sys.stdout)
+        # Only the module of the chosen subcommand is imported, so the start
+        # up of CodeChecker doesn't depend on the number of subcommands.
+        subparsers = parser.add_subparsers(help='commands',
+                                           action=LazySubParsersAction)
+
+        for subcommand, module_name in subcommands.items():
+            subparsers.add_lazy_parser(subcommand, module_name)
 
         argcomplete.autocomplete(parser)
         args = parser.parse_args()
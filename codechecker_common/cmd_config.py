@@ -7,7 +7,6 @@
 # -------------------------------------------------------------------------
 
 import os
-import yaml
 
 from typing import List
 
@@ -59,6 +58,8 @@ def process_config_file(args, subcommand_name):
     config_file = args.config_file
     if config_file and os.path.exists(config_file):
         if config_file.endswith(('.yaml', '.yml')):
+            import yaml
+
             with open(config_file, encoding='utf-8', errors='ignore') as f:
                 cfg = yaml.load(f, Loader=yaml.BaseLoader)
         else:
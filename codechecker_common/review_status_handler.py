@@ -10,7 +10,6 @@
 import fnmatch
 import os
 from typing import List, Optional
-import yaml
 
 from codechecker_report_converter.report import Report, SourceReviewStatus
 from codechecker_common.logger import get_logger
@@ -89,6 +88,8 @@ class ReviewStatusHandler:
         return src_comment_data
 
     def __check_format_version_1(self):
+        import yaml
+
         if 'rules' not in self.__data or \
                 not isinstance(self.__data['rules'], list):
             raise ValueError(
@@ -221,6 +222,8 @@ class ReviewStatusHandler:
         may contain separate config files. These need to be given before
         parsing each report folders.
         """
+        import yaml
+
         self.__review_status_yaml = config_file
 
         if os.path.islink(self.__review_status_yaml):
@@ -371,3 +374,10 @@ class ReviewStatusHandler:
         read and parsed only once for each report.
         """
         return self.__source_commets.get(report)
+
+    def set_source_comment(self, report: Report, comment: SourceCodeComment):
+        """
+        Set the source comment of the report which was read by another
+        ReviewStatusHandler, e.g. in a worker process.
+        """
+        self.__source_commets[report] = comment
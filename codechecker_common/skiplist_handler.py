@@ -15,6 +15,66 @@ from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# The results of should_skip() are cached for this many paths per handler.
+SKIP_CACHE_SIZE = 1 << 16
+
+GLOB_SPECIAL_CHARS = re.compile(r'[*?[]')
+
+
+class _PathTrieNode:
+    """
+    Node of the path component trie of SkipListHandler.
+    """
+
+    __slots__ = ('children', 'literal_index', 'globs', 'glob_regex')
+
+    def __init__(self):
+        self.children = {}
+
+        # Index of the first skip line without glob characters of which the
+        # path ends at this node.
+        self.literal_index = None
+
+        # Index and regular expression of the skip lines with glob
+        # characters of which the directory ends at this node. These are
+        # compiled together at the first match.
+        self.globs = []
+        self.glob_regex = None
+
+    def child(self, part):
+        """ Returns the child node of the given path component. """
+        node = self.children.get(part)
+        if node is None:
+            node = self.children[part] = _PathTrieNode()
+        return node
+
+    def add_glob(self, idx, pattern):
+        """ Add a skip line with glob characters to this node. """
+        self.globs.append((idx, pattern))
+        self.glob_regex = None
+
+    def first_glob_match(self, source, first):
+        """
+        Returns the index of the first skip line with glob characters of this
+        node which matches the given path, if it precedes the line of the
+        index first. Otherwise first is returned.
+        """
+        if not self.globs or (first is not None and self.globs[0][0] > first):
+            return first
+
+        if self.glob_regex is None:
+            # The alternatives are tried in the order of the skip lines.
+            self.glob_regex = re.compile('|'.join(
+                f"(?P<r{idx}>{pattern})" for idx, pattern in self.globs))
+
+        match = self.glob_regex.match(source)
+        if match:
+            idx = int(match.lastgroup[1:])
+            if first is None or idx < first:
+                return idx
+
+        return first
+
 
 class SkipListHandler:
     """
@@ -31,6 +91,8 @@ class SkipListHandler:
         Process the lines of the skip file.
         """
         self.__skip = []
+        self.__trie = _PathTrieNode()
+        self.__cache = {}
         if not skip_file_content:
             skip_file_content = ""
 
@@ -62,9 +124,81 @@ class SkipListHandler:
             translated_glob = fnmatch.translate(norm_skip_path)
             if translated_glob.endswith((r"\Z", r"\z")):
                 translated_glob = translated_glob[:-2]
-            rexpr = re.compile(
-                translated_glob + fr"(?:\{os.path.sep}.*)?$")
-            self.__skip.append((skip_line, rexpr))
+            # The regular expressions are compiled together by
+            # __build_matcher().
+            pattern = translated_glob + fr"(?:\{os.path.sep}.*)?$"
+            self.__skip.append((skip_line, pattern))
+
+        self.__build_matcher()
+
+    def __build_matcher(self):
+        """
+        Build the trie which finds the first matching skip line of a path
+        without trying every line one by one. The trie is built from the path
+        components of the skip lines. The lines without glob characters are
+        stored at the node of their path, since these match the path itself
+        and everything under it. The lines with glob characters are stored
+        at the node of the directory preceding the first glob character,
+        since only the paths under that directory may match them.
+        """
+        self.__trie = _PathTrieNode()
+        self.__cache = {}
+
+        for idx, (skip_line, pattern) in enumerate(self.__skip):
+            norm_skip_path = os.path.normpath(skip_line[1:].strip())
+
+            glob_char = GLOB_SPECIAL_CHARS.search(norm_skip_path)
+            if glob_char:
+                dir_end = norm_skip_path.rfind(os.path.sep, 0,
+                                               glob_char.start())
+                if dir_end == -1:
+                    self.__trie.add_glob(idx, pattern)
+                    continue
+
+                node = self.__trie
+                for part in norm_skip_path[:dir_end].split(os.path.sep):
+                    node = node.child(part)
+
+                node.add_glob(idx, pattern)
+                continue
+
+            node = self.__trie
+            for part in norm_skip_path.split(os.path.sep):
+                node = node.child(part)
+
+            if node.literal_index is None:
+                node.literal_index = idx
+
+    def __first_match(self, source):
+        """
+        Returns the index of the first skip line which matches the given path
+        or None.
+        """
+        if '\n' in source:
+            # '$' and '.' of the regular expressions treat new lines
+            # specially, so these paths are matched line by line.
+            return next((idx for idx, (_, pattern) in enumerate(self.__skip)
+                         if re.match(pattern, source)), None)
+
+        # The globs of the root node don't start with a directory.
+        first = self.__trie.first_glob_match(source, None)
+
+        node = self.__trie
+        parts = source.split(os.path.sep)
+        for depth, part in enumerate(parts, 1):
+            node = node.children.get(part)
+            if node is None:
+                break
+
+            idx = node.literal_index
+            if idx is not None and (first is None or idx < first):
+                first = idx
+
+            # The globs of a node match only the paths under its directory.
+            if depth < len(parts):
+                first = node.first_glob_match(source, first)
+
+        return first
 
     def __check_line_format(self, skip_lines):
         """
@@ -105,11 +239,16 @@ class SkipListHandler:
         if not self.__skip:
             return False
 
-        for line, rexpr in self.__skip:
-            if rexpr.match(source):
-                sign = line[0]
-                return sign == '-'
-        return False
+        skip = self.__cache.get(source)
+        if skip is None:
+            idx = self.__first_match(source)
+            skip = idx is not None and self.__skip[idx][0][0] == '-'
+
+            if len(self.__cache) >= SKIP_CACHE_SIZE:
+                self.__cache.clear()
+            self.__cache[source] = skip
+
+        return skip
 
 
 class SkipListHandlers(list):
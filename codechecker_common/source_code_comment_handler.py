@@ -15,6 +15,8 @@ import re
 
 from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
+from codechecker_report_converter.util import get_file_line_index
+
 from . import util
 
 
@@ -31,6 +33,10 @@ def contains_codechecker_comment(fp):
     The position in the object is restored where it was after the
     scanning.
     """
+    index = get_file_line_index(fp)
+    if index:
+        return "codechecker_" in index.text
+
     pos_before_read = fp.tell()
     if pos_before_read != 0:
         fp.seek(0)
@@ -14,13 +14,12 @@ import itertools
 import json
 import re
 import shlex
-import yaml
 import os
 import pathlib
 import random
-from typing import List, TextIO, Union
+from typing import Any, Iterator, List, TextIO, Union
 
-import portalocker
+from codechecker_report_converter import util as report_converter_util
 
 from codechecker_common.logger import get_logger
 
@@ -79,6 +78,7 @@ def load_json(path: Union[str, pathlib.Path],
     try:
         with open(path, 'r', encoding='utf-8', errors='ignore') as handle:
             if lock:
+                import portalocker
                 portalocker.lock(handle, portalocker.LOCK_SH)
 
             ret = json.load(handle)
@@ -101,10 +101,82 @@ def load_json(path: Union[str, pathlib.Path],
     return ret
 
 
+def iter_json_array(
+    path: Union[str, pathlib.Path],
+    chunk_size: int = 1 << 20
+) -> Iterator[Any]:
+    """
+    Yield the elements of the JSON array in the given file one by one. The
+    file is read in chunks, so only the currently parsed element is kept in
+    the memory, not the whole file.
+
+    Raises ValueError if the file doesn't contain a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r'\s*')
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as handle:
+        buf = handle.read(chunk_size)
+        pos = 0
+        eof = not buf
+
+        def skip_whitespace():
+            nonlocal buf, pos, eof
+            while True:
+                pos = whitespace.match(buf, pos).end()
+                if pos < len(buf) or eof:
+                    return
+                buf = handle.read(chunk_size)
+                pos = 0
+                eof = not buf
+
+        skip_whitespace()
+        if buf[pos:pos + 1] != '[':
+            raise ValueError(f"{path} doesn't contain a JSON array.")
+        pos += 1
+
+        skip_whitespace()
+        if buf[pos:pos + 1] == ']':
+            return
+
+        while True:
+            # The element is parsed again with more data if it doesn't fit in
+            # the buffer. An element ending at the end of the buffer may also
+            # be incomplete, e.g. a number.
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    if end < len(buf) or eof:
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+                chunk = handle.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+
+            pos = end
+            yield value
+
+            skip_whitespace()
+            separator = buf[pos:pos + 1]
+            pos += 1
+
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"{path} doesn't contain a valid JSON array.")
+
+            skip_whitespace()
+
+
 def load_yaml(path: str):
     """
     Load the contents of the given file as a YAML and return it's value.
     """
+    import yaml
 
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -131,13 +203,11 @@ def get_linef(fp: TextIO, line_no: int) -> str:
     """'fp' should be (readable) file object.
     Return the line content at line_no or an empty line
     if there is less lines than line_no.
+
+    The lines of the source files are read by their cached line index (see
+    codechecker_report_converter.util.get_line_index()).
     """
-    fp.seek(0)
-    for line in fp:
-        line_no -= 1
-        if line_no == 0:
-            return line
-    return ''
+    return report_converter_util.get_linef(fp, line_no)
 
 
 def path_for_fake_root(full_path: str, root_path: str = '/') -> str:
@@ -207,6 +277,17 @@ class ExistingPath:
             raise FileNotFoundError(f"File does not exist: {path.absolute()}")
 
 
+def get_user_cache_dir() -> str:
+    """
+    Returns the CodeChecker directory in the user's cache directory. The
+    persistent caches of CodeChecker are stored in its subdirectories.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'codechecker')
+
+
 def generate_random_token(num_bytes: int = 32) -> str:
     """
     Returns a random-generated string usable as a token with `num_bytes`
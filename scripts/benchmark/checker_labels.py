@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Micro-benchmark of the checker label lookups.
+
+The checker labels of the repository are loaded from the label config files
+and from the precompiled label cache. Then the severity of the checkers of
+the given number of reports is queried. The checker names of the reports are
+taken from the label config, some of them with a suffix which is matched by
+the prefix lookup, e.g. "clang-diagnostic-unused-argument".
+
+The results are compared to the linear search of the checkers which was used
+before the index. This is slow, so it is measured on a part of the reports
+only, and its run time is extrapolated.
+
+Run it from the repository root:
+    PYTHONPATH=. python3 scripts/benchmark/checker_labels.py
+"""
+
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from codechecker_common.checker_labels import CheckerLabels, split_label_kv
+
+
+def linear_matcher(labels_dir):
+    """
+    Returns a severity() function which searches the checkers like
+    CheckerLabels did before the checkers were indexed.
+    """
+    data = {}
+    for label_file in os.listdir(os.path.join(labels_dir, 'analyzers')):
+        with open(os.path.join(labels_dir, 'analyzers', label_file),
+                  encoding='utf-8') as f:
+            labels = json.load(f)
+        data[labels['analyzer']] = labels['labels']
+
+    def severity(checker, analyzer):
+        labels = []
+        for a, checkers in data.items():
+            if analyzer is not None and a != analyzer:
+                continue
+
+            c = checker
+            if c not in checkers:
+                c = next(filter(checker.startswith, checkers), None)
+
+            labels.extend(map(split_label_kv, checkers.get(c, [])))
+
+        return next((value for key, value in labels if key == 'severity'),
+                    CheckerLabels.UNIQUE_LABELS['severity'])
+
+    return severity
+
+
+def generate(checker_labels, num_reports, prefix_ratio, seed):
+    """ Generate the (checker, analyzer) pairs of the reports. """
+    rnd = random.Random(seed)
+    checkers = [(c, a) for a in checker_labels.get_analyzers()
+                for c in checker_labels.checkers(a)]
+
+    queries = []
+    for _ in range(num_reports):
+        checker, analyzer = rnd.choice(checkers)
+        if rnd.random() < prefix_ratio:
+            checker += f"-suffix{rnd.randrange(10)}"
+
+        # The analyzer of the report is not known in some cases, e.g. in the
+        # severity upgrade of the server.
+        queries.append((checker, rnd.choice([analyzer, None])))
+
+    return queries
+
+
+def measure(func, queries):
+    """ Returns the results and the run time of func on the queries. """
+    start = time.perf_counter()
+    results = [func(checker, analyzer) for checker, analyzer in queries]
+    return results, time.perf_counter() - start
+
+
+def main():
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(
+        description="Measure the checker label loading and the severity "
+                    "lookups of CheckerLabels.")
+    parser.add_argument('--labels-dir',
+                        default=os.path.join(repo_root, 'config', 'labels'),
+                        help="Directory of the label config files.")
+    parser.add_argument('--reports', type=int, default=1000000,
+                        help="Number of reports of which the severity is "
+                             "queried.")
+    parser.add_argument('--linear-reports', type=int, default=20000,
+                        help="Number of reports of which the severity is "
+                             "queried by the linear search.")
+    parser.add_argument('--prefix-ratio', type=float, default=0.2,
+                        help="Ratio of the checker names which are matched "
+                             "by a prefix.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    checker_labels = CheckerLabels(args.labels_dir)
+    parse_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        CheckerLabels(args.labels_dir, cache_dir)
+
+        start = time.perf_counter()
+        CheckerLabels(args.labels_dir, cache_dir)
+        cache_time = time.perf_counter() - start
+
+    queries = generate(checker_labels, args.reports, args.prefix_ratio,
+                       args.seed)
+    linear_queries = queries[:args.linear_reports]
+
+    expected, linear_time = measure(linear_matcher(args.labels_dir),
+                                    linear_queries)
+    linear_time *= len(queries) / len(linear_queries)
+
+    results, indexed_time = measure(checker_labels.severity, queries)
+
+    print(f"Checkers:            {len(checker_labels.checkers())}")
+    print(f"Parse label files:   {parse_time * 1000:.1f}ms")
+    print(f"Load label cache:    {cache_time * 1000:.1f}ms")
+    print(f"Reports:             {len(queries)}")
+    print(f"Linear search:       {linear_time:.3f}s (estimated from "
+          f"{len(linear_queries)} reports)")
+    print(f"CheckerLabels:       {indexed_time:.3f}s")
+    print(f"Speedup:             {linear_time / indexed_time:.1f}x")
+
+    if results[:len(expected)] != expected:
+        mismatches = [q for q, r, e in zip(linear_queries, results, expected)
+                      if r != e]
+        print(f"Results differ for {len(mismatches)} reports, e.g. "
+              f"{mismatches[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    print("Results are identical.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the start up time of the CodeChecker subcommands.
+
+Every subcommand is started with the --help flag several times, and the median
+of the run times is printed. The imported modules are listed by an additional
+run with 'python -X importtime', and their number, their total import time and
+the heaviest ones are printed too.
+
+If a time budget is given, the script exits with 1 if the start up of a
+subcommand takes longer.
+
+Run it from the repository root (CC_BIN_DIR is used to find the data files,
+e.g. the config directory of the repository):
+    PYTHONPATH=.:analyzer:web:web/client:web/server:tools/report-converter \
+        CC_BIN_DIR=$PWD/bin python3 scripts/benchmark/cli_startup.py
+"""
+
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+SUBCOMMANDS = ['version', 'analyzer-version', 'parse', 'analyze', 'check',
+               'checkers', 'analyzers', 'log', 'fixit', 'store', 'cmd',
+               'server']
+
+IMPORT_TIME_PATTERN = re.compile(
+    r'^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|'
+    r'(?P<indent> +)(?P<module>\S+)$')
+
+
+def get_cli_command():
+    """ Returns the command which starts the CodeChecker main script. """
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+
+    return [sys.executable,
+            os.path.join(repo_root, 'codechecker_common', 'cli.py')]
+
+
+def run(command, import_time=False):
+    """
+    Run the given CodeChecker command and return its run time in seconds and
+    the output of -X importtime.
+    """
+    if import_time:
+        command = command[:1] + ['-X', 'importtime'] + command[1:]
+
+    start = time.perf_counter()
+    proc = subprocess.run(command, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, check=False,
+                          encoding='utf-8', errors='ignore')
+    return time.perf_counter() - start, proc.stderr
+
+
+def parse_import_times(output):
+    """
+    Returns the number of imported modules, the total import time in seconds
+    and the (cumulative time, module) pairs of the top level imports.
+    """
+    num_modules = 0
+    total = 0
+    top_level = []
+
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+
+        num_modules += 1
+        if len(match.group('indent')) == 1:
+            cumulative = int(match.group('cumulative')) / 1e6
+            total += cumulative
+            top_level.append((cumulative, match.group('module')))
+
+    return num_modules, total, sorted(top_level, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the start up time of the CodeChecker "
+                    "subcommands.")
+    parser.add_argument('subcommands', nargs='*', default=SUBCOMMANDS,
+                        help="The subcommands to measure.")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="Number of runs of every subcommand.")
+    parser.add_argument('--top', type=int, default=3,
+                        help="Number of the heaviest top level imports to "
+                             "print.")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="Start up time budget of a subcommand in "
+                             "milliseconds.")
+    args = parser.parse_args()
+
+    cli_command = get_cli_command()
+
+    print(f"{'Subcommand':<18} {'Median':>9} {'Imports':>8} "
+          f"{'Import time':>12}  Heaviest imports")
+
+    over_budget = []
+    for subcommand in args.subcommands:
+        command = cli_command + [subcommand, '--help']
+
+        run_times = [run(command)[0] for _ in range(args.runs)]
+        median = statistics.median(run_times) * 1000
+
+        _, output = run(command, import_time=True)
+        num_modules, total, top_level = parse_import_times(output)
+
+        heaviest = ', '.join(f"{module} ({cumulative * 1000:.0f}ms)"
+                             for cumulative, module in top_level[:args.top])
+        print(f"{subcommand:<18} {median:>7.0f}ms {num_modules:>8} "
+              f"{total * 1000:>10.0f}ms  {heaviest}")
+
+        if args.budget is not None and median > args.budget:
+            over_budget.append(subcommand)
+
+    if over_budget:
+        print(f"Over the budget of {args.budget:.0f}ms: "
+              f"{', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
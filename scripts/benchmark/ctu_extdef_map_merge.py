@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of merging the CTU external definition maps.
+
+Function maps of increasing size are generated, and they are merged in memory
+and in partitions. The run time and the peak memory usage of both are printed,
+and the merged maps are compared.
+
+Run it from the repository root:
+    PYTHONPATH=analyzer/tools/merge_clang_extdef_mappings \
+        python3 scripts/benchmark/ctu_extdef_map_merge.py
+"""
+
+
+import argparse
+import filecmp
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from codechecker_merge_clang_extdef_mappings import \
+    merge_clang_extdef_mappings
+
+
+def generate(func_map_dir, num_tus, num_names, seed):
+    """
+    Generate a function map for every translation unit. Every name is defined
+    in a random number of translation units. Most of them in only one, some
+    of them (e.g. inline functions) in several ones.
+    """
+    rnd = random.Random(seed)
+    os.makedirs(func_map_dir)
+
+    # The maps are written directly, so the memory usage of this process
+    # doesn't distort the measured peak memory of the merge processes.
+    func_maps = [open(os.path.join(func_map_dir, f"tu{tu}.txt"), 'w',
+                      encoding='utf-8') for tu in range(num_tus)]
+    try:
+        for i in range(num_names):
+            # Both the old and the new clang formats.
+            usr = f"c:@N@ns{i % 97}@F@function_{i}#I#*C#"
+            name = f"{len(usr)}:{usr}" if i % 2 else usr
+
+            definitions = 1 if rnd.random() < 0.9 else rnd.randrange(2, 4)
+            for tu in rnd.sample(range(num_tus), definitions):
+                # Inline functions are defined in the same AST file.
+                ast = tu if i % 3 else definitions
+                func_maps[tu].write(
+                    f"{name} /project/src/dir{ast % 50}/file{ast}.cpp.ast\n")
+    finally:
+        for func_map in func_maps:
+            func_map.close()
+
+
+def run_merge(func_map_dir, output_file, jobs, partition_size):
+    """ Merge the function maps and print the run time and peak memory. """
+    start = time.perf_counter()
+    merge_clang_extdef_mappings.merge(func_map_dir, output_file, jobs,
+                                      partition_size)
+    run_time = time.perf_counter() - start
+
+    # The peak memory of the main process or of a worker process in KiB.
+    peak_memory = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    print(run_time, peak_memory)
+
+
+def measure(func_map_dir, output_file, jobs, partition_size):
+    """ Merge the function maps in a fresh process to measure its memory. """
+    out = subprocess.check_output(
+        [sys.executable, __file__, '--run', func_map_dir, output_file,
+         str(jobs), str(partition_size)],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    run_time, peak_memory = out.split()
+    return float(run_time), int(peak_memory) // 1024
+
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == '--run':
+        run_merge(sys.argv[2], sys.argv[3], int(sys.argv[4]),
+                  int(sys.argv[5]))
+        return
+
+    parser = argparse.ArgumentParser(
+        description="Compare merging the CTU function maps in memory to "
+                    "merging them in partitions.")
+    parser.add_argument('--names', type=int, nargs='+',
+                        default=[100000, 400000, 1600000],
+                        help="Number of distinct names in the generated "
+                             "function maps.")
+    parser.add_argument('--tus', type=int, default=200,
+                        help="Number of translation units.")
+    parser.add_argument('--jobs', type=int, default=4,
+                        help="Number of processes of the partitioned merge.")
+    parser.add_argument('--partition-size', type=int, default=16,
+                        help="Size of the partitions in MiB.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    partition_size = args.partition_size * 1024 * 1024
+
+    print(f"{'Names':>10} {'Input':>9} {'In memory':>20} "
+          f"{'Partitioned':>20}")
+
+    identical = True
+    for num_names in args.names:
+        work_dir = tempfile.mkdtemp(prefix='extdef-map-benchmark-')
+        try:
+            func_map_dir = os.path.join(work_dir, 'func_maps')
+            generate(func_map_dir, args.tus, num_names, args.seed)
+            input_size = sum(
+                os.path.getsize(os.path.join(func_map_dir, f))
+                for f in os.listdir(func_map_dir)) // (1024 * 1024)
+
+            expected = os.path.join(work_dir, 'in_memory.txt')
+            partitioned = os.path.join(work_dir, 'partitioned.txt')
+
+            # The in memory merge is used below the partition size.
+            memory_time, memory_peak = measure(
+                func_map_dir, expected, 1, sys.maxsize)
+            part_time, part_peak = measure(
+                func_map_dir, partitioned, args.jobs, partition_size)
+
+            print(f"{num_names:>10} {input_size:>7}MB "
+                  f"{memory_time:>9.2f}s {memory_peak:>7}MB "
+                  f"{part_time:>9.2f}s {part_peak:>7}MB")
+
+            if not filecmp.cmp(expected, partitioned, shallow=False):
+                print(f"The merged maps of {num_names} names differ!",
+                      file=sys.stderr)
+                identical = False
+        finally:
+            shutil.rmtree(work_dir)
+
+    if not identical:
+        sys.exit(1)
+
+    print("Merged maps are identical.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the JSON, codeclimate and sarif exports of the reports.
+
+The reports are generated in batches, like the reports of the analyzer result
+files are given by 'CodeChecker parse'. Every format is exported by
+collecting all the reports and converting them at once, and by writing the
+batches as they are given. The run time, the peak memory usage of the Python
+objects and the time until the first byte of the output are compared. The
+outputs of the two methods are checked to contain the same data.
+
+Run it from the repository root:
+    PYTHONPATH=tools/report-converter \
+        python3 scripts/benchmark/export_reports.py
+"""
+
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report.output import codeclimate, sarif, \
+    json as report_to_json
+from codechecker_report_converter.util import dump_json_output
+
+
+FORMATS = {
+    'json': report_to_json,
+    'codeclimate': codeclimate,
+    'sarif': sarif}
+
+
+def generate(num_batches, batch_size):
+    """ Yield the batches of the reports. """
+    for batch in range(num_batches):
+        file = File(f"/project/src/file_{batch}.cpp")
+        reports = []
+        for idx in range(batch_size):
+            events = [BugPathEvent(f"Step {step}", file, idx + 1, step + 1)
+                      for step in range(5)]
+            reports.append(Report(
+                file, idx + 1, 1, "Division by zero",
+                f"core.Checker{idx % 50}", report_hash=f"{batch}:{idx}",
+                severity='HIGH', analyzer_name='clangsa',
+                bug_path_events=events))
+
+        yield reports
+
+
+class FirstWriteFile:
+    """ Output file which records the time of the first write. """
+
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.first_write = None
+
+    def write(self, data):
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+def export_all(module, batches, out):
+    """ Collect all the reports and convert them at once. """
+    all_reports = []
+    for reports in batches:
+        all_reports.extend(reports)
+
+    dump_json_output(module.convert(all_reports), out=out)
+
+
+def export_stream(module, batches, out):
+    """ Write the reports as they are given. """
+    writer = module.Writer(out=out)
+    for reports in batches:
+        writer.write(reports)
+    writer.finish()
+
+
+def measure(export, module, args, path):
+    out = FirstWriteFile(path)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    export(module, generate(args.batches, args.batch_size), out)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    out.close()
+
+    return end - start, out.first_write - start, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the JSON, codeclimate and sarif exports.")
+    parser.add_argument('--batches', type=int, default=1000,
+                        help="Number of batches, i.e. analyzer result "
+                             "files.")
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help="Number of reports in a batch.")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        print(f"Reports: {args.batches * args.batch_size}")
+
+        differs = False
+        for name, module in FORMATS.items():
+            outputs = []
+            for method, export in [('convert', export_all),
+                                   ('stream', export_stream)]:
+                path = os.path.join(tmp_dir, f"{name}_{method}.json")
+                run_time, first_byte, memory = \
+                    measure(export, module, args, path)
+                print(f"{name:12} {method:8} {run_time:7.2f}s "
+                      f"(first byte: {first_byte:5.2f}s) "
+                      f"{memory:8.1f} MiB")
+
+                with open(path, encoding='utf-8') as f:
+                    outputs.append(json.load(f))
+                os.remove(path)
+
+            differs |= outputs[0] != outputs[1]
+
+        if differs:
+            print("The outputs differ.", file=sys.stderr)
+            sys.exit(1)
+
+        print("The outputs contain the same data.")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of 'CodeChecker parse' on a large report directory.
+
+A report directory is generated with the given number of analyzer result
+files. Every result file contains reports in its own source file and in header
+files which are shared by the result files, so the reports in the header files
+are deduplicated by 'CodeChecker parse'. Some of the reports are suppressed by
+source code comments.
+
+The report directory is parsed with one process and with the given number of
+processes, both to the plain text output and to the JSON export. The run time
+and the peak memory usage are printed, and the outputs are checked to be
+identical.
+
+Run it from the repository root (CC_BIN_DIR is used to find the data files,
+e.g. the config directory of the repository):
+    PYTHONPATH=.:analyzer:web:tools/report-converter \
+        CC_BIN_DIR=$PWD/bin python3 scripts/benchmark/parse_reports.py
+"""
+
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report import report_file
+
+
+def get_cli_command():
+    """ Returns the command which starts the CodeChecker main script. """
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+
+    return [sys.executable,
+            os.path.join(repo_root, 'codechecker_common', 'cli.py')]
+
+
+def generate(tmp_dir, num_files, num_reports, num_headers):
+    """ Write the source files and the analyzer result files. """
+    src_dir = os.path.join(tmp_dir, 'src')
+    report_dir = os.path.join(tmp_dir, 'reports')
+    os.makedirs(src_dir)
+    os.makedirs(report_dir)
+
+    def write_source(path, lines):
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in range(1, lines + 1):
+                if line % 10 == 0:
+                    f.write("// codechecker_suppress [core.DivideZero] "
+                            "intentional\n")
+                else:
+                    f.write(f"int x{line} = {line} / 0;\n")
+
+    headers = [os.path.join(src_dir, f"header_{i}.h")
+               for i in range(num_headers)]
+    for header in headers:
+        write_source(header, num_reports)
+
+    for idx in range(num_files):
+        source = os.path.join(src_dir, f"file_{idx}.c")
+        write_source(source, num_reports)
+
+        reports = []
+        for line in range(1, num_reports + 1):
+            # Half of the reports are in the shared header files.
+            path = headers[(idx + line) % num_headers] if line % 2 \
+                else source
+            file = File(path)
+            events = [BugPathEvent(f"Step {step}", file, line, step + 1)
+                      for step in range(5)]
+            reports.append(Report(
+                file, line + 1 if line % 10 == 9 else line, 1,
+                "Division by zero", 'core.DivideZero',
+                report_hash=f"{path}:{line}", analyzer_name='clangsa',
+                bug_path_events=events))
+
+        report_file.create(
+            os.path.join(report_dir, f"file_{idx}.c_clangsa.plist"),
+            reports)
+
+    return report_dir
+
+
+def run(command):
+    """
+    Run the given command. Returns its output, run time in seconds and peak
+    memory usage in MiB.
+    """
+    start = time.perf_counter()
+    with subprocess.Popen(command, stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL) as proc:
+        output = proc.stdout.read()
+        _, _, usage = os.wait4(proc.pid, 0)
+        proc.returncode = 0
+
+    return output, time.perf_counter() - start, usage.ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure 'CodeChecker parse' on a large report "
+                    "directory.")
+    parser.add_argument('--files', type=int, default=2000,
+                        help="Number of analyzer result files.")
+    parser.add_argument('--reports', type=int, default=100,
+                        help="Number of reports in an analyzer result file.")
+    parser.add_argument('--headers', type=int, default=20,
+                        help="Number of shared header files.")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of parallel processes.")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        report_dir = generate(tmp_dir, args.files, args.reports, args.headers)
+        print(f"Analyzer result files: {args.files}, reports: "
+              f"{args.files * args.reports}")
+
+        differs = False
+        for export in [[], ['-e', 'json']]:
+            outputs = []
+            for jobs in [1, args.jobs]:
+                output, run_time, memory = run(
+                    get_cli_command() + ['parse', report_dir,
+                                         '-j', str(jobs)] + export)
+                outputs.append(output)
+
+                print(f"{' '.join(export) or 'plain text':10} -j {jobs:<3} "
+                      f"{run_time:7.2f}s {memory:8.1f} MiB")
+
+            differs |= outputs[0] != outputs[1]
+
+        if differs:
+            print("The outputs differ.", file=sys.stderr)
+            sys.exit(1)
+
+        print("The outputs are identical.")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
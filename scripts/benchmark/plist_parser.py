@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of parsing a large plist file.
+
+A plist file is generated with reports which have deep bug paths and macro
+expansions, like the plist files of the Clang Static Analyzer for large
+translation units. The plist file is parsed in a child process and the parse
+time and the peak memory usage (maximum resident set size, which contains the
+memory of the XML parser too) of the child process are printed. The plist
+file is generated in another child process, because the maximum resident set
+size of the parent process would be inherited by the child process.
+
+Run it from the repository root:
+    PYTHONPATH=tools/report-converter \
+        python3 scripts/benchmark/plist_parser.py
+"""
+
+
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from codechecker_report_converter.report import BugPathEvent, \
+    BugPathPosition, File, MacroExpansion, Range, Report, report_file
+
+
+def generate(file_path, num_reports, path_length, num_headers):
+    """ Write the plist file. """
+    source = File("/project/src/main.cpp")
+    headers = [File(f"/project/include/header_{i}.h")
+               for i in range(num_headers)]
+
+    reports = []
+    for line in range(1, num_reports + 1):
+        events = []
+        positions = []
+        for step in range(path_length):
+            file = headers[(line + step) % num_headers] if step % 2 \
+                else source
+            events.append(BugPathEvent(
+                f"Calling 'function_{step}'", file, step + 1, 5,
+                Range(step + 1, 5, step + 1, 20)))
+            positions.append(BugPathPosition(
+                file, Range(step + 1, 5, step + 1, 20)))
+
+        macros = [MacroExpansion(f"do {{ check_{step}(p); }} while (0)",
+                                 f"CHECK_{step}", source, line, 3)
+                  for step in range(5)]
+
+        reports.append(Report(
+            source, line, 1, "Called C++ object pointer is null",
+            'core.CallAndMessage', report_hash=str(line),
+            analyzer_name='clangsa', bug_path_events=events,
+            bug_path_positions=positions, macro_expansions=macros))
+
+    report_file.create(file_path, reports)
+
+
+def parse(file_path):
+    """ Parse the plist file and print the parse time and the peak memory. """
+    start = time.perf_counter()
+    reports = report_file.get_reports(file_path)
+    run_time = time.perf_counter() - start
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"Reports: {len(reports)}, bug path events: "
+          f"{sum(len(r.bug_path_events) for r in reports)}")
+    print(f"Parse time:  {run_time:.2f}s")
+    print(f"Peak memory: {max_rss / 1024:.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure parsing a large plist file.")
+    parser.add_argument('--reports', type=int, default=5000,
+                        help="Number of reports in the plist file.")
+    parser.add_argument('--path-length', type=int, default=40,
+                        help="Number of bug path events of a report.")
+    parser.add_argument('--headers', type=int, default=20,
+                        help="Number of header files.")
+    parser.add_argument('--generate', metavar='PLIST_FILE',
+                        help="Only generate the given plist file.")
+    parser.add_argument('--parse', metavar='PLIST_FILE',
+                        help="Only parse the given plist file.")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.generate, args.reports, args.path_length, args.headers)
+        return
+
+    if args.parse:
+        parse(args.parse)
+        return
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(tmp_dir, 'main.cpp_clangsa.plist')
+        subprocess.run([sys.executable, __file__, '--generate', file_path,
+                        '--reports', str(args.reports),
+                        '--path-length', str(args.path_length),
+                        '--headers', str(args.headers)], check=True)
+        print(f"Plist file: {os.path.getsize(file_path) / 1024 / 1024:.1f} "
+              "MiB")
+
+        subprocess.run([sys.executable, __file__, '--parse', file_path],
+                       check=True)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
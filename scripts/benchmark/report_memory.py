@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the memory usage of the reports.
+
+Analyzer result files are generated with reports which have deep bug paths,
+like the reports of the Clang Static Analyzer. The bug paths go through
+header files which are shared by the analyzer result files. The analyzer
+result files are parsed like 'CodeChecker store' parses them: every file is
+parsed separately and the reports are sent back from the worker process
+(simulated by pickling them). The memory which is used by the reports of all
+the analyzer result files and the parse time (measured in a separate run,
+without tracing the memory allocations) are printed.
+
+Run it from the repository root:
+    PYTHONPATH=tools/report-converter \
+        python3 scripts/benchmark/report_memory.py
+"""
+
+
+import argparse
+import gc
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from codechecker_report_converter.report import BugPathEvent, \
+    BugPathPosition, File, Range, Report, report_file
+
+
+def generate(report_dir, num_files, num_reports, path_length, num_headers):
+    """ Write the analyzer result files. """
+    headers = [File(f"/project/include/header_{i}.h")
+               for i in range(num_headers)]
+
+    for idx in range(num_files):
+        source = File(f"/project/src/file_{idx}.cpp")
+        reports = []
+        for line in range(1, num_reports + 1):
+            events = []
+            positions = []
+            for step in range(path_length):
+                file = headers[(line + step) % num_headers] if step % 2 \
+                    else source
+                events.append(BugPathEvent(
+                    f"Calling 'function_{step}'", file, step + 1, 5,
+                    Range(step + 1, 5, step + 1, 20)))
+                positions.append(BugPathPosition(
+                    file, Range(step + 1, 5, step + 1, 20)))
+
+            reports.append(Report(
+                source, line, 1, "Called C++ object pointer is null",
+                'core.CallAndMessage', report_hash=f"{idx}:{line}",
+                analyzer_name='clangsa', bug_path_events=events,
+                bug_path_positions=positions))
+
+        report_file.create(
+            os.path.join(report_dir, f"file_{idx}.cpp_clangsa.plist"),
+            reports)
+
+
+def parse(report_dir):
+    """ Parse the analyzer result files like 'CodeChecker store' does. """
+    # Older versions of the report model can't share the File objects.
+    intern_files = hasattr(Report, 'intern_files')
+    file_cache = {}
+
+    all_reports = []
+    for file_name in sorted(os.listdir(report_dir)):
+        reports = report_file.get_reports(os.path.join(report_dir, file_name))
+        reports = pickle.loads(pickle.dumps(reports))
+
+        if intern_files:
+            for report in reports:
+                report.intern_files(file_cache)
+
+        all_reports.extend(reports)
+
+    return all_reports
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the memory usage of the reports.")
+    parser.add_argument('--files', type=int, default=100,
+                        help="Number of analyzer result files.")
+    parser.add_argument('--reports', type=int, default=20,
+                        help="Number of reports in an analyzer result file.")
+    parser.add_argument('--path-length', type=int, default=40,
+                        help="Number of bug path events of a report.")
+    parser.add_argument('--headers', type=int, default=20,
+                        help="Number of shared header files.")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        generate(tmp_dir, args.files, args.reports, args.path_length,
+                 args.headers)
+
+        start = time.perf_counter()
+        parse(tmp_dir)
+        run_time = time.perf_counter() - start
+
+        gc.collect()
+        tracemalloc.start()
+        all_reports = parse(tmp_dir)
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"Reports: {len(all_reports)}, bug path events: "
+              f"{sum(len(r.bug_path_events) for r in all_reports)}")
+        print(f"Memory of the reports: {memory / 1024 / 1024:.1f} MiB")
+        print(f"Parse time:            {run_time:.2f}s")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the debug zips of the failed analyses.
+
+C++ source files are generated which include the same project and standard
+library headers, like the translation units of a project do. The files of
+every translation unit are collected into a zip file like the failure zips of
+'CodeChecker analyze', and into a blob store with a manifest file per
+translation unit like 'CodeChecker analyze --reproducer-blob-store' does. The
+size of the written files, the time of writing them and the size of the
+compressed upload of 'CodeChecker store' are compared.
+
+Run it from the repository root (g++ is needed to collect the headers):
+    PYTHONPATH=tools/tu_collector \
+        python3 scripts/benchmark/reproducer_blob_store.py
+"""
+
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+import zlib
+
+from tu_collector import tu_collector
+
+
+STD_HEADERS = ['algorithm', 'iostream', 'map', 'memory', 'string', 'vector']
+
+
+def generate(src_dir, num_tus, num_headers):
+    """
+    Write the source files and return the compilation database of them.
+    """
+    for header in range(num_headers):
+        with open(os.path.join(src_dir, f"header_{header}.h"), 'w',
+                  encoding='utf-8') as f:
+            f.write(f"#pragma once\nint function_{header}(int);\n" +
+                    "// A comment which makes the header larger.\n" * 200)
+
+    compilation_db = []
+    for tu in range(num_tus):
+        source = os.path.join(src_dir, f"file_{tu}.cpp")
+        with open(source, 'w', encoding='utf-8') as f:
+            f.writelines(f"#include <{header}>\n" for header in STD_HEADERS)
+            f.writelines(f'#include "header_{header}.h"\n'
+                         for header in range(num_headers))
+            f.write(f"int main() {{ return function_{tu % num_headers}(0); "
+                    "}\n")
+
+        compilation_db.append({'file': source,
+                               'command': f"g++ -c {source}",
+                               'directory': src_dir})
+
+    return compilation_db
+
+
+def dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, f))
+               for root, _, files in os.walk(path) for f in files)
+
+
+def upload_size(paths):
+    """
+    The size of the compressed zip file which 'CodeChecker store' uploads.
+    """
+    with tempfile.TemporaryFile() as tmp:
+        with zipfile.ZipFile(tmp, 'w', allowZip64=True) as zipf:
+            for path in paths:
+                zipf.write(path)
+
+        tmp.seek(0)
+        return len(zlib.compress(tmp.read(), zlib.Z_BEST_COMPRESSION))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the debug zips of the failed analyses.")
+    parser.add_argument('--tus', type=int, default=200,
+                        help="Number of failed translation units.")
+    parser.add_argument('--headers', type=int, default=50,
+                        help="Number of project headers included by every "
+                             "translation unit.")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        src_dir = os.path.join(tmp_dir, 'src')
+        zip_dir = os.path.join(tmp_dir, 'zips', 'failed')
+        blob_dir = os.path.join(tmp_dir, 'blobs_report', 'blobs')
+        manifest_dir = os.path.join(tmp_dir, 'blobs_report', 'failed')
+        for path in [src_dir, zip_dir, manifest_dir]:
+            os.makedirs(path)
+
+        compilation_db = generate(src_dir, args.tus, args.headers)
+
+        start = time.perf_counter()
+        for action in compilation_db:
+            zip_file = os.path.join(
+                zip_dir, os.path.basename(action['file']) + '.zip')
+            tu_collector.zip_tu_files(zip_file, [action])
+        zip_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        blob_store = tu_collector.BlobStore(blob_dir)
+        for action in compilation_db:
+            files = tu_collector.store_tu_files(blob_store, [action])
+            manifest_file = os.path.join(
+                manifest_dir, os.path.basename(action['file']) +
+                tu_collector.MANIFEST_SUFFIX)
+            tu_collector.write_manifest(manifest_file, blob_store, files)
+        blob_time = time.perf_counter() - start
+
+        zips = [os.path.join(zip_dir, f) for f in os.listdir(zip_dir)]
+        blobs = [os.path.join(root, f)
+                 for path in [blob_dir, manifest_dir]
+                 for root, _, files in os.walk(path) for f in files]
+
+        print(f"Failed translation units:  {args.tus}")
+        print(f"Zip files:                 "
+              f"{dir_size(zip_dir) / 1024 / 1024:.1f} MiB, {zip_time:.2f}s")
+        blob_size = dir_size(blob_dir) + dir_size(manifest_dir)
+        print(f"Blob store and manifests:  "
+              f"{blob_size / 1024 / 1024:.1f} MiB, {blob_time:.2f}s")
+        print(f"Store upload of zip files: "
+              f"{upload_size(zips) / 1024 / 1024:.1f} MiB")
+        print(f"Store upload of blobs:     "
+              f"{upload_size(blobs) / 1024 / 1024:.1f} MiB")
+        print("(the time includes collecting the headers by g++)")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Micro-benchmark of the skip list matching.
+
+A skip file with the given number of lines and a set of paths are generated.
+The result of SkipListHandler.should_skip() is compared to the line by line
+matching of the skip file for every path and the run time of both is printed.
+
+Run it from the repository root:
+    PYTHONPATH=. python3 scripts/benchmark/skiplist_matcher.py
+"""
+
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import sys
+import time
+
+from codechecker_common.skiplist_handler import SkipListHandler
+
+
+def line_by_line_matcher(skip_lines):
+    """
+    Returns a should_skip() function which tries the skip lines one by one,
+    like SkipListHandler did before the lines were compiled together.
+    """
+    skip = []
+    for line in skip_lines:
+        glob = fnmatch.translate(os.path.normpath(line[1:].strip()))
+        if glob.endswith((r"\Z", r"\z")):
+            glob = glob[:-2]
+        skip.append((line, re.compile(glob + fr"(?:\{os.path.sep}.*)?$")))
+
+    def should_skip(source):
+        for line, rexpr in skip:
+            if rexpr.match(source):
+                return line[0] == '-'
+        return False
+
+    return should_skip
+
+
+def generate(num_lines, num_paths, glob_ratio, seed):
+    """ Generate skip lines and paths from a random directory tree. """
+    rnd = random.Random(seed)
+    dirs = ['/project'] + [
+        f"/project/{'/'.join(f'd{rnd.randrange(20)}' for _ in range(depth))}"
+        for depth in rnd.choices(range(1, 6), k=num_lines)]
+    files = [f"{rnd.choice(dirs)}/f{i}.{rnd.choice(['c', 'cpp', 'h'])}"
+             for i in range(num_paths)]
+
+    skip_lines = []
+    for _ in range(num_lines):
+        path = rnd.choice(dirs + files)
+        if rnd.random() < glob_ratio:
+            path = rnd.choice([path + '/*.h', path + '/*test*',
+                               '*/' + os.path.basename(path),
+                               path.replace('/d1', '/d?', 1)])
+        skip_lines.append(rnd.choice('+-') + path)
+    skip_lines.append('+*')
+
+    # System headers are matched only by the last line.
+    files += [f"/usr/include/h{i}.h" for i in range(num_paths // 4)]
+
+    # The paths are queried repeatedly, e.g. for every report and every bug
+    # path event.
+    paths = rnd.choices(files, k=num_paths * 5)
+    return skip_lines, paths
+
+
+def measure(func, paths):
+    """ Returns the results and the run time of func on the paths. """
+    start = time.perf_counter()
+    results = [func(path) for path in paths]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the compiled skip list matching of "
+                    "SkipListHandler to the line by line matching.")
+    parser.add_argument('--lines', type=int, default=5000,
+                        help="Number of skip file lines.")
+    parser.add_argument('--paths', type=int, default=2000,
+                        help="Number of distinct paths to match.")
+    parser.add_argument('--glob-ratio', type=float, default=0.3,
+                        help="Ratio of the skip lines containing globs.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    skip_lines, paths = generate(args.lines, args.paths, args.glob_ratio,
+                                 args.seed)
+
+    start = time.perf_counter()
+    handler = SkipListHandler('\n'.join(skip_lines))
+    build_time = time.perf_counter() - start
+
+    expected, line_by_line_time = measure(line_by_line_matcher(skip_lines),
+                                          paths)
+    results, compiled_time = measure(handler.should_skip, paths)
+
+    print(f"Skip lines:          {len(skip_lines)}")
+    print(f"Queries:             {len(paths)}")
+    print(f"Skipped:             {sum(expected)}")
+    print(f"Line by line:        {line_by_line_time:.3f}s")
+    print(f"SkipListHandler:     {compiled_time:.3f}s "
+          f"(+{build_time:.3f}s to build)")
+    print(f"Speedup:             {line_by_line_time / compiled_time:.1f}x")
+
+    if results != expected:
+        mismatches = [p for p, r, e in zip(paths, results, expected)
+                      if r != e]
+        print(f"Results differ for {len(mismatches)} paths, e.g. "
+              f"{mismatches[0]}", file=sys.stderr)
+        sys.exit(1)
+
+    print("Results are identical.")
+
+
+if __name__ == "__main__":
+    main()
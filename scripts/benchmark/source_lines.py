@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of reading the source lines of the reports.
+
+A large source file is generated with source code comments, and reports at
+random lines of it. The run time of the report hash generation, of reading
+the source lines of the reports and of scanning the source code comments at
+the lines of the reports is printed.
+
+Run it from the repository root:
+    PYTHONPATH=.:tools/report-converter \
+        python3 scripts/benchmark/source_lines.py
+"""
+
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report.hash import get_report_hash, \
+    HashType
+
+from codechecker_common.source_code_comment_handler import \
+    SourceCodeCommentHandler
+
+
+def generate(file_path, num_lines):
+    """ Write the source file. """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for line in range(1, num_lines + 1):
+            if line % 20 == 0:
+                f.write("// codechecker_suppress [core.DivideZero] "
+                        "intentional\n")
+            else:
+                f.write(f"  int x{line} = {line} / 0;\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure reading the source lines of the reports.")
+    parser.add_argument('--lines', type=int, default=20000,
+                        help="Number of lines in the source file.")
+    parser.add_argument('--reports', type=int, default=5000,
+                        help="Number of reports in the source file.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(tmp_dir, 'source.c')
+        generate(file_path, args.lines)
+
+        # The source file is not changed after the analysis.
+        result_file_path = os.path.join(tmp_dir, 'source.c_clangsa.plist')
+        with open(result_file_path, 'w', encoding='utf-8'):
+            pass
+
+        lines = [rnd.randrange(1, args.lines + 1)
+                 for _ in range(args.reports)]
+
+        def create_reports():
+            file = File(file_path)
+            return [Report(file, line, 3, "Division by zero",
+                           'core.DivideZero',
+                           analyzer_result_file_path=result_file_path,
+                           bug_path_events=[
+                               BugPathEvent("Division by zero", file, line,
+                                            3)])
+                    for line in lines]
+
+        reports = create_reports()
+        start = time.perf_counter()
+        for report in reports:
+            get_report_hash(report, HashType.PATH_SENSITIVE)
+            get_report_hash(report, HashType.CONTEXT_FREE)
+        hash_time = time.perf_counter() - start
+
+        reports = create_reports()
+        start = time.perf_counter()
+        for report in reports:
+            _ = report.source_line
+        source_line_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(file_path, encoding='utf-8', errors='ignore') as f:
+            comments, _ = SourceCodeCommentHandler() \
+                .scan_source_line_comments(f, lines)
+        comment_time = time.perf_counter() - start
+
+        print(f"Source lines: {args.lines}, reports: {args.reports}")
+        print(f"Report hashes:   {hash_time:7.2f}s")
+        print(f"Source lines:    {source_line_time:7.2f}s")
+        print(f"Source comments: {comment_time:7.2f}s "
+              f"({sum(1 for _, c in comments if c)} commented reports)")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
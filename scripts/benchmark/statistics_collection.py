@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Benchmark of the post-processing of the statistics collection.
+
+Clang outputs of the statistics collector checkers are generated for the
+given number of translation units. Every output contains calls in the source
+file of the translation unit, calls in header files which are shared by the
+translation units, and other diagnostics.
+
+The outputs are post-processed like before the partial results, i.e. all the
+distinct lines of the outputs are collected in a set and parsed by the
+collectors. Then the partial results of the outputs are created, like the
+pre-analysis does after the statistics collection of a translation unit, and
+they are post-processed. The size of the statistics directories, the run time
+of the post-processing and the statistics yaml files are compared.
+
+Run it from the repository root:
+    PYTHONPATH=analyzer/tools/statistics_collector \
+        python3 scripts/benchmark/statistics_collection.py
+"""
+
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from codechecker_statistics_collector import post_process_stats
+from codechecker_statistics_collector.collectors.return_value import \
+    ReturnValueCollector
+from codechecker_statistics_collector.collectors.special_return_value import \
+    SpecialReturnValueCollector
+
+
+def generate(stat_dir, num_tus, calls, headers, seed):
+    """ Write the clang outputs of the translation units. """
+    rnd = random.Random(seed)
+    functions = [f"function_{i}" for i in range(500)]
+
+    for tu in range(num_tus):
+        source = f"/project/src/module_{tu % 50}/file_{tu}.c"
+        lines = []
+        for call in range(calls):
+            path = source
+            if call < headers:
+                path = f"/project/include/header_{call % 20}.h"
+
+            loc = f"{path}:{call + 1}:{rnd.randrange(1, 80)}"
+            func = rnd.choice(functions)
+            if call < headers:
+                # The calls in the header files are the same in every
+                # translation unit.
+                loc = f"{path}:{call + 1}:5"
+                func = functions[call % len(functions)]
+
+            lines.append(f"{loc}: warning: Return Value Check:{loc},{func},"
+                         f"{int(rnd.random() < 0.1)} "
+                         "[statisticscollector.ReturnValueCheck]\n")
+            lines.append(f"{loc}: warning: Special Return Value:{loc},{func},"
+                         f"{int(rnd.random() < 0.9)},"
+                         f"{int(rnd.random() < 0.1)} "
+                         "[statisticscollector.SpecialReturnValue]\n")
+            lines.append(f"{loc}: note: Calling '{func}'\n")
+
+        with open(os.path.join(stat_dir, f"file_{tu}.c.stat"), 'w',
+                  encoding='utf-8') as f:
+            f.writelines(lines)
+
+
+def process_lines(input_dir, output_dir, min_sample_count, threshold):
+    """ Post-process the clang outputs like before the partial results. """
+    ret_collector = ReturnValueCollector(min_sample_count, threshold)
+    special_ret_collector = \
+        SpecialReturnValueCollector(min_sample_count, threshold)
+
+    lines = set()
+    for clang_output in os.listdir(input_dir):
+        with open(os.path.join(input_dir, clang_output), 'r',
+                  encoding='utf-8', errors='ignore') as out:
+            lines |= set(out.readlines())
+    for line in lines:
+        ret_collector.process_line(line)
+        special_ret_collector.process_line(line)
+
+    os.makedirs(output_dir)
+    for collector in [ret_collector, special_ret_collector]:
+        with open(collector.stats_file(output_dir), 'w',
+                  encoding='utf-8', errors='ignore') as f:
+            f.write(collector.get_yaml())
+
+
+def aggregate(input_dir, partial_dir):
+    """ Create the partial result of every clang output. """
+    for clang_output in os.listdir(input_dir):
+        with open(os.path.join(input_dir, clang_output), 'r',
+                  encoding='utf-8', errors='ignore') as out:
+            partial = post_process_stats.aggregate_lines(out)
+
+        post_process_stats.write_partial(
+            partial, os.path.join(partial_dir, clang_output +
+                                  post_process_stats.PARTIAL_SUFFIX))
+
+
+def dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, f))
+               for f in os.listdir(path))
+
+
+def read_yaml(output_dir):
+    result = []
+    for collector in [ReturnValueCollector, SpecialReturnValueCollector]:
+        with open(collector.stats_file(output_dir), encoding='utf-8') as f:
+            result.append(f.read())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the post-processing of the statistics "
+                    "collection.")
+    parser.add_argument('--tus', type=int, default=2000,
+                        help="Number of translation units.")
+    parser.add_argument('--calls', type=int, default=500,
+                        help="Number of function calls in a translation "
+                             "unit.")
+    parser.add_argument('--header-calls', type=int, default=200,
+                        help="Number of function calls in the header files "
+                             "of a translation unit.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed of the random generator.")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        stat_dir = os.path.join(tmp_dir, 'stats_raw')
+        partial_dir = os.path.join(tmp_dir, 'stats_partial')
+        os.makedirs(stat_dir)
+        os.makedirs(partial_dir)
+
+        generate(stat_dir, args.tus, args.calls, args.header_calls,
+                 args.seed)
+
+        start = time.perf_counter()
+        process_lines(stat_dir, os.path.join(tmp_dir, 'out_lines'), 10, 0.85)
+        lines_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        aggregate(stat_dir, partial_dir)
+        aggregate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        post_process_stats.process(partial_dir,
+                                   os.path.join(tmp_dir, 'out_partial'),
+                                   10, 0.85)
+        merge_time = time.perf_counter() - start
+
+        print(f"Translation units:          {args.tus}")
+        print(f"Clang outputs:              "
+              f"{dir_size(stat_dir) / 1024 / 1024:.1f} MiB")
+        print(f"Partial results:            "
+              f"{dir_size(partial_dir) / 1024 / 1024:.1f} MiB")
+        print(f"Post-process clang outputs: {lines_time:.2f}s")
+        print(f"Aggregate in the workers:   {aggregate_time:.2f}s "
+              "(in total, spread over the workers)")
+        print(f"Merge partial results:      {merge_time:.2f}s")
+
+        if read_yaml(os.path.join(tmp_dir, 'out_lines')) != \
+                read_yaml(os.path.join(tmp_dir, 'out_partial')):
+            print("The statistics differ.", file=sys.stderr)
+            sys.exit(1)
+
+        print("The statistics are identical.")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
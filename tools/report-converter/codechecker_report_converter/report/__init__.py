@@ -13,6 +13,7 @@ import itertools
 import json
 import logging
 import os
+import sys
 
 from typing import Callable, Dict, List, Optional, Protocol, Set, Tuple, \
         Union, Any
@@ -39,7 +40,23 @@ InvalidFileContentMsg: str = \
     "your project to update the reports."
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern the given string, so the same strings of many reports (e.g. checker
+    names and bug path event messages) are stored only once in the memory.
+    """
+    # The exact type is checked, because sys.intern() rejects the subclasses
+    # of str.
+    # pylint: disable=unidiomatic-typecheck
+    return sys.intern(value) if type(value) is str else value
+
+
+# The classes of the report model have __slots__, because a large number of
+# them are kept in the memory, e.g. the bug path events of deep paths.
 class File:
+    __slots__ = ('__id', '__path', '__original_path', '__content', '__name',
+                 '__lines')
+
     def __init__(
         self,
         file_path: str,
@@ -51,6 +68,7 @@ class File:
         self.__original_path = file_path
         self.__content = content
         self.__name: Optional[str] = None
+        self.__lines: Optional[List[str]] = None
 
     @property
     def id(self) -> str:
@@ -98,12 +116,16 @@ class File:
     def get_line(self, line: int) -> str:
         """ Get content from the given line.
 
-        Load file content if it's not loaded yet.
+        If the file content is not loaded, the line is read by the line index
+        of the file (see util.get_line()).
         """
         if self.__content is None:
             return util.get_line(self.original_path, line)
 
-        return self.__content.splitlines(keepends=True)[line - 1]
+        if self.__lines is None:
+            self.__lines = self.__content.splitlines(keepends=True)
+
+        return self.__lines[line - 1]
 
     def trim(self, path_prefixes: Optional[List[str]] = None) -> str:
         """ Removes the longest matching leading path from the file paths. """
@@ -147,6 +169,8 @@ def get_or_create_file(
 
 
 class Range:
+    __slots__ = ('start_line', 'start_col', 'end_line', 'end_col')
+
     def __init__(
         self,
         start_line: int,
@@ -182,6 +206,8 @@ class Range:
 
 
 class BugPathPosition:
+    __slots__ = ('file', 'range')
+
     def __init__(
         self,
         file: File,
@@ -211,6 +237,8 @@ class BugPathPosition:
 
 
 class BugPathEvent(BugPathPosition):
+    __slots__ = ('line', 'column', 'message')
+
     def __init__(
         self,
         message: str,
@@ -226,7 +254,7 @@ class BugPathEvent(BugPathPosition):
         self.line = line
         self.column = column
 
-        self.message = message
+        self.message = _intern(message)
 
     def to_json(self) -> Dict:
         """ Creates a JSON dictionary. """
@@ -255,6 +283,8 @@ class BugPathEvent(BugPathPosition):
 
 
 class MacroExpansion(BugPathEvent):
+    __slots__ = ('name',)
+
     def __init__(
         self,
         message: str,  # Expanded message.
@@ -265,7 +295,7 @@ class MacroExpansion(BugPathEvent):
         file_range: Optional[Range] = None
     ):
         super().__init__(message, file, line, column, file_range)
-        self.name = name
+        self.name = _intern(name)
 
     def to_json(self) -> Dict:
         """ Creates a JSON dictionary. """
@@ -301,6 +331,13 @@ class SourceReviewStatus:
 class Report:
     """ Represents a report object. """
 
+    __slots__ = (
+        'analyzer_result_file_path', 'file', 'line', 'column', 'message',
+        'checker_name', 'severity', 'report_hash', 'analyzer_name',
+        'category', 'type', 'annotations', 'static_message',
+        'bug_path_events', 'bug_path_positions', 'notes', 'macro_expansions',
+        'review_status', '__source_line', '__files', '__changed_files')
+
     def __init__(
         self,
         file: File,
@@ -339,17 +376,17 @@ class Report:
         self.file = file
         self.line = line
         self.column = column
-        self.message = message
-        self.checker_name = checker_name
-        self.severity = severity
+        self.message = _intern(message)
+        self.checker_name = _intern(checker_name)
+        self.severity = _intern(severity)
         self.report_hash = report_hash
-        self.analyzer_name = analyzer_name
+        self.analyzer_name = _intern(analyzer_name)
         self.category = category  # TODO: Remove this. DEPRECATED.
         self.type = type  # TODO: Remove this. DEPRECATED.
         self.annotations = annotations
 
         self.static_message = \
-            message if static_message is None else static_message
+            self.message if static_message is None else static_message
 
         self.bug_path_events = bug_path_events \
             if bug_path_events is not None else \
@@ -400,6 +437,26 @@ class Report:
         ):
             event.file.trim(path_prefixes)
 
+    def intern_files(self, file_cache: Dict[str, File]):
+        """
+        Replace the File objects of the report with the ones in the given file
+        cache (see get_or_create_file()). This way the reports which are
+        parsed from different analyzer result files or in other processes
+        share the File objects.
+        """
+        self.file = file_cache.setdefault(self.file.original_path, self.file)
+
+        for event in itertools.chain(
+            self.bug_path_events,
+            self.bug_path_positions,
+            self.notes,
+            self.macro_expansions
+        ):
+            event.file = file_cache.setdefault(
+                event.file.original_path, event.file)
+
+        self.__files = None
+
     @property
     def files(self) -> Set[File]:
         """ Returns all referenced file paths. """
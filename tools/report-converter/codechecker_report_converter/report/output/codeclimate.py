@@ -7,9 +7,12 @@
 # -------------------------------------------------------------------------
 """Codeclimate output helpers."""
 
-from typing import Dict, List
+import sys
+
+from typing import Dict, Iterable, List, Optional
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import JsonArrayWriter
 
 
 def convert(reports: List[Report]) -> List[Dict]:
@@ -28,6 +31,30 @@ def convert(reports: List[Report]) -> List[Dict]:
     return codeclimate_reports
 
 
+class Writer:
+    """
+    Write reports in codeclimate format to the given output file or to the
+    output stream as they are given. The output is the same as the output of
+    convert() for all the reports.
+    """
+
+    def __init__(
+        self,
+        output_file_path: Optional[str] = None,
+        out=sys.stdout
+    ):
+        self.__writer = JsonArrayWriter('', output_file_path, out)
+
+    def write(self, reports: Iterable[Report]):
+        """ Write the given reports. """
+        for report in reports:
+            self.__writer.write(convert([report]))
+
+    def finish(self):
+        """ Finish the JSON document. """
+        self.__writer.finish()
+
+
 __codeclimate_severity_map = {
     'CRITICAL': 'critical',
     'HIGH': 'major',
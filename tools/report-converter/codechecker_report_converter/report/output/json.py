@@ -7,17 +7,45 @@
 # -------------------------------------------------------------------------
 """ JSON output helpers. """
 
-from typing import Dict, List
+import sys
+
+from typing import Dict, Iterable, List, Optional
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.util import JsonArrayWriter
+
+
+VERSION = 1
 
 
 def convert(reports: List[Report]) -> Dict:
     """ Convert the given reports to JSON format. """
-    version = 1
-
     json_reports = []
     for report in reports:
         json_reports.append(report.to_json())
 
-    return {"version": version, "reports": json_reports}
+    return {"version": VERSION, "reports": json_reports}
+
+
+class Writer:
+    """
+    Write reports in JSON format to the given output file or to the output
+    stream as they are given. The output is the same as the output of
+    convert() for all the reports.
+    """
+
+    def __init__(
+        self,
+        output_file_path: Optional[str] = None,
+        out=sys.stdout
+    ):
+        self.__writer = JsonArrayWriter(
+            f'{{"version": {VERSION}, "reports": ', output_file_path, out)
+
+    def write(self, reports: Iterable[Report]):
+        """ Write the given reports. """
+        self.__writer.write(report.to_json() for report in reports)
+
+    def finish(self):
+        """ Finish the JSON document. """
+        self.__writer.finish("}")
@@ -1,9 +1,53 @@
-from typing import Dict, List
+import json
+import sys
+
+from typing import Dict, Iterable, List, Optional
 
 from codechecker_report_converter.report import Report
 from codechecker_report_converter.report.parser import sarif
+from codechecker_report_converter.util import JsonArrayWriter
 
 
 def convert(reports: List[Report]) -> Dict:
     sarif_parser = sarif.Parser()
     return sarif_parser.convert(reports)
+
+
+class Writer:
+    """
+    Write reports in sarif format to the given output file or to the output
+    stream as they are given. The output contains the same data as the output
+    of convert() for all the reports, but the rules of the tool are written
+    after the results, because they are known only at the end.
+    """
+
+    def __init__(
+        self,
+        output_file_path: Optional[str] = None,
+        out=sys.stdout
+    ):
+        self.__parser = sarif.Parser()
+        self.__rules: Dict[str, Dict] = {}
+
+        header = self.__parser.convert([])
+        header.pop("runs")
+        self.__writer = JsonArrayWriter(
+            f'{json.dumps(header)[:-1]}, "runs": [{{"results": ',
+            output_file_path, out)
+
+    def write(self, reports: Iterable[Report]):
+        """ Write the given reports. """
+        run = self.__parser.convert(list(reports))["runs"][0]
+
+        # The rule of a checker is created from its first report.
+        for rule in run["tool"]["driver"]["rules"]:
+            self.__rules.setdefault(rule["id"], rule)
+
+        self.__writer.write(run["results"])
+
+    def finish(self):
+        """ Write the rules of the tool and finish the JSON document. """
+        tool = self.__parser.convert([])["runs"][0]["tool"]
+        tool["driver"]["rules"] = list(self.__rules.values())
+
+        self.__writer.finish(f', "tool": {json.dumps(tool)}}}]}}')
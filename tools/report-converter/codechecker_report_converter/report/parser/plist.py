@@ -17,10 +17,11 @@ import traceback
 import sys
 
 from plistlib import _PlistParser  # type: ignore
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from xml.parsers.expat import ExpatError
 import lxml
+from lxml import etree  # pylint: disable=no-name-in-module
 
 from codechecker_report_converter.report import \
     BugPathEvent, BugPathPosition, \
@@ -171,6 +172,121 @@ def parse(fp: BinaryIO):
     return None
 
 
+def _plist_value(elem) -> PlistItem:
+    """
+    Convert the given element of a plist file to a Python object like plistlib
+    does.
+    """
+    tag = elem.tag
+    if tag == 'string':
+        return elem.text or ''
+
+    if tag == 'dict':
+        children = [child for child in elem if isinstance(child.tag, str)]
+        if len(children) % 2:
+            raise ValueError(f"Missing value for key '{children[-1].text}' "
+                             f"at line {children[-1].sourceline}")
+
+        return {key.text or '': _plist_value(value)
+                for key, value in zip(children[::2], children[1::2])}
+
+    if tag == 'array':
+        return [_plist_value(child) for child in elem
+                if isinstance(child.tag, str)]
+
+    if tag == 'integer':
+        raw = elem.text or ''
+        if raw.startswith('0x') or raw.startswith('0X'):
+            return int(raw, 16)
+        return int(raw)
+
+    if tag == 'true':
+        return True
+
+    if tag == 'false':
+        return False
+
+    if tag == 'real':
+        return float(elem.text or '')
+
+    # The other types (e.g. date and data) are not used by the analyzers, so
+    # they are converted by plistlib.
+    # pylint: disable=c-extension-no-member
+    return plistlib.loads(
+        b'<plist>' + etree.tostring(elem, with_tail=False) + b'</plist>')
+
+
+def _is_root_dict(elem) -> bool:
+    """ True if the given element is the root dictionary of a plist. """
+    if elem is None or elem.tag != 'dict':
+        return False
+
+    parent = elem.getparent()
+    return parent is None or parent.getparent() is None
+
+
+def iter_diagnostics(
+    fp: BinaryIO,
+    plist: Dict[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Read a .plist file and yield its diagnostics one by one. Only the XML
+    elements of one diagnostic are kept in the memory at once.
+
+    The other items of the root dictionary (e.g. 'files' and 'metadata') are
+    stored in the given plist dictionary when the whole file is read. They
+    usually come after the diagnostics in the file.
+
+    Raises lxml.etree.XMLSyntaxError if the file is not a valid XML file.
+    """
+    # pylint: disable=c-extension-no-member
+    context = etree.iterparse(fp, events=('end',), tag='dict')
+    for _, elem in context:
+        array = elem.getparent()
+        if array is None or array.tag != 'array' or \
+                not _is_root_dict(array.getparent()):
+            continue
+
+        key = array.getprevious()
+        if key is None or key.text != 'diagnostics':
+            continue
+
+        yield _plist_value(elem)
+
+        # Free the elements of the processed diagnostics.
+        elem.clear()
+        while elem.getprevious() is not None:
+            del array[0]
+
+    root = context.root
+    if root is not None and not _is_root_dict(root):
+        root = next((child for child in root
+                     if isinstance(child.tag, str)), None)
+
+    if not _is_root_dict(root):
+        return
+
+    children = [child for child in root if isinstance(child.tag, str)]
+    for key, value in zip(children[::2], children[1::2]):
+        if key.text != 'diagnostics':
+            plist[key.text or ''] = _plist_value(value)
+
+
+class _FileIndexMap(Dict[int, File]):
+    """
+    File index map of a plist file which is read diagnostic by diagnostic.
+    The 'files' list of the plist comes after the diagnostics, so placeholder
+    File objects are given for the file indexes until the files are known
+    (see Parser.get_reports()).
+    """
+
+    def __missing__(self, idx: int) -> File:
+        # The placeholder path can't be the path of an existing file.
+        file = File(f"\0{idx}")
+        self[idx] = file
+        return file
+
+
 def get_file_index_map(
     plist: Any,
     source_dir_path: str,
@@ -193,52 +309,112 @@ class Parser(BaseParser):
         analyzer_result_file_path: str,
         source_dir_path: Optional[str] = None
     ) -> List[Report]:
-        """ Get reports from the given analyzer result file. """
+        """
+        Get reports from the given analyzer result file.
+
+        The reports are created diagnostic by diagnostic while the file is
+        read, so the whole plist is never kept in the memory. The files and
+        the metadata of the plist come after the diagnostics, so the files,
+        the analyzer names and the missing hashes of the reports are set when
+        the whole file is read.
+        """
         reports: List[Report] = []
 
         if not source_dir_path:
             source_dir_path = os.path.dirname(analyzer_result_file_path)
 
+        plist: Dict[str, Any] = {}
+        files = _FileIndexMap()
+        error: Optional[Exception] = None
         try:
             with open(analyzer_result_file_path, 'rb') as fp:
-                plist = parse(fp)
-
-            if not plist:
-                return reports
+                for diag in iter_diagnostics(fp, plist):
+                    # The rest of the file is read after an error too, to get
+                    # the files of the reports which were created before it.
+                    if error:
+                        continue
 
-            metadata = plist.get('metadata')
+                    try:
+                        reports.append(self.__create_report(
+                            analyzer_result_file_path, diag, files, None))
+                    except Exception as ex:
+                        error = ex
+        except etree.XMLSyntaxError as ex:  # pylint: disable=no-member
+            LOG.error("Invalid plist file '%s': %s",
+                      analyzer_result_file_path, ex)
+            return []
+        except Exception as ex:
+            LOG.warning("Error during processing reports from the plist "
+                        "file: %s", analyzer_result_file_path)
+            traceback.print_exc()
+            LOG.warning(type(ex))
+            LOG.warning(ex)
+            return []
 
-            files = get_file_index_map(
+        try:
+            file_index_map = get_file_index_map(
                 plist, source_dir_path, self._file_cache)
+        except Exception as ex:
+            self.__log_error(analyzer_result_file_path, ex, {})
+            return []
+
+        # Reports are kept only until the first one which refers to an
+        # unknown file index, like when the file indexes are resolved at once.
+        unknown = {files[idx].original_path: idx for idx in files
+                   if idx not in file_index_map}
+        if unknown:
+            for idx, report in enumerate(reports):
+                unknown_files = [f for f in report.files
+                                 if f.original_path in unknown]
+                if unknown_files:
+                    error = KeyError(unknown[unknown_files[0].original_path])
+                    del reports[idx:]
+                    break
+
+        resolved_files = {file.original_path: file_index_map[idx]
+                          for idx, file in files.items()
+                          if idx in file_index_map}
+        metadata = plist.get('metadata')
+        for report in reports:
+            report.intern_files(resolved_files)
+
+            if metadata:
+                report.analyzer_name = self.__get_analyzer_name(
+                    report.checker_name, metadata)
+
+            if report.report_hash is None:
+                report.report_hash = get_report_hash(
+                    report, HashType.PATH_SENSITIVE)
 
-            for diag in plist.get('diagnostics', []):
-                report = self.__create_report(
-                    analyzer_result_file_path, diag, files, metadata)
+        if error:
+            self.__log_error(
+                analyzer_result_file_path, error, file_index_map)
 
-                if report.report_hash is None:
-                    report.report_hash = get_report_hash(
-                        report, HashType.PATH_SENSITIVE)
+        return reports
 
-                reports.append(report)
-        except KeyError as ex:
+    def __log_error(
+        self,
+        analyzer_result_file_path: str,
+        ex: Exception,
+        files: Dict[int, File]
+    ):
+        """ Log the error of processing the given analyzer result file. """
+        if isinstance(ex, KeyError):
             LOG.warning("Failed to get file path id! Found files: %s. "
                         "KeyError: %s", files, ex)
-        except IndexError as iex:
+        elif isinstance(ex, IndexError):
             LOG.warning("Indexing error during processing plist file %s",
                         analyzer_result_file_path)
-            LOG.warning(type(iex))
-            LOG.warning(repr(iex))
-            _, _, exc_traceback = sys.exc_info()
-            traceback.print_tb(exc_traceback, limit=1, file=sys.stdout)
-        except Exception as ex:
+            LOG.warning(type(ex))
+            LOG.warning(repr(ex))
+            traceback.print_tb(ex.__traceback__, limit=1, file=sys.stdout)
+        else:
             LOG.warning("Error during processing reports from the plist "
                         "file: %s", analyzer_result_file_path)
-            traceback.print_exc()
+            traceback.print_exception(type(ex), ex, ex.__traceback__)
             LOG.warning(type(ex))
             LOG.warning(ex)
 
-        return reports
-
     def __create_report(
         self,
         analyzer_result_file_path: str,
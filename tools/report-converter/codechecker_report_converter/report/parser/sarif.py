@@ -10,8 +10,6 @@ import json
 import logging
 import os
 
-from sarif import loader  # type: ignore
-
 from typing import Any, Dict, List, Optional, Tuple
 
 from urllib.parse import urlparse
@@ -59,6 +57,10 @@ class Parser(BaseParser):
         self.result_file_path = analyzer_result_file_path
         self.had_error = False
 
+        # Importing the sarif package is slow, and it is needed only if
+        # there are SARIF files to parse.
+        from sarif import loader  # type: ignore
+
         data = loader.load_sarif_file(analyzer_result_file_path)
 
         for run in data.runs:
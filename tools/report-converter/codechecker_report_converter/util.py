@@ -6,14 +6,18 @@
 #
 # -------------------------------------------------------------------------
 
+import array
+import codecs
+import functools
 import json
 import logging
 import os
 import sys
 import fnmatch
 import re
+import weakref
 
-from typing import Dict, List, Optional, TextIO
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Type
 
 
 LOG = logging.getLogger('report-converter')
@@ -28,10 +32,136 @@ def get_last_mod_time(file_path: str) -> Optional[float]:
         return None
 
 
-def get_linef(fp: TextIO, line_no: int) -> str:
-    """'fp' should be (readable) file object.
-    Return the line content at line_no or an empty line
-    if there is less lines than line_no.
+# The maximum number of the source files of which the line index is kept in
+# the memory of a process.
+LINE_INDEX_CACHE_SIZE = 256
+
+
+class LineIndex:
+    """
+    The content of a text file with the offsets of its lines, so any line can
+    be returned without iterating over the preceding lines.
+
+    The lines are the same as the lines of the file object which is opened in
+    text mode, i.e. the line endings are translated to '\\n'.
+    """
+
+    def __init__(self, text: str, newlines: Any = None):
+        self.__text = text
+        self.__newlines = newlines
+
+        offsets = array.array('q', [0] if text else [])
+        pos = text.find('\n')
+        while pos != -1 and pos + 1 < len(text):
+            offsets.append(pos + 1)
+            pos = text.find('\n', pos + 1)
+        self.__offsets = offsets
+
+    @property
+    def text(self) -> str:
+        """ The content of the file. """
+        return self.__text
+
+    @property
+    def newlines(self) -> Any:
+        """
+        The line endings which are translated in the file, like the newlines
+        attribute of the file object.
+        """
+        return self.__newlines
+
+    def get_line(self, line_no: int) -> str:
+        """
+        Return the line content at line_no or an empty line if there is less
+        lines than line_no.
+        """
+        if line_no < 1 or line_no > len(self.__offsets):
+            return ''
+
+        end = self.__offsets[line_no] if line_no < len(self.__offsets) \
+            else len(self.__text)
+
+        return self.__text[self.__offsets[line_no - 1]:end]
+
+
+@functools.lru_cache(maxsize=LINE_INDEX_CACHE_SIZE)
+def __read_line_index(
+    file_path: str,
+    errors: str,
+    mtime_ns: int,
+    size: int
+) -> LineIndex:
+    """
+    Read the line index of the given file. The modification time and the size
+    of the file are part of the cache key, so the changed files are read
+    again.
+    """
+    # pylint: disable=unused-argument
+    with open(file_path, mode='r', encoding='utf-8', errors=errors) as f:
+        text = f.read()
+        return LineIndex(text, f.newlines)
+
+
+def get_line_index(file_path: str, errors: str = 'ignore') -> LineIndex:
+    """
+    Return the line index of the given file which is read as utf-8 with the
+    given encoding error handling. The line indexes are cached in the process.
+
+    Raises OSError if the file can't be read.
+    """
+    stat = os.stat(file_path)
+    return __read_line_index(file_path, errors, stat.st_mtime_ns,
+                             stat.st_size)
+
+
+def __has_same_lines(fp: TextIO, index: LineIndex) -> bool:
+    """
+    Return True if the lines of the file object are the same as the lines of
+    the line index of its file.
+
+    The newline mode of the file object is not known, so the index is used
+    only if the file has no other line endings than '\\n' and the file object
+    is opened in universal newlines mode (newline=None or ''). In the other
+    modes the newlines attribute of the file object is never set.
+    """
+    if index.newlines is None:
+        return True
+
+    if index.newlines != '\n':
+        return False
+
+    if fp.newlines is None:
+        pos = fp.tell()
+        fp.seek(0)
+        fp.readline()
+        fp.seek(pos)
+
+    return fp.newlines is not None
+
+
+def get_file_line_index(fp: TextIO) -> Optional[LineIndex]:
+    """
+    Return the line index of the file which is opened as the given file
+    object, or None if it is not a file which is opened by its path as utf-8
+    or its lines can be different from the lines of the index.
+    """
+    file_path = getattr(fp, 'name', None)
+    if not isinstance(file_path, str) or \
+            codecs.lookup(getattr(fp, 'encoding', None) or 'ascii').name != \
+            'utf-8':
+        return None
+
+    try:
+        index = get_line_index(file_path, fp.errors)
+        return index if __has_same_lines(fp, index) else None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def __read_line(fp: TextIO, line_no: int) -> str:
+    """
+    Return the line content at line_no by reading the file object line by
+    line or an empty line if there is less lines than line_no.
     """
     fp.seek(0)
     for line in fp:
@@ -41,6 +171,18 @@ def get_linef(fp: TextIO, line_no: int) -> str:
     return ''
 
 
+def get_linef(fp: TextIO, line_no: int) -> str:
+    """'fp' should be (readable) file object.
+    Return the line content at line_no or an empty line
+    if there is less lines than line_no.
+    """
+    index = get_file_line_index(fp)
+    if index:
+        return index.get_line(line_no)
+
+    return __read_line(fp, line_no)
+
+
 def get_line(file_path: str, line_no: int, errors: str = 'ignore') -> str:
     """
     Return the given line from the file. If line_no is larger than the number
@@ -55,8 +197,14 @@ def get_line(file_path: str, line_no: int, errors: str = 'ignore') -> str:
     Changing the encoding error handling can influence the hash content!
     """
     try:
-        with open(file_path, mode='r', encoding='utf-8', errors=errors) as f:
-            return get_linef(f, line_no)
+        try:
+            return get_line_index(file_path, errors).get_line(line_no)
+        except UnicodeDecodeError:
+            # Only the lines until line_no are decoded when the file is read
+            # line by line, so the encoding error can be after them.
+            with open(file_path, mode='r', encoding='utf-8',
+                      errors=errors) as f:
+                return __read_line(f, line_no)
     except IOError:
         LOG.error("Failed to open file %s", file_path)
         return ''
@@ -121,3 +269,81 @@ def dump_json_output(
         out.write(f"{data_str}\n")
 
     return data_str
+
+
+def _remove_unfinished_file(out: TextIO, file_path: str):
+    """ Close and remove the given unfinished output file. """
+    out.close()
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON document which contains an array to the given output file or
+    to the output stream. The items of the array are written as they are
+    given, so they don't have to be kept in memory. The output is the same as
+    the output of dump_json_output() for the whole document.
+
+    The output file is written to a temporary file next to it, which is
+    renamed to the output file by finish(). If the document is not finished,
+    e.g. the process exits because of an error, the temporary file is removed
+    and the output file is not touched.
+    """
+
+    def __init__(
+        self,
+        prefix: str = '',
+        output_file_path: Optional[str] = None,
+        out=sys.stdout,
+        cls: Optional[Type[json.JSONEncoder]] = None
+    ):
+        """
+        The prefix is the part of the JSON document before the array. The
+        items are encoded by the given JSON encoder class.
+        """
+        self.__output_file_path = output_file_path
+        self.__out = out
+        self.__cls = cls
+        self.__empty = True
+
+        if output_file_path:
+            self.__tmp_file_path = os.path.join(
+                os.path.dirname(output_file_path),
+                f".{os.path.basename(output_file_path)}.{os.getpid()}.tmp")
+
+            # pylint: disable=consider-using-with
+            self.__out = open(self.__tmp_file_path, mode='w',
+                              encoding='utf-8', errors="ignore")
+            self.__remove_tmp_file = weakref.finalize(
+                self, _remove_unfinished_file, self.__out,
+                self.__tmp_file_path)
+
+        self.__out.write(f"{prefix}[")
+
+    def write(self, items: Iterable[Any]):
+        """ Write the given items of the array. """
+        for item in items:
+            if not self.__empty:
+                self.__out.write(", ")
+
+            self.__out.write(json.dumps(item, cls=self.__cls))
+            self.__empty = False
+
+    def finish(self, suffix: str = ''):
+        """
+        Close the array and write the given part of the JSON document after
+        it.
+        """
+        self.__out.write(f"]{suffix}")
+
+        if self.__output_file_path:
+            self.__out.close()
+            os.replace(self.__tmp_file_path, self.__output_file_path)
+            self.__remove_tmp_file.detach()
+            LOG.info('JSON report file was created: %s',
+                     self.__output_file_path)
+        else:
+            self.__out.write("\n")
@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Tests for writing the reports as they are given. """
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report.output import codeclimate, sarif, \
+    json as report_to_json
+
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        files = [File('/src/main.cpp'), File('/src/lib.h')]
+        self.reports = [
+            Report(files[idx % 2], idx + 1, 3, f"message {idx}",
+                   f"checker_{idx % 3}", report_hash=f"hash_{idx}",
+                   severity='HIGH', analyzer_name='clangsa',
+                   bug_path_events=[
+                       BugPathEvent("event", files[0], idx + 1, 3)])
+            for idx in range(7)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, writer_class):
+        """ Write the reports in batches to a string. """
+        out = io.StringIO()
+        writer = writer_class(out=out)
+        writer.write(self.reports[:3])
+        writer.write([])
+        writer.write(iter(self.reports[3:]))
+        writer.finish()
+
+        return out.getvalue()
+
+    def test_json(self):
+        """ The output is the same as the output of the converter. """
+        self.assertEqual(
+            self.__write(report_to_json.Writer),
+            json.dumps(report_to_json.convert(self.reports)) + "\n")
+
+    def test_codeclimate(self):
+        """ The output is the same as the output of the converter. """
+        self.assertEqual(
+            self.__write(codeclimate.Writer),
+            json.dumps(codeclimate.convert(self.reports)) + "\n")
+
+    def test_sarif(self):
+        """ The output contains the same data as the converter gives. """
+        self.assertEqual(json.loads(self.__write(sarif.Writer)),
+                         sarif.convert(self.reports))
+
+    def test_empty(self):
+        """ The output is valid if there are no reports. """
+        out = io.StringIO()
+        writer = sarif.Writer(out=out)
+        writer.finish()
+
+        self.assertEqual(json.loads(out.getvalue()), sarif.convert([]))
+
+    def test_output_file(self):
+        """ The output is written to the given output file. """
+        output_file_path = os.path.join(self.tmp_dir, 'reports.json')
+        writer = report_to_json.Writer(output_file_path)
+        writer.write(self.reports)
+        writer.finish()
+
+        with open(output_file_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f),
+                             report_to_json.convert(self.reports))
+
+    def test_unfinished_output_file(self):
+        """
+        The output file is not written if the document is not finished, e.g.
+        because of an error.
+        """
+        output_file_path = os.path.join(self.tmp_dir, 'reports.json')
+        writer = report_to_json.Writer(output_file_path)
+        writer.write(self.reports)
+        self.assertFalse(os.path.exists(output_file_path))
+
+        del writer
+        self.assertEqual(os.listdir(self.tmp_dir), [])
@@ -0,0 +1,135 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test reading the plist files diagnostic by diagnostic. """
+
+
+import datetime
+import io
+import os
+import plistlib
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import File
+from codechecker_report_converter.report.parser import plist
+
+
+def create_diag(file_idx: int, line: int) -> dict:
+    location = {'line': line, 'col': 3, 'file': file_idx}
+    return {
+        'description': f"Division by zero {line}",
+        'check_name': 'core.DivideZero',
+        'category': 'Logic error',
+        'location': location,
+        'path': [{
+            'kind': 'event',
+            'location': location,
+            'ranges': [[location, location]],
+            'message': "Division by zero"}]}
+
+
+class PlistStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.plist_file_path = os.path.join(self.tmp_dir, 'main.c.plist')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, content: dict, sort_keys: bool = True):
+        with open(self.plist_file_path, 'wb') as f:
+            plistlib.dump(content, f, sort_keys=sort_keys)
+
+    def __get_reports(self):
+        return plist.Parser().get_reports(self.plist_file_path)
+
+    def test_plist_values(self):
+        """ The plist values are converted like plistlib converts them. """
+        content = {
+            'diagnostics': [{
+                'string': "a < b", 'empty': "", 'int': -3, 'big': 2 ** 40,
+                'real': 1.5, 'true': True, 'false': False, 'data': b'\0ab',
+                'date': datetime.datetime(2020, 1, 2, 3, 4, 5),
+                'array': [[], {}, [1, {'a': ""}]], 'dict': {'': 0}}],
+            'files': ['main.c']}
+
+        result = {}
+        diags = list(plist.iter_diagnostics(
+            io.BytesIO(plistlib.dumps(content)), result))
+
+        self.assertEqual(diags, content['diagnostics'])
+        self.assertEqual(result, {'files': ['main.c']})
+
+    def test_files_after_diagnostics(self):
+        """ The file indexes are resolved when the files are read. """
+        self.__write({
+            'diagnostics': [create_diag(0, 1), create_diag(1, 2)],
+            'files': ['main.c', 'lib.h'],
+            'metadata': {'analyzer': {'name': 'clangsa'}}})
+
+        reports = self.__get_reports()
+
+        self.assertEqual(
+            [(r.file.original_path, r.line) for r in reports],
+            [(os.path.join(self.tmp_dir, 'main.c'), 1),
+             (os.path.join(self.tmp_dir, 'lib.h'), 2)])
+        for report in reports:
+            self.assertEqual(report.analyzer_name, 'clangsa')
+            self.assertTrue(report.report_hash)
+            self.assertIs(report.bug_path_events[0].file, report.file)
+            self.assertEqual(report.files, {report.file})
+
+    def test_files_before_diagnostics(self):
+        """ The files can be given before the diagnostics too. """
+        self.__write({'files': ['main.c'],
+                      'diagnostics': [create_diag(0, 1)]}, sort_keys=False)
+
+        reports = self.__get_reports()
+
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].file,
+                         File(os.path.join(self.tmp_dir, 'main.c')))
+
+    def test_unknown_file_index(self):
+        """ Reports are kept until the first unknown file index. """
+        self.__write({
+            'diagnostics': [create_diag(0, 1), create_diag(1, 2),
+                            create_diag(0, 3)],
+            'files': ['main.c']})
+
+        reports = self.__get_reports()
+
+        self.assertEqual([r.line for r in reports], [1])
+        self.assertEqual(reports[0].file.original_path,
+                         os.path.join(self.tmp_dir, 'main.c'))
+
+    def test_invalid_diagnostic(self):
+        """ Reports are kept until the first invalid diagnostic. """
+        invalid_diag = create_diag(0, 2)
+        del invalid_diag['location']['file']
+        self.__write({
+            'diagnostics': [create_diag(0, 1), invalid_diag,
+                            create_diag(0, 3)],
+            'files': ['main.c']})
+
+        reports = self.__get_reports()
+
+        self.assertEqual([r.line for r in reports], [1])
+        self.assertEqual(reports[0].file.original_path,
+                         os.path.join(self.tmp_dir, 'main.c'))
+
+    def test_invalid_xml(self):
+        """ No reports are given from an invalid plist file. """
+        data = plistlib.dumps({'diagnostics': [create_diag(0, 1)],
+                               'files': ['main.c']})
+        with open(self.plist_file_path, 'wb') as f:
+            f.write(data[:-20])
+
+        self.assertEqual(self.__get_reports(), [])
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Tests for the memory layout of the report objects. """
+
+import pickle
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, \
+    BugPathPosition, File, MacroExpansion, Range, Report
+
+
+def create_report(file_path: str, message: str) -> Report:
+    file = File(file_path)
+    return Report(
+        file, 1, 2, message, 'core.DivideZero', severity='HIGH',
+        report_hash='hash', analyzer_name='clangsa',
+        bug_path_events=[BugPathEvent(message, file, 1, 2)],
+        bug_path_positions=[BugPathPosition(file, Range(1, 2, 1, 5))],
+        macro_expansions=[MacroExpansion('1 / 0', 'DIV', file, 1, 2)])
+
+
+class TestReport(unittest.TestCase):
+    def test_slots(self):
+        """ The report objects don't have a per-instance dictionary. """
+        report = create_report('/src/main.c', 'Division by zero')
+
+        for obj in [report, report.file, report.bug_path_events[0],
+                    report.bug_path_positions[0],
+                    report.bug_path_positions[0].range,
+                    report.macro_expansions[0]]:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+
+        with self.assertRaises(AttributeError):
+            # pylint: disable=assigning-non-slot
+            report.unknown_attribute = None
+
+    def test_pickle(self):
+        """ The reports can be sent to other processes. """
+        report = create_report('/src/main.c', 'Division by zero')
+        report.source_line = 'int x = 1 / 0;\n'
+
+        copy = pickle.loads(pickle.dumps(report))
+        self.assertEqual(copy, report)
+        self.assertEqual(copy.to_json(), report.to_json())
+        self.assertEqual(copy.source_line, report.source_line)
+
+    def test_interned_strings(self):
+        """ The same strings of the reports are stored only once. """
+        message = 'Division by zero'
+        reports = [create_report('/src/main.c', ''.join(message))
+                   for _ in range(2)]
+
+        self.assertIs(reports[0].message, reports[1].message)
+        self.assertIs(reports[0].bug_path_events[0].message,
+                      reports[1].bug_path_events[0].message)
+        self.assertIs(reports[0].checker_name, reports[1].checker_name)
+
+    def test_intern_files(self):
+        """ The reports share the File objects of the file cache. """
+        reports = [create_report('/src/main.c', 'Division by zero')
+                   for _ in range(2)]
+        self.assertIsNot(reports[0].file, reports[1].file)
+
+        file_cache = {}
+        for report in reports:
+            report.intern_files(file_cache)
+
+        self.assertEqual(list(file_cache), ['/src/main.c'])
+        for report in reports:
+            self.assertIs(report.file, file_cache['/src/main.c'])
+            self.assertIs(report.bug_path_events[0].file, report.file)
+            self.assertIs(report.bug_path_positions[0].file, report.file)
+            self.assertIs(report.macro_expansions[0].file, report.file)
+            self.assertEqual(report.files, {report.file})
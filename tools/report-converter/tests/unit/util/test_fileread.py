@@ -11,9 +11,12 @@ File reading tests.
 
 
 import os
+import shutil
+import tempfile
 import unittest
 
-from codechecker_report_converter.util import get_line
+from codechecker_report_converter.util import get_line, get_line_index, \
+    get_linef
 
 
 class GetLineTest(unittest.TestCase):
@@ -43,3 +46,96 @@ class GetLineTest(unittest.TestCase):
 
         line6 = get_line(file_to_process, 6)
         self.assertEqual(line6, 'line6\n')
+
+
+class LineIndexTest(unittest.TestCase):
+    """
+    Tests of the line index which gives the same lines as reading the file
+    line by line.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def __write(self, content: bytes) -> str:
+        file_path = os.path.join(self.tmp_dir, 'source.c')
+        with open(file_path, 'wb') as f:
+            f.write(content)
+
+        return file_path
+
+    def test_same_lines(self):
+        """ The lines are the same as the lines of the file object. """
+        contents = [
+            b'',
+            b'\n',
+            b'no newline',
+            b'line1\nline2\n',
+            b'dos\r\nline\r\nmac\rline\r\rlast',
+            b'form\x0cfeed\nseparator\xe2\x80\xa8\n',
+            b'invalid \xff\xfe utf-8\ntruncated \xe2\x82\nend']
+
+        for content in contents:
+            file_path = self.__write(content)
+            for errors in ['ignore', 'replace']:
+                with open(file_path, encoding='utf-8', errors=errors) as f:
+                    lines = f.readlines()
+
+                for line_no in range(-1, len(lines) + 3):
+                    expected = lines[line_no - 1] \
+                        if 1 <= line_no <= len(lines) else ''
+                    self.assertEqual(get_line(file_path, line_no, errors),
+                                     expected, (content, errors, line_no))
+
+                    with open(file_path, encoding='utf-8',
+                              errors=errors) as f:
+                        self.assertEqual(get_linef(f, line_no), expected)
+
+    def test_newline_modes(self):
+        """ The lines are the same in every newline mode of the file. """
+        contents = [b'line1\nline2\n', b'dos\r\nline\r\n', b'mac\rline\r']
+
+        for content in contents:
+            file_path = self.__write(content)
+            for newline in [None, '', '\n', '\r\n', '\r']:
+                with open(file_path, encoding='utf-8', newline=newline) as f:
+                    lines = f.readlines()
+
+                for line_no in range(1, len(lines) + 2):
+                    expected = lines[line_no - 1] \
+                        if line_no <= len(lines) else ''
+                    with open(file_path, encoding='utf-8',
+                              newline=newline) as f:
+                        self.assertEqual(get_linef(f, line_no), expected,
+                                         (content, newline, line_no))
+
+    def test_strict_decoding(self):
+        """
+        Only the lines until the requested line are decoded with strict
+        encoding error handling, so an encoding error after them is not
+        raised.
+        """
+        file_path = self.__write(b'valid\n' * 10000 + b'invalid \xff\n')
+
+        self.assertEqual(get_line(file_path, 1, 'strict'), 'valid\n')
+        with open(file_path, encoding='utf-8', errors='strict') as f:
+            self.assertEqual(get_linef(f, 1), 'valid\n')
+            with self.assertRaises(UnicodeDecodeError):
+                get_linef(f, 10001)
+
+    def test_changed_file(self):
+        """ The line index of a changed file is read again. """
+        file_path = self.__write(b'first\n')
+        self.assertEqual(get_line(file_path, 1), 'first\n')
+        self.assertIs(get_line_index(file_path), get_line_index(file_path))
+
+        file_path = self.__write(b'second version\n')
+        self.assertEqual(get_line(file_path, 1), 'second version\n')
+
+    def test_missing_file(self):
+        """ Empty line is returned for a missing file. """
+        self.assertEqual(
+            get_line(os.path.join(self.tmp_dir, 'missing.c'), 1), '')
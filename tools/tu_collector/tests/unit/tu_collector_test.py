@@ -93,3 +93,51 @@ class TUCollectorTest(unittest.TestCase):
 
         self.assertTrue(any(
             [path.endswith(os.path.join('/', 'zero.h')) for path in files]))
+
+    def test_blob_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            blob_store = tu_collector.BlobStore(os.path.join(tmp_dir, 'blobs'))
+            failed_dir = os.path.join(tmp_dir, 'failed')
+            os.makedirs(failed_dir)
+
+            manifests = []
+            for source in ['main.cpp', 'ctu.cpp', 'zero.cpp']:
+                files = tu_collector.store_tu_files(
+                    blob_store, self.compile_cmd_data, file_filter=source)
+                self.assertIn('compilation_database.json', files)
+
+                manifest_file = os.path.join(
+                    failed_dir, source + tu_collector.MANIFEST_SUFFIX)
+                tu_collector.write_manifest(manifest_file, blob_store, files)
+                manifests.append((source, manifest_file, files))
+
+            # The C++ standard headers are stored once for the translation
+            # units.
+            stored = set()
+            for _, _, files in manifests:
+                stored.update(files.values())
+            self.assertLess(len(stored),
+                            sum(len(files) for _, _, files in manifests))
+
+            for source, manifest_file, _ in manifests:
+                materialized = os.path.join(tmp_dir, source + '.manifest.zip')
+                tu_collector.materialize_zip(manifest_file, materialized)
+
+                classic = os.path.join(tmp_dir, source + '.zip')
+                tu_collector.zip_tu_files(classic, self.compile_cmd_data,
+                                          file_filter=source)
+
+                with zipfile.ZipFile(materialized) as m_archive, \
+                        zipfile.ZipFile(classic) as c_archive:
+                    self.assertEqual(sorted(m_archive.namelist()),
+                                     sorted(c_archive.namelist()))
+                    for name in c_archive.namelist():
+                        self.assertEqual(m_archive.read(name),
+                                         c_archive.read(name))
+
+            # The files which are not referenced by the manifests anymore are
+            # removed.
+            _, files = tu_collector.read_manifest(manifests[0][1])
+            self.assertGreater(blob_store.prune(set(files.values())), 0)
+            for digest in files.values():
+                self.assertTrue(os.path.isfile(blob_store.blob_path(digest)))
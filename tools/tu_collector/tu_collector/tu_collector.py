@@ -27,11 +27,13 @@ import shlex
 import string
 import subprocess
 import sys
+import tempfile
 import zipfile
 from shutil import which
 
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, \
+    Union
 
 if sys.version_info >= (3, 8):
     from typing import TypedDict  # pylint: disable=no-name-in-module
@@ -57,6 +59,15 @@ class CompileAction(TypedDict):
 
 CompilationDB = List[CompileAction]
 
+# The version of the format of the manifest files of the blob store.
+MANIFEST_VERSION = 1
+
+# The suffix of the manifest files.
+MANIFEST_SUFFIX = '.manifest.json'
+
+# The size of the chunks in which the files are copied to the blob store.
+BLOB_CHUNK_SIZE = 1024 * 1024
+
 
 def __random_string(length: int) -> str:
     """
@@ -348,6 +359,15 @@ def get_dependent_headers(
     return dependencies, error
 
 
+def sources_root_path(file_path: str) -> str:
+    """
+    Returns the path of the given source file under the "sources-root"
+    directory of the ZIP file.
+    """
+    return os.path.normpath(
+        os.path.join('sources-root', file_path.lstrip(os.sep)))
+
+
 def add_sources_to_zip(
     zip_file: Union[str, Path],
     files: Union[str, Iterable[str]]
@@ -365,8 +385,7 @@ def add_sources_to_zip(
 
     with zipfile.ZipFile(zip_file, 'a') as archive:
         for f in files:
-            archive_path = os.path.normpath(
-                os.path.join('sources-root', f.lstrip(os.sep)))
+            archive_path = sources_root_path(f)
 
             try:
                 archive.getinfo(archive_path)
@@ -377,39 +396,18 @@ def add_sources_to_zip(
                           "again!", f)
 
 
-def zip_tu_files(
-    zip_file: Union[str, Path],
+def collect_tu_files(
     compilation_db: Union[str, CompilationDB],
     file_filter='*',
-    write_mode='w',
     ctu_deps_dir: Optional[str] = None
-):
+) -> Tuple[CompilationDB, Set[str], str]:
     """
-    Collects all files to a zip file which are required for the compilation of
-    the translation units described by the given compilation database.
-    If there are some files which couldn't be collected then a "no-sources"
-    file will contain the error message of its reason.
-    The function returns the set of files.
+    Collects the files which are required for the compilation of the
+    translation units described by the given compilation database. The
+    function returns the compilation database, the set of files and the error
+    messages of the files which couldn't be collected.
 
-    zip_file -- A file name or a file object.
-    compilation_database -- Either a path of the compilation database JSON file
-                            or a list of the parsed JSON.
-    file_filter -- A glob used as file name filter. The files of a TU will be
-                   collected only if the "file" attribute of the build action
-                   matches this glob.
-    write_mode -- The file opening mode of the zip_file. In case of 'a' the new
-                  files are appended to the existing zip file, in case of 'w'
-                  the files are added to a clean zip file.
-    ctu_deps_dir -- This directory contains a list of files. Each file belongs
-                    to a translation unit and lists what other files are
-                    involved during CTU analysis. These files and their
-                    included headers will also be compressed in the .zip file.
-                    File names in this directory must contain a hash of a the
-                    build command. See __analyzer_action_hash() documentation.
-                    When using this options, make sure to provide a compilation
-                    database in the first argument which contains the build
-                    commands of these files otherwise the files of this folder
-                    can't be identified.
+    For the description of the parameters see zip_tu_files().
     """
     if isinstance(compilation_db, str):
         with open(compilation_db, encoding="utf-8", errors="ignore") as f:
@@ -417,7 +415,6 @@ def zip_tu_files(
     else:
         compilation_database = compilation_db
 
-    no_sources = 'no-sources'
     tu_files: Set[str] = set()
     error_messages = ''
 
@@ -447,6 +444,47 @@ def zip_tu_files(
             error_messages += buildaction['file'] + '\n' \
                 + '-' * len(buildaction['file']) + '\n' + err + '\n'
 
+    return compilation_database, tu_files, error_messages
+
+
+def zip_tu_files(
+    zip_file: Union[str, Path],
+    compilation_db: Union[str, CompilationDB],
+    file_filter='*',
+    write_mode='w',
+    ctu_deps_dir: Optional[str] = None
+):
+    """
+    Collects all files to a zip file which are required for the compilation of
+    the translation units described by the given compilation database.
+    If there are some files which couldn't be collected then a "no-sources"
+    file will contain the error message of its reason.
+    The function returns the set of files.
+
+    zip_file -- A file name or a file object.
+    compilation_database -- Either a path of the compilation database JSON file
+                            or a list of the parsed JSON.
+    file_filter -- A glob used as file name filter. The files of a TU will be
+                   collected only if the "file" attribute of the build action
+                   matches this glob.
+    write_mode -- The file opening mode of the zip_file. In case of 'a' the new
+                  files are appended to the existing zip file, in case of 'w'
+                  the files are added to a clean zip file.
+    ctu_deps_dir -- This directory contains a list of files. Each file belongs
+                    to a translation unit and lists what other files are
+                    involved during CTU analysis. These files and their
+                    included headers will also be compressed in the .zip file.
+                    File names in this directory must contain a hash of a the
+                    build command. See __analyzer_action_hash() documentation.
+                    When using this options, make sure to provide a compilation
+                    database in the first argument which contains the build
+                    commands of these files otherwise the files of this folder
+                    can't be identified.
+    """
+    compilation_database, tu_files, error_messages = collect_tu_files(
+        compilation_db, file_filter, ctu_deps_dir)
+
+    no_sources = 'no-sources'
     if write_mode == 'a' and os.path.isfile(zip_file):
         with zipfile.ZipFile(zip_file) as archive:
             try:
@@ -472,6 +510,208 @@ def zip_tu_files(
                          json.dumps(compilation_database, indent=2))
 
 
+class BlobStore:
+    """
+    Content-addressed store of files. Every distinct file content is stored
+    once, named by its SHA-256 hash, so the translation units sharing source
+    and header files don't copy them again. A manifest file describes the
+    files of a translation unit, and it can be materialized into the ZIP file
+    which zip_tu_files() would write.
+    """
+
+    # The hash of the files which are already stored by this process, indexed
+    # by their path, size and modification time. The header files are shared
+    # by lots of translation units, so they are hashed only once.
+    __digests: Dict[Tuple[str, int, int], str] = {}
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def blob_path(self, digest: str) -> str:
+        """ Returns the path of the file with the given hash. """
+        return os.path.join(self.path, digest[:2], digest[2:])
+
+    def __has_blob(self, digest: str) -> bool:
+        return os.path.isfile(self.blob_path(digest))
+
+    def __write_blob(self, digest: str, tmp_file: str):
+        """ Move the temporary file to its place in the store. """
+        blob_path = self.blob_path(digest)
+        if os.path.isfile(blob_path):
+            os.remove(tmp_file)
+            return
+
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+
+        # The files are written by parallel processes, but their content is
+        # the same if they have the same name.
+        os.replace(tmp_file, blob_path)
+
+    def add_chunks(self, chunks: Iterable[bytes]) -> str:
+        """ Store the content given in chunks and return its hash. """
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=self.path, prefix='.tmp')
+        try:
+            sha = hashlib.sha256()
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    sha.update(chunk)
+                    f.write(chunk)
+
+            digest = sha.hexdigest()
+            self.__write_blob(digest, tmp_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+        return digest
+
+    def add_bytes(self, data: bytes) -> str:
+        """ Store the given content and return its hash. """
+        return self.add_chunks([data])
+
+    def add_file(self, file_path: str) -> str:
+        """ Store the content of the given file and return its hash. """
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_size, stat.st_mtime_ns)
+        digest = BlobStore.__digests.get(key)
+        if not digest:
+            # Most of the files are already stored by an earlier translation
+            # unit, so the file is hashed before it is copied.
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(BLOB_CHUNK_SIZE), b''):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+
+        if not self.__has_blob(digest):
+            with open(file_path, 'rb') as f:
+                digest = self.add_chunks(
+                    iter(lambda: f.read(BLOB_CHUNK_SIZE), b''))
+
+        BlobStore.__digests[key] = digest
+        return digest
+
+    def prune(self, digests: Set[str]) -> int:
+        """
+        Remove the files of the store which are not in the given set of
+        hashes. Returns the number of removed files.
+        """
+        removed = 0
+        for root, _, files in os.walk(self.path, topdown=False):
+            for f in files:
+                digest = os.path.basename(root) + f
+                if digest not in digests:
+                    os.remove(os.path.join(root, f))
+                    removed += 1
+
+            if root != self.path and not os.listdir(root):
+                os.rmdir(root)
+
+        return removed
+
+
+def store_tu_files(
+    blob_store: BlobStore,
+    compilation_db: Union[str, CompilationDB],
+    file_filter='*',
+    ctu_deps_dir: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Collects all files to the blob store which are required for the
+    compilation of the translation units described by the given compilation
+    database. The function returns the hash of the files indexed by their path
+    in the ZIP file which zip_tu_files() would write.
+
+    For the description of the parameters see zip_tu_files().
+    """
+    compilation_database, tu_files, error_messages = collect_tu_files(
+        compilation_db, file_filter, ctu_deps_dir)
+
+    files: Dict[str, str] = {}
+    if error_messages:
+        files['no-sources'] = \
+            blob_store.add_bytes(error_messages.encode('utf-8'))
+
+    add_sources_to_manifest(blob_store, files, tu_files)
+
+    files['compilation_database.json'] = blob_store.add_bytes(
+        json.dumps(compilation_database, indent=2).encode('utf-8'))
+
+    return files
+
+
+def add_sources_to_manifest(
+    blob_store: BlobStore,
+    files: Dict[str, str],
+    sources: Iterable[str]
+):
+    """
+    Add the given source files to the blob store and to the files of a
+    manifest if those are not present yet, like add_sources_to_zip().
+    """
+    for f in sources:
+        archive_path = sources_root_path(f)
+        if archive_path in files:
+            LOG.debug("'%s' is already in the manifest, won't add it "
+                      "again!", f)
+            continue
+
+        files[archive_path] = blob_store.add_file(f)
+
+
+def write_manifest(
+    manifest_file: str,
+    blob_store: BlobStore,
+    files: Dict[str, str]
+):
+    """
+    Write the manifest of a translation unit, i.e. the hash of its files in
+    the blob store indexed by their path in the ZIP file.
+    """
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'blob_dir': os.path.relpath(
+            blob_store.path, os.path.dirname(os.path.abspath(manifest_file))),
+        'files': files}
+
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def read_manifest(manifest_file: str) -> Tuple[BlobStore, Dict[str, str]]:
+    """
+    Returns the blob store and the files of the given manifest. ValueError is
+    raised if the manifest is invalid.
+    """
+    with open(manifest_file, encoding='utf-8', errors='ignore') as f:
+        manifest = json.load(f)
+
+    if not isinstance(manifest, dict) or \
+            manifest.get('version') != MANIFEST_VERSION or \
+            'blob_dir' not in manifest or 'files' not in manifest:
+        raise ValueError(f"Unsupported manifest file: {manifest_file}")
+
+    blob_dir = os.path.join(os.path.dirname(os.path.abspath(manifest_file)),
+                            manifest['blob_dir'])
+
+    return BlobStore(os.path.normpath(blob_dir)), manifest['files']
+
+
+def materialize_zip(manifest_file: str, zip_file: Union[str, Path]):
+    """
+    Write the ZIP file of the translation unit described by the given
+    manifest. The ZIP file has the same content as if the files of the
+    translation unit were written to it directly.
+    """
+    blob_store, files = read_manifest(manifest_file)
+
+    with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for archive_path, digest in files.items():
+            archive.write(blob_store.blob_path(digest), archive_path)
+
+
 def get_dependent_sources(
     compilation_db: CompilationDB,
     header_path: Optional[str] = None
@@ -528,6 +768,13 @@ used to generate a log file on the fly.""")
     log_args.add_argument('-l', '--logfile', type=str, dest='logfile',
                           help="Use an already existing JSON compilation "
                                "command database file specified at this path.")
+    log_args.add_argument('-m', '--manifest', type=str, dest='manifest',
+                          help="Use the manifest file of a translation unit "
+                               "which was written to a blob store by "
+                               "'CodeChecker analyze "
+                               "--reproducer-blob-store'. The files of the "
+                               "translation unit are written from the blob "
+                               "store to the ZIP file given by '--zip'.")
 
     parser.add_argument('-f', '--filter', dest='filter',
                         type=str, required=False, default='*',
@@ -580,8 +827,28 @@ used to generate a log file on the fly.""")
         LOG.error("Compilation database file doesn't exist: %s", args.logfile)
         sys.exit(1)
 
+    if args.manifest:
+        if not args.zip:
+            LOG.error("The '--manifest' flag can be used only with '--zip'.")
+            sys.exit(1)
+
+        if not os.path.isfile(args.manifest):
+            LOG.error("Manifest file doesn't exist: %s", args.manifest)
+            sys.exit(1)
+
     # --- Do the job. --- #
 
+    if args.manifest:
+        try:
+            materialize_zip(args.manifest, args.zip)
+        except (OSError, ValueError) as ex:
+            LOG.error("Failed to write the ZIP file of %s: %s",
+                      args.manifest, ex)
+            sys.exit(1)
+
+        LOG.info("Done.")
+        return
+
     if args.logfile:
         with open(args.logfile, encoding="utf-8", errors="ignore") as f:
             compilation_db = json.load(f)
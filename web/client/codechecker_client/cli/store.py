@@ -35,7 +35,7 @@ from codechecker_api.codeCheckerDBAccess_v6.ttypes import \
     StoreLimitKind, SubmittedRunOptions
 
 from codechecker_report_converter import twodim
-from codechecker_report_converter.report import Report, report_file, \
+from codechecker_report_converter.report import File, Report, report_file, \
     reports as reports_helper, statistics as report_statistics
 from codechecker_report_converter.report.hash import get_report_path_hash
 from codechecker_report_converter.report.parser.base import AnalyzerInfo
@@ -67,6 +67,10 @@ LOG = logger.get_logger('system')
 
 MAX_UPLOAD_SIZE = 1024 ** 3  # 1024^3 = 1 GiB.
 
+# The suffix of the manifest files of the failure zips which are written by
+# 'CodeChecker analyze --reproducer-blob-store'.
+MANIFEST_SUFFIX = '.manifest.json'
+
 
 AnalyzerResultFileReports = Dict[str, List[Report]]
 
@@ -440,6 +444,10 @@ def parse_analyzer_result_files(
     """ Get reports from the given analyzer result files. """
     analyzer_result_file_reports: AnalyzerResultFileReports = defaultdict(list)
 
+    # The reports of the analyzer result files are parsed in other processes,
+    # so they are made to share the File objects for memory effiency.
+    file_cache: Dict[str, File] = {}
+
     ctx = nullcontext() if jobs == 1 else Pool(max_workers=jobs)
 
     with ctx as executor:
@@ -451,6 +459,9 @@ def parse_analyzer_result_files(
                 analyzer_result_files))):
             LOG.debug(f"[{idx}/{len(analyzer_result_files)}] "
                       f"Parsed '{file_path}' ...")
+            for report in reports:
+                report.intern_files(file_cache)
+
             analyzer_result_file_reports[file_path] = reports
 
     return analyzer_result_file_reports
@@ -709,6 +720,33 @@ def should_be_zipped(input_file: str, input_files: Iterable[str]) -> bool:
                 and 'compiler_info.json' not in input_files))
 
 
+def get_manifest_blobs(manifest_file: str) -> List[str]:
+    """
+    Returns the files of the blob store which are referenced by the given
+    manifest file of a failure zip. The manifest files are written by
+    'CodeChecker analyze --reproducer-blob-store'.
+    """
+    try:
+        with open(manifest_file, encoding='utf-8', errors='ignore') as f:
+            manifest = json.load(f)
+
+        blob_dir = os.path.join(os.path.dirname(manifest_file),
+                                manifest['blob_dir'])
+
+        blobs = []
+        for digest in sorted(set(manifest['files'].values())):
+            blob = os.path.normpath(
+                os.path.join(blob_dir, digest[:2], digest[2:]))
+            if os.path.isfile(blob):
+                blobs.append(blob)
+
+        return blobs
+    except (OSError, ValueError, KeyError, TypeError) as ex:
+        LOG.debug("Failed to read the manifest file '%s': %s",
+                  manifest_file, ex)
+        return []
+
+
 def get_analysis_statistics(inputs, limits):
     """
     Collects analysis statistics information and returns them.
@@ -755,10 +793,21 @@ def get_analysis_statistics(inputs, limits):
                 failed_dir = os.path.join(input_path, inp_dir)
                 _, _, files = next(os.walk(failed_dir), ([], [], []))
                 failed_files_size = 0
+                blob_files: Set[str] = set()
                 for f in files:
                     failure_zip = os.path.join(failed_dir, f)
-                    failure_zip_size = os.stat(failure_zip).st_size
-                    failed_files_size += failure_zip_size
+
+                    # The source files of a manifest file are in the blob
+                    # store, and they are uploaded only once even if they are
+                    # referenced by several manifest files.
+                    failure_files = [failure_zip]
+                    if f.endswith(MANIFEST_SUFFIX):
+                        failure_files += [
+                            blob for blob in get_manifest_blobs(failure_zip)
+                            if blob not in blob_files]
+
+                    failed_files_size += sum(os.stat(failure_file).st_size
+                                             for failure_file in failure_files)
 
                     if failed_files_size > failure_zip_limit:
                         LOG.debug("We reached the limit of maximum uploadable "
@@ -768,7 +817,8 @@ def get_analysis_statistics(inputs, limits):
                     else:
                         LOG.debug("Copying failure zip file '%s' to analyzer "
                                   "statistics ZIP...", failure_zip)
-                        statistics_files.append(failure_zip)
+                        statistics_files.extend(failure_files)
+                        blob_files.update(failure_files[1:])
                         has_failed_zip = True
 
         return statistics_files if has_failed_zip else []
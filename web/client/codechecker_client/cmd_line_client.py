@@ -32,7 +32,8 @@ from codechecker_report_converter.report.output import baseline, codeclimate, \
 from codechecker_report_converter.report.output.html import \
     html as report_to_html
 from codechecker_report_converter.report.statistics import Statistics
-from codechecker_report_converter.util import dump_json_output
+from codechecker_report_converter.util import dump_json_output, \
+    JsonArrayWriter
 
 from codechecker_common import logger
 from codechecker_common.checker_labels import CheckerLabels
@@ -203,6 +204,7 @@ def get_report_dir_results(
     Absolute paths are expected to the given report directories.
     """
     all_reports = []
+    file_cache: Dict[str, File] = {}  # For memory effiency.
 
     processed_path_hashes = set()
     for report_dir, file_paths in \
@@ -220,7 +222,8 @@ def get_report_dir_results(
 
         for file_path in file_paths:
             # Get reports.
-            reports = report_file.get_reports(file_path, checker_labels)
+            reports = report_file.get_reports(
+                file_path, checker_labels, file_cache)
 
             try:
                 for report in reports:
@@ -403,6 +406,33 @@ def get_run_data(client, run_filter, sort_mode=None):
     return all_runs
 
 
+def iter_run_results(client,
+                     run_ids,
+                     limit,
+                     offset,
+                     sort_type,
+                     report_filter,
+                     compare_data,
+                     query_report_details):
+    """Get all the results with multiple api request.
+
+    In each api request get the limit ammount of reports.
+    Yield the reports of the api requests one by one based on the filters.
+    """
+    while True:
+        results = client.getRunResults(run_ids,
+                                       limit,
+                                       offset,
+                                       sort_type,
+                                       report_filter,
+                                       compare_data,
+                                       query_report_details)
+        yield results
+        offset += limit
+        if len(results) < limit:
+            break
+
+
 def get_run_results(client,
                     run_ids,
                     limit,
@@ -418,18 +448,10 @@ def get_run_results(client,
     """
 
     all_results = []
-    while True:
-        results = client.getRunResults(run_ids,
-                                       limit,
-                                       offset,
-                                       sort_type,
-                                       report_filter,
-                                       compare_data,
-                                       query_report_details)
+    for results in iter_run_results(client, run_ids, limit, offset,
+                                    sort_type, report_filter, compare_data,
+                                    query_report_details):
         all_results.extend(results)
-        offset += limit
-        if len(results) < limit:
-            break
 
     return all_results
 
@@ -806,21 +828,33 @@ def handle_list_results(args):
     # flag is deprecated in 6.28.0 and should be removed in 6.29.0.
     query_report_details = 'details' in args or args.output_format == 'json'
 
-    all_results = get_run_results(client,
-                                  run_ids,
-                                  constants.MAX_QUERY_SIZE,
-                                  0,
-                                  None,
-                                  report_filter,
-                                  None,
-                                  query_report_details)
-
     if args.output_format == 'json':
+        # The reports are written as they are received, so they don't have
+        # to be kept in memory.
         run_id2name = {run.runId: run.name for run in run_data}
-        for report in all_results:
-            report.runName = run_id2name[report.runId]
-        print(CmdLineOutputEncoder().encode(all_results))
+        writer = JsonArrayWriter(cls=CmdLineOutputEncoder)
+        for results in iter_run_results(client,
+                                        run_ids,
+                                        constants.MAX_QUERY_SIZE,
+                                        0,
+                                        None,
+                                        report_filter,
+                                        None,
+                                        query_report_details):
+            for report in results:
+                report.runName = run_id2name[report.runId]
+            writer.write(results)
+        writer.finish()
     else:
+        all_results = get_run_results(client,
+                                      run_ids,
+                                      constants.MAX_QUERY_SIZE,
+                                      0,
+                                      None,
+                                      report_filter,
+                                      None,
+                                      query_report_details)
+
         rows = []
         header = []
         max_msg_len = 50
@@ -960,7 +994,6 @@ def convert_report_data_to_report(
             report_data, cached_report_file_lookup)
 
         report.changed_files = []
-        report.source_code_comments = []
 
         if source_line_contents:
             source_line = convert.from_b64(
@@ -19,7 +19,7 @@ from codechecker_common import logger
 from codechecker_common.checker_labels import CheckerLabels
 from codechecker_common.guidelines import Guidelines
 from codechecker_common.singleton import Singleton
-from codechecker_common.util import load_json
+from codechecker_common.util import get_user_cache_dir, load_json
 
 LOG = logger.get_logger('system')
 
@@ -74,7 +74,9 @@ class Context(metaclass=Singleton):
         guidelines_dir = os.path.join(self._data_files_dir_path,
                                       'config', 'guidelines')
 
-        self._checker_labels = CheckerLabels(labels_dir)
+        self._checker_labels = CheckerLabels(
+            labels_dir,
+            os.path.join(get_user_cache_dir(), 'checker-labels'))
         self._guidelines = Guidelines(guidelines_dir)
         self.__system_comment_map = load_json(self.system_comment_map_file, {})
         self.__git_commit_urls = self.__get_git_commit_urls()